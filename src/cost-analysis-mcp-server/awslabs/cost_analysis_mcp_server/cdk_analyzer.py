@@ -15,8 +15,10 @@ This module provides functionality for analyzing CDK projects to identify AWS se
 and their configurations.
 """
 
+import asyncio
 import logging
 import re
+from awslabs.cost_analysis_mcp_server.file_analysis import analyze_files, find_source_files
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -25,6 +27,52 @@ from typing import Any, Dict, List
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Files analyzed in a CDK project, and files left out
+CDK_FILE_PATTERNS = ('*.py', '*.ts')
+CDK_EXCLUDED_FILES = ('__init__.py', '*.d.ts')
+
+# Version of the results of parse_cdk_file; a new version ignores cached results
+PARSER_VERSION = '1'
+
+# Python: from aws_cdk import aws_x as y, ... or from aws_cdk import ( ... )
+PYTHON_IMPORT_FROM_PATTERN = re.compile(
+    r'^[ \t]*from[ \t]+aws_cdk[ \t]+import[ \t]+(\([^)]*\)|[^\n]+)', re.MULTILINE
+)
+
+# Python: from aws_cdk.aws_x import ... or import aws_cdk.aws_x
+PYTHON_MODULE_PATTERN = re.compile(
+    r'^[ \t]*(?:from[ \t]+aws_cdk\.aws_(\w+)[ \t]+import|import[ \t]+aws_cdk\.aws_(\w+))',
+    re.MULTILINE,
+)
+
+# Python: a module name in an import list
+PYTHON_IMPORTED_NAME_PATTERN = re.compile(r'\baws_(\w+)')
+
+# TypeScript: imports and requires of aws-cdk-lib/aws-x (v2) or @aws-cdk/aws-x (v1)
+TYPESCRIPT_IMPORT_PATTERN = re.compile(
+    r'(?:from|require\()[ \t]*[\'"](?:aws-cdk-lib|@aws-cdk)/aws-(\w+)[\'"]'
+)
+
+
+def parse_cdk_file(content: str) -> Dict[str, List[str]]:
+    """Find the AWS service modules a CDK source file imports.
+
+    Args:
+        content: Content of a Python or TypeScript file
+
+    Returns:
+        Dictionary with the imported 'services' in order of appearance
+    """
+    services = []
+    for match in PYTHON_IMPORT_FROM_PATTERN.finditer(content):
+        # Strip comments from multi-line import lists
+        names = re.sub(r'#[^\n]*', '', match.group(1))
+        services.extend(PYTHON_IMPORTED_NAME_PATTERN.findall(names))
+    for match in PYTHON_MODULE_PATTERN.finditer(content):
+        services.append(match.group(1) or match.group(2))
+    services.extend(TYPESCRIPT_IMPORT_PATTERN.findall(content))
+    return {'services': list(dict.fromkeys(services))}
+
 
 class CDKAnalyzer:
     """Analyzes CDK projects to identify AWS services and configurations."""
@@ -46,80 +94,17 @@ class CDKAnalyzer:
         Returns:
             List of identified AWS services and their configurations
         """
-        services = []
-        logger.info(f'Analyzing file: {file_path}')
-
+        logger.debug(f'Analyzing file: {file_path}')
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                logger.info('Successfully read file content')
-
-            # Process line by line to handle imports
-            lines = content.split('\n')
-            in_import_block = False
-
-            for line in lines:
-                line = line.strip()
-
-                # Python: Start of import block
-                if line.startswith('from aws_cdk import ('):
-                    in_import_block = True
-                    continue
-
-                # Python: End of import block
-                if in_import_block and line.startswith(')'):
-                    in_import_block = False
-                    continue
-
-                # Python: Process lines in import block
-                if in_import_block:
-                    if 'aws_' in line:
-                        # Extract service name from aws_X as Y format
-                        match = re.match(r'\s*aws_(\w+)\s+as\s+\w+', line)
-                        if match:
-                            service_name = match.group(1)
-                            logger.info(f'Found AWS service in import block: {service_name}')
-                            services.append(
-                                {
-                                    'name': service_name,
-                                    'source': 'cdk',
-                                    'configurations': [],
-                                }
-                            )
-                    continue
-
-                # Python: Process direct imports
-                if line.startswith('from aws_cdk.aws_'):
-                    match = re.match(r'from\s+aws_cdk\.aws_(\w+)\s+import', line)
-                    if match:
-                        service_name = match.group(1)
-                        logger.info(f'Found AWS service in direct import: {service_name}')
-                        services.append(
-                            {
-                                'name': service_name,
-                                'source': 'cdk',
-                                'configurations': [],
-                            }
-                        )
-
-                # TypeScript: Process imports from aws-cdk-lib/aws-*
-                if 'aws-cdk-lib/aws-' in line:
-                    match = re.match(r'.*from\s+[\'"]aws-cdk-lib/aws-(\w+)[\'"].*', line)
-                    if match:
-                        service_name = match.group(1)
-                        logger.info(f'Found AWS service in TypeScript import: {service_name}')
-                        services.append(
-                            {
-                                'name': service_name,
-                                'source': 'cdk',
-                                'configurations': [],
-                            }
-                        )
-
+                result = parse_cdk_file(f.read())
         except Exception as e:
             logger.warning(f'Error analyzing file {file_path}: {e}')
-
-        return services
+            return []
+        return [
+            {'name': service_name, 'source': 'cdk', 'configurations': []}
+            for service_name in result['services']
+        ]
 
     async def analyze_project(self) -> Dict[str, Any]:
         """Analyze the CDK project to identify AWS services and their configurations.
@@ -146,24 +131,21 @@ class CDKAnalyzer:
                 },
             }
 
-        all_services = []
-
-        # Get all Python and TypeScript files in the project
-        source_files = list(self.project_path.rglob('*.py')) + list(
-            self.project_path.rglob('*.ts')
+        # Get all Python and TypeScript files in the project, skipping node_modules, cdk.out and
+        # other dependency and cache directories, and parse the new and changed ones on a
+        # worker pool
+        source_files = await asyncio.to_thread(
+            find_source_files, self.project_path, CDK_FILE_PATTERNS, CDK_EXCLUDED_FILES
         )
-        logger.info(f'Found source files: {source_files}')
-
-        for file_path in source_files:
-            if file_path.name != '__init__.py':
-                logger.info(f'Analyzing file: {file_path}')
-                try:
-                    file_services = self._analyze_file(file_path)
-                    if file_services:
-                        logger.info(f'Found services in {file_path}: {file_services}')
-                        all_services.extend(file_services)
-                except Exception as e:
-                    logger.error(f'Error analyzing {file_path}: {e}')
+        results, cached_files = await analyze_files(
+            self.project_path, source_files, parse_cdk_file, 'cdk', PARSER_VERSION
+        )
+
+        all_services = [
+            {'name': service_name, 'source': 'cdk', 'configurations': []}
+            for file_path in source_files
+            for service_name in results.get(file_path, {}).get('services', [])
+        ]
 
         # Deduplicate services by name
         seen_services = set()
@@ -184,6 +166,8 @@ class CDKAnalyzer:
                 'services': unique_services,
                 'project_path': str(self.project_path),
                 'analysis_type': 'cdk',
+                'file_count': len(results),
+                'cached_file_count': cached_files,
             },
         }
 
@@ -0,0 +1,267 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""awslabs MCP Cost Analysis project file analysis.
+
+This module finds the source files of a project, skipping vendored and cache directories, and
+parses them in parallel. Parse results are cached per file and reused while the file's
+modification time and size, or failing that its content hash, are unchanged, so analyzing a
+large repository again only parses the files that changed. Files are read and checked against
+the cache on a thread pool; parsing is CPU-bound, so large batches of changed files are parsed
+on a pool of worker processes.
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Directory holding one cache file per analyzed project and analyzer, overridable through the
+# environment
+ANALYSIS_CACHE_DIR = Path(
+    os.getenv(
+        'COST_ANALYSIS_CACHE_DIR',
+        Path.home() / '.cache' / 'awslabs-cost-analysis-mcp-server' / 'analysis',
+    )
+)
+
+# Version of the cache file layout; older files are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Dependency, build output and tool cache directories, in addition to hidden directories such
+# as .terraform, .terragrunt-cache, .git and .venv
+IGNORED_DIRS = {
+    'node_modules',
+    'cdk.out',
+    '__pycache__',
+    'venv',
+    'vendor',
+    'site-packages',
+}
+
+# Number of files read and checked against the cache concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Number of worker processes parsing files
+MAX_PARSE_PROCESSES = os.cpu_count() or 1
+
+# Below this many changed files, parsing in the server process is faster than handing the
+# files to worker processes
+PROCESS_POOL_MIN_FILES = 32
+
+# Worker processes parsing files, started on first use and kept for later analyses
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def find_source_files(
+    root: Path, patterns: Iterable[str], exclude: Iterable[str] = ()
+) -> List[Path]:
+    """Find the source files of a project.
+
+    Args:
+        root: Project root
+        patterns: File name patterns to include (e.g., '*.tf')
+        exclude: File name patterns to leave out (e.g., '__init__.py')
+
+    Returns:
+        Sorted paths of the matching files outside ignored directories
+    """
+    patterns = tuple(patterns)
+    exclude = tuple(exclude)
+    files = []
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories[:] = [
+            name
+            for name in subdirectories
+            if not name.startswith('.') and name not in IGNORED_DIRS
+        ]
+        for name in names:
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns) and not any(
+                fnmatch.fnmatch(name, pattern) for pattern in exclude
+            ):
+                files.append(Path(directory, name))
+    return sorted(files)
+
+
+def _cache_path(root: Path, namespace: str) -> Path:
+    """Return the cache file of a project and analyzer."""
+    key = hashlib.sha256(f'{namespace}\0{root}'.encode()).hexdigest()
+    return ANALYSIS_CACHE_DIR / f'{key}.json'
+
+
+def _load_cache(path: Path, parser_version: str) -> Dict[str, Dict[str, Any]]:
+    """Load the cached results of a project, empty if nothing usable is cached."""
+    try:
+        cache = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('format') != CACHE_FORMAT_VERSION or cache.get('parser') != parser_version:
+        return {}
+    return cache.get('files', {})
+
+
+def _save_cache(path: Path, parser_version: str, files: Dict[str, Dict[str, Any]]) -> None:
+    """Store the results of a project, replacing the cache file atomically."""
+    cache = {'format': CACHE_FORMAT_VERSION, 'parser': parser_version, 'files': files}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f'Failed to store analysis cache {path}: {e}')
+
+
+def _read_one(
+    path: Path, cached: Optional[Dict[str, Any]]
+) -> Tuple[Optional[Dict[str, Any]], bool, Optional[str]]:
+    """Read a file unless its cache entry is still valid.
+
+    Returns:
+        Tuple of the cache entry (None if the file cannot be read), whether the cached result
+        was reused and the content to parse when it was not
+    """
+    try:
+        stat = path.stat()
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached, True, None
+
+        data = path.read_bytes()
+    except OSError as e:
+        logger.warning(f'Error reading file {path}: {e}')
+        return None, False, None
+
+    digest = hashlib.sha256(data).hexdigest()
+    entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+    if cached and cached['sha256'] == digest:
+        return dict(entry, result=cached['result']), True, None
+    return entry, False, data.decode('utf-8', 'replace')
+
+
+def _parse_one(parse: Callable[[str], Dict[str, Any]], path: Path, content: str) -> Dict[str, Any]:
+    """Parse the content of a file, with an empty result if the parser fails."""
+    try:
+        return parse(content)
+    except Exception as e:
+        logger.warning(f'Error analyzing file {path}: {e}')
+        return {}
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Return the worker processes parsing files, starting them on first use.
+
+    Workers are spawned rather than forked, since the server process runs an event loop and
+    other threads.
+    """
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=MAX_PARSE_PROCESSES, mp_context=multiprocessing.get_context('spawn')
+        )
+    return _PROCESS_POOL
+
+
+async def _parse_files(
+    parse: Callable[[str], Dict[str, Any]], pending: List[Tuple[Path, str]]
+) -> List[Dict[str, Any]]:
+    """Parse file contents, on the worker processes when there are enough of them."""
+
+    def parse_all() -> List[Dict[str, Any]]:
+        return [_parse_one(parse, path, content) for path, content in pending]
+
+    if len(pending) < PROCESS_POOL_MIN_FILES:
+        return await asyncio.to_thread(parse_all)
+
+    global _PROCESS_POOL
+    loop = asyncio.get_running_loop()
+    pool = _process_pool()
+    try:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _parse_one, parse, path, content)
+                for path, content in pending
+            )
+        )
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f'Parsing files in the server process, the worker processes failed: {e}')
+        _PROCESS_POOL = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return await asyncio.to_thread(parse_all)
+
+
+async def analyze_files(
+    root: Path,
+    files: List[Path],
+    parse: Callable[[str], Dict[str, Any]],
+    namespace: str,
+    parser_version: str,
+) -> Tuple[Dict[Path, Dict[str, Any]], int]:
+    """Parse files in parallel, reusing cached results of unchanged files.
+
+    Args:
+        root: Project root, which keys the cache
+        files: Files to parse
+        parse: Function parsing the content of a file into a JSON serializable result; a
+            module-level function, since worker processes receive it by reference
+        namespace: Name of the analyzer, so analyzers of the same project do not share results
+        parser_version: Version of the parser; a different version ignores the cache
+
+    Returns:
+        Tuple of the result of each readable file and the number of results taken from the cache
+    """
+    cache_path = _cache_path(root.resolve(), namespace)
+    cached_files = await asyncio.to_thread(_load_cache, cache_path, parser_version)
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        reads = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _read_one, path, cached_files.get(str(path)))
+                for path in files
+            )
+        )
+
+    pending = [
+        (path, content) for path, (_, _, content) in zip(files, reads) if content is not None
+    ]
+    parsed = iter(await _parse_files(parse, pending))
+    entries = []
+    for entry, was_cached, content in reads:
+        if content is not None:
+            entry = dict(entry, result=next(parsed))
+        entries.append((entry, was_cached))
+
+    results = {}
+    new_cache = {}
+    reused = 0
+    changed = False
+    for path, (entry, was_cached) in zip(files, entries):
+        if entry is None:
+            continue
+        results[path] = entry['result']
+        new_cache[str(path)] = entry
+        reused += was_cached
+        changed = changed or entry is not cached_files.get(str(path))
+
+    if changed or len(new_cache) != len(cached_files):
+        await asyncio.to_thread(_save_cache, cache_path, parser_version, new_cache)
+    logger.info(f'Analyzed {len(files)} files under {root}, {reused} unchanged')
+    return results, reused
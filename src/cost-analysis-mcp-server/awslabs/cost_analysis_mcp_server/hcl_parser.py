@@ -0,0 +1,221 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Minimal HCL parser for Terraform project analysis.
+
+This module splits HCL files into their top-level blocks (e.g., ``resource "aws_s3_bucket" "b"``)
+with the top-level attributes of each block. Comments, quoted strings with template
+interpolations and heredocs are tokenized properly, so braces and keywords inside them do not
+confuse the block structure. Attribute values are kept as source text; only quoted strings
+are unquoted.
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class Token(NamedTuple):
+    """A token of an HCL file."""
+
+    kind: str  # 'ident', 'string', 'heredoc', 'newline', or the punctuation character itself
+    value: str
+    start: int
+    end: int
+
+
+IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_\-]*')
+HEREDOC_PATTERN = re.compile(r'<<(-?)([A-Za-z_][A-Za-z0-9_]*)[ \t]*\r?\n')
+OPENING_BRACKETS = {'{': '}', '[': ']', '(': ')'}
+
+
+def _skip_template(content: str, position: int) -> int:
+    """Skip a template interpolation or directive starting after its opening brace.
+
+    Returns:
+        Position after the closing brace
+    """
+    depth = 1
+    while position < len(content) and depth:
+        char = content[position]
+        if char == '"':
+            position = _skip_string(content, position + 1)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        position += 1
+    return position
+
+
+def _skip_string(content: str, position: int) -> int:
+    """Skip a quoted string starting after its opening quote.
+
+    Returns:
+        Position after the closing quote
+    """
+    while position < len(content):
+        char = content[position]
+        if char == '\\':
+            position += 2
+        elif char == '"' or char == '\n':
+            return position + 1
+        elif char in '$%' and content.startswith('{', position + 1):
+            if content.startswith(char, position - 1) and position > 0:
+                # Escaped $${ or %%{ is a literal
+                position += 2
+            else:
+                position = _skip_template(content, position + 2)
+        else:
+            position += 1
+    return position
+
+
+def tokenize(content: str) -> List[Token]:
+    """Split HCL content into tokens, dropping comments and whitespace.
+
+    Args:
+        content: HCL source
+
+    Returns:
+        List of tokens
+    """
+    tokens = []
+    position = 0
+    length = len(content)
+    while position < length:
+        char = content[position]
+        if char == '\n':
+            tokens.append(Token('newline', char, position, position + 1))
+            position += 1
+        elif char in ' \t\r':
+            position += 1
+        elif char == '#' or content.startswith('//', position):
+            end = content.find('\n', position)
+            position = length if end == -1 else end
+        elif content.startswith('/*', position):
+            end = content.find('*/', position + 2)
+            position = length if end == -1 else end + 2
+        elif char == '"':
+            end = _skip_string(content, position + 1)
+            tokens.append(Token('string', content[position + 1 : end - 1], position, end))
+            position = end
+        elif char == '<' and HEREDOC_PATTERN.match(content, position):
+            heredoc = HEREDOC_PATTERN.match(content, position)
+            marker = heredoc.group(2) if heredoc else ''
+            body_start = heredoc.end() if heredoc else position
+            closing = re.compile(rf'^[ \t]*{re.escape(marker)}[ \t]*$', re.MULTILINE)
+            end_match = closing.search(content, body_start)
+            end = length if end_match is None else end_match.end()
+            body_end = length if end_match is None else end_match.start()
+            tokens.append(Token('heredoc', content[body_start:body_end], position, end))
+            position = end
+        else:
+            match = IDENTIFIER_PATTERN.match(content, position)
+            if match:
+                tokens.append(Token('ident', match.group(), position, match.end()))
+                position = match.end()
+            else:
+                tokens.append(Token(char, char, position, position + 1))
+                position += 1
+    return tokens
+
+
+def _find_closing(tokens: List[Token], index: int) -> int:
+    """Return the index of the bracket closing the one at ``index``, or the last index."""
+    stack = []
+    for position in range(index, len(tokens)):
+        kind = tokens[position].kind
+        if kind in OPENING_BRACKETS:
+            stack.append(OPENING_BRACKETS[kind])
+        elif stack and kind == stack[-1]:
+            stack.pop()
+            if not stack:
+                return position
+    return len(tokens) - 1
+
+
+def _parse_body(content: str, tokens: List[Token], start: int, end: int) -> Dict[str, Any]:
+    """Parse the attributes and nested blocks of a block body between two token indexes."""
+    attributes: Dict[str, Any] = {}
+    blocks: List[Dict[str, Any]] = []
+    index = start
+    while index < end:
+        token = tokens[index]
+        if token.kind != 'ident':
+            index += 1
+            continue
+
+        if index + 1 < end and tokens[index + 1].kind == '=':
+            value_start = index + 2
+            value_end = value_start
+            while value_end < end and tokens[value_end].kind != 'newline':
+                if tokens[value_end].kind in OPENING_BRACKETS:
+                    value_end = _find_closing(tokens, value_end)
+                value_end += 1
+            value_tokens = tokens[value_start:value_end]
+            if len(value_tokens) == 1 and value_tokens[0].kind in ('string', 'heredoc'):
+                value = value_tokens[0].value
+            elif value_tokens:
+                value = content[value_tokens[0].start : value_tokens[-1].end]
+            else:
+                value = ''
+            attributes[token.value] = value
+            index = value_end
+            continue
+
+        labels = []
+        label_index = index + 1
+        while label_index < end and tokens[label_index].kind in ('string', 'ident'):
+            labels.append(tokens[label_index].value)
+            label_index += 1
+        if label_index < end and tokens[label_index].kind == '{':
+            closing = _find_closing(tokens, label_index)
+            block = _parse_body(content, tokens, label_index + 1, closing)
+            blocks.append({'type': token.value, 'labels': labels, **block})
+            index = closing + 1
+            continue
+        index += 1
+    return {'attributes': attributes, 'blocks': blocks}
+
+
+def parse_blocks(content: str) -> List[Dict[str, Any]]:
+    """Parse the top-level blocks of an HCL file.
+
+    Args:
+        content: HCL source
+
+    Returns:
+        List of blocks, each with its type, labels, top-level attributes and nested blocks
+    """
+    tokens = tokenize(content)
+    return _parse_body(content, tokens, 0, len(tokens))['blocks']
+
+
+def find_blocks(
+    blocks: List[Dict[str, Any]], block_type: str, label_count: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Return the blocks of a type, optionally with an exact number of labels.
+
+    Args:
+        blocks: Blocks from parse_blocks
+        block_type: Block type (e.g., 'resource')
+        label_count: Number of labels the blocks must have
+
+    Returns:
+        Matching blocks
+    """
+    return [
+        block
+        for block in blocks
+        if block['type'] == block_type
+        and (label_count is None or len(block['labels']) == label_count)
+    ]
@@ -16,6 +16,7 @@ This module provides helper classes for analyzing AWS service costs.
 
 import json
 import re
+from awslabs.cost_analysis_mcp_server.price_list_parser import GROUP_SUMMARY_FIELDS
 from typing import Dict, List, Optional
 
 
@@ -166,11 +167,40 @@ class CostAnalysisHelper:
         else:
             # API data (JSON)
             price_list = pricing_data.get('data', [])
+            # Attributes shared by all flattened rows are returned once, outside the rows
+            common_attributes = pricing_data.get('common_attributes') or {}
 
             if isinstance(price_list, list) and price_list:
                 # Process the first few price list items
                 for i, price_item in enumerate(price_list[:5]):
-                    if isinstance(price_item, str):
+                    if isinstance(price_item, dict) and 'pricePerUnit' in price_item:
+                        # Flattened price row from get_pricing_from_api
+                        row = {**common_attributes, **price_item}
+                        pricing_structure['unit_pricing'].append(
+                            {
+                                'unit': row.get('unit') or '',
+                                'price': str(row['pricePerUnit']),
+                                'description': row.get('priceDescription') or '',
+                            }
+                        )
+                    elif isinstance(price_item, dict) and 'minPrice' in price_item:
+                        # Price summary of a group from get_pricing_from_api with group_by
+                        min_price, max_price = price_item['minPrice'], price_item.get('maxPrice')
+                        group = [
+                            f'{key}: {value}'
+                            for key, value in price_item.items()
+                            if key not in GROUP_SUMMARY_FIELDS
+                        ]
+                        pricing_structure['unit_pricing'].append(
+                            {
+                                'unit': ', '.join(price_item.get('units', [])),
+                                'price': str(min_price)
+                                if max_price in (None, min_price)
+                                else f'{min_price} - {max_price}',
+                                'description': ', '.join(group),
+                            }
+                        )
+                    elif isinstance(price_item, str):
                         try:
                             price_data = json.loads(price_item)
                             product = price_data.get('product', {})
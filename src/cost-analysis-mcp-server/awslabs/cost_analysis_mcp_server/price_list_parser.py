@@ -0,0 +1,283 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""awslabs MCP Cost Analysis Price List parser.
+
+This module turns AWS Price List entries, as returned by the Price List API, into compact rows
+with one row per price dimension: the product attributes, the term and the unit price. Rows can
+be projected to a subset of attributes, sorted by price and grouped by an attribute, so only
+what a cost review needs is returned.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Keys of every row, kept by a projection
+PRICE_FIELDS = ('sku', 'termType', 'unit', 'pricePerUnit', 'currency')
+
+# Keys that identify a row and are never moved to the common attributes
+ROW_IDENTITY_FIELDS = ('sku', 'pricePerUnit')
+
+# Keys of a group summary besides the attribute the rows were grouped by
+GROUP_SUMMARY_FIELDS = (
+    'minPrice',
+    'maxPrice',
+    'currency',
+    'units',
+    'priceCount',
+    'cheapestSku',
+    'skuCount',
+)
+
+# Currencies of the Price List, in order of preference
+CURRENCIES = ('USD', 'CNY')
+
+
+def parse_price_list_item(item: Any) -> Dict[str, Any]:
+    """Parse a Price List entry, which the API returns as a JSON string.
+
+    Args:
+        item: Price List entry as a JSON string or dictionary
+
+    Returns:
+        The entry as a dictionary
+    """
+    if isinstance(item, str):
+        return json.loads(item)
+    return item
+
+
+def _unit_price(price_per_unit: Dict[str, str]) -> Tuple[Optional[float], Optional[str]]:
+    """Return the price and currency of a price dimension."""
+    for currency in CURRENCIES + tuple(price_per_unit):
+        if currency in price_per_unit:
+            try:
+                return float(price_per_unit[currency]), currency
+            except ValueError:
+                return None, currency
+    return None, None
+
+
+def flatten_price_list(
+    price_list: List[Any], term_type: Optional[str] = 'OnDemand'
+) -> List[Dict[str, Any]]:
+    """Flatten Price List entries into one row per price dimension.
+
+    Each row holds the product attributes, the product family, the term type and attributes
+    (e.g., LeaseContractLength for reserved terms) and the unit price as a number. Tiered price
+    dimensions also carry their beginRange and endRange.
+
+    Args:
+        price_list: Price List entries as JSON strings or dictionaries
+        term_type: Only flatten terms of this type (e.g., 'OnDemand', 'Reserved'), or None for all
+
+    Returns:
+        List of rows
+    """
+    rows = []
+    for item in price_list:
+        try:
+            entry = parse_price_list_item(item)
+        except ValueError:
+            logger.warning('Skipping Price List entry that is not valid JSON')
+            continue
+
+        product = entry.get('product', {})
+        base = dict(product.get('attributes', {}))
+        if product.get('productFamily'):
+            base['productFamily'] = product['productFamily']
+        base['sku'] = product.get('sku')
+
+        for entry_term_type, terms in entry.get('terms', {}).items():
+            if term_type and entry_term_type != term_type:
+                continue
+            for term in terms.values():
+                for dimension in term.get('priceDimensions', {}).values():
+                    price, currency = _unit_price(dimension.get('pricePerUnit', {}))
+                    row = dict(base)
+                    row.update(term.get('termAttributes', {}))
+                    row.update(
+                        {
+                            'termType': entry_term_type,
+                            'unit': dimension.get('unit'),
+                            'pricePerUnit': price,
+                            'currency': currency,
+                            'priceDescription': dimension.get('description'),
+                        }
+                    )
+                    if dimension.get('beginRange') not in (None, '0') or dimension.get(
+                        'endRange'
+                    ) not in (None, 'Inf'):
+                        row['beginRange'] = dimension.get('beginRange')
+                        row['endRange'] = dimension.get('endRange')
+                    rows.append(row)
+    return rows
+
+
+def _price_key(price: Optional[float], descending: bool) -> Tuple[bool, float]:
+    """Sort key placing rows without a price last in either order."""
+    if price is None:
+        return (True, 0.0)
+    return (False, -price if descending else price)
+
+
+def sort_by_price(rows: List[Dict[str, Any]], sort_order: str = 'asc') -> List[Dict[str, Any]]:
+    """Sort rows by unit price.
+
+    Args:
+        rows: Rows from flatten_price_list
+        sort_order: 'asc' for the cheapest first or 'desc' for the most expensive first
+
+    Returns:
+        Sorted rows, with rows without a price last
+    """
+    descending = sort_order == 'desc'
+    return sorted(rows, key=lambda row: _price_key(row.get('pricePerUnit'), descending))
+
+
+def group_prices(
+    rows: List[Dict[str, Any]], group_by: str, sort_order: str = 'asc'
+) -> List[Dict[str, Any]]:
+    """Summarize rows by the value of an attribute.
+
+    Args:
+        rows: Rows from flatten_price_list
+        group_by: Attribute to group by (e.g., 'instanceType', 'usagetype')
+        sort_order: 'asc' for the cheapest group first or 'desc' for the most expensive first
+
+    Returns:
+        One summary per group with its price range, units, number of prices and products and
+        the SKU of its cheapest price
+    """
+    groups: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        value = row.get(group_by)
+        group = groups.setdefault(
+            value,
+            {
+                group_by: value,
+                'minPrice': None,
+                'maxPrice': None,
+                'currency': row.get('currency'),
+                'units': set(),
+                'skus': set(),
+                'priceCount': 0,
+                'cheapestSku': None,
+            },
+        )
+        price = row.get('pricePerUnit')
+        group['priceCount'] += 1
+        group['skus'].add(row.get('sku'))
+        if row.get('unit'):
+            group['units'].add(row['unit'])
+        if price is not None:
+            if group['minPrice'] is None or price < group['minPrice']:
+                group['minPrice'] = price
+                group['cheapestSku'] = row.get('sku')
+            if group['maxPrice'] is None or price > group['maxPrice']:
+                group['maxPrice'] = price
+
+    summaries = []
+    for group in groups.values():
+        group['units'] = sorted(group['units'])
+        group['skuCount'] = len(group.pop('skus'))
+        summaries.append(group)
+    descending = sort_order == 'desc'
+    price_field = 'maxPrice' if descending else 'minPrice'
+    return sorted(summaries, key=lambda group: _price_key(group[price_field], descending))
+
+
+def project_rows(rows: List[Dict[str, Any]], fields: List[str]) -> List[Dict[str, Any]]:
+    """Keep only the given attributes, besides the price fields, of each row.
+
+    Args:
+        rows: Rows from flatten_price_list
+        fields: Attributes to keep (e.g., ['instanceType', 'vcpu', 'memory'])
+
+    Returns:
+        Projected rows
+    """
+    keep = list(PRICE_FIELDS) + [field for field in fields if field not in PRICE_FIELDS]
+    return [{key: row[key] for key in keep if key in row} for row in rows]
+
+
+def split_common_attributes(
+    rows: List[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Move the attributes shared by every row out of the rows.
+
+    Args:
+        rows: Rows from flatten_price_list
+
+    Returns:
+        Tuple of the shared attributes and the rows without them
+    """
+    if len(rows) < 2:
+        return {}, rows
+    common = {
+        key: value
+        for key, value in rows[0].items()
+        if key not in ROW_IDENTITY_FIELDS and all(row.get(key, ...) == value for row in rows[1:])
+    }
+    return common, [{k: v for k, v in row.items() if k not in common} for row in rows]
+
+
+def summarize_price_list(
+    price_list: List[Any],
+    fields: Optional[List[str]] = None,
+    group_by: Optional[str] = None,
+    top_n: Optional[int] = None,
+    sort_order: str = 'asc',
+    term_type: Optional[str] = 'OnDemand',
+    max_rows: int = 100,
+) -> Dict[str, Any]:
+    """Flatten, sort and optionally group or project Price List entries.
+
+    Args:
+        price_list: Price List entries as JSON strings or dictionaries
+        fields: Attributes to keep in each row, or None for all
+        group_by: Attribute to summarize the prices by, or None to return the rows
+        top_n: Number of rows or groups to return (default: max_rows)
+        sort_order: 'asc' for the cheapest first or 'desc' for the most expensive first
+        term_type: Only include terms of this type, or None for all
+        max_rows: Number of rows or groups returned when top_n is not set
+
+    Returns:
+        Dictionary with the rows or groups ('data'), the attributes shared by all rows
+        ('common_attributes'), the number of products and prices and whether rows or groups
+        were left out ('truncated')
+    """
+    rows = flatten_price_list(price_list, term_type)
+    if group_by:
+        data = group_prices(rows, group_by, sort_order)
+    else:
+        data = sort_by_price(rows, sort_order)
+        if fields:
+            data = project_rows(data, fields)
+
+    limit = top_n if top_n and top_n > 0 else max_rows
+    truncated = len(data) > limit
+    data = data[:limit]
+    common_attributes: Dict[str, Any] = {}
+    if not group_by:
+        common_attributes, data = split_common_attributes(data)
+
+    return {
+        'data': data,
+        'common_attributes': common_attributes,
+        'product_count': len(price_list),
+        'price_count': len(rows),
+        'truncated': truncated,
+    }
@@ -0,0 +1,430 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""awslabs MCP Cost Analysis local AWS Price List store.
+
+This module keeps a local copy of the AWS Price List, built from the bulk offer files. The
+per-region offer file of a service is downloaded once and normalized into a SQLite database,
+indexed by service, region and product attribute, so pricing filters are answered locally with
+complete results. A refresh first reads the small region index of the service and only
+downloads the offer file of a region when its offer version changed.
+"""
+
+import asyncio
+import ijson
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from httpx import AsyncClient
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Host serving the bulk offer files
+PRICE_LIST_ENDPOINT = 'https://pricing.us-east-1.amazonaws.com'
+
+# Index of all offers, with the region index of each service
+OFFER_INDEX_URL = f'{PRICE_LIST_ENDPOINT}/offers/v1.0/aws/index.json'
+
+# SQLite database holding the local Price List, overridable through the environment
+PRICE_LIST_DB_PATH = Path(
+    os.getenv(
+        'COST_ANALYSIS_PRICE_LIST_DB',
+        Path.home() / '.cache' / 'awslabs-cost-analysis-mcp-server' / 'price-list.sqlite3',
+    )
+)
+
+# Offer files of large services are hundreds of megabytes
+DOWNLOAD_TIMEOUT_SECONDS = 600.0
+
+# Term types of an offer file
+TERM_TYPES = ('OnDemand', 'Reserved')
+
+# Rows inserted per batch while streaming an offer file into the database
+INSERT_BATCH_SIZE = 10000
+
+# Product fields that are not attributes but can be filtered on
+PRODUCT_FIELDS = {'sku': 'sku', 'productFamily': 'product_family'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS offers (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    version TEXT NOT NULL,
+    publication_date TEXT,
+    product_count INTEGER NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (service_code, region)
+);
+CREATE TABLE IF NOT EXISTS products (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    product_family TEXT,
+    attributes TEXT NOT NULL,
+    PRIMARY KEY (service_code, region, sku)
+);
+CREATE TABLE IF NOT EXISTS product_attributes (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS product_attributes_lookup
+    ON product_attributes (service_code, region, name, value);
+CREATE TABLE IF NOT EXISTS terms (
+    service_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    term_type TEXT NOT NULL,
+    term_key TEXT NOT NULL,
+    term TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS terms_lookup ON terms (service_code, region, sku);
+"""
+
+
+class PriceListStore:
+    """SQLite-backed store of normalized AWS Price List offers."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the store.
+
+        Args:
+            path: Database file (default: PRICE_LIST_DB_PATH)
+        """
+        self.path = Path(path or PRICE_LIST_DB_PATH)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the database, creating the schema if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.executescript(SCHEMA)
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get_offer(self, service_code: str, region: str) -> Optional[Dict[str, Any]]:
+        """Return the loaded offer of a service in a region.
+
+        Args:
+            service_code: Price List service code (e.g., 'AmazonEC2')
+            region: AWS region code
+
+        Returns:
+            Dictionary with the offer version, publication date, product count and refresh time,
+            or None if the offer is not loaded
+        """
+        if not self.path.exists():
+            return None
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT version, publication_date, product_count, refreshed_at FROM offers '
+                'WHERE service_code = ? AND region = ?',
+                (service_code, region),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'version': row[0],
+            'publication_date': row[1],
+            'product_count': row[2],
+            'refreshed_at': row[3],
+        }
+
+    def list_offers(self) -> List[Dict[str, Any]]:
+        """Return every loaded offer.
+
+        Returns:
+            List of dictionaries with service code, region, version and product count
+        """
+        if not self.path.exists():
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                'SELECT service_code, region, version, product_count FROM offers '
+                'ORDER BY service_code, region'
+            ).fetchall()
+        return [
+            {'service_code': row[0], 'region': row[1], 'version': row[2], 'product_count': row[3]}
+            for row in rows
+        ]
+
+    def load_offer_file(self, service_code: str, region: str, offer_file: Path) -> int:
+        """Replace the stored offer of a service in a region with a downloaded offer file.
+
+        Offer files of large services are gigabytes of JSON, so they are parsed incrementally,
+        one product or one product's terms at a time, and inserted in batches.
+
+        Args:
+            service_code: Price List service code
+            region: AWS region code
+            offer_file: Path of the regional offer file (JSON)
+
+        Returns:
+            Number of products loaded
+        """
+
+        def stream(prefix: str) -> Iterator[Tuple[str, Any]]:
+            with open(offer_file, 'rb') as f:
+                yield from ijson.kvitems(f, prefix, use_float=True)
+
+        def header(field: str) -> Optional[str]:
+            with open(offer_file, 'rb') as f:
+                return next(ijson.items(f, field), None)
+
+        product_count = 0
+        with self._connect() as connection:
+            for table in ('products', 'product_attributes', 'terms', 'offers'):
+                connection.execute(
+                    f'DELETE FROM {table} WHERE service_code = ? AND region = ?',  # nosec B608
+                    (service_code, region),
+                )
+
+            product_rows: List[Tuple[Any, ...]] = []
+            attribute_rows: List[Tuple[Any, ...]] = []
+            for sku, product in stream('products'):
+                attributes = product.get('attributes', {})
+                product_rows.append(
+                    (
+                        service_code,
+                        region,
+                        sku,
+                        product.get('productFamily'),
+                        json.dumps(attributes),
+                    )
+                )
+                attribute_rows.extend(
+                    (service_code, region, sku, name, str(value))
+                    for name, value in attributes.items()
+                )
+                product_count += 1
+                if len(product_rows) >= INSERT_BATCH_SIZE:
+                    connection.executemany(
+                        'INSERT INTO products VALUES (?, ?, ?, ?, ?)', product_rows
+                    )
+                    connection.executemany(
+                        'INSERT INTO product_attributes VALUES (?, ?, ?, ?, ?)', attribute_rows
+                    )
+                    product_rows.clear()
+                    attribute_rows.clear()
+            connection.executemany('INSERT INTO products VALUES (?, ?, ?, ?, ?)', product_rows)
+            connection.executemany(
+                'INSERT INTO product_attributes VALUES (?, ?, ?, ?, ?)', attribute_rows
+            )
+
+            for term_type in TERM_TYPES:
+                connection.executemany(
+                    'INSERT INTO terms VALUES (?, ?, ?, ?, ?, ?)',
+                    (
+                        (service_code, region, sku, term_type, term_key, json.dumps(term))
+                        for sku, sku_terms in stream(f'terms.{term_type}')
+                        for term_key, term in sku_terms.items()
+                    ),
+                )
+
+            connection.execute(
+                'INSERT INTO offers VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    service_code,
+                    region,
+                    header('version') or '',
+                    header('publicationDate'),
+                    product_count,
+                    time.time(),
+                ),
+            )
+        logger.info(f'Loaded {product_count} products of {service_code} in {region}')
+        return product_count
+
+    def query(
+        self,
+        service_code: str,
+        region: str,
+        filters: Optional[List[Dict[str, str]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find the products of an offer matching Price List API style filters.
+
+        Filters use the keys of the API ('Field', 'Type', 'Value'). TERM_MATCH and EQUALS match
+        exactly, CONTAINS matches a substring, and ANY_OF and NONE_OF take comma-separated
+        values. A 'regionCode' filter is implied by the region. Only the first ``limit``
+        products by SKU are read along with their terms.
+
+        Args:
+            service_code: Price List service code
+            region: AWS region code
+            filters: Optional filters
+            limit: Optional maximum number of products to return
+
+        Returns:
+            Price List entries in the shape returned by the Price List API
+        """
+        conditions = ['p.service_code = ?', 'p.region = ?']
+        parameters: List[Any] = [service_code, region]
+        for price_filter in filters or []:
+            field = price_filter['Field']
+            match_type = price_filter.get('Type', 'TERM_MATCH')
+            value = price_filter['Value']
+            if field == 'regionCode':
+                continue
+
+            if match_type == 'CONTAINS':
+                values = [f'%{value}%']
+                predicate = 'LIKE ?'
+            elif match_type in ('ANY_OF', 'NONE_OF'):
+                values = [v.strip() for v in value.split(',')]
+                predicate = f'IN ({", ".join("?" for _ in values)})'
+            else:
+                values = [value]
+                predicate = '= ?'
+
+            negate = 'NOT ' if match_type == 'NONE_OF' else ''
+            if field in PRODUCT_FIELDS:
+                conditions.append(f'{negate}p.{PRODUCT_FIELDS[field]} {predicate}')
+            else:
+                conditions.append(
+                    f'{negate}EXISTS (SELECT 1 FROM product_attributes a '
+                    'WHERE a.service_code = p.service_code AND a.region = p.region '
+                    f'AND a.sku = p.sku AND a.name = ? AND a.value {predicate})'
+                )
+                parameters.append(field)
+            parameters.extend(values)
+
+        offer = self.get_offer(service_code, region) or {}
+        with self._connect() as connection:
+            # Select the page of products first, so only its terms are joined and decoded
+            rows = connection.execute(
+                'WITH page AS (SELECT p.sku, p.product_family, p.attributes FROM products p '  # nosec B608
+                f'WHERE {" AND ".join(conditions)} ORDER BY p.sku LIMIT ?) '
+                'SELECT page.sku, page.product_family, page.attributes, '
+                't.term_type, t.term_key, t.term FROM page LEFT JOIN terms t '
+                'ON t.service_code = ? AND t.region = ? AND t.sku = page.sku ORDER BY page.sku',
+                [*parameters, -1 if limit is None else limit, service_code, region],
+            ).fetchall()
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        for sku, product_family, attributes, term_type, term_key, term in rows:
+            entry = entries.get(sku)
+            if entry is None:
+                entry = entries[sku] = {
+                    'product': {
+                        'productFamily': product_family,
+                        'attributes': json.loads(attributes),
+                        'sku': sku,
+                    },
+                    'serviceCode': service_code,
+                    'terms': {},
+                    'version': offer.get('version'),
+                    'publicationDate': offer.get('publication_date'),
+                }
+            if term_type is not None:
+                entry['terms'].setdefault(term_type, {})[term_key] = json.loads(term)
+        return list(entries.values())
+
+
+def _offer_version(offer_url: str) -> str:
+    """Extract the offer version from a regional offer URL.
+
+    The URL has the form /offers/v1.0/aws/<service>/<version>/<region>/index.json.
+    """
+    parts = offer_url.strip('/').split('/')
+    return parts[-3] if len(parts) >= 3 else offer_url
+
+
+async def _download(client: AsyncClient, url: str, destination: Path) -> None:
+    """Stream a file to disk so large offer files are never held in memory as text."""
+    async with client.stream('GET', url, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        response.raise_for_status()
+        with open(destination, 'wb') as f:
+            async for chunk in response.aiter_bytes():
+                f.write(chunk)
+
+
+async def refresh_offers(
+    store: PriceListStore,
+    service_code: str,
+    regions: List[str],
+    client: Optional[AsyncClient] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Download the offers of a service in the given regions when their version changed.
+
+    Args:
+        store: Store to update
+        service_code: Price List service code (e.g., 'AmazonEC2')
+        regions: AWS region codes
+        client: Optional HTTP client to reuse
+
+    Returns:
+        Mapping of each region to its refresh status ('updated', 'up_to_date' or
+        'not_available'), offer version and product count
+
+    Raises:
+        ValueError: If the service code is not in the offer index
+    """
+    own_client = client is None
+    client = client or AsyncClient(follow_redirects=True)
+    try:
+        response = await client.get(OFFER_INDEX_URL, timeout=30.0)
+        response.raise_for_status()
+        offers = response.json().get('offers', {})
+        if service_code not in offers:
+            raise ValueError(f'Unknown Price List service code: {service_code}')
+
+        region_index_url = PRICE_LIST_ENDPOINT + offers[service_code]['currentRegionIndexUrl']
+        response = await client.get(region_index_url, timeout=30.0)
+        response.raise_for_status()
+        region_index = response.json().get('regions', {})
+
+        results = {}
+        for region in regions:
+            if region not in region_index:
+                results[region] = {'status': 'not_available'}
+                continue
+
+            offer_url = region_index[region]['currentVersionUrl']
+            version = _offer_version(offer_url)
+            stored = await asyncio.to_thread(store.get_offer, service_code, region)
+            if stored and stored['version'] == version:
+                results[region] = {
+                    'status': 'up_to_date',
+                    'version': version,
+                    'product_count': stored['product_count'],
+                }
+                continue
+
+            logger.info(f'Downloading {service_code} offer {version} for {region}')
+            with tempfile.TemporaryDirectory() as temp_dir:
+                offer_file = Path(temp_dir) / 'index.json'
+                await _download(client, PRICE_LIST_ENDPOINT + offer_url, offer_file)
+                product_count = await asyncio.to_thread(
+                    store.load_offer_file, service_code, region, offer_file
+                )
+            results[region] = {
+                'status': 'updated',
+                'version': version,
+                'product_count': product_count,
+            }
+        return results
+    finally:
+        if own_client:
+            await client.aclose()
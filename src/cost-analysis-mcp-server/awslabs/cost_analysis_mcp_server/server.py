@@ -14,17 +14,20 @@
 This server provides tools for analyzing AWS service costs across different user tiers.
 """
 
+import asyncio
 import boto3
 import logging
 import os
+import threading
 from awslabs.cost_analysis_mcp_server.cdk_analyzer import analyze_cdk_project
+from awslabs.cost_analysis_mcp_server.price_list_parser import summarize_price_list
+from awslabs.cost_analysis_mcp_server.price_list_store import PriceListStore, refresh_offers
 from awslabs.cost_analysis_mcp_server.static.patterns import BEDROCK
 from awslabs.cost_analysis_mcp_server.terraform_analyzer import analyze_terraform_project
-from bs4 import BeautifulSoup
-from httpx import AsyncClient
+from awslabs.cost_analysis_mcp_server.web_pricing import fetch_pricing_text
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 
 # Set up logging
@@ -103,6 +106,69 @@ mcp = FastMCP(
 profile_name = os.getenv('AWS_PROFILE', 'default')
 logger.info(f'Using AWS profile {profile_name}')
 
+# Maximum number of products get_pricing_from_api reads, across all result pages
+MAX_API_RESULTS = int(os.getenv('COST_ANALYSIS_MAX_API_RESULTS', '10000'))
+
+# Number of prices or groups get_pricing_from_api returns when top_n is not set
+DEFAULT_RESULT_ROWS = 100
+
+# Pricing clients by profile; boto3 clients are thread safe and expensive to create
+_pricing_clients: Dict[str, Any] = {}
+_pricing_clients_lock = threading.Lock()
+
+# Local copy of the AWS Price List, used for the offers loaded with refresh_price_list
+price_list_store = PriceListStore()
+
+
+def get_pricing_client(profile: str) -> Any:
+    """Return the cached AWS Price List API client of a profile, creating it on first use.
+
+    Args:
+        profile: AWS profile name
+
+    Returns:
+        boto3 pricing client
+    """
+    with _pricing_clients_lock:
+        if profile not in _pricing_clients:
+            _pricing_clients[profile] = boto3.Session(profile_name=profile).client(
+                'pricing', region_name='us-east-1'
+            )
+        return _pricing_clients[profile]
+
+
+def get_all_products(
+    pricing_client: Any,
+    service_code: str,
+    api_filters: List[Dict[str, str]],
+    max_results: Optional[int] = None,
+) -> Tuple[List[Any], bool]:
+    """Fetch every page of a Price List API query.
+
+    Args:
+        pricing_client: boto3 pricing client
+        service_code: The service code
+        api_filters: Filters in the format of the API
+        max_results: Maximum number of products to return (default: MAX_API_RESULTS)
+
+    Returns:
+        Tuple of the products and whether more products were available than returned
+    """
+    max_results = max_results or MAX_API_RESULTS
+    price_list: List[Any] = []
+    next_token = None
+    while True:
+        kwargs = {'ServiceCode': service_code, 'Filters': api_filters, 'MaxResults': 100}
+        if next_token:
+            kwargs['NextToken'] = next_token
+        response = pricing_client.get_products(**kwargs)
+        price_list.extend(response['PriceList'])
+        next_token = response.get('NextToken')
+        if not next_token:
+            return price_list, False
+        if len(price_list) >= max_results:
+            return price_list[:max_results], True
+
 
 @mcp.tool(
     name='analyze_cdk_project',
@@ -170,7 +236,7 @@ async def analyze_terraform_project_wrapper(project_path: str, ctx: Context) ->
 
 @mcp.tool(
     name='get_pricing_from_web',
-    description='Get pricing information from AWS pricing webpage. Service codes typically use lowercase with hyphens format (e.g., "opensearch-service" for both OpenSearch and OpenSearch Serverless, "api-gateway", "lambda"). Note that some services like OpenSearch Serverless are part of broader service codes (use "opensearch-service" not "opensearch-serverless"). Important: Web service codes differ from API service codes (e.g., use "opensearch-service" for web but "AmazonES" for API). When retrieving foundation model pricing, always use the latest models for comparison rather than specific named ones that may become outdated.',
+    description='Get pricing information from AWS pricing webpage. Service codes typically use lowercase with hyphens format (e.g., "opensearch-service" for both OpenSearch and OpenSearch Serverless, "api-gateway", "lambda"). Note that some services like OpenSearch Serverless are part of broader service codes (use "opensearch-service" not "opensearch-serverless"). Important: Web service codes differ from API service codes (e.g., use "opensearch-service" for web but "AmazonES" for API). When retrieving foundation model pricing, always use the latest models for comparison rather than specific named ones that may become outdated. Only the pricing tables of the page, and other lines quoting prices, are returned; pages are cached per service for a day.',
 )
 async def get_pricing_from_web(service_code: str, ctx: Context) -> Optional[Dict]:
     """Get pricing information from AWS pricing webpage.
@@ -187,39 +253,20 @@ async def get_pricing_from_web(service_code: str, ctx: Context) -> Optional[Dict
             if service_code.startswith(prefix):
                 service_code = service_code[len(prefix) :].lower()
         service_code = service_code.lower().strip()
-        url = f'https://aws.amazon.com/{service_code}/pricing'
-        async with AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True, timeout=10.0)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Remove script and style elements
-            for script in soup(['script', 'style']):
-                script.decompose()
-
-            # Extract text content
-            text = soup.get_text()
-
-            # Break into lines and remove leading and trailing space on each
-            lines = (line.strip() for line in text.splitlines())
+        page = await fetch_pricing_text(service_code)
 
-            # Break multi-headlines into a line each
-            chunks = (phrase.strip() for line in lines for phrase in line.split('  '))
-
-            # Drop blank lines
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-
-            result = {
-                'status': 'success',
-                'service_name': service_code,
-                'data': text,
-                'message': f'Retrieved pricing for {service_code} from AWS Pricing url',
-            }
+        result = {
+            'status': 'success',
+            'service_name': service_code,
+            'data': page['text'],
+            'message': f'Retrieved pricing for {service_code} from AWS Pricing url',
+            'url': page['url'],
+            'cached': page['cached'],
+        }
 
-            # No need to store in context, just return the result
+        # No need to store in context, just return the result
 
-            return result
+        return result
 
     except Exception as e:
         await ctx.error(f'Failed to get pricing from web: {e}')
@@ -251,10 +298,27 @@ async def get_pricing_from_web(service_code: str, ctx: Context) -> Optional[Dict
         }
     ]
     Details of the filter can be found at https://docs.aws.amazon.com/aws-cost-management/latest/APIReference/API_pricing_Filter.html
+
+    Results are flattened into one row per price: the product attributes, the term type, the
+    unit and the unit price as a number, sorted by price. Attributes shared by every row are
+    returned once in 'common_attributes'. All result pages are read, so keep the results small:
+    - fields: only return these attributes (e.g., ["instanceType", "vcpu", "memory"])
+    - group_by: summarize prices by an attribute (e.g., "instanceType", "usagetype") with the
+      price range of each group instead of returning every price
+    - top_n and sort_order: return the N cheapest ("asc") or most expensive ("desc") rows or groups
+    - term_type: "OnDemand" (default), "Reserved", or null for all terms
     """,
 )
 async def get_pricing_from_api(
-    service_code: str, region: str, ctx: Context, filters: Optional[PricingFilters] = None
+    service_code: str,
+    region: str,
+    ctx: Context,
+    filters: Optional[PricingFilters] = None,
+    fields: Optional[List[str]] = None,
+    group_by: Optional[str] = None,
+    top_n: Optional[int] = None,
+    sort_order: Literal['asc', 'desc'] = 'asc',
+    term_type: Optional[str] = 'OnDemand',
 ) -> Optional[Dict]:
     """Get pricing information from AWS Price List API. If the API request fails in the initial attempt, retry by modifying the service_code.
 
@@ -263,30 +327,41 @@ async def get_pricing_from_api(
         region: AWS region (e.g., 'us-west-2')
         filters: Optional list of filter dictionaries in format {'Field': str, 'Type': str, 'Value': str}
         ctx: MCP context for logging and state management
+        fields: Optional attributes to keep in each price row
+        group_by: Optional attribute to summarize the prices by
+        top_n: Optional number of rows or groups to return
+        sort_order: 'asc' for the cheapest first or 'desc' for the most expensive first
+        term_type: Only include terms of this type, or None for all
 
     Returns:
         Dictionary containing pricing information from AWS Pricing API
     """
     try:
-        pricing_client = boto3.Session(profile_name=profile_name).client(
-            'pricing', region_name='us-east-1'
-        )
-
         # Start with the region filter
         region_filter = PricingFilter(field='regionCode', type='TERM_MATCH', value=region)
-        api_filters = [region_filter.dict()]
-
-        # Add any additional filters if provided
-        if filters and filters.filters:
-            api_filters.extend([f.dict() for f in filters.filters])
-
-        response = pricing_client.get_products(
-            ServiceCode=service_code,
-            Filters=api_filters,
-            MaxResults=100,
-        )
+        api_filters = [
+            {'Field': f.field, 'Type': f.type, 'Value': f.value}
+            for f in [region_filter] + (filters.filters if filters else [])
+        ]
+
+        # Answer from the local Price List when the offer has been loaded
+        offer = await asyncio.to_thread(price_list_store.get_offer, service_code, region)
+        if offer:
+            # One product past the limit tells whether the results were truncated
+            price_list = await asyncio.to_thread(
+                price_list_store.query, service_code, region, api_filters, MAX_API_RESULTS + 1
+            )
+            products_truncated = len(price_list) > MAX_API_RESULTS
+            price_list = price_list[:MAX_API_RESULTS]
+            source = 'local Price List'
+        else:
+            pricing_client = get_pricing_client(profile_name)
+            price_list, products_truncated = await asyncio.to_thread(
+                get_all_products, pricing_client, service_code, api_filters
+            )
+            source = 'AWS Pricing API'
 
-        if not response['PriceList']:
+        if not price_list:
             await ctx.error(f'Pricing API returned empty results for service code: {service_code}')
             return {
                 'status': 'error',
@@ -300,12 +375,36 @@ async def get_pricing_from_api(
                 },
             }
 
+        summary = await asyncio.to_thread(
+            summarize_price_list,
+            price_list,
+            fields=fields,
+            group_by=group_by,
+            top_n=top_n,
+            sort_order=sort_order,
+            term_type=term_type,
+            max_rows=DEFAULT_RESULT_ROWS,
+        )
+
         result = {
             'status': 'success',
             'service_name': service_code,
-            'data': response['PriceList'],
-            'message': f'Retrieved pricing for {service_code} in {region} from AWS Pricing API',
+            **summary,
+            'products_truncated': products_truncated,
+            'message': f'Retrieved pricing for {service_code} in {region} from {source}',
+            'source': source,
         }
+        if offer:
+            result['offer_version'] = offer['version']
+        if products_truncated:
+            result['message'] += (
+                f' (first {MAX_API_RESULTS} products, add filters to narrow the results)'
+            )
+        if summary['truncated']:
+            result['message'] += (
+                f'; returned {len(summary["data"])} of the results, use filters, group_by or '
+                'top_n to select the rest'
+            )
 
         # No need to store in context, just return the result
 
@@ -326,6 +425,41 @@ async def get_pricing_from_api(
         }
 
 
+@mcp.tool(
+    name='refresh_price_list',
+    description="""Download the AWS Price List of a service in one or more regions into the local Price List.
+
+    Once loaded, get_pricing_from_api answers queries for the service and region from the local
+    copy, with complete results and without calling the AWS Pricing API. Use the same service
+    codes as get_pricing_from_api (e.g., "AmazonEC2", "AmazonES"). Refreshing only downloads the
+    offer of a region when AWS published a new version, so it is cheap to call again.
+    """,
+)
+async def refresh_price_list(service_code: str, regions: List[str], ctx: Context) -> Dict:
+    """Load or update the local AWS Price List of a service.
+
+    Args:
+        service_code: The service code (e.g., 'AmazonEC2')
+        regions: AWS regions (e.g., ['us-east-1', 'eu-west-1'])
+        ctx: MCP context for logging and state management
+
+    Returns:
+        Dictionary with the refresh status, offer version and product count of each region
+    """
+    try:
+        results = await refresh_offers(price_list_store, service_code, regions)
+    except Exception as e:
+        await ctx.error(f'Failed to refresh the Price List of {service_code}: {e}')
+        return {'status': 'error', 'service_code': service_code, 'message': str(e)}
+
+    return {
+        'status': 'success',
+        'service_code': service_code,
+        'regions': results,
+        'message': f'Refreshed the local Price List of {service_code}',
+    }
+
+
 @mcp.tool(
     name='get_bedrock_patterns',
     description='Get architecture patterns for Amazon Bedrock applications, including component relationships and cost considerations',
@@ -15,16 +15,112 @@ This module provides functionality for analyzing Terraform projects to identify
 and their configurations.
 """
 
+import asyncio
+import json
 import logging
 import re
+from awslabs.cost_analysis_mcp_server.file_analysis import analyze_files, find_source_files
+from awslabs.cost_analysis_mcp_server.hcl_parser import find_blocks, parse_blocks
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Files analyzed in a Terraform project
+TERRAFORM_FILE_PATTERNS = ('*.tf', '*.tf.json', '*.hcl')
+
+# Version of the results of parse_terraform_file; a new version ignores cached results
+PARSER_VERSION = '1'
+
+# Resource type prefixes of the AWS providers
+AWS_PROVIDER_PREFIXES = ('aws_', 'awscc_')
+
+
+def _aws_resource(kind: str, resource_type: str) -> Optional[Dict[str, str]]:
+    """Describe a resource or data source of an AWS provider, or None for other providers."""
+    for prefix in AWS_PROVIDER_PREFIXES:
+        if resource_type.startswith(prefix):
+            return {
+                'kind': kind,
+                'type': resource_type,
+                'provider': prefix.rstrip('_'),
+                # The main service name (e.g., 'lambda' from 'aws_lambda_function')
+                'service': resource_type[len(prefix) :].split('_')[0],
+            }
+    return None
+
+
+def _parse_terraform_json(content: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Parse a Terraform JSON configuration (.tf.json)."""
+    config = json.loads(content)
+    sections = config if isinstance(config, list) else [config]
+    resources = []
+    modules = []
+    for section in sections:
+        for kind in ('resource', 'data'):
+            for entry in _as_list(section.get(kind)):
+                for resource_type in entry:
+                    resource = _aws_resource(kind, resource_type)
+                    if resource:
+                        resources.append(resource)
+        for entry in _as_list(section.get('module')):
+            for name, module in entry.items():
+                for block in _as_list(module):
+                    if isinstance(block.get('source'), str):
+                        variables = {k: v for k, v in block.items() if k != 'source'}
+                        modules.append(
+                            {'name': name, 'source': block['source'], 'variables': variables}
+                        )
+    return {'resources': resources, 'modules': modules}
+
+
+def _as_list(value: Any) -> List[Dict[str, Any]]:
+    """Return the objects of a JSON configuration value, which may be an object or a list."""
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+def parse_terraform_file(content: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Parse the AWS resources, data sources and module calls of a Terraform file.
+
+    Args:
+        content: Content of a .tf, .tf.json or .hcl file
+
+    Returns:
+        Dictionary with the AWS 'resources' (kind, type, provider and service) and the
+        'modules' called (name, source and input variables)
+    """
+    if content.lstrip().startswith(('{', '[')):
+        return _parse_terraform_json(content)
+
+    blocks = parse_blocks(content)
+    resources = []
+    for kind in ('resource', 'data'):
+        for block in find_blocks(blocks, kind, label_count=2):
+            resource = _aws_resource(kind, block['labels'][0])
+            if resource:
+                resources.append(resource)
+
+    modules = []
+    for block in find_blocks(blocks, 'module', label_count=1):
+        attributes = block['attributes']
+        if 'source' in attributes:
+            variables = {k: v for k, v in attributes.items() if k != 'source'}
+            name = block['labels'][0]
+            modules.append({'name': name, 'source': attributes['source'], 'variables': variables})
+    return {'resources': resources, 'modules': modules}
+
+
+def _is_local_source(source: str) -> bool:
+    """Return whether a module source is a local path."""
+    return source.startswith('./') or source.startswith('../')
+
 
 class TerraformAnalyzer:
     """Analyzes Terraform projects to identify AWS services and configurations."""
@@ -36,15 +132,110 @@ class TerraformAnalyzer:
             project_path: Path to the Terraform project root
         """
         self.project_path = Path(project_path)
+        self._parsed: Dict[Path, Dict[str, Any]] = {}
+        self._local_modules: Dict[Path, List[Dict[str, Any]]] = {}
+
+    def _parse(self, file_path: Path) -> Dict[str, Any]:
+        """Return the parse result of a file, parsing it if the project analysis did not."""
+        if file_path not in self._parsed:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self._parsed[file_path] = parse_terraform_file(f.read())
+        return self._parsed[file_path]
+
+    def _local_module_services(
+        self, module_path: Path, visiting: FrozenSet[Path] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Find the services of a local module, including the modules it calls.
+
+        Each module directory is analyzed once, however often it is called.
+
+        Args:
+            module_path: Directory of the module
+            visiting: Modules being analyzed up the call chain, to stop at cycles
+
+        Returns:
+            List of services of the module
+        """
+        module_path = module_path.resolve()
+        if module_path in self._local_modules:
+            return self._local_modules[module_path]
+        if module_path in visiting or not module_path.is_dir():
+            return []
+
+        services = []
+        for pattern in TERRAFORM_FILE_PATTERNS:
+            for file_path in sorted(module_path.glob(pattern)):
+                try:
+                    services.extend(
+                        self._services_from_result(
+                            self._parse(file_path), module_path, visiting | {module_path}
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(f'Error analyzing local module file {file_path}: {e}')
+        self._local_modules[module_path] = services
+        return services
+
+    def _services_from_result(
+        self,
+        result: Dict[str, Any],
+        base_dir: Path,
+        visiting: FrozenSet[Path] = frozenset(),
+    ) -> List[Dict[str, Any]]:
+        """Turn the parse result of a file into services.
+
+        Args:
+            result: Result of parse_terraform_file
+            base_dir: Directory of the file, which local module sources are relative to
+            visiting: Local modules being analyzed up the call chain
+
+        Returns:
+            List of services of the file's resources, data sources and module calls
+        """
+        services = [
+            {
+                'name': resource['service'],
+                'source': 'terraform',
+                'provider': resource['provider'],
+                'configurations': [],
+            }
+            for resource in result.get('resources', [])
+        ]
+        for module in result.get('modules', []):
+            found_services = self._find_aws_services_from_module(
+                module['source'], module['variables'], base_dir, visiting
+            )
+            if found_services:
+                services.extend(found_services)
+            else:
+                # If we couldn't find any services, add a generic module entry
+                logger.debug(f'Could not find AWS services for module: {module["name"]}')
+                services.append(
+                    {
+                        'name': module['name'],
+                        'source': 'terraform-module',
+                        'provider': 'unknown',
+                        'configurations': [],
+                        'module_name': module['name'],
+                        'module_source': module['source'],
+                    }
+                )
+        return services
 
     def _find_aws_services_from_module(
-        self, source: str, variables: Dict[str, Any]
+        self,
+        source: str,
+        variables: Dict[str, Any],
+        base_dir: Optional[Path] = None,
+        visiting: FrozenSet[Path] = frozenset(),
     ) -> List[Dict[str, Any]]:
         """Find AWS services used by a module based on its source and variables.
 
         Args:
             source: The module source path or URL
             variables: Dictionary of input variables for the module
+            base_dir: Directory local module sources are relative to (default: project root)
+            visiting: Local modules being analyzed up the call chain
 
         Returns:
             List of found AWS services
@@ -132,112 +323,25 @@ class TerraformAnalyzer:
                     )
 
         # Handle local modules
-        if not found_services and (source.startswith('./') or source.startswith('../')):
-            # For local modules, we need to resolve the path relative to the project root
-            try:
-                # Resolve the local module path
-                module_path = self.project_path / source
-                if module_path.exists() and module_path.is_dir():
-                    logger.info(f'Found local module directory: {module_path}')
-
-                    # Analyze the local module directory
-                    local_analyzer = TerraformAnalyzer(str(module_path))
-                    local_services = []
-
-                    # Get all Terraform files in the module directory
-                    local_files = list(module_path.glob('*.tf')) + list(module_path.glob('*.hcl'))
-                    for local_file in local_files:
-                        try:
-                            file_services = local_analyzer._analyze_file(local_file)
-                            if file_services:
-                                local_services.extend(file_services)
-                        except Exception as e:
-                            logger.warning(f'Error analyzing local module file {local_file}: {e}')
-
-                    # Extract service names from the local module
-                    for service in local_services:
-                        if service['source'] == 'terraform' and service['provider'] == 'aws':
-                            logger.info(f'Found AWS service in local module: {service["name"]}')
-                            found_services.append(
-                                {
-                                    'name': service['name'],
-                                    'source': 'terraform-module',
-                                    'provider': 'aws',
-                                    'configurations': [],
-                                    'module_source': source,
-                                }
-                            )
-            except Exception as e:
-                logger.warning(f'Error analyzing local module at {source}: {e}')
+        if not found_services and _is_local_source(source):
+            # Local module paths are relative to the directory of the calling file
+            module_path = (base_dir or self.project_path) / source
+            seen = set()
+            for service in self._local_module_services(module_path, visiting):
+                if service['provider'] == 'aws' and service['name'] not in seen:
+                    seen.add(service['name'])
+                    found_services.append(
+                        {
+                            'name': service['name'],
+                            'source': 'terraform-module',
+                            'provider': 'aws',
+                            'configurations': [],
+                            'module_source': source,
+                        }
+                    )
 
         return found_services
 
-    def _extract_module_info(
-        self, content: str, start_line_idx: int
-    ) -> Tuple[Optional[str], Dict[str, Any]]:
-        """Extract module source and variables from module block.
-
-        Args:
-            content: The file content as a list of lines
-            start_line_idx: The index of the line where the module block starts
-
-        Returns:
-            Tuple of (source, variables_dict)
-        """
-        lines = content.split('\n')
-        source = None
-        variables = {}
-
-        # Find the opening brace
-        brace_count = 0
-        in_module_block = False
-
-        for i in range(start_line_idx, len(lines)):
-            line = lines[i].strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-
-            # Count braces to track when we're inside the module block
-            if '{' in line:
-                brace_count += line.count('{')
-                in_module_block = True
-
-            if '}' in line:
-                brace_count -= line.count('}')
-
-            # We're inside the module block
-            if in_module_block and brace_count > 0:
-                # Look for source attribute
-                source_match = re.match(r'source\s*=\s*"([^"]+)"', line)
-                if source_match:
-                    source = source_match.group(1)
-                    logger.info(f'Found module source: {source}')
-
-                # Look for variable assignments
-                var_match = re.match(r'(\w+)\s*=\s*(.+)', line)
-                if var_match and var_match.group(1) != 'source':
-                    var_name = var_match.group(1)
-                    var_value = var_match.group(2).strip()
-
-                    # Remove trailing comma if present
-                    if var_value.endswith(','):
-                        var_value = var_value[:-1]
-
-                    # Remove quotes if present
-                    if var_value.startswith('"') and var_value.endswith('"'):
-                        var_value = var_value[1:-1]
-
-                    variables[var_name] = var_value
-                    logger.info(f'Found module variable: {var_name} = {var_value}')
-
-            # If we've exited the module block, we're done
-            if in_module_block and brace_count == 0:
-                break
-
-        return source, variables
-
     def _analyze_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """Analyze a file for AWS service usage.
 
@@ -247,102 +351,12 @@ class TerraformAnalyzer:
         Returns:
             List of identified AWS services and their configurations
         """
-        services = []
-        logger.info(f'Analyzing file: {file_path}')
-
+        logger.debug(f'Analyzing file: {file_path}')
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                logger.info('Successfully read file content')
-
-            # Process line by line to handle declarations
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-
-                # Check for provider blocks
-                if 'provider "aws"' in line or 'provider "awscc"' in line:
-                    provider_type = 'aws' if 'provider "aws"' in line else 'awscc'
-                    logger.info(f'Found {provider_type.upper()} provider declaration')
-                    continue
-
-                # Check for resource declarations
-                resource_match = re.match(r'resource\s+"(aws_|awscc_)(\w+)"', line)
-                if resource_match:
-                    provider = resource_match.group(1).rstrip('_')
-                    service_name = resource_match.group(2)
-                    # Extract the main service name (e.g., 'lambda' from 'lambda_function')
-                    main_service = service_name.split('_')[0]
-                    logger.info(
-                        f'Found {provider.upper()} service in resource declaration: {main_service}'
-                    )
-                    services.append(
-                        {
-                            'name': main_service,
-                            'source': 'terraform',
-                            'provider': provider,
-                            'configurations': [],
-                        }
-                    )
-                    continue
-
-                # Check for data source declarations
-                data_match = re.match(r'data\s+"(aws_|awscc_)(\w+)"', line)
-                if data_match:
-                    provider = data_match.group(1).rstrip('_')
-                    service_name = data_match.group(2)
-                    # Extract the main service name
-                    main_service = service_name.split('_')[0]
-                    logger.info(
-                        f'Found {provider.upper()} service in data source declaration: {main_service}'
-                    )
-                    services.append(
-                        {
-                            'name': main_service,
-                            'source': 'terraform',
-                            'provider': provider,
-                            'configurations': [],
-                        }
-                    )
-                    continue
-
-                # Check for module blocks
-                module_match = re.match(r'module\s+"([^"]+)"\s*\{', line)
-                if module_match:
-                    module_name = module_match.group(1)
-                    logger.info(f'Found module declaration: {module_name}')
-
-                    # Extract module source and variables
-                    source, variables = self._extract_module_info(content, i)
-
-                    if source:
-                        # Find AWS services from module source and variables
-                        found_services = self._find_aws_services_from_module(source, variables)
-
-                        if found_services:
-                            services.extend(found_services)
-                        else:
-                            # If we couldn't find any services, add a generic module entry
-                            logger.info(f'Could not find AWS services for module: {module_name}')
-                            services.append(
-                                {
-                                    'name': module_name,
-                                    'source': 'terraform-module',
-                                    'provider': 'unknown',
-                                    'configurations': [],
-                                    'module_name': module_name,
-                                    'module_source': source,
-                                }
-                            )
-
+            return self._services_from_result(self._parse(file_path), file_path.parent)
         except Exception as e:
             logger.warning(f'Error analyzing file {file_path}: {e}')
-
-        return services
+            return []
 
     async def analyze_project(self) -> Dict[str, Any]:
         """Analyze the Terraform project to identify AWS services and their configurations.
@@ -369,26 +383,36 @@ class TerraformAnalyzer:
                 },
             }
 
-        all_services = []
-
-        # Get all Terraform files in the project
-        source_files = list(self.project_path.rglob('*.tf')) + list(
-            self.project_path.rglob('*.hcl')
+        # Get all Terraform files in the project, skipping .terraform and other cache and
+        # vendored directories, and parse the new and changed ones on a worker pool
+        source_files = await asyncio.to_thread(
+            find_source_files, self.project_path, TERRAFORM_FILE_PATTERNS
+        )
+        results, cached_files = await analyze_files(
+            self.project_path, source_files, parse_terraform_file, 'terraform', PARSER_VERSION
         )
-        logger.info(f'Found source files: {source_files}')
+        self._parsed.update(results)
+
+        # Directories called as local modules are counted through their callers only
+        called_modules = {
+            (file_path.parent / module['source']).resolve()
+            for file_path, result in results.items()
+            for module in result.get('modules', [])
+            if _is_local_source(module['source'])
+        }
 
+        all_services = []
         for file_path in source_files:
-            logger.info(f'Analyzing file: {file_path}')
+            if file_path not in results or file_path.parent.resolve() in called_modules:
+                continue
             try:
-                file_services = self._analyze_file(file_path)
-                if file_services:
-                    logger.info(f'Found services in {file_path}: {file_services}')
-                    all_services.extend(file_services)
+                all_services.extend(
+                    self._services_from_result(results[file_path], file_path.parent)
+                )
             except Exception as e:
                 logger.error(f'Error analyzing {file_path}: {e}')
 
-        # Debug logging for all services
-        logger.info(f'All services before deduplication: {all_services}')
+        logger.debug(f'All services before deduplication: {all_services}')
 
         # Deduplicate services by name and source
         seen_services = set()
@@ -412,6 +436,8 @@ class TerraformAnalyzer:
                 'services': unique_services,
                 'project_path': str(self.project_path),
                 'analysis_type': 'terraform',
+                'file_count': len(results),
+                'cached_file_count': cached_files,
             },
         }
 
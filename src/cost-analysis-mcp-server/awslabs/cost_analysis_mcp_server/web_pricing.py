@@ -0,0 +1,192 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""awslabs MCP Cost Analysis pricing page fetcher.
+
+This module fetches AWS pricing pages with a shared HTTP client, extracts the pricing tables
+(and the lines quoting prices) off the event loop, and caches the extracted text per service,
+in memory and on disk, for a configurable time.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from httpx import AsyncClient
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the extracted pricing text of each service, overridable through the
+# environment
+WEB_PRICING_CACHE_DIR = Path(
+    os.getenv(
+        'COST_ANALYSIS_WEB_CACHE_DIR',
+        Path.home() / '.cache' / 'awslabs-cost-analysis-mcp-server' / 'web-pricing',
+    )
+)
+
+# Time the extracted pricing text of a service is reused, in seconds
+WEB_PRICING_TTL_SECONDS = int(os.getenv('COST_ANALYSIS_WEB_CACHE_TTL', str(24 * 60 * 60)))
+
+# Elements that never hold pricing information
+IGNORED_ELEMENTS = ['script', 'style', 'noscript', 'svg', 'nav', 'header', 'footer']
+
+# Headings used to label the tables that follow them
+HEADING_ELEMENTS = ['h1', 'h2', 'h3', 'h4', 'h5']
+
+# Amounts such as $0.20 or 0.0000166667 USD
+PRICE_PATTERN = re.compile(r'\$\s?\d|\d\s?USD\b')
+
+# Extracted pricing text by service, with the time it was fetched
+_memory_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Shared HTTP client and the event loop it belongs to
+_client: Optional[Tuple[asyncio.AbstractEventLoop, AsyncClient]] = None
+
+
+def get_http_client() -> AsyncClient:
+    """Return the HTTP client shared by all pricing page requests of the running event loop.
+
+    Returns:
+        HTTP client keeping connections to the pricing pages alive between requests
+    """
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client[0] is not loop or _client[1].is_closed:
+        _client = (loop, AsyncClient(follow_redirects=True, timeout=10.0))
+    return _client[1]
+
+
+def _clean_lines(text: str) -> List[str]:
+    """Split text into stripped, non-empty lines, breaking multi-headlines into a line each."""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split('  '))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _table_text(table: Any) -> List[str]:
+    """Render a table as one line per row with its cells separated by ' | '."""
+    rows = []
+    for row in table.find_all('tr'):
+        cells = [
+            ' '.join(cell.get_text(' ', strip=True).split()) for cell in row.find_all(['th', 'td'])
+        ]
+        if any(cells):
+            rows.append(' | '.join(cells))
+    return rows
+
+
+def extract_pricing_text(html: str) -> str:
+    """Extract the pricing information of a pricing page.
+
+    The pricing tables are rendered one row per line under the heading preceding them,
+    followed by the other lines of the page quoting a price. Pages without tables fall back to
+    their full text.
+
+    Args:
+        html: Pricing page HTML
+
+    Returns:
+        Extracted text
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(IGNORED_ELEMENTS):
+        element.decompose()
+
+    sections = []
+    tables = soup.find_all('table')
+    for table in tables:
+        rows = _table_text(table)
+        if not rows:
+            continue
+        heading = table.find_previous(HEADING_ELEMENTS)
+        title = heading.get_text(' ', strip=True) if heading else ''
+        sections.append('\n'.join(([f'## {title}'] if title else []) + rows))
+
+    if not sections:
+        return '\n'.join(_clean_lines(soup.get_text()))
+
+    for table in tables:
+        table.decompose()
+    price_lines = [line for line in _clean_lines(soup.get_text()) if PRICE_PATTERN.search(line)]
+    if price_lines:
+        sections.append('\n'.join(['## Other prices'] + list(dict.fromkeys(price_lines))))
+    return '\n\n'.join(sections)
+
+
+def _cache_path(service_code: str) -> Path:
+    """Return the cache file of a service."""
+    return WEB_PRICING_CACHE_DIR / f'{hashlib.sha256(service_code.encode()).hexdigest()}.json'
+
+
+def _load_cached(service_code: str) -> Optional[Dict[str, Any]]:
+    """Return the cached pricing of a service if it is still fresh."""
+    now = time.time()
+    cached = _memory_cache.get(service_code)
+    if cached is None:
+        try:
+            entry = json.loads(_cache_path(service_code).read_text(encoding='utf-8'))
+            cached = (entry['fetched_at'], entry)
+        except (OSError, ValueError, KeyError):
+            return None
+        _memory_cache[service_code] = cached
+    fetched_at, entry = cached
+    if now - fetched_at > WEB_PRICING_TTL_SECONDS:
+        return None
+    return entry
+
+
+def _store(service_code: str, entry: Dict[str, Any]) -> None:
+    """Cache the pricing of a service in memory and on disk."""
+    _memory_cache[service_code] = (entry['fetched_at'], entry)
+    path = _cache_path(service_code)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_text(json.dumps(entry), encoding='utf-8')
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f'Failed to cache pricing page of {service_code} in {path}: {e}')
+
+
+async def fetch_pricing_text(service_code: str) -> Dict[str, Any]:
+    """Return the pricing information of a service's pricing page, from the cache if fresh.
+
+    Args:
+        service_code: Web service code (e.g., 'lambda')
+
+    Returns:
+        Dictionary with the page 'url', the extracted 'text', the time it was fetched
+        ('fetched_at') and whether it came from the cache ('cached')
+
+    Raises:
+        httpx.HTTPError: If the page cannot be fetched
+    """
+    cached = await asyncio.to_thread(_load_cached, service_code)
+    if cached is not None:
+        return dict(cached, cached=True)
+
+    url = f'https://aws.amazon.com/{service_code}/pricing'
+    response = await get_http_client().get(url, follow_redirects=True, timeout=10.0)
+    response.raise_for_status()
+
+    text = await asyncio.to_thread(extract_pricing_text, response.text)
+    entry = {'url': url, 'text': text, 'fetched_at': time.time()}
+    await asyncio.to_thread(_store, service_code, entry)
+    logger.info(f'Extracted {len(text)} characters of pricing from {url}')
+    return dict(entry, cached=False)
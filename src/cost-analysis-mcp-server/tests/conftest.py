@@ -18,6 +18,35 @@ from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_pricing_state(tmp_path, monkeypatch):
+    """Start every test without cached pricing clients and with an empty local Price List."""
+    from awslabs.cost_analysis_mcp_server import server
+    from awslabs.cost_analysis_mcp_server.price_list_store import PriceListStore
+
+    monkeypatch.setattr(server, '_pricing_clients', {})
+    monkeypatch.setattr(
+        server, 'price_list_store', PriceListStore(tmp_path / 'price-list.sqlite3')
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_web_pricing_cache(tmp_path, monkeypatch):
+    """Start every test with an empty pricing page cache in its own directory."""
+    from awslabs.cost_analysis_mcp_server import web_pricing
+
+    monkeypatch.setattr(web_pricing, 'WEB_PRICING_CACHE_DIR', tmp_path / 'web-pricing')
+    monkeypatch.setattr(web_pricing, '_memory_cache', {})
+
+
+@pytest.fixture(autouse=True)
+def isolated_analysis_cache(tmp_path, monkeypatch):
+    """Keep the per-file project analysis cache of every test in its own directory."""
+    from awslabs.cost_analysis_mcp_server import file_analysis
+
+    monkeypatch.setattr(file_analysis, 'ANALYSIS_CACHE_DIR', tmp_path / 'analysis-cache')
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context."""
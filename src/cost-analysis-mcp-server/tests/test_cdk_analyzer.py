@@ -198,3 +198,21 @@ from aws_cdk.aws_sns import Topic
         # Check that all services from complex imports are detected
         expected_services = {'lambda', 'dynamodb', 's3', 'iam', 'ec2', 'rds', 'sns'}
         assert expected_services.issubset(services)
+
+    @pytest.mark.asyncio
+    async def test_analyze_project_skips_dependencies_and_reuses_results(self, tmp_path):
+        """Test that node_modules and cdk.out are skipped and unchanged files are not parsed."""
+        (tmp_path / 'node_modules' / 'aws-cdk-lib').mkdir(parents=True)
+        (tmp_path / 'node_modules' / 'aws-cdk-lib' / 'index.ts').write_text(
+            "import * as rds from 'aws-cdk-lib/aws-rds';"
+        )
+        (tmp_path / 'cdk.out').mkdir()
+        (tmp_path / 'cdk.out' / 'asset.py').write_text('from aws_cdk import aws_ec2 as ec2')
+        (tmp_path / 'stack.ts').write_text("import { Queue } from 'aws-cdk-lib/aws-sqs';")
+
+        first = await CDKAnalyzer(str(tmp_path)).analyze_project()
+        second = await CDKAnalyzer(str(tmp_path)).analyze_project()
+
+        assert [service['name'] for service in first['services']] == ['sqs']
+        assert first['details']['cached_file_count'] == 0
+        assert second['details']['cached_file_count'] == 1
@@ -12,6 +12,33 @@
 """Tests for the helpers module."""
 
 from awslabs.cost_analysis_mcp_server.helpers import CostAnalysisHelper
+from awslabs.cost_analysis_mcp_server.price_list_parser import summarize_price_list
+
+
+def lambda_price_list():
+    """Build Price List entries for two Lambda request prices with the same unit."""
+    return [
+        {
+            'product': {'sku': sku, 'attributes': {'group': group}},
+            'terms': {
+                'OnDemand': {
+                    f'{sku}.TERM': {
+                        'priceDimensions': {
+                            f'{sku}.DIM': {
+                                'unit': 'Requests',
+                                'description': '$0.20 per 1M requests',
+                                'pricePerUnit': {'USD': price},
+                            }
+                        }
+                    }
+                }
+            },
+        }
+        for sku, group, price in (
+            ('SKU1', 'AWS-Lambda-Requests', '0.0000002'),
+            ('SKU2', 'Edge', '0.0000006'),
+        )
+    ]
 
 
 class TestCostAnalysisHelper:
@@ -31,6 +58,29 @@ class TestCostAnalysisHelper:
 
         assert result is not None
 
+    def test_parse_pricing_data_api_rows_with_common_attributes(self):
+        """Test that attributes shared by all rows are merged back into each price."""
+        summary = summarize_price_list(lambda_price_list())
+        assert 'unit' in summary['common_attributes']
+
+        result = CostAnalysisHelper.parse_pricing_data(summary, 'AWS Lambda')
+
+        assert result['unit_pricing'][0] == {
+            'unit': 'Requests',
+            'price': '2e-07',
+            'description': '$0.20 per 1M requests',
+        }
+
+    def test_parse_pricing_data_api_groups(self):
+        """Test that group summaries report their price range, units and group."""
+        summary = summarize_price_list(lambda_price_list(), group_by='unit')
+
+        result = CostAnalysisHelper.parse_pricing_data(summary, 'AWS Lambda')
+
+        assert result['unit_pricing'] == [
+            {'unit': 'Requests', 'price': '2e-07 - 6e-07', 'description': 'unit: Requests'}
+        ]
+
     def test_parse_pricing_data_with_related_services(self, sample_pricing_data_web):
         """Test parsing pricing data with related services context."""
         result = CostAnalysisHelper.parse_pricing_data(
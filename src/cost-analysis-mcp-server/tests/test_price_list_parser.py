@@ -0,0 +1,142 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the Price List parser of the cost-analysis-mcp-server."""
+
+import json
+import pytest
+from awslabs.cost_analysis_mcp_server.price_list_parser import (
+    flatten_price_list,
+    group_prices,
+    split_common_attributes,
+    summarize_price_list,
+)
+
+
+@pytest.fixture
+def price_list():
+    """Price List API entries for two instance types with on-demand and reserved prices."""
+    entries = []
+    for sku, instance_type, hourly in (
+        ('SKU1', 't3.micro', '0.0104'),
+        ('SKU2', 'm5.large', '0.0960'),
+        ('SKU3', 'm5.large', '0.1920'),
+    ):
+        entries.append(
+            json.dumps(
+                {
+                    'product': {
+                        'sku': sku,
+                        'productFamily': 'Compute Instance',
+                        'attributes': {
+                            'instanceType': instance_type,
+                            'location': 'US East (N. Virginia)',
+                            'operatingSystem': 'Linux' if sku != 'SKU3' else 'Windows',
+                        },
+                    },
+                    'terms': {
+                        'OnDemand': {
+                            f'{sku}.OD': {
+                                'priceDimensions': {
+                                    f'{sku}.OD.1': {
+                                        'unit': 'Hrs',
+                                        'description': f'{instance_type} per hour',
+                                        'beginRange': '0',
+                                        'endRange': 'Inf',
+                                        'pricePerUnit': {'USD': hourly},
+                                    }
+                                },
+                            }
+                        },
+                        'Reserved': {
+                            f'{sku}.RI': {
+                                'termAttributes': {'LeaseContractLength': '1yr'},
+                                'priceDimensions': {
+                                    f'{sku}.RI.1': {
+                                        'unit': 'Quantity',
+                                        'pricePerUnit': {'USD': '100'},
+                                    }
+                                },
+                            }
+                        },
+                    },
+                }
+            )
+        )
+    return entries
+
+
+def test_flatten_price_list(price_list):
+    """Test that each price dimension of the selected term type becomes a row."""
+    rows = flatten_price_list(price_list)
+
+    assert len(rows) == 3
+    assert rows[0] == {
+        'instanceType': 't3.micro',
+        'location': 'US East (N. Virginia)',
+        'operatingSystem': 'Linux',
+        'productFamily': 'Compute Instance',
+        'sku': 'SKU1',
+        'termType': 'OnDemand',
+        'unit': 'Hrs',
+        'pricePerUnit': 0.0104,
+        'currency': 'USD',
+        'priceDescription': 't3.micro per hour',
+    }
+
+    reserved = flatten_price_list(price_list, term_type='Reserved')
+    assert reserved[0]['LeaseContractLength'] == '1yr'
+    assert len(flatten_price_list(price_list, term_type=None)) == 6
+
+
+def test_flatten_price_list_skips_invalid_entries():
+    """Test that entries that are not JSON are skipped."""
+    assert flatten_price_list(['not json']) == []
+
+
+def test_group_prices(price_list):
+    """Test summarizing prices by an attribute."""
+    groups = group_prices(flatten_price_list(price_list), 'instanceType')
+
+    assert [group['instanceType'] for group in groups] == ['t3.micro', 'm5.large']
+    assert groups[1]['minPrice'] == 0.096
+    assert groups[1]['maxPrice'] == 0.192
+    assert groups[1]['skuCount'] == 2
+    assert groups[1]['cheapestSku'] == 'SKU2'
+
+
+def test_split_common_attributes(price_list):
+    """Test that attributes shared by every row are returned once."""
+    common, rows = split_common_attributes(flatten_price_list(price_list))
+
+    assert common['location'] == 'US East (N. Virginia)'
+    assert common['unit'] == 'Hrs'
+    assert 'location' not in rows[0]
+    assert 'sku' in rows[0]
+
+
+def test_summarize_price_list_projection_and_top_n(price_list):
+    """Test projection, sorting and top N."""
+    summary = summarize_price_list(price_list, fields=['instanceType'], top_n=2, sort_order='desc')
+
+    assert summary['data'] == [
+        {'sku': 'SKU3', 'pricePerUnit': 0.192},
+        {'sku': 'SKU2', 'pricePerUnit': 0.096},
+    ]
+    assert summary['common_attributes'] == {
+        'termType': 'OnDemand',
+        'unit': 'Hrs',
+        'currency': 'USD',
+        'instanceType': 'm5.large',
+    }
+    assert summary['product_count'] == 3
+    assert summary['price_count'] == 3
+    assert summary['truncated'] is True
@@ -0,0 +1,256 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the local AWS Price List store of the cost-analysis-mcp-server."""
+
+import json
+import pytest
+import sqlite3
+from awslabs.cost_analysis_mcp_server.price_list_store import (
+    PRICE_LIST_ENDPOINT,
+    PriceListStore,
+    refresh_offers,
+)
+from unittest.mock import MagicMock, patch
+
+
+def make_offer(version):
+    """Build a regional offer file with two EC2 instance types."""
+    products = {
+        sku: {
+            'sku': sku,
+            'productFamily': 'Compute Instance',
+            'attributes': {'instanceType': instance_type, 'operatingSystem': 'Linux'},
+        }
+        for sku, instance_type in (('SKU1', 't3.micro'), ('SKU2', 'm5.large'))
+    }
+    products['SKU3'] = {
+        'sku': 'SKU3',
+        'productFamily': 'Storage',
+        'attributes': {'volumeApiName': 'gp3'},
+    }
+    terms = {
+        'OnDemand': {
+            sku: {f'{sku}.TERM': {'sku': sku, 'priceDimensions': {}}} for sku in products
+        },
+        'Reserved': {
+            'SKU1': {
+                f'SKU1.RI{years}': {
+                    'sku': 'SKU1',
+                    'termAttributes': {'LeaseContractLength': years},
+                }
+                for years in ('1yr', '3yr')
+            }
+        },
+    }
+    return {
+        'offerCode': 'AmazonEC2',
+        'version': version,
+        'publicationDate': '2025-01-01T00:00:00Z',
+        'products': products,
+        'terms': terms,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store with the EC2 offer of us-east-1 loaded."""
+    store = PriceListStore(tmp_path / 'price-list.sqlite3')
+    offer_file = tmp_path / 'offer.json'
+    offer_file.write_text(json.dumps(make_offer('20250101000000')))
+    store.load_offer_file('AmazonEC2', 'us-east-1', offer_file)
+    return store
+
+
+def test_get_offer_without_database(tmp_path):
+    """Test that looking up an offer does not create a database."""
+    store = PriceListStore(tmp_path / 'missing.sqlite3')
+
+    assert store.get_offer('AmazonEC2', 'us-east-1') is None
+    assert not (tmp_path / 'missing.sqlite3').exists()
+
+
+def test_query_filters(store):
+    """Test the supported filter types against product attributes and fields."""
+
+    def skus(*filters):
+        return [
+            entry['product']['sku']
+            for entry in store.query('AmazonEC2', 'us-east-1', list(filters))
+        ]
+
+    assert skus() == ['SKU1', 'SKU2', 'SKU3']
+    assert skus({'Field': 'instanceType', 'Type': 'TERM_MATCH', 'Value': 'm5.large'}) == ['SKU2']
+    assert skus({'Field': 'instanceType', 'Type': 'CONTAINS', 'Value': 't3'}) == ['SKU1']
+    assert skus({'Field': 'instanceType', 'Type': 'ANY_OF', 'Value': 't3.micro, m5.large'}) == [
+        'SKU1',
+        'SKU2',
+    ]
+    assert skus({'Field': 'productFamily', 'Type': 'NONE_OF', 'Value': 'Storage'}) == [
+        'SKU1',
+        'SKU2',
+    ]
+    assert skus({'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-east-1'}) == [
+        'SKU1',
+        'SKU2',
+        'SKU3',
+    ]
+    assert store.query('AmazonEC2', 'eu-west-1') == []
+
+
+def test_query_returns_api_shaped_entries(store):
+    """Test that products come back in the shape of the Price List API with their terms."""
+    entry = store.query(
+        'AmazonEC2', 'us-east-1', [{'Field': 'sku', 'Type': 'TERM_MATCH', 'Value': 'SKU1'}]
+    )[0]
+
+    assert entry['serviceCode'] == 'AmazonEC2'
+    assert entry['version'] == '20250101000000'
+    assert entry['product']['attributes']['instanceType'] == 't3.micro'
+    assert entry['terms']['OnDemand']['SKU1.TERM']['sku'] == 'SKU1'
+    assert sorted(entry['terms']['Reserved']) == ['SKU1.RI1yr', 'SKU1.RI3yr']
+
+    entries = store.query('AmazonEC2', 'us-east-1')
+    assert [len(entry['terms']) for entry in entries] == [2, 1, 1]
+
+
+def test_query_limit(store):
+    """Test that the limit selects the first products by SKU in SQL, before joining terms."""
+    connect = sqlite3.connect
+    statements = []
+
+    def traced_connect(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    with patch('sqlite3.connect', side_effect=traced_connect):
+        entries = store.query('AmazonEC2', 'us-east-1', limit=2)
+
+    assert [entry['product']['sku'] for entry in entries] == ['SKU1', 'SKU2']
+    assert sorted(entries[0]['terms']['Reserved']) == ['SKU1.RI1yr', 'SKU1.RI3yr']
+    assert any('ORDER BY p.sku LIMIT 2)' in statement for statement in statements)
+
+
+def test_load_offer_file_replaces_previous_version(store, tmp_path):
+    """Test that loading a new version replaces the products of the region."""
+    offer = make_offer('20250201000000')
+    del offer['products']['SKU2']
+    offer_file = tmp_path / 'offer-new.json'
+    offer_file.write_text(json.dumps(offer))
+
+    store.load_offer_file('AmazonEC2', 'us-east-1', offer_file)
+
+    assert store.get_offer('AmazonEC2', 'us-east-1')['version'] == '20250201000000'
+    assert [entry['product']['sku'] for entry in store.query('AmazonEC2', 'us-east-1')] == [
+        'SKU1',
+        'SKU3',
+    ]
+    assert store.list_offers() == [
+        {
+            'service_code': 'AmazonEC2',
+            'region': 'us-east-1',
+            'version': '20250201000000',
+            'product_count': 2,
+        }
+    ]
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    def __init__(self, payload):
+        """Serve the given JSON document."""
+        self.payload = payload
+
+    def raise_for_status(self):
+        """Accept every response."""
+
+    def json(self):
+        """Return the document."""
+        return self.payload
+
+    async def aiter_bytes(self):
+        """Stream the encoded document."""
+        yield json.dumps(self.payload).encode()
+
+    async def __aenter__(self):
+        """Enter the streaming context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit the streaming context."""
+        return False
+
+
+def make_client(version):
+    """Build an HTTP client serving the offer index, region index and one regional offer."""
+    offer_url = f'/offers/v1.0/aws/AmazonEC2/{version}/us-east-1/index.json'
+    documents = {
+        '/offers/v1.0/aws/index.json': {
+            'offers': {
+                'AmazonEC2': {
+                    'currentRegionIndexUrl': '/offers/v1.0/aws/AmazonEC2/current/region_index.json'
+                }
+            }
+        },
+        '/offers/v1.0/aws/AmazonEC2/current/region_index.json': {
+            'regions': {'us-east-1': {'currentVersionUrl': offer_url}}
+        },
+        offer_url: make_offer(version),
+    }
+    client = MagicMock()
+
+    async def get(url, **kwargs):
+        return FakeResponse(documents[url[len(PRICE_LIST_ENDPOINT) :]])
+
+    client.get = get
+    client.stream = MagicMock(
+        side_effect=lambda method, url, **kwargs: FakeResponse(
+            documents[url[len(PRICE_LIST_ENDPOINT) :]]
+        )
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_refresh_offers_downloads_only_new_versions(tmp_path):
+    """Test that a region is downloaded once per offer version."""
+    store = PriceListStore(tmp_path / 'price-list.sqlite3')
+
+    first = await refresh_offers(
+        store, 'AmazonEC2', ['us-east-1', 'mars-1'], client=make_client('20250101000000')
+    )
+    unchanged_client = make_client('20250101000000')
+    unchanged = await refresh_offers(store, 'AmazonEC2', ['us-east-1'], client=unchanged_client)
+    updated = await refresh_offers(
+        store, 'AmazonEC2', ['us-east-1'], client=make_client('20250201000000')
+    )
+
+    assert first['us-east-1'] == {
+        'status': 'updated',
+        'version': '20250101000000',
+        'product_count': 3,
+    }
+    assert first['mars-1'] == {'status': 'not_available'}
+    assert unchanged['us-east-1']['status'] == 'up_to_date'
+    unchanged_client.stream.assert_not_called()
+    assert updated['us-east-1']['status'] == 'updated'
+    assert store.get_offer('AmazonEC2', 'us-east-1')['version'] == '20250201000000'
+
+
+@pytest.mark.asyncio
+async def test_refresh_offers_unknown_service(tmp_path):
+    """Test that an unknown service code is rejected."""
+    store = PriceListStore(tmp_path / 'price-list.sqlite3')
+
+    with pytest.raises(ValueError, match='Unknown Price List service code'):
+        await refresh_offers(store, 'AmazonNothing', ['us-east-1'], client=make_client('1'))
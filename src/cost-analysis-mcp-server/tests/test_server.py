@@ -11,6 +11,7 @@
 
 """Tests for the server module of the cost-analysis-mcp-server."""
 
+import json
 import pytest
 from awslabs.cost_analysis_mcp_server.server import (
     analyze_cdk_project_wrapper,
@@ -18,10 +19,29 @@ from awslabs.cost_analysis_mcp_server.server import (
     get_bedrock_patterns,
     get_pricing_from_api,
     get_pricing_from_web,
+    refresh_price_list,
 )
 from unittest.mock import MagicMock, patch
 
 
+def price_list_entry(sku, price, **attributes):
+    """Build a Price List API entry with one on-demand price."""
+    return json.dumps(
+        {
+            'product': {'sku': sku, 'productFamily': 'Compute Instance', 'attributes': attributes},
+            'terms': {
+                'OnDemand': {
+                    f'{sku}.T': {
+                        'priceDimensions': {
+                            f'{sku}.T.D': {'unit': 'Hrs', 'pricePerUnit': {'USD': str(price)}}
+                        }
+                    }
+                }
+            },
+        }
+    )
+
+
 class TestAnalyzeCdkProject:
     """Tests for the analyze_cdk_project_wrapper function."""
 
@@ -159,6 +179,133 @@ class TestGetPricingFromApi:
         assert 'error_type' in result
         assert result['error_type'] == 'api_error'
 
+    @pytest.mark.asyncio
+    async def test_get_pricing_follows_next_token(self, mock_boto3, mock_context):
+        """Test that every result page is returned and the client is created once."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.side_effect = [
+            {'PriceList': [price_list_entry('SKU1', 2.0)], 'NextToken': 'token'},
+            {'PriceList': [price_list_entry('SKU2', 1.0)]},
+            {'PriceList': [price_list_entry('SKU3', 3.0)]},
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()) as mock_session:
+            result = await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context)
+            await get_pricing_from_api('AWSLambda', 'us-west-2', mock_context)
+
+        assert [row['sku'] for row in result['data']] == ['SKU2', 'SKU1']
+        assert result['product_count'] == 2
+        assert result['products_truncated'] is False
+        assert mock_session.call_count == 1
+        second_call = pricing_client.get_products.call_args_list[1]
+        assert second_call.kwargs['NextToken'] == 'token'
+        assert second_call.kwargs['Filters'] == [
+            {'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-west-2'}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_truncates_large_results(self, mock_boto3, mock_context):
+        """Test that paging stops at the result limit."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.return_value = {
+            'PriceList': [price_list_entry(f'SKU{i}', i) for i in range(100)],
+            'NextToken': 't',
+        }
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            with patch('awslabs.cost_analysis_mcp_server.server.MAX_API_RESULTS', 250):
+                result = await get_pricing_from_api('AmazonEC2', 'us-west-2', mock_context)
+
+        assert result['product_count'] == 250
+        assert result['products_truncated'] is True
+        assert len(result['data']) == 100
+        assert result['truncated'] is True
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_grouped_top_n(self, mock_boto3, mock_context):
+        """Test grouping the prices by an attribute and returning the most expensive group."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.return_value = {
+            'PriceList': [
+                price_list_entry('SKU1', 0.1, instanceType='t3.micro'),
+                price_list_entry('SKU2', 0.2, instanceType='t3.micro'),
+                price_list_entry('SKU3', 0.5, instanceType='m5.large'),
+            ]
+        }
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing_from_api(
+                'AmazonEC2',
+                'us-west-2',
+                mock_context,
+                group_by='instanceType',
+                top_n=1,
+                sort_order='desc',
+            )
+
+        assert result['data'] == [
+            {
+                'instanceType': 'm5.large',
+                'minPrice': 0.5,
+                'maxPrice': 0.5,
+                'currency': 'USD',
+                'units': ['Hrs'],
+                'priceCount': 1,
+                'cheapestSku': 'SKU3',
+                'skuCount': 1,
+            }
+        ]
+        assert result['truncated'] is True
+
+    @pytest.mark.asyncio
+    async def test_get_pricing_from_local_price_list(self, mock_boto3, mock_context):
+        """Test that loaded offers are answered locally without calling the API."""
+        from awslabs.cost_analysis_mcp_server import server
+
+        local_entry = price_list_entry('LOCAL', 1.0)
+        with patch.object(server.price_list_store, 'get_offer', return_value={'version': 'v1'}):
+            with patch.object(
+                server.price_list_store, 'query', return_value=[local_entry]
+            ) as mock_query:
+                with patch('boto3.Session', return_value=mock_boto3.Session()) as mock_session:
+                    result = await get_pricing_from_api('AmazonEC2', 'us-west-2', mock_context)
+
+        assert result['data'][0]['sku'] == 'LOCAL'
+        assert result['source'] == 'local Price List'
+        assert result['offer_version'] == 'v1'
+        assert mock_query.call_args.args[:2] == ('AmazonEC2', 'us-west-2')
+        mock_session.assert_not_called()
+
+
+class TestRefreshPriceList:
+    """Tests for the refresh_price_list function."""
+
+    @pytest.mark.asyncio
+    async def test_refresh(self, mock_context):
+        """Test refreshing the local Price List of a service."""
+        regions = {'us-east-1': {'status': 'updated', 'version': 'v1', 'product_count': 3}}
+        with patch(
+            'awslabs.cost_analysis_mcp_server.server.refresh_offers', return_value=regions
+        ) as mock_refresh:
+            result = await refresh_price_list('AmazonEC2', ['us-east-1'], mock_context)
+
+        assert result['status'] == 'success'
+        assert result['regions'] == regions
+        assert mock_refresh.call_args.args[1:] == ('AmazonEC2', ['us-east-1'])
+
+    @pytest.mark.asyncio
+    async def test_refresh_error(self, mock_context):
+        """Test that refresh failures are reported."""
+        with patch(
+            'awslabs.cost_analysis_mcp_server.server.refresh_offers',
+            side_effect=ValueError('Unknown Price List service code: Nope'),
+        ):
+            result = await refresh_price_list('Nope', ['us-east-1'], mock_context)
+
+        assert result['status'] == 'error'
+        assert 'Unknown Price List service code' in result['message']
+        mock_context.error.assert_called_once()
+
 
 class TestGetBedrockPatterns:
     """Tests for the get_bedrock_patterns function."""
@@ -15,7 +15,9 @@ import pytest
 from awslabs.cost_analysis_mcp_server.terraform_analyzer import (
     TerraformAnalyzer,
     analyze_terraform_project,
+    parse_terraform_file,
 )
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -452,3 +454,95 @@ async def test_local_module_finding(tmp_path):
 
     # Verify services found from modules
     assert 'lambda' in module_services
+
+
+def test_parse_terraform_file_ignores_comments_and_strings():
+    """Test that blocks are parsed from the HCL structure rather than line by line."""
+    result = parse_terraform_file(
+        """
+# resource "aws_instance" "commented" {}
+/* resource "aws_rds_cluster" "block_comment" {} */
+resource "aws_sqs_queue" "q" { name = "resource \\"aws_sns_topic\\" \\"x\\"" }
+resource "aws_ssm_parameter" "p" {
+  value = <<EOT
+resource "aws_kinesis_stream" "heredoc" {}
+EOT
+}
+resource "random_id" "r" {}
+module "mod" {
+  source = "./modules/mod"
+  tags   = { Name = "x" }
+}
+"""
+    )
+
+    assert [resource['service'] for resource in result['resources']] == ['sqs', 'ssm']
+    assert result['modules'] == [
+        {'name': 'mod', 'source': './modules/mod', 'variables': {'tags': '{ Name = "x" }'}}
+    ]
+
+
+def test_parse_terraform_json_file():
+    """Test parsing a Terraform JSON configuration."""
+    result = parse_terraform_file(
+        '{"resource": {"aws_s3_bucket": {"b": {}}}, '
+        '"module": {"vpc": {"source": "terraform-aws-modules/vpc/aws", "cidr": "10.0.0.0/16"}}}'
+    )
+
+    assert result['resources'][0]['service'] == 's3'
+    assert result['modules'][0]['variables'] == {'cidr': '10.0.0.0/16'}
+
+
+@pytest.mark.asyncio
+async def test_analyze_project_skips_cache_directories_and_counts_modules_once(tmp_path):
+    """Test that .terraform copies are skipped and local modules are only counted as modules."""
+    (tmp_path / 'modules' / 'queue').mkdir(parents=True)
+    (tmp_path / 'modules' / 'queue' / 'main.tf').write_text('resource "aws_sqs_queue" "q" {}\n')
+    (tmp_path / '.terraform' / 'modules' / 'copy').mkdir(parents=True)
+    (tmp_path / '.terraform' / 'modules' / 'copy' / 'main.tf').write_text(
+        'resource "aws_kinesis_stream" "s" {}\n'
+    )
+    (tmp_path / 'main.tf').write_text(
+        'module "a" {\n  source = "./modules/queue"\n}\n'
+        'module "b" {\n  source = "./modules/queue"\n}\n'
+    )
+
+    result = await analyze_terraform_project(str(tmp_path))
+
+    assert [(service['name'], service['source']) for service in result['services']] == [
+        ('sqs', 'terraform-module')
+    ]
+    assert result['details']['file_count'] == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_project_reuses_results_of_unchanged_files(sample_terraform_project):
+    """Test that a second analysis only parses the files that changed."""
+    first = await analyze_terraform_project(str(sample_terraform_project))
+    (sample_terraform_project / 'variables.tf').write_text('resource "aws_sns_topic" "t" {}\n')
+
+    with patch(
+        'awslabs.cost_analysis_mcp_server.terraform_analyzer.parse_terraform_file',
+        wraps=parse_terraform_file,
+    ) as mock_parse:
+        second = await analyze_terraform_project(str(sample_terraform_project))
+
+    assert first['details']['cached_file_count'] == 0
+    assert second['details']['cached_file_count'] == second['details']['file_count'] - 1
+    assert mock_parse.call_count == 1
+    assert 'sns' in {service['name'] for service in second['services']}
+
+
+@pytest.mark.asyncio
+async def test_analyze_project_parses_on_worker_processes(sample_terraform_project, tmp_path):
+    """Test that parsing on worker processes gives the same results as in the server process."""
+    expected = await analyze_terraform_project(str(sample_terraform_project))
+
+    with (
+        patch('awslabs.cost_analysis_mcp_server.file_analysis.ANALYSIS_CACHE_DIR', tmp_path),
+        patch('awslabs.cost_analysis_mcp_server.file_analysis.PROCESS_POOL_MIN_FILES', 1),
+    ):
+        result = await analyze_terraform_project(str(sample_terraform_project))
+
+    assert result['details']['cached_file_count'] == 0
+    assert result['services'] == expected['services']
@@ -0,0 +1,90 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the pricing page fetcher of the cost-analysis-mcp-server."""
+
+import pytest
+from awslabs.cost_analysis_mcp_server import web_pricing
+from awslabs.cost_analysis_mcp_server.web_pricing import extract_pricing_text, fetch_pricing_text
+from unittest.mock import MagicMock, patch
+
+
+PRICING_PAGE = """
+<html>
+  <head><script>var prices = {};</script><style>.x {}</style></head>
+  <body>
+    <nav>Products Solutions Pricing</nav>
+    <h2>Requests</h2>
+    <p>Lambda counts a request each time it starts executing.</p>
+    <table>
+      <tr><th>Architecture</th><th>Price</th></tr>
+      <tr><td>x86</td><td>$0.20 per 1M requests</td></tr>
+    </table>
+    <p>Provisioned Concurrency costs $0.0000041667 for every GB-second.</p>
+    <footer>Terms of use</footer>
+  </body>
+</html>
+"""
+
+
+def make_response(text):
+    """Build a successful HTTP response."""
+    response = MagicMock()
+    response.text = text
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def test_extract_pricing_text_keeps_tables_and_prices():
+    """Test that only the pricing tables and lines quoting prices are extracted."""
+    text = extract_pricing_text(PRICING_PAGE)
+
+    assert text == (
+        '## Requests\n'
+        'Architecture | Price\n'
+        'x86 | $0.20 per 1M requests\n'
+        '\n'
+        '## Other prices\n'
+        'Provisioned Concurrency costs $0.0000041667 for every GB-second.'
+    )
+
+
+def test_extract_pricing_text_without_tables():
+    """Test that pages without tables fall back to their text."""
+    text = extract_pricing_text(
+        '<p>Pricing</p>\n<p>$0.20 per 1M requests</p>\n<script>var x = 1;</script>'
+    )
+
+    assert text == 'Pricing\n$0.20 per 1M requests'
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.get')
+async def test_fetch_pricing_text_uses_cache(mock_get):
+    """Test that a page is fetched once and then served from the cache until it expires."""
+    mock_get.return_value = make_response(PRICING_PAGE)
+
+    first = await fetch_pricing_text('lambda')
+    second = await fetch_pricing_text('lambda')
+    web_pricing._memory_cache.clear()
+    from_disk = await fetch_pricing_text('lambda')
+
+    assert mock_get.call_count == 1
+    assert first['cached'] is False
+    assert second['cached'] is True
+    assert from_disk['cached'] is True
+    assert from_disk['text'] == first['text']
+
+    with patch.object(web_pricing, 'WEB_PRICING_TTL_SECONDS', -1):
+        expired = await fetch_pricing_text('lambda')
+
+    assert expired['cached'] is False
+    assert mock_get.call_count == 2
@@ -13,17 +13,33 @@
 
 import boto3
 import os
+import threading
 from botocore.config import Config
-from typing import Any, Optional
+from loguru import logger
+from typing import Any, Dict, Optional, Tuple
+
+
+# Default maximum number of connections each pooled client keeps open
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# Default maximum number of attempts of an API call, with adaptive retries
+DEFAULT_MAX_ATTEMPTS = 5
 
 
 class AwsHelper:
     """Helper class for AWS operations.
 
     This class provides utility methods for interacting with AWS services,
-    including region and profile management and client creation.
+    including region and profile management and client creation. Clients are pooled per
+    service, region and profile and shared by all handlers, since boto3 clients are thread-safe
+    and creating one loads its service model and opens new connections.
     """
 
+    # Clients by (service name, region, profile), and the number of clients created per service
+    _client_pool: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+    _client_creation_counts: Dict[str, int] = {}
+    _client_pool_lock = threading.Lock()
+
     @staticmethod
     def get_aws_region() -> Optional[str]:
         """Get the AWS region from the environment if set."""
@@ -34,12 +50,25 @@ class AwsHelper:
         """Get the AWS profile from the environment if set."""
         return os.environ.get('AWS_PROFILE')
 
+    @staticmethod
+    def get_max_pool_connections() -> int:
+        """Get the maximum number of connections per client from the environment if set."""
+        return int(os.environ.get('EKS_MCP_MAX_POOL_CONNECTIONS', DEFAULT_MAX_POOL_CONNECTIONS))
+
+    @staticmethod
+    def get_max_attempts() -> int:
+        """Get the maximum number of attempts per API call from the environment if set."""
+        return int(os.environ.get('AWS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+
     @classmethod
     def create_boto3_client(cls, service_name: str, region_name: Optional[str] = None) -> Any:
-        """Create a boto3 client with the appropriate profile and region.
+        """Get a pooled boto3 client with the appropriate profile and region.
 
-        The client is configured with a custom user agent suffix 'awslabs/mcp/eks-mcp-server/0.1.0'
-        to identify API calls made by the EKS MCP Server.
+        A client is created on the first call for a service, region and profile and returned by
+        the following calls. The client is configured with a custom user agent suffix
+        'awslabs/mcp/eks-mcp-server/0.1.0' to identify API calls made by the EKS MCP Server,
+        a connection pool of EKS_MCP_MAX_POOL_CONNECTIONS connections (default: 50), and
+        adaptive retries of up to AWS_MAX_ATTEMPTS attempts (default: 5).
 
         Args:
             service_name: The AWS service name (e.g., 'ec2', 's3', 'eks')
@@ -54,8 +83,53 @@ class AwsHelper:
         # Get profile from environment if set
         profile = cls.get_aws_profile()
 
-        # Create config with user agent suffix
-        config = Config(user_agent_extra='awslabs/mcp/eks-mcp-server/0.1.0')
+        key = (service_name, region, profile)
+        with cls._client_pool_lock:
+            client = cls._client_pool.get(key)
+            if client is None:
+                client = cls._create_client(service_name, region, profile)
+                cls._client_pool[key] = client
+                cls._client_creation_counts[service_name] = (
+                    cls._client_creation_counts.get(service_name, 0) + 1
+                )
+                logger.debug(
+                    f'Created {service_name} client for region {region} and profile {profile}'
+                )
+            return client
+
+    @classmethod
+    def get_client_creation_counts(cls) -> Dict[str, int]:
+        """Get the number of clients created per service since the pool was last cleared."""
+        with cls._client_pool_lock:
+            return dict(cls._client_creation_counts)
+
+    @classmethod
+    def clear_client_pool(cls) -> None:
+        """Drop the pooled clients, e.g. after the credentials of a profile changed."""
+        with cls._client_pool_lock:
+            cls._client_pool.clear()
+            cls._client_creation_counts.clear()
+
+    @classmethod
+    def _create_client(
+        cls, service_name: str, region: Optional[str], profile: Optional[str]
+    ) -> Any:
+        """Create a boto3 client (private method).
+
+        Args:
+            service_name: The AWS service name
+            region: Region name, or None for the default region
+            profile: Profile name, or None for the default credentials
+
+        Returns:
+            A new boto3 client for the specified service
+        """
+        # Create config with user agent suffix, connection pool size and adaptive retries
+        config = Config(
+            user_agent_extra='awslabs/mcp/eks-mcp-server/0.1.0',
+            max_pool_connections=cls.get_max_pool_connections(),
+            retries={'max_attempts': cls.get_max_attempts(), 'mode': 'adaptive'},
+        )
 
         # Create session with profile if specified
         if profile:
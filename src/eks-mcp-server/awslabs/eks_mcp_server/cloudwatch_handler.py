@@ -11,16 +11,52 @@
 
 """CloudWatch handler for the EKS MCP Server."""
 
+import asyncio
 import datetime
 import json
-import time
+import re
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
-from awslabs.eks_mcp_server.models import CloudWatchLogsResponse, CloudWatchMetricsResponse
+from awslabs.eks_mcp_server.models import (
+    CloudWatchLogsResponse,
+    CloudWatchMetricsBatchResponse,
+    CloudWatchMetricsResponse,
+    MetricQuerySpec,
+)
+from cachetools import TTLCache
+from loguru import logger
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Maximum number of Logs Insights queries one tool call runs at the same time
+MAX_CONCURRENT_QUERIES = 5
+
+# Time ranges longer than this are split into windows queried concurrently, in minutes
+QUERY_WINDOW_MINUTES = 60
+
+# Maximum number of windows a time range is split into
+MAX_QUERY_WINDOWS = 8
+
+# Time the results of a query are reused for the same log groups, query and time range, in seconds
+QUERY_CACHE_TTL = 60
+
+# Maximum number of new partial results sent to the client with each poll of a running query
+PARTIAL_RESULTS_PREVIEW = 5
+
+# Aggregating queries, whose results cannot be merged across time windows
+STATS_PATTERN = re.compile(r'\bstats\b')
+
+# Maximum number of metric data queries in one GetMetricData request
+MAX_METRIC_DATA_QUERIES = 500
+
+# Maximum number of GetMetricData requests one tool call runs at the same time
+MAX_CONCURRENT_METRIC_REQUESTS = 4
+
+# Identifiers referenced by metric math expressions
+METRIC_ID_PATTERN = re.compile(r'\b[a-z][a-zA-Z0-9_]*\b')
 
 
 class CloudWatchHandler:
@@ -40,9 +76,13 @@ class CloudWatchHandler:
         self.mcp = mcp
         self.allow_sensitive_data_access = allow_sensitive_data_access
 
+        # Log entries by log groups, normalized query and time range
+        self._query_cache = TTLCache(maxsize=100, ttl=QUERY_CACHE_TTL)
+
         # Register tools
         self.mcp.tool(name='get_cloudwatch_logs')(self.get_cloudwatch_logs)
         self.mcp.tool(name='get_cloudwatch_metrics')(self.get_cloudwatch_metrics)
+        self.mcp.tool(name='get_cloudwatch_metrics_batch')(self.get_cloudwatch_metrics_batch)
 
     def resolve_time_range(
         self,
@@ -80,6 +120,87 @@ class CloudWatchHandler:
 
         return start_dt, end_dt
 
+    def split_time_range(
+        self, start_dt: datetime.datetime, end_dt: datetime.datetime
+    ) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """Split a long time range into windows that can be queried concurrently.
+
+        This function is public for unit testing purposes.
+
+        Args:
+            start_dt: Start of the time range
+            end_dt: End of the time range
+
+        Returns:
+            Windows covering the time range, newest first
+        """
+        window = datetime.timedelta(minutes=QUERY_WINDOW_MINUTES)
+        if end_dt - start_dt <= window:
+            return [(start_dt, end_dt)]
+
+        window = max(window, (end_dt - start_dt) / MAX_QUERY_WINDOWS)
+        windows = []
+        window_end = end_dt
+        while window_end > start_dt:
+            window_start = max(start_dt, window_end - window)
+            windows.append((window_start, window_end))
+            window_end = window_start
+        return windows
+
+    def pack_metric_queries(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Pack metric data queries into GetMetricData requests.
+
+        Expressions are kept in the same request as the queries they refer to.
+
+        This function is public for unit testing purposes.
+
+        Args:
+            queries: Metric data queries
+
+        Returns:
+            Lists of at most MAX_METRIC_DATA_QUERIES queries, one per request
+
+        Raises:
+            ValueError: If an expression refers to more queries than fit in one request
+        """
+        # Group the queries connected by expressions
+        parents = {query['Id']: query['Id'] for query in queries}
+
+        def find(query_id: str) -> str:
+            while parents[query_id] != query_id:
+                parents[query_id] = parents[parents[query_id]]
+                query_id = parents[query_id]
+            return query_id
+
+        for query in queries:
+            for referenced_id in METRIC_ID_PATTERN.findall(query.get('Expression', '')):
+                if referenced_id in parents:
+                    parents[find(referenced_id)] = find(query['Id'])
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for query in queries:
+            groups.setdefault(find(query['Id']), []).append(query)
+
+        # Fill each request with whole groups, in order
+        requests: List[List[Dict[str, Any]]] = []
+        for group in groups.values():
+            if len(group) > MAX_METRIC_DATA_QUERIES:
+                raise ValueError(
+                    f'Expressions refer to {len(group)} metrics, more than the '
+                    f'{MAX_METRIC_DATA_QUERIES} of one GetMetricData request'
+                )
+            request = next(
+                (r for r in requests if len(r) + len(group) <= MAX_METRIC_DATA_QUERIES), None
+            )
+            if request is None:
+                request = []
+                requests.append(request)
+            request.extend(group)
+
+        # Keep the order of the queries within each request
+        order = {query['Id']: index for index, query in enumerate(queries)}
+        return [sorted(request, key=lambda query: order[query['Id']]) for request in requests]
+
     async def get_cloudwatch_logs(
         self,
         ctx: Context,
@@ -102,7 +223,8 @@ class CloudWatchHandler:
             - "host": Node-level system logs
             - "performance": Performance metrics logs
             - "control-plane": EKS control plane logs
-            - Or provide a custom CloudWatch log group name directly""",
+            - Or provide a custom CloudWatch log group name directly
+            Separate several log types with commas (e.g., "application,host") to query them concurrently.""",
         ),
         minutes: int = Field(
             15,
@@ -150,6 +272,10 @@ class CloudWatchHandler:
         - Use filter_pattern to narrow down results (e.g., "ERROR", "exception")
         - For JSON logs, the tool automatically parses nested structures
         - Combine with get_k8s_events for comprehensive troubleshooting
+        - Query several log types at once with a comma-separated log_type; long time ranges are
+          split into windows queried concurrently, and partial results are sent as log messages
+          while the queries run
+        - Repeating the same query within a minute returns the cached results
 
         Args:
             ctx: MCP context
@@ -188,18 +314,15 @@ class CloudWatchHandler:
                 )
 
             start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+            limit_value = limit if isinstance(limit, int) else limit.default
 
-            # Create CloudWatch Logs client
-            logs = AwsHelper.create_boto3_client('logs')
-
-            # Determine the log group based on log_type
-            known_types = {'application', 'host', 'performance', 'dataplane'}
-            if log_type in known_types:
-                log_group = f'/aws/containerinsights/{cluster_name}/{log_type}'
-            elif log_type == 'control-plane':
-                log_group = f'/aws/eks/{cluster_name}/cluster'
-            else:
-                log_group = log_type  # Assume user passed full log group name
+            # Determine the log groups based on log_type
+            log_groups = [
+                self._get_log_group(cluster_name, single_log_type.strip())
+                for single_log_type in log_type.split(',')
+                if single_log_type.strip()
+            ]
+            log_group = ', '.join(log_groups)
 
             # Determine fields to include
             query_fields = fields if fields else '@timestamp, @message'
@@ -217,37 +340,87 @@ class CloudWatchHandler:
             # Add sorting and limit
             query += f'\n| sort @timestamp desc\n| limit {limit}'
 
-            log_with_request_id(
-                ctx,
-                LogLevel.INFO,
-                f'Starting CloudWatch Logs query for {resource_type} {resource_name} in cluster {cluster_name}',
-                log_group=log_group,
-                start_time=start_dt.isoformat(),
-                end_time=end_dt.isoformat(),
-            )
-
-            # Start the query
-            start_query_response = logs.start_query(
-                logGroupName=log_group,
-                startTime=int(start_dt.timestamp()),
-                endTime=int(end_dt.timestamp()),
-                queryString=query,
-            )
-
-            query_id = start_query_response['queryId']
+            # Relative time ranges are cached by their length, absolute ones by their bounds
+            if isinstance(start_time, str) or isinstance(end_time, str):
+                time_range_key: Tuple = (int(start_dt.timestamp()), int(end_dt.timestamp()))
+            else:
+                time_range_key = ('minutes', minutes if isinstance(minutes, int) else 15)
+            cache_key = (tuple(log_groups), ' '.join(query.split()), time_range_key)
 
-            # Poll for results
-            query_response = self._poll_query_results(
-                ctx, logs, query_id, resource_type, resource_name
-            )
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                start_dt, end_dt, log_entries = cached
+                log_with_request_id(
+                    ctx,
+                    LogLevel.INFO,
+                    f'Using cached CloudWatch Logs query results for {resource_type} {resource_name}',
+                )
+            else:
+                # Create CloudWatch Logs client
+                logs = AwsHelper.create_boto3_client('logs')
 
-            # Process results
-            results = query_response['results']
-            log_entries = []
+                log_with_request_id(
+                    ctx,
+                    LogLevel.INFO,
+                    f'Starting CloudWatch Logs query for {resource_type} {resource_name} in cluster {cluster_name}',
+                    log_group=log_group,
+                    start_time=start_dt.isoformat(),
+                    end_time=end_dt.isoformat(),
+                )
 
-            for result in results:
-                entry = self._build_log_entry(result)
-                log_entries.append(entry)
+                # Aggregations cannot be merged across windows, so only plain queries are split
+                if filter_pattern and STATS_PATTERN.search(str(filter_pattern)):
+                    windows = [(start_dt, end_dt)]
+                else:
+                    windows = self.split_time_range(start_dt, end_dt)
+
+                # Run one query per log group and window, a few at a time
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+                queries = [
+                    (query_log_group, window_start, window_end)
+                    for query_log_group in log_groups
+                    for window_start, window_end in windows
+                ]
+                tasks = [
+                    asyncio.ensure_future(
+                        self._run_query(
+                            ctx,
+                            logs,
+                            query_log_group,
+                            query,
+                            window_start,
+                            window_end,
+                            resource_type,
+                            resource_name,
+                            semaphore,
+                        )
+                    )
+                    for query_log_group, window_start, window_end in queries
+                ]
+                try:
+                    query_results = await asyncio.gather(*tasks)
+                except BaseException:
+                    # Stop the other queries when one of them fails
+                    for task in tasks:
+                        task.cancel()
+                    raise
+
+                # Process results
+                log_entries = []
+                for (query_log_group, _, _), results in zip(queries, query_results):
+                    for result in results:
+                        entry = self._build_log_entry(result)
+                        if len(log_groups) > 1:
+                            entry['log_group'] = query_log_group
+                        log_entries.append(entry)
+
+                # Merge the results of several queries, newest first, up to the limit
+                if len(queries) > 1:
+                    if all('timestamp' in entry for entry in log_entries):
+                        log_entries.sort(key=lambda entry: entry['timestamp'], reverse=True)
+                    log_entries = log_entries[:limit_value]
+
+                self._query_cache[cache_key] = (start_dt, end_dt, log_entries)
 
             log_with_request_id(
                 ctx,
@@ -531,7 +704,365 @@ class CloudWatchHandler:
                 data_points=[],
             )
 
-    def _poll_query_results(
+    async def get_cloudwatch_metrics_batch(
+        self,
+        ctx: Context,
+        metrics: List[MetricQuerySpec] = Field(
+            ...,
+            description="""Metrics and metric math expressions to retrieve. Each spec has either:
+            - namespace, metric_name and dimensions (e.g., {"ClusterName": "my-cluster", "Namespace": "default", "PodName": "web"}), with optional stat and period
+            - expression, a metric math expression referring to other specs by id (e.g., "m1 / m2 * 100")
+            Optional fields: id (referenced by expressions, defaults to m<index>), label, return_data (false to only use the spec in expressions).""",
+        ),
+        minutes: int = Field(
+            15,
+            description='Number of minutes to look back for metrics. Default: 15. Ignored if start_time is provided.',
+        ),
+        start_time: Optional[str] = Field(
+            None,
+            description='Start time in ISO format (e.g., "2023-01-01T00:00:00Z"). If provided, overrides the minutes parameter.',
+        ),
+        end_time: Optional[str] = Field(
+            None,
+            description='End time in ISO format (e.g., "2023-01-01T01:00:00Z"). If not provided, defaults to current time.',
+        ),
+        period: int = Field(
+            60,
+            description='Default period in seconds of the metrics that do not set their own. Default: 60 (1 minute).',
+        ),
+        stat: str = Field(
+            'Average',
+            description='Default statistic of the metrics that do not set their own (Average, Sum, Maximum, Minimum, SampleCount, or a percentile such as p99).',
+        ),
+    ) -> CloudWatchMetricsBatchResponse:
+        """Get many CloudWatch metrics and metric math expressions in batched requests.
+
+        This tool retrieves many metric series at once, such as CPU, memory, network and restarts
+        for every pod of a deployment, instead of calling get_cloudwatch_metrics once per metric.
+        The metrics are packed into GetMetricData requests of up to 500 queries, and the series
+        are returned as columns aligned on one timestamp axis.
+
+        ## Requirements
+        - The EKS cluster must have CloudWatch Container Insights enabled for ContainerInsights metrics
+        - The metrics must be available in the specified namespaces
+
+        ## Response Information
+        The response includes the timestamps of the rows, the values of each series by id (null
+        where a series has no data point at a timestamp), the label and status of each series,
+        and the number of GetMetricData requests made. A spec returning several series, such as
+        a SEARCH expression, has one column per series keyed "<id>:<label>".
+
+        ## Usage Tips
+        - Give specs an id to refer to them in expressions (e.g., "m1 + m2", "RATE(m3)")
+        - Set return_data to false for metrics only used in expressions
+        - Use SEARCH expressions to retrieve a metric for every matching resource in one spec
+
+        Args:
+            ctx: MCP context
+            metrics: Metric and expression specs
+            minutes: Number of minutes to look back
+            start_time: Start time in ISO format (overrides minutes)
+            end_time: End time in ISO format (defaults to now)
+            period: Default period in seconds
+            stat: Default statistic
+
+        Returns:
+            CloudWatchMetricsBatchResponse with the aligned series
+        """
+        try:
+            start_dt, end_dt = self.resolve_time_range(start_time, end_time, minutes)
+            period_value = period if isinstance(period, int) else period.default
+            stat_value = stat if isinstance(stat, str) else stat.default
+
+            queries = self._build_metric_queries(metrics, period_value, stat_value)
+            requests = self.pack_metric_queries(queries)
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Getting {len(queries)} CloudWatch metric series in {len(requests)} batches',
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+            )
+
+            # Create CloudWatch client
+            cloudwatch = AwsHelper.create_boto3_client('cloudwatch')
+
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_METRIC_REQUESTS)
+
+            async def get_batch(batch_queries):
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._get_metric_data, cloudwatch, batch_queries, start_dt, end_dt
+                    )
+
+            batch_results = await asyncio.gather(*[get_batch(batch) for batch in requests])
+
+            # Align the series on the union of their timestamps
+            series_by_id: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            request_count = 0
+            for batch_series, batch_request_count in batch_results:
+                for (query_id, label), result in batch_series.items():
+                    series_by_id.setdefault(query_id, []).append((label, result))
+                request_count += batch_request_count
+
+            timestamps = sorted(
+                {
+                    ts
+                    for id_series in series_by_id.values()
+                    for _, result in id_series
+                    for ts in result['values']
+                }
+            )
+
+            # Give each series of a SEARCH expression its own column, keyed by id and label
+            columns: Dict[str, List[Optional[float]]] = {}
+            labels: Dict[str, str] = {}
+            statuses: Dict[str, str] = {}
+            for query in queries:
+                id_series = series_by_id.get(query['Id'], [])
+                for label, result in id_series:
+                    column = query['Id'] if len(id_series) == 1 else f'{query["Id"]}:{label}'
+                    columns[column] = [result['values'].get(ts) for ts in timestamps]
+                    labels[column] = label
+                    statuses[column] = result['status']
+
+            log_with_request_id(
+                ctx,
+                LogLevel.INFO,
+                f'Retrieved {len(columns)} metric series with {len(timestamps)} timestamps in {request_count} requests',
+            )
+
+            return CloudWatchMetricsBatchResponse(
+                isError=False,
+                content=[
+                    TextContent(
+                        type='text',
+                        text=f'Successfully retrieved {len(columns)} metric series with {len(timestamps)} timestamps in {request_count} GetMetricData requests',
+                    )
+                ],
+                start_time=start_dt.isoformat(),
+                end_time=end_dt.isoformat(),
+                timestamps=[ts.isoformat() for ts in timestamps],
+                columns=columns,
+                labels=labels,
+                statuses=statuses,
+                request_count=request_count,
+            )
+
+        except Exception as e:
+            error_message = f'Failed to get metrics: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CloudWatchMetricsBatchResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+                start_time='',
+                end_time='',
+                timestamps=[],
+                columns={},
+                labels={},
+                statuses={},
+                request_count=0,
+            )
+
+    def _build_metric_queries(
+        self, metrics: List[MetricQuerySpec], period: int, stat: str
+    ) -> List[Dict[str, Any]]:
+        """Build the GetMetricData queries of metric specs.
+
+        Args:
+            metrics: Metric and expression specs
+            period: Default period in seconds
+            stat: Default statistic
+
+        Returns:
+            Metric data queries
+
+        Raises:
+            ValueError: If a spec is invalid or an id is used twice
+        """
+        queries = []
+        for index, spec in enumerate(metrics):
+            if isinstance(spec, dict):
+                spec = MetricQuerySpec(**spec)
+            query: Dict[str, Any] = {
+                'Id': spec.id or f'm{index + 1}',
+                'ReturnData': spec.return_data,
+            }
+            if spec.label:
+                query['Label'] = spec.label
+
+            if spec.expression:
+                query['Expression'] = spec.expression
+                if spec.period:
+                    query['Period'] = spec.period
+            elif spec.namespace and spec.metric_name:
+                query['MetricStat'] = {
+                    'Metric': {
+                        'Namespace': spec.namespace,
+                        'MetricName': spec.metric_name,
+                        'Dimensions': [
+                            {'Name': name, 'Value': value}
+                            for name, value in spec.dimensions.items()
+                        ],
+                    },
+                    'Period': spec.period or period,
+                    'Stat': spec.stat or stat,
+                }
+            else:
+                raise ValueError(
+                    f'Metric {query["Id"]} needs either an expression or a namespace and metric_name'
+                )
+            queries.append(query)
+
+        ids = [query['Id'] for query in queries]
+        duplicates = sorted({query_id for query_id in ids if ids.count(query_id) > 1})
+        if duplicates:
+            raise ValueError(f'Duplicate metric ids: {", ".join(duplicates)}')
+        return queries
+
+    def _get_metric_data(
+        self,
+        cloudwatch_client,
+        queries: List[Dict[str, Any]],
+        start_dt: datetime.datetime,
+        end_dt: datetime.datetime,
+    ) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], int]:
+        """Get the data of one request of metric data queries, following NextToken.
+
+        A SEARCH expression returns one result per matching metric under the same id, so the
+        series are keyed by id and label.
+
+        Args:
+            cloudwatch_client: Boto3 CloudWatch client
+            queries: Metric data queries of one request
+            start_dt: Start of the time range
+            end_dt: End of the time range
+
+        Returns:
+            Tuple of the series by (id, label), each with its 'status' and 'values' by timestamp,
+            and the number of requests made
+        """
+        series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        request_kwargs: Dict[str, Any] = {
+            'MetricDataQueries': queries,
+            'StartTime': start_dt,
+            'EndTime': end_dt,
+            'ScanBy': 'TimestampAscending',
+        }
+        request_count = 0
+        while True:
+            response = cloudwatch_client.get_metric_data(**request_kwargs)
+            request_count += 1
+            for result in response.get('MetricDataResults', []):
+                result_series = series.setdefault(
+                    (result['Id'], result.get('Label', result['Id'])), {'values': {}}
+                )
+                result_series['status'] = result.get('StatusCode', 'Complete')
+                result_series['values'].update(
+                    zip(result.get('Timestamps', []), result.get('Values', []))
+                )
+            next_token = response.get('NextToken')
+            if not next_token:
+                return series, request_count
+            request_kwargs['NextToken'] = next_token
+
+    def _get_log_group(self, cluster_name: str, log_type: str) -> str:
+        """Get the CloudWatch log group of a log type.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            log_type: Log type (application, host, performance, control-plane, or custom)
+
+        Returns:
+            CloudWatch log group name
+        """
+        known_types = {'application', 'host', 'performance', 'dataplane'}
+        if log_type in known_types:
+            return f'/aws/containerinsights/{cluster_name}/{log_type}'
+        elif log_type == 'control-plane':
+            return f'/aws/eks/{cluster_name}/cluster'
+        return log_type  # Assume user passed full log group name
+
+    async def _run_query(
+        self,
+        ctx,
+        logs_client,
+        log_group: str,
+        query: str,
+        start_dt: datetime.datetime,
+        end_dt: datetime.datetime,
+        resource_type: str,
+        resource_name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> List[List[Dict[str, str]]]:
+        """Run a CloudWatch Logs Insights query and wait for its results.
+
+        Args:
+            ctx: MCP context
+            logs_client: Boto3 CloudWatch Logs client
+            log_group: Log group to query
+            query: Logs Insights query string
+            start_dt: Start of the time range
+            end_dt: End of the time range
+            resource_type: Resource type for logging
+            resource_name: Resource name for logging
+            semaphore: Semaphore bounding the number of concurrent queries
+
+        Returns:
+            Query results
+        """
+        async with semaphore:
+            start_query_response = await asyncio.to_thread(
+                logs_client.start_query,
+                logGroupName=log_group,
+                startTime=int(start_dt.timestamp()),
+                endTime=int(end_dt.timestamp()),
+                queryString=query,
+            )
+            query_response = await self._poll_query_results(
+                ctx, logs_client, start_query_response['queryId'], resource_type, resource_name
+            )
+            return query_response['results']
+
+    async def _send_partial_results(
+        self, ctx, query_id: str, query_response: Dict[str, Any], seen: set
+    ) -> None:
+        """Send the new partial results of a running query to the client as log messages.
+
+        Args:
+            ctx: MCP context
+            query_id: ID of the running query
+            query_response: Response of get_query_results
+            seen: Record pointers of the results already sent, updated in place
+        """
+        new_results = []
+        for result in query_response.get('results', []):
+            pointer = next((f['value'] for f in result if f['field'] == '@ptr'), None)
+            key = pointer or json.dumps(result, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                new_results.append(result)
+        if not new_results:
+            return
+
+        statistics = query_response.get('statistics', {})
+        entries = [self._build_log_entry(result) for result in new_results]
+        entries = [
+            {k: v for k, v in entry.items() if k != '@ptr'}
+            for entry in entries[:PARTIAL_RESULTS_PREVIEW]
+        ]
+        try:
+            await ctx.info(
+                f'Partial results of query {query_id} '
+                f'({int(statistics.get("recordsMatched", 0))} records matched, '
+                f'{int(statistics.get("recordsScanned", 0))} scanned): {json.dumps(entries)}'
+            )
+        except Exception as e:
+            logger.debug(f'Failed to send partial query results: {str(e)}')
+
+    async def _poll_query_results(
         self,
         ctx,
         logs_client,
@@ -543,6 +1074,10 @@ class CloudWatchHandler:
     ):
         """Poll for CloudWatch Logs query results with exponential backoff.
 
+        The event loop keeps serving other requests between polls, and the new partial results
+        of the running query are sent to the client as they arrive. A query that does not
+        complete is stopped so it does not keep counting against the concurrent query quota.
+
         Args:
             ctx: MCP context
             logs_client: Boto3 CloudWatch Logs client
@@ -560,6 +1095,8 @@ class CloudWatchHandler:
         """
         attempts = 0
         delay = initial_delay
+        seen_results: set = set()
+        finished = False
 
         log_with_request_id(
             ctx,
@@ -567,40 +1104,56 @@ class CloudWatchHandler:
             f'Polling for CloudWatch Logs query results (query_id: {query_id})',
         )
 
-        while attempts < max_attempts:
-            query_response = logs_client.get_query_results(queryId=query_id)
-            status = query_response.get('status')
-
-            if status == 'Complete':
-                log_with_request_id(
-                    ctx,
-                    LogLevel.INFO,
-                    f'CloudWatch Logs query completed successfully after {attempts + 1} attempts',
-                )
-                return query_response
-            elif status == 'Failed':
-                error_message = f'CloudWatch Logs query failed for {resource_type} {resource_name}'
-                log_with_request_id(ctx, LogLevel.ERROR, error_message)
-                raise Exception(error_message)
-            elif status == 'Cancelled':
-                error_message = (
-                    f'CloudWatch Logs query was cancelled for {resource_type} {resource_name}'
+        try:
+            while attempts < max_attempts:
+                query_response = await asyncio.to_thread(
+                    logs_client.get_query_results, queryId=query_id
                 )
-                log_with_request_id(ctx, LogLevel.ERROR, error_message)
-                raise Exception(error_message)
+                status = query_response.get('status')
+
+                if status == 'Complete':
+                    finished = True
+                    log_with_request_id(
+                        ctx,
+                        LogLevel.INFO,
+                        f'CloudWatch Logs query completed successfully after {attempts + 1} attempts',
+                    )
+                    return query_response
+                elif status == 'Failed':
+                    finished = True
+                    error_message = (
+                        f'CloudWatch Logs query failed for {resource_type} {resource_name}'
+                    )
+                    log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                    raise Exception(error_message)
+                elif status == 'Cancelled':
+                    finished = True
+                    error_message = (
+                        f'CloudWatch Logs query was cancelled for {resource_type} {resource_name}'
+                    )
+                    log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                    raise Exception(error_message)
 
-            # Log progress periodically
-            if attempts % 5 == 0:
-                log_with_request_id(
-                    ctx,
-                    LogLevel.INFO,
-                    f'Waiting for CloudWatch Logs query to complete (attempt {attempts + 1}/{max_attempts})',
-                )
+                await self._send_partial_results(ctx, query_id, query_response, seen_results)
 
-            # Sleep with exponential backoff (capped at 5 seconds)
-            time.sleep(min(delay, 5))
-            delay = min(delay * 1.5, 5)  # Exponential backoff with a cap
-            attempts += 1
+                # Log progress periodically
+                if attempts % 5 == 0:
+                    log_with_request_id(
+                        ctx,
+                        LogLevel.INFO,
+                        f'Waiting for CloudWatch Logs query to complete (attempt {attempts + 1}/{max_attempts})',
+                    )
+
+                # Sleep with exponential backoff (capped at 5 seconds)
+                await asyncio.sleep(min(delay, 5))
+                delay = min(delay * 1.5, 5)  # Exponential backoff with a cap
+                attempts += 1
+        finally:
+            if not finished:
+                try:
+                    await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
+                except Exception as e:
+                    logger.debug(f'Failed to stop CloudWatch Logs query {query_id}: {str(e)}')
 
         # If we've exhausted all attempts, raise a timeout error
         error_message = f'CloudWatch Logs query timed out after {max_attempts} attempts for {resource_type} {resource_name}'
@@ -15,6 +15,7 @@
 GENERATE_OPERATION = 'generate'
 DEPLOY_OPERATION = 'deploy'
 DESCRIBE_OPERATION = 'describe'
+WAIT_OPERATION = 'wait'
 DELETE_OPERATION = 'delete'
 
 # AWS CloudFormation
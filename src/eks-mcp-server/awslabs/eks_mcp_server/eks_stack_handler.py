@@ -11,7 +11,9 @@
 
 """EKS stack handler for the EKS MCP Server."""
 
+import asyncio
 import os
+import time
 import yaml
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
 from awslabs.eks_mcp_server.consts import (
@@ -25,6 +27,7 @@ from awslabs.eks_mcp_server.consts import (
     DESCRIBE_OPERATION,
     GENERATE_OPERATION,
     STACK_NOT_OWNED_ERROR_TEMPLATE,
+    WAIT_OPERATION,
 )
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
 from awslabs.eks_mcp_server.models import (
@@ -32,11 +35,35 @@ from awslabs.eks_mcp_server.models import (
     DeployStackResponse,
     DescribeStackResponse,
     GenerateTemplateResponse,
+    StackEvent,
+    WaitStackResponse,
 )
+from cachetools import TTLCache
 from mcp.server.fastmcp import Context
 from mcp.types import EmbeddedResource, ImageContent, TextContent
 from pydantic import Field
-from typing import Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+
+# Time stack descriptions are reused by describe and the ownership checks, in seconds
+STACK_DESCRIBE_CACHE_TTL = 10
+
+# Time the wait operation waits for a stack operation to finish by default, and at most, in seconds
+DEFAULT_STACK_WAIT_SECONDS = 300
+MAX_STACK_WAIT_SECONDS = 900
+
+# Delay between polls of a stack while waiting, doubled while no new events arrive, in seconds
+STACK_POLL_INITIAL_DELAY = 5
+STACK_POLL_MAX_DELAY = 30
+
+# Stack statuses starting a stack operation
+STACK_OPERATION_START_STATUSES = (
+    'CREATE_IN_PROGRESS',
+    'UPDATE_IN_PROGRESS',
+    'DELETE_IN_PROGRESS',
+    'IMPORT_IN_PROGRESS',
+    'REVIEW_IN_PROGRESS',
+)
 
 
 class EksStackHandler:
@@ -56,6 +83,10 @@ class EksStackHandler:
         self.mcp = mcp
         self.allow_write = allow_write
 
+        # Stack descriptions by stack name, and the last reported event by stack ID
+        self._stack_cache = TTLCache(maxsize=100, ttl=STACK_DESCRIBE_CACHE_TTL)
+        self._last_event_ids: Dict[str, str] = {}
+
         # Register tools
         self.mcp.tool(name='manage_eks_stacks')(self.manage_eks_stacks)
 
@@ -76,12 +107,15 @@ class EksStackHandler:
             - error_message: Error message if the stack doesn't exist or wasn't created by this tool, None if successful
         """
         try:
-            # Create CloudFormation client
-            cfn_client = AwsHelper.create_boto3_client('cloudformation')
+            # Get stack details, reusing a recent description
+            stack = self._stack_cache.get(stack_name)
+            if stack is None:
+                # Create CloudFormation client
+                cfn_client = AwsHelper.create_boto3_client('cloudformation')
 
-            # Get stack details
-            stack_details = cfn_client.describe_stacks(StackName=stack_name)
-            stack = stack_details['Stacks'][0]
+                stack_details = cfn_client.describe_stacks(StackName=stack_name)
+                stack = stack_details['Stacks'][0]
+                self._stack_cache[stack_name] = stack
 
             # Verify the stack was created by our tool
             tags = stack.get('Tags', [])
@@ -113,7 +147,7 @@ class EksStackHandler:
         ctx: Context,
         operation: str = Field(
             ...,
-            description='Operation to perform: generate, deploy, describe, or delete. Choose "describe" for read-only operations when write access is disabled.',
+            description='Operation to perform: generate, deploy, describe, wait, or delete. Choose "describe" or "wait" for read-only operations when write access is disabled.',
         ),
         template_file: Optional[str] = Field(
             None,
@@ -125,8 +159,17 @@ class EksStackHandler:
             description="""Name of the EKS cluster (for generate, deploy, describe and delete operations).
             This name will be used to derive the CloudFormation stack name and will be embedded in the cluster resources.""",
         ),
+        wait_seconds: Optional[int] = Field(
+            None,
+            description="""Seconds to wait for the stack operation to finish, streaming stack events as progress notifications (for deploy and wait operations, at most 900).
+            Default: 0 for deploy (return once the deployment started), 300 for wait.""",
+        ),
     ) -> Union[
-        GenerateTemplateResponse, DeployStackResponse, DescribeStackResponse, DeleteStackResponse
+        GenerateTemplateResponse,
+        DeployStackResponse,
+        DescribeStackResponse,
+        WaitStackResponse,
+        DeleteStackResponse,
     ]:
         """Manage EKS CloudFormation stacks with both read and write operations.
 
@@ -144,6 +187,7 @@ class EksStackHandler:
         - **generate**: Create a CloudFormation template at the specified absolute path with the cluster name embedded
         - **deploy**: Deploy a CloudFormation template from the specified absolute path (creates a new stack or updates an existing one)
         - **describe**: Get detailed information about a CloudFormation stack for a specific cluster
+        - **wait**: Wait for the current operation of a stack to finish, returning the stack events since the last deploy or wait operation
         - **delete**: Delete a CloudFormation stack for the specified cluster
 
         ## Response Information
@@ -151,12 +195,14 @@ class EksStackHandler:
         - generate: Returns GenerateTemplateResponse with the template path
         - deploy: Returns DeployStackResponse with stack name, ARN, and cluster name
         - describe: Returns DescribeStackResponse with stack details, outputs, and status
+        - wait: Returns WaitStackResponse with the stack status, whether the operation finished, new stack events, and outputs
         - delete: Returns DeleteStackResponse with stack name, ID, and cluster name
 
         ## Usage Tips
         - Use the describe operation first to check if a cluster already exists
         - For safety, this tool will only modify or delete stacks that it created
-        - Stack creation typically takes 15-20 minutes to complete
+        - Stack creation typically takes 15-20 minutes to complete; call wait until complete is true
+          instead of polling describe, or pass wait_seconds to deploy to follow the deployment
         - Use absolute paths for template files (e.g., '/home/user/templates/eks-template.yaml')
         - The cluster name is used to derive the CloudFormation stack name
 
@@ -165,15 +211,17 @@ class EksStackHandler:
             operation: Operation to perform (generate, deploy, describe, or delete)
             template_file: Absolute path for the CloudFormation template (for generate and deploy operations)
             cluster_name: Name of the EKS cluster (for all operations)
+            wait_seconds: Seconds to wait for the stack operation to finish (for deploy and wait operations)
 
         Returns:
-            Union[GenerateTemplateResponse, DeployStackResponse, DescribeStackResponse, DeleteStackResponse]:
+            Union[GenerateTemplateResponse, DeployStackResponse, DescribeStackResponse, WaitStackResponse, DeleteStackResponse]:
             Response specific to the operation performed
         """
         try:
             # Check if write access is disabled and trying to perform a mutating operation
             if not self.allow_write and operation not in [
                 DESCRIBE_OPERATION,
+                WAIT_OPERATION,
             ]:
                 error_message = f'Operation {operation} is not allowed without write access'
                 log_with_request_id(ctx, LogLevel.ERROR, error_message)
@@ -242,13 +290,26 @@ class EksStackHandler:
 
                 # Derive stack name from cluster name
                 stack_name = CFN_STACK_NAME_TEMPLATE.format(cluster_name=cluster_name)
-                return await self._deploy_stack(
+                response = await self._deploy_stack(
                     ctx=ctx,
                     template_file=template_file,
                     stack_name=stack_name,
                     cluster_name=cluster_name,
                 )
 
+                # Follow the deployment if requested
+                if isinstance(wait_seconds, int) and wait_seconds > 0 and not response.isError:
+                    wait_response = await self._wait_for_stack(
+                        ctx=ctx,
+                        stack_name=stack_name,
+                        cluster_name=cluster_name,
+                        wait_seconds=wait_seconds,
+                    )
+                    response.stack_status = wait_response.stack_status
+                    response.events = wait_response.events
+                    response.content.extend(wait_response.content)
+                return response
+
             elif operation == DESCRIBE_OPERATION:
                 if cluster_name is None:
                     raise ValueError('cluster_name is required for describe operation')
@@ -259,6 +320,21 @@ class EksStackHandler:
                     ctx=ctx, stack_name=stack_name, cluster_name=cluster_name
                 )
 
+            elif operation == WAIT_OPERATION:
+                if cluster_name is None:
+                    raise ValueError('cluster_name is required for wait operation')
+
+                # Derive stack name from cluster name
+                stack_name = CFN_STACK_NAME_TEMPLATE.format(cluster_name=cluster_name)
+                return await self._wait_for_stack(
+                    ctx=ctx,
+                    stack_name=stack_name,
+                    cluster_name=cluster_name,
+                    wait_seconds=wait_seconds
+                    if isinstance(wait_seconds, int)
+                    else DEFAULT_STACK_WAIT_SECONDS,
+                )
+
             elif operation == DELETE_OPERATION:
                 if cluster_name is None:
                     raise ValueError('cluster_name is required for delete operation')
@@ -270,7 +346,7 @@ class EksStackHandler:
                 )
 
             else:
-                error_message = f'Invalid operation: {operation}. Must be one of: generate, deploy, describe, delete'
+                error_message = f'Invalid operation: {operation}. Must be one of: generate, deploy, describe, wait, delete'
                 log_with_request_id(ctx, LogLevel.ERROR, error_message)
                 # Default to DescribeStackResponse for invalid operations
                 return DescribeStackResponse(
@@ -421,6 +497,9 @@ class EksStackHandler:
 
             # Create or update the stack
             if stack_exists:
+                # Report only the events of this update when the deployment is followed
+                self._record_last_event(cfn_client, stack_name)
+
                 log_with_request_id(
                     ctx,
                     LogLevel.INFO,
@@ -452,6 +531,8 @@ class EksStackHandler:
 
                 operation_text = 'creation'
 
+            self._stack_cache.pop(stack_name, None)
+
             log_with_request_id(
                 ctx,
                 LogLevel.INFO,
@@ -623,6 +704,7 @@ class EksStackHandler:
 
             # Delete the stack
             cfn_client.delete_stack(StackName=stack_name)
+            self._stack_cache.pop(stack_name, None)
 
             log_with_request_id(
                 ctx,
@@ -659,3 +741,198 @@ class EksStackHandler:
                 stack_id='',
                 cluster_name=cluster_name,
             )
+
+    async def _wait_for_stack(
+        self, ctx: Context, stack_name: str, cluster_name: str, wait_seconds: int
+    ) -> WaitStackResponse:
+        """Wait for the current operation of a CloudFormation stack to finish.
+
+        The stack and its new events are polled with a delay that starts at 5 seconds and doubles,
+        up to 30 seconds, while no new events arrive. New events are streamed as progress
+        notifications, with the number of resources completed as the progress.
+        """
+        try:
+            # Verify stack ownership
+            success, stack, error_message = self._ensure_stack_ownership(ctx, stack_name, 'wait')
+            if not success or not stack:
+                return WaitStackResponse(
+                    isError=True,
+                    content=cast(
+                        List[Union[TextContent, ImageContent, EmbeddedResource]],
+                        [TextContent(type='text', text=error_message or 'Unknown error')],
+                    ),
+                    stack_name=stack_name,
+                    stack_id=stack['StackId'] if stack else '',
+                    cluster_name=cluster_name,
+                    stack_status=stack['StackStatus'] if stack else '',
+                    complete=False,
+                    events=[],
+                    outputs={},
+                )
+
+            # Poll by stack ID, which keeps working once the stack is deleted
+            cfn_client = AwsHelper.create_boto3_client('cloudformation')
+            stack_id = stack['StackId']
+            wait_seconds = min(max(wait_seconds, 0), MAX_STACK_WAIT_SECONDS)
+            deadline = time.monotonic() + wait_seconds
+            delay = STACK_POLL_INITIAL_DELAY
+            events: List[StackEvent] = []
+            completed_resources = 0
+
+            while True:
+                new_events = await asyncio.to_thread(
+                    self._get_new_stack_events, cfn_client, stack_id
+                )
+                if new_events:
+                    events.extend(new_events)
+                    completed_resources += sum(
+                        1
+                        for event in new_events
+                        if event.resource_status.endswith('_COMPLETE')
+                        and event.resource_type != 'AWS::CloudFormation::Stack'
+                    )
+                    await self._report_stack_events(ctx, new_events, completed_resources)
+                    delay = STACK_POLL_INITIAL_DELAY
+
+                stack_details = await asyncio.to_thread(
+                    cfn_client.describe_stacks, StackName=stack_id
+                )
+                stack = stack_details['Stacks'][0]
+                self._stack_cache[stack_name] = stack
+                complete = not stack['StackStatus'].endswith('_IN_PROGRESS')
+
+                remaining = deadline - time.monotonic()
+                if complete or remaining <= 0:
+                    break
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, STACK_POLL_MAX_DELAY)
+
+            # Extract outputs
+            outputs = {
+                output['OutputKey']: output['OutputValue']
+                for output in stack.get('Outputs', [])
+                if 'OutputKey' in output and 'OutputValue' in output
+            }
+
+            if complete:
+                message = f'CloudFormation stack {stack_name} finished with status {stack["StackStatus"]}'
+            else:
+                message = f'CloudFormation stack {stack_name} is still {stack["StackStatus"]} after {wait_seconds} seconds; call wait again to keep waiting'
+            log_with_request_id(ctx, LogLevel.INFO, message)
+
+            return WaitStackResponse(
+                isError=False,
+                content=cast(
+                    List[Union[TextContent, ImageContent, EmbeddedResource]],
+                    [TextContent(type='text', text=message)],
+                ),
+                stack_name=stack_name,
+                stack_id=stack_id,
+                cluster_name=cluster_name,
+                stack_status=stack['StackStatus'],
+                complete=complete,
+                events=events,
+                outputs=outputs,
+            )
+        except Exception as e:
+            error_message = f'Failed to wait for stack: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return WaitStackResponse(
+                isError=True,
+                content=cast(
+                    List[Union[TextContent, ImageContent, EmbeddedResource]],
+                    [TextContent(type='text', text=error_message or 'Unknown error')],
+                ),
+                stack_name=stack_name,
+                stack_id='',
+                cluster_name=cluster_name,
+                stack_status='',
+                complete=False,
+                events=[],
+                outputs={},
+            )
+
+    def _record_last_event(self, cfn_client: Any, stack_name: str) -> None:
+        """Record the newest event of a stack, so only later events are reported."""
+        try:
+            response = cfn_client.describe_stack_events(StackName=stack_name)
+            stack_events = response.get('StackEvents', [])
+            if stack_events:
+                self._last_event_ids[stack_events[0]['StackId']] = stack_events[0]['EventId']
+        except Exception:
+            # The events of the previous operation are then reported as well
+            pass
+
+    def _get_new_stack_events(self, cfn_client: Any, stack_id: str) -> List[StackEvent]:
+        """Get the events of a stack since the last reported event.
+
+        Without a last reported event, the events of the current (or last) stack operation are
+        returned, from the newest page of events.
+
+        Args:
+            cfn_client: CloudFormation client
+            stack_id: ID of the stack
+
+        Returns:
+            New stack events, oldest first
+        """
+        last_event_id = self._last_event_ids.get(stack_id)
+        raw_events = []
+        kwargs = {'StackName': stack_id}
+        while True:
+            response = cfn_client.describe_stack_events(**kwargs)
+            page = response.get('StackEvents', [])
+            event_ids = [event['EventId'] for event in page]
+            if last_event_id in event_ids:
+                raw_events.extend(page[: event_ids.index(last_event_id)])
+                break
+            raw_events.extend(page)
+            if last_event_id is None:
+                raw_events = self._current_operation_events(raw_events)
+                break
+            if not response.get('NextToken'):
+                break
+            kwargs['NextToken'] = response['NextToken']
+
+        if raw_events:
+            self._last_event_ids[stack_id] = raw_events[0]['EventId']
+
+        return [
+            StackEvent(
+                timestamp=event['Timestamp'].isoformat()
+                if hasattr(event['Timestamp'], 'isoformat')
+                else str(event['Timestamp']),
+                logical_resource_id=event.get('LogicalResourceId', ''),
+                resource_type=event.get('ResourceType', ''),
+                resource_status=event.get('ResourceStatus', ''),
+                resource_status_reason=event.get('ResourceStatusReason'),
+            )
+            for event in reversed(raw_events)
+        ]
+
+    def _current_operation_events(self, raw_events: List[Dict]) -> List[Dict]:
+        """Cut stack events, newest first, at the event starting the latest stack operation."""
+        for index, event in enumerate(raw_events):
+            if (
+                event.get('ResourceType') == 'AWS::CloudFormation::Stack'
+                and event.get('LogicalResourceId') == event.get('StackName')
+                and event.get('ResourceStatus') in STACK_OPERATION_START_STATUSES
+            ):
+                return raw_events[: index + 1]
+        return raw_events
+
+    async def _report_stack_events(
+        self, ctx: Context, events: List[StackEvent], completed_resources: int
+    ) -> None:
+        """Stream new stack events to the client as a progress notification."""
+        lines = []
+        for event in events:
+            line = f'{event.timestamp} {event.logical_resource_id} ({event.resource_type}) {event.resource_status}'
+            if event.resource_status_reason:
+                line += f': {event.resource_status_reason}'
+            lines.append(line)
+        try:
+            await ctx.report_progress(completed_resources, None, '\n'.join(lines))
+        except Exception as e:
+            log_with_request_id(ctx, LogLevel.DEBUG, f'Failed to report stack events: {str(e)}')
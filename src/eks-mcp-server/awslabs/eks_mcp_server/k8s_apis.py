@@ -14,9 +14,20 @@
 import base64
 import os
 import tempfile
+from awslabs.eks_mcp_server.k8s_discovery_cache import DiscoveryCache
 from awslabs.eks_mcp_server.models import Operation
 from loguru import logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Number of resources requested per page when listing resources
+LIST_PAGE_SIZE = 500
+
+# Accept header asking the API server for the metadata of listed resources only, falling back
+# to full objects on servers that cannot serve PartialObjectMetadataList
+METADATA_ONLY_ACCEPT = (
+    'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+)
 
 
 class K8sApis:
@@ -35,8 +46,9 @@ class K8sApis:
             ca_data: CA certificate data (base64 encoded) - required for SSL verification
         """
         try:
-            from kubernetes import client, dynamic
+            from kubernetes import client
 
+            self.endpoint = endpoint
             configuration = client.Configuration()
             configuration.host = endpoint
             configuration.api_key = {'authorization': f'Bearer {token}'}
@@ -46,39 +58,76 @@ class K8sApis:
 
             # Always enable SSL verification with CA data
             configuration.verify_ssl = True
+            ca_cert_data = base64.b64decode(ca_data)
 
-            # Create a temporary file for the CA certificate using a context manager
-            try:
-                with tempfile.NamedTemporaryFile(delete=False) as ca_cert_file:
-                    ca_cert_data = base64.b64decode(ca_data)
-                    ca_cert_file.write(ca_cert_data)
-                    # File is automatically closed when exiting the with block
-
-                    # Store the path for cleanup and set the SSL CA cert
-                    self._ca_cert_file_path = ca_cert_file.name
-                    # Set the SSL CA cert to the temporary file path
-                    # Use setattr to avoid potential attribute access issues
-                    setattr(configuration, 'ssl_ca_cert', ca_cert_file.name)
-            except Exception as e:
-                # If we have a path and the file exists, clean it up
-                if (
-                    hasattr(self, '_ca_cert_file_path')
-                    and self._ca_cert_file_path
-                    and os.path.exists(self._ca_cert_file_path)
-                ):
-                    os.unlink(self._ca_cert_file_path)
-                raise e
+            if hasattr(configuration, 'ca_cert_data'):
+                # Load the CA certificate in memory when the client supports it (kubernetes>=37)
+                configuration.ca_cert_data = ca_cert_data.decode('utf-8')
+            else:
+                # Create a temporary file for the CA certificate using a context manager
+                try:
+                    with tempfile.NamedTemporaryFile(delete=False) as ca_cert_file:
+                        ca_cert_file.write(ca_cert_data)
+                        # File is automatically closed when exiting the with block
+
+                        # Store the path for cleanup and set the SSL CA cert
+                        self._ca_cert_file_path = ca_cert_file.name
+                        # Set the SSL CA cert to the temporary file path
+                        # Use setattr to avoid potential attribute access issues
+                        setattr(configuration, 'ssl_ca_cert', ca_cert_file.name)
+                except Exception as e:
+                    # If we have a path and the file exists, clean it up
+                    if (
+                        hasattr(self, '_ca_cert_file_path')
+                        and self._ca_cert_file_path
+                        and os.path.exists(self._ca_cert_file_path)
+                    ):
+                        os.unlink(self._ca_cert_file_path)
+                    raise e
 
             # Create base API client
             self.api_client = client.ApiClient(configuration)
 
-            # Create dynamic client
-            self.dynamic_client = dynamic.DynamicClient(self.api_client)
+            # Create dynamic client, reusing the cluster's cached API discovery results
+            self.dynamic_client = DiscoveryCache().get_dynamic_client(endpoint, self.api_client)
 
         except ImportError:
             logger.error('kubernetes package not installed')
             raise
 
+    def update_token(self, token: str) -> None:
+        """Replace the authentication token of the client.
+
+        The API client, its connection pool and the dynamic client are kept, so requests after a
+        token refresh reuse the open connections to the API server.
+
+        Args:
+            token: New authentication token
+        """
+        self.api_client.configuration.api_key = {'authorization': f'Bearer {token}'}
+
+    def _get_resource(self, api_version: str, kind: str) -> Any:
+        """Get the dynamic API resource of a kind.
+
+        The dynamic client discovers the APIs again when the kind is missing from its cached
+        discovery results; if the kind is still not found, the cached API versions of the cluster
+        are dropped so they reflect the new discovery results.
+
+        Args:
+            api_version: API version (e.g., 'v1', 'apps/v1')
+            kind: Resource kind (e.g., 'Pod', 'Service')
+
+        Returns:
+            The dynamic resource object
+        """
+        from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+        try:
+            return self.dynamic_client.resources.get(api_version=api_version, kind=kind)
+        except ResourceNotFoundError:
+            DiscoveryCache().invalidate(self.endpoint)
+            raise
+
     def _patch_resource(
         self,
         resource,
@@ -160,7 +209,7 @@ class K8sApis:
 
         try:
             # Get the API resource
-            resource = self.dynamic_client.resources.get(api_version=api_version, kind=kind)
+            resource = self._get_resource(api_version, kind)
 
             # Set kind and apiVersion in the body if provided
             if body:
@@ -193,18 +242,25 @@ class K8sApis:
 
         except Exception as e:
             # Re-raise with more context
-            raise ValueError(f'Error managing {kind} resource: {str(e)}')
+            raise ValueError(f'Error managing {kind} resource: {str(e)}') from e
 
-    def list_resources(
+    def iter_resource_pages(
         self,
         kind: str,
         api_version: str,
         namespace: Optional[str] = None,
         label_selector: Optional[str] = None,
         field_selector: Optional[str] = None,
+        page_size: int = LIST_PAGE_SIZE,
+        metadata_only: bool = False,
         **kwargs,
-    ) -> Any:
-        """List Kubernetes resources of a specific kind using dynamic client.
+    ) -> Iterator[Any]:
+        """List Kubernetes resources of a specific kind one page at a time.
+
+        Pages are requested with ``limit`` and the ``continue`` token of the previous page, so
+        only one page of resources is held in memory at a time. In metadata-only mode the API
+        server returns a PartialObjectMetadataList, leaving out the spec and status of every
+        resource.
 
         Args:
             kind: Resource kind (e.g., 'Pod', 'Service')
@@ -212,34 +268,88 @@ class K8sApis:
             namespace: Namespace to list resources from (optional)
             label_selector: Label selector to filter resources (optional)
             field_selector: Field selector to filter resources (optional)
+            page_size: Maximum number of resources per page
+            metadata_only: Whether to fetch only the metadata of the resources
             **kwargs: Additional arguments for the API call
 
-        Returns:
-            The API response containing the list of resources
+        Yields:
+            API responses, each containing one page of resources in its items
         """
         try:
             # Get the API resource
-            resource = self.dynamic_client.resources.get(api_version=api_version, kind=kind)
+            resource = self._get_resource(api_version, kind)
 
             # Prepare kwargs for the list operation
-            list_kwargs = {}
+            list_kwargs: Dict[str, Any] = {'limit': page_size}
+            if namespace:
+                list_kwargs['namespace'] = namespace
             if label_selector:
                 list_kwargs['label_selector'] = label_selector
             if field_selector:
                 list_kwargs['field_selector'] = field_selector
+            if metadata_only:
+                list_kwargs['header_params'] = {'Accept': METADATA_ONLY_ACCEPT}
 
             # Add any additional kwargs
             list_kwargs.update(kwargs)
 
-            # List resources
-            if namespace:
-                return resource.get(namespace=namespace, **list_kwargs)
-            else:
-                return resource.get(**list_kwargs)
+            continue_token = None
+            while True:
+                if continue_token:
+                    list_kwargs['_continue'] = continue_token
+                page = resource.get(**list_kwargs)
+                yield page
+
+                continue_token = getattr(page.metadata, 'continue', None)
+                if not isinstance(continue_token, str) or not continue_token:
+                    return
 
         except Exception as e:
             # Re-raise with more context
-            raise ValueError(f'Error listing {kind} resources: {str(e)}')
+            raise ValueError(f'Error listing {kind} resources: {str(e)}') from e
+
+    def list_resources(
+        self,
+        kind: str,
+        api_version: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        page_size: int = LIST_PAGE_SIZE,
+        metadata_only: bool = False,
+        **kwargs,
+    ) -> Any:
+        """List Kubernetes resources of a specific kind using dynamic client.
+
+        Args:
+            kind: Resource kind (e.g., 'Pod', 'Service')
+            api_version: API version (e.g., 'v1', 'apps/v1')
+            namespace: Namespace to list resources from (optional)
+            label_selector: Label selector to filter resources (optional)
+            field_selector: Field selector to filter resources (optional)
+            page_size: Maximum number of resources requested per page
+            metadata_only: Whether to fetch only the metadata of the resources
+            **kwargs: Additional arguments for the API call
+
+        Returns:
+            The API response of the first page, with the resources of all pages in its items
+        """
+        pages = self.iter_resource_pages(
+            kind,
+            api_version,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            page_size=page_size,
+            metadata_only=metadata_only,
+            **kwargs,
+        )
+        response = next(pages)
+        items = list(response.items)
+        for page in pages:
+            items.extend(page.items)
+        response.items = items
+        return response
 
     def apply_from_yaml(
         self, yaml_objects: list, namespace: str = 'default', force: bool = True, **kwargs
@@ -279,7 +389,7 @@ class K8sApis:
 
             try:
                 # Get the API resource
-                resource = self.dynamic_client.resources.get(api_version=api_version, kind=kind)
+                resource = self._get_resource(api_version, kind)
 
                 # Check if resource exists
                 exists = False
@@ -318,7 +428,7 @@ class K8sApis:
             except Exception as e:
                 # Add context to the error
                 resource_name = f'{obj_namespace}/{name}' if obj_namespace else name
-                raise ValueError(f'Error applying {kind} {resource_name}: {str(e)}')
+                raise ValueError(f'Error applying {kind} {resource_name}: {str(e)}') from e
 
         return results, created_count, updated_count
 
@@ -340,7 +450,7 @@ class K8sApis:
         """
         try:
             # Get the Event resource using the dynamic client
-            event_resource = self.dynamic_client.resources.get(api_version='v1', kind='Event')
+            event_resource = self._get_resource('v1', 'Event')
 
             # Prepare field selector to filter events
             field_selector = f'involvedObject.kind={kind},involvedObject.name={name}'
@@ -382,7 +492,7 @@ class K8sApis:
         except Exception as e:
             # Re-raise with more context
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
-            raise ValueError(f'Error getting events for {kind} {resource_name}: {str(e)}')
+            raise ValueError(f'Error getting events for {kind} {resource_name}: {str(e)}') from e
 
     def get_pod_logs(
         self,
@@ -392,6 +502,8 @@ class K8sApis:
         since_seconds: Optional[int] = None,
         tail_lines: Optional[int] = None,
         limit_bytes: Optional[int] = None,
+        since_time: Optional[str] = None,
+        timestamps: bool = False,
     ) -> str:
         """Get logs from a pod.
 
@@ -402,33 +514,44 @@ class K8sApis:
             since_seconds: Only return logs newer than this many seconds (optional)
             tail_lines: Number of lines to return from the end of the logs (optional)
             limit_bytes: Maximum number of bytes to return (optional)
+            since_time: Only return logs after this RFC 3339 time (optional)
+            timestamps: Whether to prefix each line with its RFC 3339 timestamp
 
         Returns:
             Pod logs as a string
         """
         try:
             # Get the Pod resource using the dynamic client
-            pod_resource = self.dynamic_client.resources.get(api_version='v1', kind='Pod')
+            pod_resource = self._get_resource('v1', 'Pod')
 
-            # Prepare parameters for the log subresource
-            params = {}
+            # Prepare query parameters for the log subresource; the dynamic client only
+            # forwards the parameters it knows, so the log options are passed as query_params
+            query_params = []
             if container_name:
-                params['container'] = container_name
+                query_params.append(('container', container_name))
             if since_seconds:
-                params['sinceSeconds'] = since_seconds
+                query_params.append(('sinceSeconds', since_seconds))
+            if since_time:
+                query_params.append(('sinceTime', since_time))
             if tail_lines:
-                params['tailLines'] = tail_lines
+                query_params.append(('tailLines', tail_lines))
             if limit_bytes:
-                params['limitBytes'] = limit_bytes
+                query_params.append(('limitBytes', limit_bytes))
+            if timestamps:
+                query_params.append(('timestamps', 'true'))
 
             # Call the log subresource (note: singular 'log', not 'logs')
-            logs_response = pod_resource.log.get(name=pod_name, namespace=namespace, **params)
+            logs_response = pod_resource.log.get(
+                name=pod_name, namespace=namespace, query_params=query_params
+            )
 
             return logs_response
 
         except Exception as e:
             # Re-raise with more context
-            raise ValueError(f'Error getting logs from pod {namespace}/{pod_name}: {str(e)}')
+            raise ValueError(
+                f'Error getting logs from pod {namespace}/{pod_name}: {str(e)}'
+            ) from e
 
     def get_api_versions(self) -> List[str]:
         """Get preferred API versions from the Kubernetes cluster.
@@ -439,6 +562,10 @@ class K8sApis:
         Returns:
             List of preferred API versions (e.g., ['v1', 'apps/v1', 'networking.k8s.io/v1'])
         """
+        cached_versions = DiscoveryCache().get_api_versions(self.endpoint)
+        if cached_versions is not None:
+            return cached_versions
+
         try:
             from kubernetes import client
 
@@ -459,7 +586,7 @@ class K8sApis:
                                 api_versions.add(version)
             except Exception as e:
                 logger.warning(f'Error getting core API versions: {str(e)}')
-                raise ValueError(f'Error getting API versions: {str(e)}')
+                raise ValueError(f'Error getting API versions: {str(e)}') from e
 
             # Get API groups and their preferred versions
             try:
@@ -486,11 +613,13 @@ class K8sApis:
                 logger.warning(f'Error getting API groups: {str(e)}')
 
             # Convert to sorted list
-            return sorted(api_versions)
+            sorted_versions = sorted(api_versions)
+            DiscoveryCache().set_api_versions(self.endpoint, sorted_versions)
+            return sorted_versions
 
         except Exception as e:
             # Re-raise with more context
-            raise ValueError(f'Error getting API versions: {str(e)}')
+            raise ValueError(f'Error getting API versions: {str(e)}') from e
 
     def __del__(self):
         """Clean up temporary files when the object is garbage collected."""
@@ -12,9 +12,16 @@
 """Kubernetes client cache for the EKS MCP Server."""
 
 import base64
+import ssl
+import threading
+import time
 from awslabs.eks_mcp_server.aws_helper import AwsHelper
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
+from loguru import logger
+from typing import Dict, Optional, Tuple
+from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import SSLError as Urllib3SSLError
 
 
 # Presigned url timeout in seconds
@@ -25,12 +32,51 @@ K8S_AWS_ID_HEADER = 'x-k8s-aws-id'
 # 14 minutes in seconds (buffer before the 15-minute token expiration)
 TOKEN_TTL = 14 * 60
 
+# Time before a token's TTL runs out when the background refresh replaces it, in seconds
+TOKEN_REFRESH_MARGIN = 2 * 60
+
+# Interval between background checks for tokens to refresh, in seconds
+TOKEN_REFRESH_INTERVAL = 30
+
+# Time the endpoint and CA data of a cluster are reused before describing the cluster again
+CLUSTER_INFO_TTL = 60 * 60
+
+
+def is_stale_client_error(error: BaseException) -> bool:
+    """Check whether an error means the cached client of a cluster can no longer reach it.
+
+    The API server rejecting the token (401) or the TLS handshake failing (e.g. after the CA of the
+    cluster was rotated) are not fixed by retrying with the same client. The errors K8sApis
+    re-raises with more context are followed back to the error of the request itself.
+
+    Args:
+        error: Error raised by a Kubernetes API request
+
+    Returns:
+        True if the client of the cluster should be rebuilt
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, MaxRetryError) and current.reason is not None:
+            current = current.reason
+        if getattr(current, 'status', None) == 401 or isinstance(
+            current, (ssl.SSLError, Urllib3SSLError)
+        ):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
 
 class K8sClientCache:
     """Singleton class for managing Kubernetes API client cache.
 
     This class provides a centralized cache for Kubernetes API clients
-    to avoid creating multiple clients for the same cluster.
+    to avoid creating multiple clients for the same cluster. Tokens are refreshed in the
+    background shortly before they expire, keeping each client and its connection pool, and the
+    endpoint and CA data of each cluster are cached separately from its token. A client is rebuilt
+    when the endpoint or CA data of its cluster change.
     """
 
     # Singleton instance
@@ -49,8 +95,20 @@ class K8sClientCache:
         if hasattr(self, '_initialized') and self._initialized:
             return
 
-        # Client cache with TTL to handle token expiration
-        self._client_cache = TTLCache(maxsize=100, ttl=TOKEN_TTL)
+        # Clients by cluster name, with the time their token must be replaced by
+        self._client_cache = LRUCache(maxsize=100)
+        self._token_expires_at: Dict[str, float] = {}
+
+        # Endpoint and CA data by cluster name, and the ones each cached client was built with
+        self._cluster_info_cache = TTLCache(maxsize=100, ttl=CLUSTER_INFO_TTL)
+        self._client_cluster_info: Dict[str, Tuple[str, str]] = {}
+
+        # The cache lock only guards the dictionaries; describing a cluster and creating its
+        # client happen under the lock of the cluster, so other clusters are not blocked
+        self._lock = threading.RLock()
+        self._cluster_locks: Dict[str, threading.Lock] = {}
+        self._refresh_thread = None
+        self._stop_event = threading.Event()
 
         # Clients for credential retrieval
         self._eks_client = None
@@ -69,14 +127,16 @@ class K8sClientCache:
         if self._sts_client is None:
             sts_client = AwsHelper.create_boto3_client('sts')
 
-            # Register STS event handlers
+            # Register STS event handlers, once on the pooled client
             sts_client.meta.events.register(
                 'provide-client-params.sts.GetCallerIdentity',
                 self._retrieve_k8s_aws_id,
+                unique_id='eks-mcp-server-retrieve-k8s-aws-id',
             )
             sts_client.meta.events.register(
                 'before-sign.sts.GetCallerIdentity',
                 self._inject_k8s_aws_id_header,
+                unique_id='eks-mcp-server-inject-k8s-aws-id',
             )
 
             self._sts_client = sts_client
@@ -93,27 +153,38 @@ class K8sClientCache:
         if K8S_AWS_ID_HEADER in request.context:
             request.headers[K8S_AWS_ID_HEADER] = request.context[K8S_AWS_ID_HEADER]
 
-    def _get_cluster_credentials(self, cluster_name: str):
-        """Get credentials for an EKS cluster (private method).
+    def _get_cluster_info(self, cluster_name: str) -> Tuple[str, str]:
+        """Get the endpoint and CA data of an EKS cluster, from the cache if fresh.
 
         Args:
             cluster_name: Name of the EKS cluster
 
         Returns:
-            Tuple of (endpoint, token, ca_data)
+            Tuple of (endpoint, ca_data)
+        """
+        with self._lock:
+            cluster_info = self._cluster_info_cache.get(cluster_name)
+        if cluster_info is None:
+            response = self._get_eks_client().describe_cluster(name=cluster_name)
+            cluster_info = (
+                response['cluster']['endpoint'],
+                response['cluster']['certificateAuthority']['data'],
+            )
+            with self._lock:
+                self._cluster_info_cache[cluster_name] = cluster_info
+        return cluster_info
 
-        Raises:
-            ValueError: If the cluster credentials are invalid
-            Exception: If there's an error getting the cluster credentials
+    def _get_token(self, cluster_name: str) -> str:
+        """Create an authentication token for an EKS cluster.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+
+        Returns:
+            Token presigning an STS GetCallerIdentity request for the cluster
         """
-        eks_client = self._get_eks_client()
         sts_client = self._get_sts_client()
 
-        # Get cluster details
-        response = eks_client.describe_cluster(name=cluster_name)
-        endpoint = response['cluster']['endpoint']
-        ca_data = response['cluster']['certificateAuthority']['data']
-
         # Generate a presigned URL for authentication
         url = sts_client.generate_presigned_url(
             'get_caller_identity',
@@ -123,12 +194,88 @@ class K8sClientCache:
         )
 
         # Create the token from the presigned URL
-        token = TOKEN_PREFIX + base64.urlsafe_b64encode(url.encode('utf-8')).decode(
-            'utf-8'
-        ).rstrip('=')
+        encoded_url = base64.urlsafe_b64encode(url.encode('utf-8')).decode('utf-8')
+        return TOKEN_PREFIX + encoded_url.rstrip('=')
 
+    def _get_cluster_credentials(self, cluster_name: str):
+        """Get credentials for an EKS cluster (private method).
+
+        Args:
+            cluster_name: Name of the EKS cluster
+
+        Returns:
+            Tuple of (endpoint, token, ca_data)
+
+        Raises:
+            ValueError: If the cluster credentials are invalid
+            Exception: If there's an error getting the cluster credentials
+        """
+        endpoint, ca_data = self._get_cluster_info(cluster_name)
+        token = self._get_token(cluster_name)
         return endpoint, token, ca_data
 
+    def _refresh_token(self, cluster_name: str) -> None:
+        """Replace the token of a cached client, keeping the client and its connection pool.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+        """
+        token = self._get_token(cluster_name)
+        with self._lock:
+            client = self._client_cache.get(cluster_name)
+            if client is None:
+                return
+            client.update_token(token)
+            self._token_expires_at[cluster_name] = time.time() + TOKEN_TTL
+
+    def _refresh_tokens(self) -> None:
+        """Refresh the tokens of the cached clients shortly before they expire, until stopped."""
+        while not self._stop_event.wait(TOKEN_REFRESH_INTERVAL):
+            refresh_before = time.time() + TOKEN_REFRESH_MARGIN
+            with self._lock:
+                # Forget the tokens and cluster info of clients evicted from the cache
+                for cluster_name in list(self._token_expires_at):
+                    if cluster_name not in self._client_cache:
+                        del self._token_expires_at[cluster_name]
+                        self._client_cluster_info.pop(cluster_name, None)
+                cluster_names = [
+                    cluster_name
+                    for cluster_name in self._client_cache
+                    if self._token_expires_at.get(cluster_name, 0) < refresh_before
+                ]
+            for cluster_name in cluster_names:
+                try:
+                    self._refresh_token(cluster_name)
+                    logger.debug(f'Refreshed the token of cluster {cluster_name}')
+                except Exception as e:
+                    # get_client refreshes the token when it is used after expiring
+                    logger.warning(f'Failed to refresh the token of cluster {cluster_name}: {e}')
+
+    def _start_refresh_thread(self) -> None:
+        """Start the background token refresh if it is not running."""
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            self._stop_event.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_tokens, name='k8s-token-refresh', daemon=True
+            )
+            self._refresh_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background token refresh."""
+        self._stop_event.set()
+
+    def invalidate(self, cluster_name: str) -> None:
+        """Drop the cached client and cluster info of a cluster, so the next request rebuilds them.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+        """
+        with self._lock:
+            self._client_cache.pop(cluster_name, None)
+            self._token_expires_at.pop(cluster_name, None)
+            self._client_cluster_info.pop(cluster_name, None)
+            self._cluster_info_cache.pop(cluster_name, None)
+
     def get_client(self, cluster_name: str) -> K8sApis:
         """Get a Kubernetes client for the specified cluster.
 
@@ -144,8 +291,26 @@ class K8sClientCache:
             ValueError: If the cluster credentials are invalid
             Exception: If there's an error getting the cluster credentials
         """
-        if cluster_name not in self._client_cache:
+        with self._lock:
+            cluster_lock = self._cluster_locks.setdefault(cluster_name, threading.Lock())
+
+        with cluster_lock:
+            with self._lock:
+                client = self._client_cache.get(cluster_name)
+                token_expires_at = self._token_expires_at.get(cluster_name, 0)
+                client_cluster_info = self._client_cluster_info.get(cluster_name)
+
             try:
+                if client is not None:
+                    # Describe the cluster again once its info expired, keeping the client
+                    # unless the endpoint or CA data changed
+                    if self._get_cluster_info(cluster_name) == client_cluster_info:
+                        if time.time() >= token_expires_at:
+                            # The background refresh fell behind; refresh the token before use
+                            self._refresh_token(cluster_name)
+                        return client
+                    logger.info(f'Endpoint or CA data of cluster {cluster_name} changed')
+
                 # Create a new client
                 endpoint, token, ca_data = self._get_cluster_credentials(cluster_name)
 
@@ -153,7 +318,7 @@ class K8sClientCache:
                 if not endpoint or not token or endpoint is None or token is None:
                     raise ValueError('Invalid cluster credentials')
 
-                self._client_cache[cluster_name] = K8sApis(endpoint, token, ca_data)
+                client = K8sApis(endpoint, token, ca_data)
             except ValueError:
                 # Re-raise ValueError for invalid credentials
                 raise
@@ -161,4 +326,9 @@ class K8sClientCache:
                 # Re-raise any other exceptions
                 raise Exception(f'Failed to get cluster credentials: {str(e)}')
 
-        return self._client_cache[cluster_name]
+            with self._lock:
+                self._client_cache[cluster_name] = client
+                self._token_expires_at[cluster_name] = time.time() + TOKEN_TTL
+                self._client_cluster_info[cluster_name] = (endpoint, ca_data)
+                self._start_refresh_thread()
+            return client
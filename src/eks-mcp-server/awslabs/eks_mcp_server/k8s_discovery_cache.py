@@ -0,0 +1,200 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Kubernetes API discovery cache for the EKS MCP Server."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Directory holding the API discovery results of each cluster
+DISCOVERY_CACHE_DIR = Path.home() / '.cache' / 'awslabs-eks-mcp-server' / 'discovery'
+
+# Time discovery results are used before checking that the cluster's server version is unchanged
+DISCOVERY_CACHE_TTL = 6 * 60 * 60
+
+
+class DiscoveryCache:
+    """Singleton class for sharing Kubernetes API discovery results.
+
+    Discovery results are kept per cluster in memory, in one dynamic client that is rebound to
+    each new API client (and token) of the cluster, and on disk, so a new process does not
+    discover the APIs again. Results older than the TTL are checked against the server version
+    of the cluster and dropped when the cluster was upgraded.
+    """
+
+    # Singleton instance
+    _instance = None
+
+    def __new__(cls):
+        """Ensure only one instance of DiscoveryCache exists."""
+        if cls._instance is None:
+            cls._instance = super(DiscoveryCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the discovery cache."""
+        # Only initialize once
+        if hasattr(self, '_initialized') and self._initialized:
+            return
+
+        # Dynamic client, server version, validation time and API versions by cluster endpoint
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self._initialized = True
+
+    def cache_file(self, endpoint: str) -> Path:
+        """Return the file holding the discovery results of a cluster.
+
+        Args:
+            endpoint: Kubernetes API endpoint of the cluster
+
+        Returns:
+            Path of the cache file
+        """
+        return DISCOVERY_CACHE_DIR / f'{hashlib.sha256(endpoint.encode()).hexdigest()}.json'
+
+    def _get_server_version(self, api_client: Any) -> Optional[str]:
+        """Return the git version of the cluster's API server, or None if it cannot be read."""
+        try:
+            from kubernetes import client
+
+            return client.VersionApi(api_client).get_code().git_version
+        except Exception as e:
+            logger.warning(f'Failed to get the Kubernetes server version: {str(e)}')
+            return None
+
+    def _read_cached_version(self, path: Path) -> Optional[str]:
+        """Return the server version recorded in a discovery cache file."""
+        try:
+            cache = json.loads(path.read_text(encoding='utf-8'))
+            return cache['version']['kubernetes']['gitVersion']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _validate_cache_file(self, endpoint: str, api_client: Any) -> Optional[str]:
+        """Remove the cache file of a cluster if it is stale and the server version changed.
+
+        Returns:
+            Server version of the cluster if it was checked
+        """
+        path = self.cache_file(endpoint)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            return None
+        if age <= DISCOVERY_CACHE_TTL:
+            return None
+
+        server_version = self._get_server_version(api_client)
+        try:
+            if server_version is not None and server_version != self._read_cached_version(path):
+                logger.info(f'Server version of {endpoint} changed, discovering APIs again')
+                path.unlink()
+            else:
+                os.utime(path)
+        except OSError as e:
+            logger.warning(f'Failed to update discovery cache {path}: {str(e)}')
+        return server_version
+
+    def get_dynamic_client(self, endpoint: str, api_client: Any) -> Any:
+        """Return the dynamic client of a cluster, bound to the given API client.
+
+        Args:
+            endpoint: Kubernetes API endpoint of the cluster
+            api_client: Kubernetes API client with the current credentials of the cluster
+
+        Returns:
+            Dynamic client reusing the cluster's cached discovery results
+        """
+        from kubernetes import dynamic
+
+        with self._lock:
+            now = time.time()
+            entry = self._entries.get(endpoint)
+            if entry is not None and now - entry['validated_at'] > DISCOVERY_CACHE_TTL:
+                server_version = self._get_server_version(api_client)
+                cached_version = entry['server_version'] or self._read_cached_version(
+                    self.cache_file(endpoint)
+                )
+                if server_version is None or server_version == cached_version:
+                    entry['validated_at'] = now
+                    entry['server_version'] = server_version or cached_version
+                else:
+                    logger.info(f'Server version of {endpoint} changed, discovering APIs again')
+                    self.cache_file(endpoint).unlink(missing_ok=True)
+                    entry = None
+
+            if entry is None:
+                server_version = self._validate_cache_file(endpoint, api_client)
+                entry = {
+                    'dynamic_client': dynamic.DynamicClient(
+                        api_client, cache_file=str(self.cache_file(endpoint))
+                    ),
+                    'server_version': server_version,
+                    'validated_at': now,
+                    'api_versions': None,
+                }
+                self._entries[endpoint] = entry
+            else:
+                # Keep the discovered resources and send their requests with the new credentials
+                entry['dynamic_client'].client = api_client
+                entry['dynamic_client'].configuration = api_client.configuration
+
+            return entry['dynamic_client']
+
+    def get_api_versions(self, endpoint: str) -> Optional[List[str]]:
+        """Return the cached preferred API versions of a cluster.
+
+        Args:
+            endpoint: Kubernetes API endpoint of the cluster
+
+        Returns:
+            Preferred API versions, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            return list(entry['api_versions']) if entry and entry['api_versions'] else None
+
+    def set_api_versions(self, endpoint: str, api_versions: List[str]) -> None:
+        """Cache the preferred API versions of a cluster.
+
+        Args:
+            endpoint: Kubernetes API endpoint of the cluster
+            api_versions: Preferred API versions
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None:
+                entry['api_versions'] = list(api_versions)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop the cached API versions of a cluster after a resource kind was not found.
+
+        The dynamic client already discovers the APIs again when a kind is missing from its
+        results; the API versions are dropped so they reflect the new discovery results.
+
+        Args:
+            endpoint: Kubernetes API endpoint of the cluster
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None:
+                entry['api_versions'] = None
@@ -11,10 +11,15 @@
 
 """Kubernetes handler for the EKS MCP Server."""
 
+import asyncio
+import heapq
 import os
+import re
+import time
 import yaml
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
-from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache
+from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache, is_stale_client_error
+from awslabs.eks_mcp_server.k8s_watch_cache import K8sWatchCache
 from awslabs.eks_mcp_server.logging_helper import LogLevel, log_with_request_id
 from awslabs.eks_mcp_server.models import (
     ApiVersionsResponse,
@@ -24,6 +29,7 @@ from awslabs.eks_mcp_server.models import (
     GenerateAppManifestResponse,
     KubernetesResourceListResponse,
     KubernetesResourceResponse,
+    MultiPodLogsResponse,
     Operation,
     PodLogsResponse,
     ResourceSummary,
@@ -31,7 +37,37 @@ from awslabs.eks_mcp_server.models import (
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
 from pydantic import Field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+
+# Maximum number of container logs get_pod_logs_by_selector fetches at the same time
+MAX_CONCURRENT_LOG_REQUESTS = 10
+
+# Maximum number of containers get_pod_logs_by_selector fetches logs from
+MAX_LOG_CONTAINERS = 100
+
+# Interval between polls for new log lines in follow mode, in seconds
+LOG_FOLLOW_INTERVAL = 2
+
+# Maximum time get_pod_logs_by_selector follows the logs, in seconds
+MAX_LOG_FOLLOW_SECONDS = 300
+
+# Maximum number of new log lines sent with each progress notification in follow mode
+MAX_FOLLOW_NOTIFICATION_LINES = 50
+
+
+def log_sort_key(timestamp: str) -> str:
+    """Return a key ordering RFC 3339 log timestamps with varying fractional digits.
+
+    Args:
+        timestamp: Timestamp prefixed to a log line by the API server (e.g.,
+            2025-01-01T12:00:00.123456789Z)
+
+    Returns:
+        Timestamp with its fraction padded to nanoseconds
+    """
+    seconds, _, fraction = timestamp.rstrip('Z').partition('.')
+    return f'{seconds}.{fraction.ljust(9, "0")}'
 
 
 class K8sHandler:
@@ -46,6 +82,7 @@ class K8sHandler:
         mcp,
         allow_write: bool = False,
         allow_sensitive_data_access: bool = False,
+        enable_watch_cache: bool = False,
     ):
         """Initialize the Kubernetes handler.
 
@@ -53,15 +90,19 @@ class K8sHandler:
             mcp: The MCP server instance
             allow_write: Whether to enable write access (default: False)
             allow_sensitive_data_access: Whether to allow access to sensitive data (default: False)
+            enable_watch_cache: Whether to serve resource lists and events from per-cluster
+                watch caches (default: False)
         """
         self.mcp = mcp
         self.client_cache = K8sClientCache()
         self.allow_write = allow_write
         self.allow_sensitive_data_access = allow_sensitive_data_access
+        self.watch_cache = K8sWatchCache(self.get_client) if enable_watch_cache else None
 
         # Register tools
         self.mcp.tool(name='list_k8s_resources')(self.list_k8s_resources)
         self.mcp.tool(name='get_pod_logs')(self.get_pod_logs)
+        self.mcp.tool(name='get_pod_logs_by_selector')(self.get_pod_logs_by_selector)
         self.mcp.tool(name='get_k8s_events')(self.get_k8s_events)
         self.mcp.tool(name='list_api_versions')(self.list_api_versions)
         self.mcp.tool(name='manage_k8s_resource')(self.manage_k8s_resource)
@@ -83,6 +124,16 @@ class K8sHandler:
         """
         return self.client_cache.get_client(cluster_name)
 
+    def _invalidate_stale_client(self, cluster_name: str, error: Exception) -> None:
+        """Drop the cached client of a cluster when a request failed on its token or TLS setup.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            error: Error raised by the request
+        """
+        if is_stale_client_error(error):
+            self.client_cache.invalidate(cluster_name)
+
     async def apply_yaml(
         self,
         ctx: Context,
@@ -208,6 +259,7 @@ class K8sHandler:
 
             except Exception as e:
                 # Any exception means the operation failed
+                self._invalidate_stale_client(cluster_name, e)
                 error_msg = f'Failed to apply YAML from file {yaml_path}: {str(e)}'
                 log_with_request_id(ctx, LogLevel.ERROR, error_msg)
 
@@ -285,6 +337,36 @@ class K8sHandler:
         # Then filter out null values
         return self.filter_null_values(resource)
 
+    def _summarize_resources(self, response: Any) -> List[ResourceSummary]:
+        """Summarize the items of a list response or page.
+
+        Args:
+            response: List response of the dynamic client
+
+        Returns:
+            Summary of each resource with its name, namespace, creation time and metadata
+        """
+        summaries = []
+        for item in response.items:
+            item_dict = self.cleanup_resource_response(item.to_dict())
+            metadata = item_dict.get('metadata', {})
+
+            # Dynamic client uses camelCase field names
+            creation_timestamp = metadata.get('creationTimestamp')
+            if creation_timestamp is not None:
+                creation_timestamp = str(creation_timestamp)
+
+            summaries.append(
+                ResourceSummary(
+                    name=metadata.get('name', ''),
+                    namespace=metadata.get('namespace'),
+                    creation_timestamp=creation_timestamp,
+                    labels=metadata.get('labels'),
+                    annotations=metadata.get('annotations'),
+                )
+            )
+        return summaries
+
     async def manage_k8s_resource(
         self,
         ctx: Context,
@@ -477,6 +559,7 @@ class K8sHandler:
             )
 
         except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
             # Log error
             resource_name = f'{namespace + "/" if namespace else ""}{name or ""}'
             error_msg = f'Failed to {operation} {kind} {resource_name}: {str(e)}'
@@ -557,41 +640,43 @@ class K8sHandler:
             KubernetesResourceListResponse with operation result
         """
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
-
-            # List resources
-            response = k8s_client.list_resources(
-                kind,
-                api_version,
-                namespace=namespace,
-                label_selector=label_selector,
-                field_selector=field_selector,
-            )
-
-            # Extract summaries from items and clean up the responses
-            summaries = []
-            for item in response.items:
-                item_dict = self.cleanup_resource_response(item.to_dict())
-                metadata = item_dict.get('metadata', {})
-
-                # Dynamic client uses camelCase field names
-                creation_timestamp = metadata.get('creationTimestamp')
-                if creation_timestamp is not None:
-                    creation_timestamp = str(creation_timestamp)
-
-                summary = ResourceSummary(
-                    name=metadata.get('name', ''),
-                    namespace=metadata.get('namespace'),
-                    creation_timestamp=creation_timestamp,
-                    labels=metadata.get('labels'),
-                    annotations=metadata.get('annotations'),
+            # Serve the list from the watch cache when enabled and able to answer the query; the
+            # first query of a kind waits for its initial LIST, so it runs off the event loop
+            cached_items = None
+            if self.watch_cache is not None:
+                cached_items = await asyncio.to_thread(
+                    self.watch_cache.list_resources,
+                    cluster_name,
+                    kind,
+                    api_version,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
                 )
-                summaries.append(summary)
 
-            log_with_request_id(
-                ctx, LogLevel.INFO, f'Cleaned up resource responses for {kind} resources'
-            )
+            if cached_items is not None:
+                summaries = [ResourceSummary(**item) for item in cached_items]
+                log_with_request_id(
+                    ctx, LogLevel.INFO, f'Served {kind} resources from the watch cache'
+                )
+            else:
+                # Get Kubernetes client for the cluster
+                k8s_client = self.get_client(cluster_name)
+
+                # List the metadata of the resources page by page, summarizing each page
+                summaries = []
+                for page in k8s_client.iter_resource_pages(
+                    kind,
+                    api_version,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    metadata_only=True,
+                ):
+                    summaries.extend(self._summarize_resources(page))
+                log_with_request_id(
+                    ctx, LogLevel.INFO, f'Cleaned up resource responses for {kind} resources'
+                )
 
             # Log success
             resource_location = f'in {namespace + "/" if namespace else ""}all namespaces'
@@ -616,6 +701,7 @@ class K8sHandler:
             )
 
         except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
             # Log error
             error_msg = f'Failed to list {kind} resources: {str(e)}'
             log_with_request_id(ctx, LogLevel.ERROR, error_msg)
@@ -922,6 +1008,7 @@ class K8sHandler:
             )
 
         except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
             # Format container info for error message
             container_info = f' (container: {container_name})' if container_name else ''
 
@@ -941,6 +1028,288 @@ class K8sHandler:
                 log_lines=[],
             )
 
+    async def get_pod_logs_by_selector(
+        self,
+        ctx: Context,
+        cluster_name: str = Field(
+            ..., description='Name of the EKS cluster where the pods are running.'
+        ),
+        namespace: str = Field(
+            ..., description='Kubernetes namespace where the pods are located.'
+        ),
+        label_selector: str = Field(
+            ...,
+            description='Label selector of the pods to retrieve logs from (e.g., "app=web"). Use the selector labels of a Deployment, StatefulSet or DaemonSet to get the logs of all its pods.',
+        ),
+        container_name: Optional[str] = Field(
+            None,
+            description='Name of the containers to get logs from. Default: all containers of the matching pods.',
+        ),
+        since_seconds: Optional[int] = Field(
+            None,
+            description='Only return logs newer than this many seconds. Useful for getting recent logs without retrieving the entire history.',
+        ),
+        tail_lines: int = Field(
+            100,
+            description='Number of lines to fetch from the end of the logs of each container. Default: 100.',
+        ),
+        limit_bytes: int = Field(
+            10240,
+            description='Maximum number of bytes to fetch from each container. Default: 10KB (10240 bytes).',
+        ),
+        grep: Optional[str] = Field(
+            None,
+            description='Regular expression the log lines must match (e.g., "ERROR|Exception"). Applied on the server before the lines are limited to max_lines.',
+        ),
+        max_lines: int = Field(
+            500,
+            description='Maximum number of merged log lines to return; the newest lines are kept. Default: 500.',
+        ),
+        follow_seconds: int = Field(
+            0,
+            description='Keep polling for new log lines for this many seconds (at most 300) and stream them as progress notifications. Default: 0 (no follow).',
+        ),
+    ) -> MultiPodLogsResponse:
+        """Get logs from all pods matching a label selector in a Kubernetes cluster.
+
+        This tool retrieves the logs of every container of the pods matching a label selector
+        concurrently, and merges them into one stream ordered by timestamp, so the logs of all
+        replicas of a workload can be read in one call. It's useful for debugging errors that
+        only some replicas hit, following a rollout, and correlating requests across pods.
+
+        ## Requirements
+        - The server must be run with the `--allow-sensitive-data-access` flag
+        - The EKS cluster must exist and be accessible
+
+        ## Response Information
+        The response includes the containers the logs were retrieved from (as pod/container),
+        and the log lines ordered by time, each prefixed with its timestamp and pod/container.
+
+        ## Usage Tips
+        - Use grep to keep only the relevant lines before they are limited to max_lines
+        - Use follow_seconds to watch new lines during a rollout or a reproduction; new lines
+          are streamed as progress notifications and also returned at the end
+
+        Args:
+            ctx: MCP context
+            cluster_name: Name of the EKS cluster
+            namespace: Namespace of the pods
+            label_selector: Label selector of the pods
+            container_name: Container name (optional, defaults to all containers)
+            since_seconds: Only return logs newer than this many seconds (optional)
+            tail_lines: Number of lines to fetch from the end of each container's logs
+            limit_bytes: Maximum number of bytes to fetch from each container
+            grep: Regular expression the log lines must match (optional)
+            max_lines: Maximum number of merged log lines to return
+            follow_seconds: Number of seconds to follow the logs for (0 to not follow)
+
+        Returns:
+            MultiPodLogsResponse with the merged logs
+        """
+        # Check if sensitive data access is disabled
+        if not self.allow_sensitive_data_access:
+            error_msg = 'Access to pod logs requires --allow-sensitive-data-access flag'
+            log_with_request_id(ctx, LogLevel.ERROR, error_msg)
+            return MultiPodLogsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_msg)],
+                namespace=namespace,
+                label_selector=label_selector,
+                containers=[],
+                log_lines=[],
+                truncated=False,
+            )
+
+        try:
+            pattern = re.compile(grep) if grep else None
+            started_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+            # Get Kubernetes client for the cluster
+            k8s_client = self.get_client(cluster_name)
+
+            # Find the containers of the matching pods
+            pods = await asyncio.to_thread(
+                k8s_client.list_resources,
+                kind='Pod',
+                api_version='v1',
+                namespace=namespace,
+                label_selector=label_selector,
+            )
+            targets = []
+            for pod in pods.items:
+                pod_dict = pod.to_dict()
+                for container in pod_dict.get('spec', {}).get('containers', []):
+                    if not container_name or container['name'] == container_name:
+                        targets.append((pod_dict['metadata']['name'], container['name']))
+            if len(targets) > MAX_LOG_CONTAINERS:
+                log_with_request_id(
+                    ctx,
+                    LogLevel.WARNING,
+                    f'{len(targets)} containers match {label_selector}, '
+                    f'getting logs from the first {MAX_LOG_CONTAINERS}',
+                )
+                targets = targets[:MAX_LOG_CONTAINERS]
+
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOG_REQUESTS)
+
+            async def fetch(target, since_time=None):
+                async with semaphore:
+                    logs = await asyncio.to_thread(
+                        k8s_client.get_pod_logs,
+                        pod_name=target[0],
+                        namespace=namespace,
+                        container_name=target[1],
+                        since_seconds=None if since_time else since_seconds,
+                        tail_lines=None if since_time else tail_lines,
+                        limit_bytes=limit_bytes,
+                        since_time=since_time,
+                        timestamps=True,
+                    )
+                return self._parse_timestamped_logs(logs, target)
+
+            async def fetch_all(since_times):
+                results = await asyncio.gather(
+                    *[fetch(target, since_times.get(target)) for target in targets],
+                    return_exceptions=True,
+                )
+                entries_by_target = {}
+                for target, result in zip(targets, results):
+                    if isinstance(result, BaseException):
+                        failed.add(f'{target[0]}/{target[1]}')
+                        log_with_request_id(
+                            ctx,
+                            LogLevel.WARNING,
+                            f'Failed to get logs from {target[0]}/{target[1]}: {str(result)}',
+                        )
+                    else:
+                        entries_by_target[target] = result
+                return entries_by_target
+
+            def matching(entries):
+                return [entry for entry in entries if not pattern or pattern.search(entry[2])]
+
+            # Fetch the logs of all containers and merge them by timestamp
+            failed: set = set()
+            entries_by_target = await fetch_all({})
+            log_entries = list(
+                heapq.merge(
+                    *[matching(entries) for entries in entries_by_target.values()],
+                    key=lambda entry: entry[0],
+                )
+            )
+
+            # Follow the logs, streaming the new lines
+            follow = min(max(follow_seconds or 0, 0), MAX_LOG_FOLLOW_SECONDS)
+            if follow:
+                last_seen = {
+                    target: self._last_seen(entries_by_target.get(target, []))
+                    for target in targets
+                }
+                follow_started = time.monotonic()
+                while (remaining := follow - (time.monotonic() - follow_started)) > 0:
+                    await asyncio.sleep(min(LOG_FOLLOW_INTERVAL, remaining))
+                    since_times = {
+                        target: (key.split('.')[0] + 'Z') if key else started_at
+                        for target, (key, _) in last_seen.items()
+                    }
+                    new_entries = []
+                    for target, entries in (await fetch_all(since_times)).items():
+                        last_key, lines_at_last_key = last_seen[target]
+                        entries = [
+                            entry
+                            for entry in entries
+                            if entry[0] > last_key
+                            or (entry[0] == last_key and entry[1] not in lines_at_last_key)
+                        ]
+                        if entries:
+                            last_seen[target] = self._last_seen(entries)
+                            new_entries.append(matching(entries))
+                    new_lines = list(heapq.merge(*new_entries, key=lambda entry: entry[0]))
+                    if new_lines:
+                        log_entries.extend(new_lines)
+                        await self._report_log_lines(
+                            ctx,
+                            [entry[1] for entry in new_lines],
+                            time.monotonic() - follow_started,
+                            follow,
+                        )
+
+            truncated = len(log_entries) > max_lines
+            log_lines = [entry[1] for entry in log_entries[-max_lines:]]
+
+            summary = (
+                f'Successfully retrieved {len(log_lines)} log lines from {len(targets)} '
+                f'containers of pods matching {label_selector} in namespace {namespace}'
+            )
+            if failed:
+                summary += f' (failed to get logs from {", ".join(sorted(failed))})'
+            log_with_request_id(ctx, LogLevel.INFO, summary)
+
+            return MultiPodLogsResponse(
+                isError=False,
+                content=[TextContent(type='text', text=summary)],
+                namespace=namespace,
+                label_selector=label_selector,
+                containers=[f'{pod_name}/{name}' for pod_name, name in targets],
+                log_lines=log_lines,
+                truncated=truncated,
+            )
+
+        except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
+            error_msg = f'Failed to get logs from pods matching {label_selector} in namespace {namespace}: {str(e)}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_msg)
+
+            return MultiPodLogsResponse(
+                isError=True,
+                content=[TextContent(type='text', text=error_msg)],
+                namespace=namespace,
+                label_selector=label_selector,
+                containers=[],
+                log_lines=[],
+                truncated=False,
+            )
+
+    def _parse_timestamped_logs(self, logs: Any, target: tuple) -> List[tuple]:
+        """Parse logs fetched with timestamps into sortable entries.
+
+        Args:
+            logs: Logs of one container, each line prefixed with its RFC 3339 timestamp
+            target: Tuple of (pod name, container name) the logs come from
+
+        Returns:
+            Chronological list of (sort key, formatted line, message) tuples
+        """
+        entries = []
+        for raw_line in str(logs or '').splitlines():
+            timestamp, _, message = raw_line.partition(' ')
+            entries.append(
+                (
+                    log_sort_key(timestamp),
+                    f'{timestamp} [{target[0]}/{target[1]}] {message}',
+                    message,
+                )
+            )
+        return entries
+
+    def _last_seen(self, entries: List[tuple]) -> tuple:
+        """Return the newest sort key of log entries and the lines with that key."""
+        if not entries:
+            return '', set()
+        last_key = entries[-1][0]
+        return last_key, {entry[1] for entry in entries if entry[0] == last_key}
+
+    async def _report_log_lines(
+        self, ctx: Context, lines: List[str], elapsed: float, total: float
+    ) -> None:
+        """Stream new log lines to the client as a progress notification."""
+        try:
+            await ctx.report_progress(
+                elapsed, total, '\n'.join(lines[-MAX_FOLLOW_NOTIFICATION_LINES:])
+            )
+        except Exception as e:
+            log_with_request_id(ctx, LogLevel.DEBUG, f'Failed to report new log lines: {str(e)}')
+
     async def get_k8s_events(
         self,
         ctx: Context,
@@ -1004,15 +1373,23 @@ class K8sHandler:
             )
 
         try:
-            # Get Kubernetes client for the cluster
-            k8s_client = self.get_client(cluster_name)
+            # Serve the events from the watch cache when enabled and synced
+            events = None
+            if self.watch_cache is not None:
+                events = await asyncio.to_thread(
+                    self.watch_cache.get_events, cluster_name, kind, name, namespace
+                )
 
-            # Get events
-            events = k8s_client.get_events(
-                kind=kind,
-                name=name,
-                namespace=namespace,
-            )
+            if events is None:
+                # Get Kubernetes client for the cluster
+                k8s_client = self.get_client(cluster_name)
+
+                # Get events
+                events = k8s_client.get_events(
+                    kind=kind,
+                    name=name,
+                    namespace=namespace,
+                )
 
             # Format resource name for logging
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
@@ -1058,6 +1435,7 @@ class K8sHandler:
             )
 
         except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
             # Format resource name for error message
             resource_name = f'{namespace + "/" if namespace else ""}{name}'
 
@@ -1137,6 +1515,7 @@ class K8sHandler:
             )
 
         except Exception as e:
+            self._invalidate_stale_client(cluster_name, e)
             # Log error
             error_msg = f'Failed to get API versions from cluster {cluster_name}: {str(e)}'
             log_with_request_id(ctx, LogLevel.ERROR, error_msg)
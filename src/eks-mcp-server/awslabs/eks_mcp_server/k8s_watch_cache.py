@@ -0,0 +1,579 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Informer-style watch cache for the EKS MCP Server.
+
+An informer lists all resources of one kind in a cluster once, then keeps a compact copy of
+their metadata up to date with a WATCH from the listed resourceVersion (with bookmarks, so
+reconnects rarely need a new LIST). Lists and event lookups are then answered from in-memory
+indexes by namespace, label and involved object instead of the API server, consistent with the
+cluster to within the watch propagation delay.
+"""
+
+import re
+import threading
+import time
+from awslabs.eks_mcp_server.k8s_apis import K8sApis
+from collections import defaultdict
+from loguru import logger
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+# Server-side timeout of each WATCH request; every reconnect picks up a fresh client and token
+WATCH_TIMEOUT_SECONDS = 240
+
+# Time the first query of a kind waits for the initial LIST before falling back to the API
+SYNC_TIMEOUT_SECONDS = 10
+
+# Informers not queried for this long are stopped
+IDLE_TIMEOUT_SECONDS = 30 * 60
+
+# Maximum delay between attempts to re-establish a failed LIST or WATCH
+MAX_BACKOFF_SECONDS = 30
+
+# Consecutive failed LISTs after which an informer gives up, e.g. when access is denied
+MAX_LIST_FAILURES = 3
+
+# Time a kind whose informer gave up is served from the API server before a new attempt
+FAILED_RETRY_SECONDS = 5 * 60
+
+# Fields of a cached entry returned by lists
+SUMMARY_FIELDS = ('name', 'namespace', 'creation_timestamp', 'labels', 'annotations')
+
+# Fields of a field selector that can be answered from the cache
+CACHED_SELECTOR_FIELDS = {'metadata.name': 'name', 'metadata.namespace': 'namespace'}
+
+# key in (a, b), key notin (a, b)
+SET_REQUIREMENT_PATTERN = re.compile(r'^([^\s!=]+)\s+(in|notin)\s+\(([^)]*)\)$')
+
+# key=value, key==value, key!=value
+EQUALITY_REQUIREMENT_PATTERN = re.compile(r'^([^\s!=]+)\s*(==|=|!=)\s*([^\s!=]*)$')
+
+# A key of the cache: namespace (empty for cluster-scoped resources) and name
+ItemKey = Tuple[str, str]
+
+# A label selector requirement: key, operator and values
+Requirement = Tuple[str, str, Tuple[str, ...]]
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a selector on the commas outside parentheses."""
+    parts = []
+    depth = 0
+    current = ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += char
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+def parse_label_selector(selector: Optional[str]) -> List[Requirement]:
+    """Parse a label selector into requirements.
+
+    Supports equality-based (``a=b``, ``a==b``, ``a!=b``) and set-based (``a in (b, c)``,
+    ``a notin (b)``, ``a``, ``!a``) requirements, as accepted by kubectl's --selector flag.
+
+    Args:
+        selector: Label selector (e.g., 'app=nginx,tier in (frontend, backend)')
+
+    Returns:
+        List of (key, operator, values) requirements; the operator is one of '=', '!=',
+        'in', 'notin', 'exists' and '!'
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    requirements: List[Requirement] = []
+    for part in _split_selector(selector or ''):
+        set_match = SET_REQUIREMENT_PATTERN.match(part)
+        equality_match = EQUALITY_REQUIREMENT_PATTERN.match(part)
+        if set_match:
+            values = tuple(value.strip() for value in set_match.group(3).split(','))
+            requirements.append((set_match.group(1), set_match.group(2), values))
+        elif equality_match:
+            operator = '!=' if equality_match.group(2) == '!=' else '='
+            requirements.append((equality_match.group(1), operator, (equality_match.group(3),)))
+        elif part.startswith('!') and re.fullmatch(r'![^\s!=(),]+', part):
+            requirements.append((part[1:], '!', ()))
+        elif re.fullmatch(r'[^\s!=(),]+', part):
+            requirements.append((part, 'exists', ()))
+        else:
+            raise ValueError(f'Invalid label selector requirement: {part}')
+    return requirements
+
+
+def parse_field_selector(selector: Optional[str]) -> List[Tuple[str, str, str]]:
+    """Parse a field selector restricted to the metadata fields kept in the cache.
+
+    Args:
+        selector: Field selector (e.g., 'metadata.name=my-pod')
+
+    Returns:
+        List of (cached field, operator, value) requirements; the operator is '=' or '!='
+
+    Raises:
+        ValueError: If the selector uses a field the cache does not keep, such as status.phase
+    """
+    requirements = []
+    for part in _split_selector(selector or ''):
+        match = EQUALITY_REQUIREMENT_PATTERN.match(part)
+        if not match or match.group(1) not in CACHED_SELECTOR_FIELDS:
+            raise ValueError(f'Field selector not supported by the watch cache: {part}')
+        operator = '!=' if match.group(2) == '!=' else '='
+        requirements.append((CACHED_SELECTOR_FIELDS[match.group(1)], operator, match.group(3)))
+    return requirements
+
+
+def labels_match(labels: Dict[str, str], requirements: List[Requirement]) -> bool:
+    """Check whether labels satisfy all requirements of a parsed label selector.
+
+    Args:
+        labels: Labels of a resource
+        requirements: Requirements from parse_label_selector
+
+    Returns:
+        True if every requirement is satisfied
+    """
+    for key, operator, values in requirements:
+        value = labels.get(key)
+        if operator == '=' and value != values[0]:
+            return False
+        if operator == '!=' and value == values[0]:
+            return False
+        if operator == 'in' and value not in values:
+            return False
+        if operator == 'notin' and value in values:
+            return False
+        if operator == 'exists' and key not in labels:
+            return False
+        if operator == '!' and key in labels:
+            return False
+    return True
+
+
+def _compact(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the fields of a resource that lists and event lookups return."""
+    metadata = obj.get('metadata') or {}
+    entry: Dict[str, Any] = {
+        'name': metadata.get('name', ''),
+        'namespace': metadata.get('namespace'),
+        'creation_timestamp': metadata.get('creationTimestamp'),
+        'labels': metadata.get('labels'),
+        'annotations': metadata.get('annotations'),
+    }
+    if 'involvedObject' in obj:
+        involved_object = obj.get('involvedObject') or {}
+        source = obj.get('source') or {}
+        entry['involved_object'] = (
+            involved_object.get('kind'),
+            involved_object.get('name'),
+            involved_object.get('namespace'),
+        )
+        entry['event'] = {
+            'first_timestamp': obj.get('firstTimestamp'),
+            'last_timestamp': obj.get('lastTimestamp'),
+            'count': obj.get('count'),
+            'message': obj.get('message', ''),
+            'reason': obj.get('reason'),
+            'reporting_component': source.get('component'),
+            'type': obj.get('type'),
+        }
+    return entry
+
+
+def _is_gone(error: Exception) -> bool:
+    """Check whether an error means the watched resourceVersion is too old (HTTP 410)."""
+    return getattr(error, 'status', None) == 410 or '410' in str(error)
+
+
+class ResourceInformer:
+    """Keeps the metadata of all resources of one kind in a cluster in memory.
+
+    A daemon thread runs the LIST and WATCH loop. After a failure the informer backs off,
+    lists again and stays unsynced, so queries fall back to the API server, until the LIST
+    succeeds. After MAX_LIST_FAILURES consecutive failed LISTs the informer stops and is
+    marked as failed.
+    """
+
+    def __init__(self, client_factory: Callable[[], K8sApis], api_version: str, kind: str):
+        """Initialize the informer.
+
+        Args:
+            client_factory: Function returning a Kubernetes client with a valid token
+            api_version: API version of the resources (e.g., 'v1', 'apps/v1')
+            kind: Resource kind (e.g., 'Pod', 'Event')
+        """
+        self.api_version = api_version
+        self.kind = kind
+        self.namespaced = True
+        self.last_used = time.monotonic()
+        self.failed = False
+
+        self._client_factory = client_factory
+        self._lock = threading.Lock()
+        self._items: Dict[ItemKey, Dict[str, Any]] = {}
+        self._by_namespace: Dict[str, Set[ItemKey]] = defaultdict(set)
+        self._by_label: Dict[Tuple[str, str], Set[ItemKey]] = defaultdict(set)
+        self._by_involved_object: Dict[Tuple[Any, ...], Set[ItemKey]] = defaultdict(set)
+        self._resource_version: Optional[str] = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher: Any = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the LIST and WATCH loop in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name=f'informer-{self.api_version}-{self.kind}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the informer and its current WATCH request."""
+        self._stopped.set()
+        self._synced.clear()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the informer was stopped."""
+        return self._stopped.is_set()
+
+    def wait_synced(self, timeout: float) -> bool:
+        """Wait until the cache reflects a LIST and its WATCH, or the informer stops.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the cache can serve queries
+        """
+        deadline = time.monotonic() + timeout
+        while not self._synced.is_set() and not self._stopped.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._synced.wait(min(remaining, 0.1))
+        return self._synced.is_set()
+
+    def _run(self) -> None:
+        """LIST then WATCH until stopped, listing again after failures."""
+        backoff = 1
+        list_failures = 0
+        while not self._stopped.is_set():
+            listing = self._resource_version is None
+            try:
+                if listing:
+                    self._list()
+                    list_failures = 0
+                self._watch()
+                backoff = 1
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                self._synced.clear()
+                self._resource_version = None
+                if listing:
+                    list_failures += 1
+                    if list_failures >= MAX_LIST_FAILURES:
+                        logger.warning(
+                            f'Stopping watch of {self.kind} after {list_failures} failed '
+                            f'lists: {str(e)}'
+                        )
+                        self.failed = True
+                        self.stop()
+                        break
+                reason = 'expired' if _is_gone(e) else f'failed: {str(e)}'
+                logger.warning(f'Watch of {self.kind} {reason}, listing again in {backoff}s')
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def _get_resource(self) -> Any:
+        """Return the dynamic client resource of the informer's kind."""
+        client = self._client_factory()
+        return client.dynamic_client.resources.get(api_version=self.api_version, kind=self.kind)
+
+    def _new_watcher(self) -> Any:
+        """Create a watcher that stop() can interrupt."""
+        from kubernetes import watch
+
+        return watch.Watch()
+
+    def _list(self) -> None:
+        """Replace the cache with a full LIST of the kind."""
+        client = self._client_factory()
+        resource = client.dynamic_client.resources.get(
+            api_version=self.api_version, kind=self.kind
+        )
+
+        # Events need their involved object and message; other kinds only their metadata
+        entries = []
+        resource_version = None
+        for page in client.iter_resource_pages(
+            self.kind, self.api_version, metadata_only=self.kind != 'Event'
+        ):
+            entries.extend(_compact(item.to_dict()) for item in page.items)
+            resource_version = page.metadata.resourceVersion
+
+        with self._lock:
+            self.namespaced = bool(getattr(resource, 'namespaced', True))
+            self._items.clear()
+            self._by_namespace.clear()
+            self._by_label.clear()
+            self._by_involved_object.clear()
+            for entry in entries:
+                self._add(entry)
+        self._resource_version = resource_version
+        self._synced.set()
+        logger.info(f'Watch cache listed {len(entries)} {self.kind} resources')
+
+    def _watch(self) -> None:
+        """Apply WATCH events from the current resourceVersion until the request times out."""
+        resource = self._get_resource()
+        self._watcher = self._new_watcher()
+        for event in resource.watch(
+            resource_version=self._resource_version,
+            timeout=WATCH_TIMEOUT_SECONDS,
+            watcher=self._watcher,
+            allow_watch_bookmarks=True,
+        ):
+            if self._stopped.is_set():
+                return
+            event_type = event.get('type')
+            obj = event.get('raw_object') or {}
+            if event_type == 'ERROR':
+                raise ValueError(f'{obj.get("code")} {obj.get("message", "watch error")}')
+            if event_type in ('ADDED', 'MODIFIED'):
+                entry = _compact(obj)
+                with self._lock:
+                    self._remove((entry['namespace'] or '', entry['name']))
+                    self._add(entry)
+            elif event_type == 'DELETED':
+                metadata = obj.get('metadata') or {}
+                with self._lock:
+                    self._remove((metadata.get('namespace') or '', metadata.get('name', '')))
+            resource_version = (obj.get('metadata') or {}).get('resourceVersion')
+            if resource_version:
+                self._resource_version = resource_version
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        """Add an entry to the items and indexes; the lock must be held."""
+        key = (entry['namespace'] or '', entry['name'])
+        self._items[key] = entry
+        self._by_namespace[key[0]].add(key)
+        for label in (entry['labels'] or {}).items():
+            self._by_label[label].add(key)
+        if 'involved_object' in entry:
+            self._by_involved_object[entry['involved_object']].add(key)
+
+    def _remove(self, key: ItemKey) -> None:
+        """Remove an entry from the items and indexes; the lock must be held."""
+        entry = self._items.pop(key, None)
+        if entry is None:
+            return
+        indexed = [self._by_namespace.get(key[0])]
+        indexed.extend(self._by_label.get(label) for label in (entry['labels'] or {}).items())
+        if 'involved_object' in entry:
+            indexed.append(self._by_involved_object.get(entry['involved_object']))
+        for keys in indexed:
+            if keys is not None:
+                keys.discard(key)
+
+    def list(
+        self,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List the cached resources matching the filters.
+
+        Args:
+            namespace: Namespace to list resources from (ignored for cluster-scoped kinds)
+            label_selector: Label selector to filter resources (optional)
+            field_selector: Field selector on metadata.name or metadata.namespace (optional)
+
+        Returns:
+            Summaries with name, namespace, creation_timestamp, labels and annotations, sorted
+            by namespace and name
+
+        Raises:
+            ValueError: If a selector is malformed or not supported by the cache
+        """
+        self.last_used = time.monotonic()
+        requirements = parse_label_selector(label_selector)
+        fields = parse_field_selector(field_selector)
+        with self._lock:
+            if namespace and self.namespaced:
+                candidates = set(self._by_namespace.get(namespace, ()))
+            else:
+                candidates = set(self._items)
+            for key, operator, values in requirements:
+                if operator == '=':
+                    candidates &= self._by_label.get((key, values[0]), set())
+            entries = [self._items[key] for key in sorted(candidates)]
+
+        return [
+            {field: entry[field] for field in SUMMARY_FIELDS}
+            for entry in entries
+            if labels_match(entry['labels'] or {}, requirements)
+            and all(
+                (entry[field] == value) == (operator == '=') for field, operator, value in fields
+            )
+        ]
+
+    def events_for(self, kind: str, name: str, namespace: Optional[str]) -> List[Dict[str, Any]]:
+        """Return the cached events of an involved object.
+
+        Args:
+            kind: Kind of the involved object
+            name: Name of the involved object
+            namespace: Namespace of the involved object (None for cluster-scoped objects)
+
+        Returns:
+            Events in the format of K8sApis.get_events
+        """
+        self.last_used = time.monotonic()
+        with self._lock:
+            if namespace:
+                keys = self._by_involved_object.get((kind, name, namespace), set())
+            else:
+                keys = set().union(
+                    *(
+                        keys
+                        for involved_object, keys in self._by_involved_object.items()
+                        if involved_object[:2] == (kind, name)
+                    )
+                )
+            return [dict(self._items[key]['event']) for key in sorted(keys)]
+
+
+class K8sWatchCache:
+    """Per-cluster informers serving list_k8s_resources and get_k8s_events from memory.
+
+    Informers start on the first query of a kind in a cluster and stop after being idle for
+    IDLE_TIMEOUT_SECONDS. Queries the cache cannot answer (kind not synced yet, informer
+    failing, field selectors on fields other than name and namespace) return None, and the
+    caller falls back to the API server. A kind whose informer gave up is not watched again
+    for FAILED_RETRY_SECONDS.
+    """
+
+    def __init__(self, client_factory: Callable[[str], K8sApis]):
+        """Initialize the watch cache.
+
+        Args:
+            client_factory: Function returning a Kubernetes client for a cluster name
+        """
+        self._client_factory = client_factory
+        self._informers: Dict[Tuple[str, str, str], ResourceInformer] = {}
+        self._failed_until: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def _get_informer(
+        self, cluster_name: str, api_version: str, kind: str
+    ) -> Optional[ResourceInformer]:
+        """Return the informer of a kind in a cluster, starting it if needed.
+
+        Returns:
+            The informer, or None while the kind is not watched after its informer gave up
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key, informer in list(self._informers.items()):
+                if informer.failed:
+                    self._failed_until[key] = now + FAILED_RETRY_SECONDS
+                    del self._informers[key]
+                elif informer.stopped or now - informer.last_used > IDLE_TIMEOUT_SECONDS:
+                    informer.stop()
+                    del self._informers[key]
+                    logger.info(f'Stopped idle watch of {key[2]} in cluster {key[0]}')
+
+            key = (cluster_name, api_version, kind)
+            if self._failed_until.get(key, 0) > now:
+                return None
+            self._failed_until.pop(key, None)
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = ResourceInformer(
+                    lambda: self._client_factory(cluster_name), api_version, kind
+                )
+                self._informers[key] = informer
+                informer.start()
+                logger.info(f'Started watch of {kind} in cluster {cluster_name}')
+            return informer
+
+    def list_resources(
+        self,
+        cluster_name: str,
+        kind: str,
+        api_version: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """List resources from the cache.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            kind: Resource kind (e.g., 'Pod', 'Service')
+            api_version: API version (e.g., 'v1', 'apps/v1')
+            namespace: Namespace to list resources from (optional)
+            label_selector: Label selector to filter resources (optional)
+            field_selector: Field selector to filter resources (optional)
+
+        Returns:
+            Resource summaries, or None if the cache cannot answer the query
+        """
+        try:
+            parse_field_selector(field_selector)
+            parse_label_selector(label_selector)
+        except ValueError as e:
+            logger.debug(f'Listing {kind} from the API server: {str(e)}')
+            return None
+
+        informer = self._get_informer(cluster_name, api_version, kind)
+        if informer is None or not informer.wait_synced(SYNC_TIMEOUT_SECONDS):
+            return None
+        return informer.list(namespace, label_selector, field_selector)
+
+    def get_events(
+        self, cluster_name: str, kind: str, name: str, namespace: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get the events of an involved object from the cache.
+
+        Args:
+            cluster_name: Name of the EKS cluster
+            kind: Kind of the involved object
+            name: Name of the involved object
+            namespace: Namespace of the involved object (optional)
+
+        Returns:
+            Events in the format of K8sApis.get_events, or None if the cache is not synced
+        """
+        informer = self._get_informer(cluster_name, 'v1', 'Event')
+        if informer is None or not informer.wait_synced(SYNC_TIMEOUT_SECONDS):
+            return None
+        return informer.events_for(kind, name, namespace)
+
+    def stop(self) -> None:
+        """Stop all informers."""
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
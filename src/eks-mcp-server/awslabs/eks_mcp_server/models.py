@@ -119,6 +119,24 @@ class PodLogsResponse(CallToolResult):
     log_lines: List[str] = Field(..., description='Pod log lines')
 
 
+class MultiPodLogsResponse(CallToolResult):
+    """Response model for get_pod_logs_by_selector tool."""
+
+    namespace: str = Field(..., description='Namespace of the pods')
+    label_selector: str = Field(..., description='Label selector matching the pods')
+    containers: List[str] = Field(
+        ..., description='Containers the logs were retrieved from, as pod/container'
+    )
+    log_lines: List[str] = Field(
+        ...,
+        description='Log lines of all containers ordered by time, each prefixed with its '
+        'timestamp and pod/container',
+    )
+    truncated: bool = Field(
+        ..., description='Whether older lines were left out to stay within max_lines'
+    )
+
+
 class EventsResponse(CallToolResult):
     """Response model for get_k8s_events tool."""
 
@@ -193,6 +211,59 @@ class CloudWatchMetricsResponse(CallToolResult):
     )
 
 
+class MetricQuerySpec(BaseModel):
+    """Specification of one metric or metric math expression in a batched metrics query.
+
+    Either namespace and metric_name, or expression must be set. Expressions refer to the
+    other specs of the batch by their id.
+    """
+
+    id: Optional[str] = Field(
+        None,
+        description='Identifier of the series, referenced by expressions (defaults to m<index>)',
+        pattern=r'^[a-z][a-zA-Z0-9_]*$',
+    )
+    label: Optional[str] = Field(None, description='Label of the series')
+    namespace: Optional[str] = Field(
+        None, description='CloudWatch namespace (e.g., ContainerInsights)'
+    )
+    metric_name: Optional[str] = Field(None, description='Metric name (e.g., pod_cpu_utilization)')
+    dimensions: Dict[str, str] = Field(
+        default_factory=dict, description='Dimension name-value pairs of the metric'
+    )
+    stat: Optional[str] = Field(None, description='Statistic (defaults to the batch statistic)')
+    period: Optional[int] = Field(
+        None, description='Period in seconds (defaults to the batch period)', ge=1
+    )
+    expression: Optional[str] = Field(
+        None, description='Metric math expression (e.g., "m1 + m2", "RATE(m3)")'
+    )
+    return_data: bool = Field(
+        True, description='Whether to return the series, or only use it in expressions'
+    )
+
+
+class CloudWatchMetricsBatchResponse(CallToolResult):
+    """Response model for get_cloudwatch_metrics_batch tool.
+
+    The series are returned as columns aligned on one timestamp axis, with null where a series
+    has no data point at a timestamp. The series of a spec returning several of them, such as a
+    SEARCH expression, are keyed "<id>:<label>".
+    """
+
+    start_time: str = Field(..., description='Start time in ISO format')
+    end_time: str = Field(..., description='End time in ISO format')
+    timestamps: List[str] = Field(..., description='Timestamps of the rows in ISO format')
+    columns: Dict[str, List[Optional[float]]] = Field(
+        ..., description='Values of each series by id, aligned with the timestamps'
+    )
+    labels: Dict[str, str] = Field(..., description='Label of each series by id')
+    statuses: Dict[str, str] = Field(
+        ..., description='CloudWatch status code of each series by id (e.g., Complete)'
+    )
+    request_count: int = Field(..., description='Number of GetMetricData requests made')
+
+
 class StackSummary(BaseModel):
     """Summary of a CloudFormation stack."""
 
@@ -210,12 +281,30 @@ class GenerateTemplateResponse(CallToolResult):
     template_path: str = Field(..., description='Path to the generated template')
 
 
+class StackEvent(BaseModel):
+    """Event of a CloudFormation stack."""
+
+    timestamp: str = Field(..., description='Time of the event in ISO format')
+    logical_resource_id: str = Field(..., description='Logical ID of the resource')
+    resource_type: str = Field(..., description='Type of the resource')
+    resource_status: str = Field(..., description='Status of the resource')
+    resource_status_reason: Optional[str] = Field(
+        None, description='Reason for the status of the resource'
+    )
+
+
 class DeployStackResponse(CallToolResult):
     """Response model for deploy operation of manage_eks_stacks tool."""
 
     stack_name: str = Field(..., description='Name of the CloudFormation stack')
     stack_arn: str = Field(..., description='ARN of the CloudFormation stack')
     cluster_name: str = Field(..., description='Name of the EKS cluster')
+    stack_status: Optional[str] = Field(
+        None, description='Status of the stack when the deployment was last followed'
+    )
+    events: List[StackEvent] = Field(
+        default_factory=list, description='Stack events while the deployment was followed'
+    )
 
 
 class DescribeStackResponse(CallToolResult):
@@ -229,6 +318,22 @@ class DescribeStackResponse(CallToolResult):
     outputs: Dict[str, str] = Field(..., description='Stack outputs')
 
 
+class WaitStackResponse(CallToolResult):
+    """Response model for wait operation of manage_eks_stacks tool."""
+
+    stack_name: str = Field(..., description='Name of the CloudFormation stack')
+    stack_id: str = Field(..., description='ID of the CloudFormation stack')
+    cluster_name: str = Field(..., description='Name of the EKS cluster')
+    stack_status: str = Field(..., description='Current status of the stack')
+    complete: bool = Field(
+        ..., description='Whether the stack operation finished (the status is not in progress)'
+    )
+    events: List[StackEvent] = Field(
+        ..., description='Stack events since the last deploy or wait operation, oldest first'
+    )
+    outputs: Dict[str, str] = Field(..., description='Stack outputs')
+
+
 class DeleteStackResponse(CallToolResult):
     """Response model for delete operation of manage_eks_stacks tool."""
 
@@ -48,7 +48,7 @@ This MCP server provides tools for managing Amazon EKS clusters and is the prefe
 
 ### Creating and Deploying an Application
 1. Generate a CloudFormation template: `manage_eks_stacks(operation='generate', template_file='/path/to/template.yaml', cluster_name='my-cluster')`
-2. Deploy the CloudFormation stack: `manage_eks_stacks(operation='deploy', template_file='/path/to/template.yaml', cluster_name='my-cluster')`
+2. Deploy the CloudFormation stack: `manage_eks_stacks(operation='deploy', template_file='/path/to/template.yaml', cluster_name='my-cluster')`, then wait for it until complete is true: `manage_eks_stacks(operation='wait', cluster_name='my-cluster')`
 3. Generate an application manifest: `generate_app_manifest(app_name='my-app', image_uri='123456789012.dkr.ecr.us-east-1.amazonaws.com/my-repo:latest')`
 4. Apply the manifest: `apply_yaml(yaml_path='/path/to/manifest.yaml', cluster_name='my-cluster', namespace='default')`
 5. Monitor the application: `get_pod_logs(cluster_name='my-cluster', namespace='default', pod_name='my-app-pod')`
@@ -115,11 +115,18 @@ def main():
         default=False,
         help='Enable sensitive data access (required for reading logs, events, and Kubernetes Secrets)',
     )
+    parser.add_argument(
+        '--enable-watch-cache',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Serve Kubernetes resource lists and events from per-cluster watch caches',
+    )
 
     args = parser.parse_args()
 
     allow_write = args.allow_write
     allow_sensitive_data_access = args.allow_sensitive_data_access
+    enable_watch_cache = args.enable_watch_cache
 
     # Log startup mode
     mode_info = []
@@ -138,7 +145,7 @@ def main():
     CloudWatchHandler(mcp, allow_sensitive_data_access)
     EKSKnowledgeBaseHandler(mcp)
     EksStackHandler(mcp, allow_write)
-    K8sHandler(mcp, allow_write, allow_sensitive_data_access)
+    K8sHandler(mcp, allow_write, allow_sensitive_data_access, enable_watch_cache)
     IAMHandler(mcp, allow_write)
 
     # Run server
@@ -0,0 +1,48 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Test fixtures for the eks-mcp-server tests."""
+
+import pytest
+from awslabs.eks_mcp_server.aws_helper import AwsHelper
+from awslabs.eks_mcp_server.k8s_client_cache import K8sClientCache
+from awslabs.eks_mcp_server.k8s_discovery_cache import DiscoveryCache
+from unittest.mock import patch
+
+
+@pytest.fixture(autouse=True)
+def isolated_discovery_cache(tmp_path):
+    """Give each test an empty discovery cache outside the home directory."""
+    DiscoveryCache._instance = None
+    with patch(
+        'awslabs.eks_mcp_server.k8s_discovery_cache.DISCOVERY_CACHE_DIR',
+        tmp_path / 'discovery',
+    ):
+        yield tmp_path / 'discovery'
+    DiscoveryCache._instance = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_client_cache():
+    """Give each test an empty Kubernetes client cache and stop its token refresh afterwards."""
+    K8sClientCache._instance = None
+    yield
+    if K8sClientCache._instance is not None:
+        K8sClientCache._instance.stop()
+    K8sClientCache._instance = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_client_pool():
+    """Give each test an empty boto3 client pool."""
+    AwsHelper.clear_client_pool()
+    yield
+    AwsHelper.clear_client_pool()
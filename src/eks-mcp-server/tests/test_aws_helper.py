@@ -146,3 +146,37 @@ class TestAwsHelper:
                     # Verify the user agent suffix
                     assert config is not None
                     assert config.user_agent_extra == 'awslabs/mcp/eks-mcp-server/0.1.0'
+
+    def test_create_boto3_client_config(self):
+        """Test that create_boto3_client configures the connection pool and adaptive retries."""
+        with patch.object(AwsHelper, 'get_aws_profile', return_value=None):
+            with patch.dict(
+                os.environ, {'EKS_MCP_MAX_POOL_CONNECTIONS': '20', 'AWS_MAX_ATTEMPTS': '8'}
+            ):
+                with patch('boto3.client') as mock_client:
+                    AwsHelper.create_boto3_client('cloudformation', region_name='us-west-2')
+
+                    config = mock_client.call_args.kwargs['config']
+                    assert config.max_pool_connections == 20
+                    assert config.retries == {'max_attempts': 8, 'mode': 'adaptive'}
+
+    @patch('boto3.client')
+    def test_create_boto3_client_pooled(self, mock_boto3_client):
+        """Test that create_boto3_client reuses clients per service, region and profile."""
+        mock_boto3_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        with patch.object(AwsHelper, 'get_aws_profile', return_value=None):
+            logs = AwsHelper.create_boto3_client('logs', region_name='us-west-2')
+            assert AwsHelper.create_boto3_client('logs', region_name='us-west-2') is logs
+            assert AwsHelper.create_boto3_client('logs', region_name='eu-west-1') is not logs
+            AwsHelper.create_boto3_client('cloudwatch', region_name='us-west-2')
+
+        with patch.object(AwsHelper, 'get_aws_profile', return_value='test-profile'):
+            with patch('boto3.Session'):
+                assert AwsHelper.create_boto3_client('logs', region_name='us-west-2') is not logs
+
+        assert mock_boto3_client.call_count == 3
+        assert AwsHelper.get_client_creation_counts() == {'logs': 3, 'cloudwatch': 1}
+
+        AwsHelper.clear_client_pool()
+        assert AwsHelper.get_client_creation_counts() == {}
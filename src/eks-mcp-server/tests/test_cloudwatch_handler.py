@@ -16,7 +16,7 @@ import pytest
 from awslabs.eks_mcp_server.cloudwatch_handler import CloudWatchHandler
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
@@ -45,8 +45,8 @@ class TestCloudWatchHandler:
         assert handler.mcp == mock_mcp
         assert handler.allow_sensitive_data_access is False
 
-        # Verify that both tools are registered
-        assert mock_mcp.tool.call_count == 2
+        # Verify that all tools are registered
+        assert mock_mcp.tool.call_count == 3
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -57,6 +57,9 @@ class TestCloudWatchHandler:
         # Verify that get_cloudwatch_metrics was registered
         assert call_args_list[1][1]['name'] == 'get_cloudwatch_metrics'
 
+        # Verify that get_cloudwatch_metrics_batch was registered
+        assert call_args_list[2][1]['name'] == 'get_cloudwatch_metrics_batch'
+
     def test_resolve_time_range_defaults(self):
         """Test resolve_time_range with default values."""
         # Initialize the CloudWatch handler
@@ -913,3 +916,343 @@ class TestCloudWatchHandler:
                 assert result.cluster_name == 'test-cluster'
                 assert result.metric_name == 'cpu_usage_total'
                 assert len(result.data_points) == 0
+
+    def test_split_time_range(self):
+        """Test splitting long time ranges into windows."""
+        handler = CloudWatchHandler(MagicMock())
+        end_dt = datetime.datetime(2025, 1, 2, 0, 0, 0)
+
+        # Short time ranges are not split
+        start_dt = end_dt - datetime.timedelta(minutes=30)
+        assert handler.split_time_range(start_dt, end_dt) == [(start_dt, end_dt)]
+
+        # Long time ranges are split into contiguous windows, newest first
+        start_dt = end_dt - datetime.timedelta(hours=24)
+        windows = handler.split_time_range(start_dt, end_dt)
+        assert len(windows) == 8
+        assert windows[0][1] == end_dt
+        assert windows[-1][0] == start_dt
+        assert all(windows[i][0] == windows[i + 1][1] for i in range(len(windows) - 1))
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_concurrent_queries(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_logs queries log types and windows concurrently and merges them."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        queries = {}
+
+        def start_query(**kwargs):
+            query_id = f'query-{len(queries)}'
+            queries[query_id] = kwargs
+            return {'queryId': query_id}
+
+        def get_query_results(queryId):
+            timestamp = datetime.datetime.fromtimestamp(queries[queryId]['endTime'])
+            return {
+                'status': 'Complete',
+                'results': [
+                    [
+                        {'field': '@timestamp', 'value': timestamp.isoformat(sep=' ')},
+                        {'field': '@message', 'value': f'{queries[queryId]["logGroupName"]}'},
+                    ]
+                ],
+            }
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.start_query.side_effect = start_query
+        mock_logs_client.get_query_results.side_effect = get_query_results
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_logs_client,
+        ):
+            result = await handler.get_cloudwatch_logs(
+                mock_context,
+                resource_type='pod',
+                resource_name='test-pod',
+                cluster_name='test-cluster',
+                log_type='application,host',
+                start_time='2025-01-01T09:00:00',
+                end_time='2025-01-01T12:00:00',
+                limit=4,
+                filter_pattern=None,
+                fields=None,
+            )
+
+        # One query per log type and one-hour window
+        assert mock_logs_client.start_query.call_count == 6
+        assert not result.isError
+        assert result.log_group == (
+            '/aws/containerinsights/test-cluster/application, '
+            '/aws/containerinsights/test-cluster/host'
+        )
+        assert len(result.log_entries) == 4
+        timestamps = [entry['timestamp'] for entry in result.log_entries]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert {entry['log_group'] for entry in result.log_entries} == {
+            '/aws/containerinsights/test-cluster/application',
+            '/aws/containerinsights/test-cluster/host',
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_logs_cached(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_logs reuses the results of the same query."""
+        handler = CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.start_query.return_value = {'queryId': 'test-query-id'}
+        mock_logs_client.get_query_results.return_value = {
+            'status': 'Complete',
+            'results': [[{'field': '@message', 'value': 'Test log message for test-pod'}]],
+        }
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_logs_client,
+        ):
+            for _ in range(2):
+                result = await handler.get_cloudwatch_logs(
+                    mock_context,
+                    resource_type='pod',
+                    resource_name='test-pod',
+                    cluster_name='test-cluster',
+                    log_type='application',
+                    minutes=15,
+                    start_time=None,
+                    end_time=None,
+                    limit=50,
+                    filter_pattern=None,
+                    fields=None,
+                )
+                assert result.log_entries == [{'message': 'Test log message for test-pod'}]
+
+        mock_logs_client.start_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_sends_partial_results(self, mock_context, mock_mcp):
+        """Test polling sleeps without blocking and sends partial results."""
+        handler = CloudWatchHandler(mock_mcp)
+        partial_result = [
+            {'field': '@message', 'value': 'partial message'},
+            {'field': '@ptr', 'value': 'ptr-1'},
+        ]
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.side_effect = [
+            {
+                'status': 'Running',
+                'results': [partial_result],
+                'statistics': {'recordsMatched': 1.0, 'recordsScanned': 10.0},
+            },
+            {'status': 'Running', 'results': [partial_result]},
+            {'status': 'Complete', 'results': [partial_result]},
+        ]
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.asyncio.sleep', new_callable=AsyncMock
+        ) as mock_sleep:
+            response = await handler._poll_query_results(
+                mock_context, mock_logs_client, 'test-query-id', 'pod', 'test-pod'
+            )
+
+        assert response['status'] == 'Complete'
+        assert mock_sleep.await_count == 2
+        mock_context.info.assert_awaited_once()
+        message = mock_context.info.call_args.args[0]
+        assert '1 records matched, 10 scanned' in message
+        assert 'partial message' in message
+        mock_logs_client.stop_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_query_results_timeout_stops_query(self, mock_context, mock_mcp):
+        """Test a query that does not complete in time is stopped."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        mock_logs_client = MagicMock()
+        mock_logs_client.get_query_results.return_value = {'status': 'Running', 'results': []}
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.asyncio.sleep', new_callable=AsyncMock
+        ):
+            with pytest.raises(TimeoutError, match='timed out after 2 attempts'):
+                await handler._poll_query_results(
+                    mock_context,
+                    mock_logs_client,
+                    'test-query-id',
+                    'pod',
+                    'test-pod',
+                    max_attempts=2,
+                )
+
+        mock_logs_client.stop_query.assert_called_once_with(queryId='test-query-id')
+
+    def test_pack_metric_queries(self):
+        """Test packing metric data queries into requests of at most 500 queries."""
+        handler = CloudWatchHandler(MagicMock())
+        queries = [{'Id': f'm{i}'} for i in range(1, 1001)]
+        # An expression tying a metric of the first request to one of the second
+        queries.append({'Id': 'e1', 'Expression': 'm1 + m600'})
+
+        requests = handler.pack_metric_queries(queries)
+
+        assert sum(len(request) for request in requests) == 1001
+        assert all(len(request) <= 500 for request in requests)
+        request_of = {query['Id']: i for i, request in enumerate(requests) for query in request}
+        assert request_of['m1'] == request_of['m600'] == request_of['e1']
+
+    def test_pack_metric_queries_group_too_large(self):
+        """Test an expression referring to more metrics than fit in one request."""
+        handler = CloudWatchHandler(MagicMock())
+        queries = [{'Id': f'm{i}'} for i in range(1, 501)]
+        queries.append({'Id': 'e1', 'Expression': ' + '.join(f'm{i}' for i in range(1, 501))})
+
+        with pytest.raises(ValueError, match='501 metrics'):
+            handler.pack_metric_queries(queries)
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_batch(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_batch aligns series and follows NextToken."""
+        handler = CloudWatchHandler(mock_mcp)
+        t1 = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        t2 = datetime.datetime(2025, 1, 1, 12, 1, 0)
+
+        mock_cloudwatch_client = MagicMock()
+        mock_cloudwatch_client.get_metric_data.side_effect = [
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'cpu',
+                        'Label': 'CPU',
+                        'Timestamps': [t1],
+                        'Values': [10.0],
+                        'StatusCode': 'PartialData',
+                    },
+                    {'Id': 'm2', 'Timestamps': [t2], 'Values': [512.0]},
+                ],
+                'NextToken': 'next',
+            },
+            {
+                'MetricDataResults': [
+                    {
+                        'Id': 'cpu',
+                        'Label': 'CPU',
+                        'Timestamps': [t2],
+                        'Values': [20.0],
+                        'StatusCode': 'Complete',
+                    },
+                    {'Id': 'double_cpu', 'Timestamps': [t1, t2], 'Values': [20.0, 40.0]},
+                ],
+            },
+        ]
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_cloudwatch_client,
+        ):
+            result = await handler.get_cloudwatch_metrics_batch(
+                mock_context,
+                metrics=[
+                    {
+                        'id': 'cpu',
+                        'namespace': 'ContainerInsights',
+                        'metric_name': 'pod_cpu_utilization',
+                        'dimensions': {'ClusterName': 'test-cluster', 'PodName': 'web'},
+                        'stat': 'Maximum',
+                    },
+                    {
+                        'namespace': 'ContainerInsights',
+                        'metric_name': 'pod_memory_utilization',
+                        'dimensions': {'ClusterName': 'test-cluster', 'PodName': 'web'},
+                    },
+                    {'id': 'double_cpu', 'expression': 'cpu * 2'},
+                ],
+                start_time='2025-01-01T11:45:00',
+                end_time='2025-01-01T12:15:00',
+                period=60,
+                stat='Average',
+            )
+
+        assert not result.isError
+        assert result.request_count == 2
+        assert result.timestamps == [t1.isoformat(), t2.isoformat()]
+        assert result.columns == {
+            'cpu': [10.0, 20.0],
+            'm2': [None, 512.0],
+            'double_cpu': [20.0, 40.0],
+        }
+        assert result.labels['cpu'] == 'CPU'
+        assert result.statuses['cpu'] == 'Complete'
+
+        first_call, second_call = mock_cloudwatch_client.get_metric_data.call_args_list
+        queries = first_call.kwargs['MetricDataQueries']
+        assert [query['Id'] for query in queries] == ['cpu', 'm2', 'double_cpu']
+        assert queries[0]['MetricStat']['Stat'] == 'Maximum'
+        assert queries[1]['MetricStat']['Stat'] == 'Average'
+        assert queries[1]['MetricStat']['Period'] == 60
+        assert queries[2]['Expression'] == 'cpu * 2'
+        assert second_call.kwargs['NextToken'] == 'next'
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_batch_search(self, mock_context, mock_mcp):
+        """Test that each series of a SEARCH expression gets its own column."""
+        handler = CloudWatchHandler(mock_mcp)
+        t1 = datetime.datetime(2025, 1, 1, 12, 0, 0)
+        t2 = datetime.datetime(2025, 1, 1, 12, 1, 0)
+
+        mock_cloudwatch_client = MagicMock()
+        mock_cloudwatch_client.get_metric_data.side_effect = [
+            {
+                'MetricDataResults': [
+                    {'Id': 'cpu', 'Label': 'web-1', 'Timestamps': [t1], 'Values': [10.0]},
+                    {'Id': 'cpu', 'Label': 'web-2', 'Timestamps': [t1], 'Values': [30.0]},
+                ],
+                'NextToken': 'next',
+            },
+            {
+                'MetricDataResults': [
+                    {'Id': 'cpu', 'Label': 'web-1', 'Timestamps': [t2], 'Values': [20.0]},
+                    {'Id': 'cpu', 'Label': 'web-2', 'Timestamps': [t2], 'Values': [40.0]},
+                ],
+            },
+        ]
+
+        with patch(
+            'awslabs.eks_mcp_server.cloudwatch_handler.AwsHelper.create_boto3_client',
+            return_value=mock_cloudwatch_client,
+        ):
+            result = await handler.get_cloudwatch_metrics_batch(
+                mock_context,
+                metrics=[
+                    {
+                        'id': 'cpu',
+                        'expression': "SEARCH('{ContainerInsights,PodName} web', 'Average')",
+                    }
+                ],
+                start_time='2025-01-01T11:45:00',
+                end_time='2025-01-01T12:15:00',
+                period=60,
+                stat='Average',
+            )
+
+        assert not result.isError
+        assert result.columns == {'cpu:web-1': [10.0, 20.0], 'cpu:web-2': [30.0, 40.0]}
+        assert result.labels == {'cpu:web-1': 'web-1', 'cpu:web-2': 'web-2'}
+        assert result.statuses == {'cpu:web-1': 'Complete', 'cpu:web-2': 'Complete'}
+
+    @pytest.mark.asyncio
+    async def test_get_cloudwatch_metrics_batch_invalid_spec(self, mock_context, mock_mcp):
+        """Test get_cloudwatch_metrics_batch with a spec lacking a metric or expression."""
+        handler = CloudWatchHandler(mock_mcp)
+
+        result = await handler.get_cloudwatch_metrics_batch(
+            mock_context,
+            metrics=[{'id': 'cpu', 'namespace': 'ContainerInsights'}],
+            minutes=15,
+            start_time=None,
+            end_time=None,
+            period=60,
+            stat='Average',
+        )
+
+        assert result.isError
+        assert 'needs either an expression' in result.content[0].text
@@ -26,10 +26,35 @@ from awslabs.eks_mcp_server.models import (
     DeployStackResponse,
     DescribeStackResponse,
     GenerateTemplateResponse,
+    WaitStackResponse,
 )
+from datetime import datetime
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+
+
+def stack_event(event_id, logical_id, status, resource_type='AWS::EC2::VPC', reason=None):
+    """Create a CloudFormation stack event of the eks-test-cluster-stack stack."""
+    event = {
+        'StackId': 'test-stack-id',
+        'StackName': 'eks-test-cluster-stack',
+        'EventId': event_id,
+        'LogicalResourceId': logical_id,
+        'ResourceType': resource_type,
+        'ResourceStatus': status,
+        'Timestamp': datetime(2025, 1, 1, 12, 0, int(event_id)),
+    }
+    if reason:
+        event['ResourceStatusReason'] = reason
+    return event
+
+
+OWNED_STACK = {
+    'StackId': 'test-stack-id',
+    'StackStatus': 'CREATE_IN_PROGRESS',
+    'Tags': [{'Key': CFN_STACK_TAG_KEY, 'Value': CFN_STACK_TAG_VALUE}],
+}
 
 
 class TestEksStackHandler:
@@ -884,3 +909,178 @@ class TestEksStackHandler:
                 operation='delete',
                 cluster_name=None,  # Explicitly pass None
             )
+
+        # Test missing cluster_name for wait operation
+        with pytest.raises(ValueError, match='cluster_name is required for wait operation'):
+            await handler.manage_eks_stacks(
+                ctx=mock_ctx,
+                operation='wait',
+                cluster_name=None,  # Explicitly pass None
+            )
+
+    def test_ensure_stack_ownership_cached(self):
+        """Test that _ensure_stack_ownership reuses a recent stack description."""
+        handler = EksStackHandler(MagicMock())
+        mock_ctx = MagicMock(spec=Context)
+        mock_cfn_client = MagicMock()
+        mock_cfn_client.describe_stacks.return_value = {'Stacks': [OWNED_STACK]}
+
+        with patch.object(AwsHelper, 'create_boto3_client', return_value=mock_cfn_client):
+            for _ in range(3):
+                success, stack, _ = handler._ensure_stack_ownership(
+                    ctx=mock_ctx, stack_name='eks-test-cluster-stack', operation='describe'
+                )
+                assert success is True
+                assert stack == OWNED_STACK
+
+        mock_cfn_client.describe_stacks.assert_called_once_with(StackName='eks-test-cluster-stack')
+
+    @pytest.mark.asyncio
+    async def test_wait_for_stack_streams_new_events(self):
+        """Test that the wait operation polls with backoff and reports only new stack events."""
+        handler = EksStackHandler(MagicMock())
+        mock_ctx = MagicMock(spec=Context)
+        mock_cfn_client = MagicMock()
+        stack_start = stack_event(
+            '1', 'eks-test-cluster-stack', 'CREATE_IN_PROGRESS', 'AWS::CloudFormation::Stack'
+        )
+        vpc_started = stack_event('2', 'VPC', 'CREATE_IN_PROGRESS')
+        vpc_created = stack_event('3', 'VPC', 'CREATE_COMPLETE')
+        stack_created = stack_event(
+            '4', 'eks-test-cluster-stack', 'CREATE_COMPLETE', 'AWS::CloudFormation::Stack'
+        )
+        # Events are returned newest first; the first page also holds an older operation
+        mock_cfn_client.describe_stack_events.side_effect = [
+            {
+                'StackEvents': [
+                    vpc_started,
+                    stack_start,
+                    stack_event('0', 'Old', 'DELETE_COMPLETE'),
+                ]
+            },
+            {'StackEvents': [vpc_started, stack_start]},
+            {'StackEvents': [stack_created, vpc_created, vpc_started, stack_start]},
+        ]
+        in_progress = dict(OWNED_STACK)
+        created = dict(
+            OWNED_STACK,
+            StackStatus='CREATE_COMPLETE',
+            Outputs=[{'OutputKey': 'ClusterName', 'OutputValue': 'test-cluster'}],
+        )
+        mock_cfn_client.describe_stacks.side_effect = [
+            {'Stacks': [in_progress]},
+            {'Stacks': [in_progress]},
+            {'Stacks': [in_progress]},
+            {'Stacks': [created]},
+        ]
+
+        with (
+            patch.object(AwsHelper, 'create_boto3_client', return_value=mock_cfn_client),
+            patch(
+                'awslabs.eks_mcp_server.eks_stack_handler.asyncio.sleep', new=AsyncMock()
+            ) as mock_sleep,
+        ):
+            result = await handler.manage_eks_stacks(
+                ctx=mock_ctx, operation='wait', cluster_name='test-cluster', wait_seconds=600
+            )
+
+        assert isinstance(result, WaitStackResponse)
+        assert not result.isError
+        assert result.complete is True
+        assert result.stack_status == 'CREATE_COMPLETE'
+        assert result.outputs == {'ClusterName': 'test-cluster'}
+        assert [(e.logical_resource_id, e.resource_status) for e in result.events] == [
+            ('eks-test-cluster-stack', 'CREATE_IN_PROGRESS'),
+            ('VPC', 'CREATE_IN_PROGRESS'),
+            ('VPC', 'CREATE_COMPLETE'),
+            ('eks-test-cluster-stack', 'CREATE_COMPLETE'),
+        ]
+        # The stack is polled by ID, and the delay doubles while no new events arrive
+        mock_cfn_client.describe_stack_events.assert_called_with(StackName='test-stack-id')
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10]
+        assert mock_ctx.report_progress.call_count == 2
+        assert mock_ctx.report_progress.call_args.args[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_stack_times_out(self):
+        """Test that the wait operation returns the stack status when the wait time runs out."""
+        handler = EksStackHandler(MagicMock())
+        mock_ctx = MagicMock(spec=Context)
+        mock_cfn_client = MagicMock()
+        mock_cfn_client.describe_stacks.return_value = {'Stacks': [OWNED_STACK]}
+        mock_cfn_client.describe_stack_events.return_value = {'StackEvents': []}
+
+        with patch.object(AwsHelper, 'create_boto3_client', return_value=mock_cfn_client):
+            result = await handler.manage_eks_stacks(
+                ctx=mock_ctx, operation='wait', cluster_name='test-cluster', wait_seconds=0
+            )
+
+        assert not result.isError
+        assert result.complete is False
+        assert result.stack_status == 'CREATE_IN_PROGRESS'
+        assert 'call wait again' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_wait_for_stack_allowed_without_write_access(self):
+        """Test that the wait operation is allowed in read-only mode."""
+        handler = EksStackHandler(MagicMock(), allow_write=False)
+        mock_ctx = MagicMock(spec=Context)
+        mock_result = MagicMock()
+
+        with patch.object(handler, '_wait_for_stack', return_value=mock_result) as mock_wait:
+            result = await handler.manage_eks_stacks(
+                ctx=mock_ctx, operation='wait', cluster_name='test-cluster'
+            )
+
+        mock_wait.assert_called_once_with(
+            ctx=mock_ctx,
+            stack_name='eks-test-cluster-stack',
+            cluster_name='test-cluster',
+            wait_seconds=300,
+        )
+        assert result == mock_result
+
+    @pytest.mark.asyncio
+    async def test_manage_eks_stacks_deploy_and_wait(self):
+        """Test that deploy follows the deployment when wait_seconds is set."""
+        handler = EksStackHandler(MagicMock(), allow_write=True)
+        mock_ctx = MagicMock(spec=Context)
+        deploy_result = DeployStackResponse(
+            isError=False,
+            content=[TextContent(type='text', text='CloudFormation stack creation initiated')],
+            stack_name='eks-test-cluster-stack',
+            stack_arn='test-stack-id',
+            cluster_name='test-cluster',
+        )
+        wait_result = WaitStackResponse(
+            isError=False,
+            content=[TextContent(type='text', text='finished with status CREATE_COMPLETE')],
+            stack_name='eks-test-cluster-stack',
+            stack_id='test-stack-id',
+            cluster_name='test-cluster',
+            stack_status='CREATE_COMPLETE',
+            complete=True,
+            events=[],
+            outputs={},
+        )
+
+        with (
+            patch.object(handler, '_deploy_stack', return_value=deploy_result),
+            patch.object(handler, '_wait_for_stack', return_value=wait_result) as mock_wait,
+        ):
+            result = await handler.manage_eks_stacks(
+                ctx=mock_ctx,
+                operation='deploy',
+                template_file='/path/to/template.yaml',
+                cluster_name='test-cluster',
+                wait_seconds=900,
+            )
+
+        mock_wait.assert_called_once_with(
+            ctx=mock_ctx,
+            stack_name='eks-test-cluster-stack',
+            cluster_name='test-cluster',
+            wait_seconds=900,
+        )
+        assert result.stack_status == 'CREATE_COMPLETE'
+        assert len(result.content) == 2
@@ -66,8 +66,8 @@ def k8s_apis(mock_kubernetes_client):
             # Create the actual instance
             apis = K8sApis('https://test-endpoint', 'test-token', ca_data)
 
-            # Verify CA data was written to the temp file
-            mock_temp_file.write.assert_called_once_with(b'test-ca-data')
+            # Verify CA data was loaded in memory
+            assert mock_config.ca_cert_data == 'test-ca-data'
 
             # Set up get_events to return different values for different tests
             apis.get_events = MagicMock()
@@ -96,21 +96,14 @@ class TestK8sApisInitialization:
             K8sApis('https://test-endpoint', 'test-token', None)
 
     def test_init_with_ca_data(self, mock_kubernetes_client):
-        """Test initialization with CA data."""
+        """Test initialization loads the CA data in memory."""
         mock_client, mock_config, mock_api_client = mock_kubernetes_client
 
-        # Mock tempfile and file operations with context manager support
-        mock_temp_file = MagicMock()
-        mock_temp_file.name = '/tmp/ca-cert-file'
-        mock_temp_file.__enter__.return_value = mock_temp_file
-
         # Mock the dynamic client
         mock_dynamic_client = MagicMock()
 
         with (
-            patch('tempfile.NamedTemporaryFile', return_value=mock_temp_file),
-            patch('os.path.exists', return_value=True),
-            patch('os.unlink'),
+            patch('tempfile.NamedTemporaryFile') as mock_named_temporary_file,
             patch('kubernetes.dynamic.DynamicClient', return_value=mock_dynamic_client),
         ):
             # Create K8sApis instance with CA data
@@ -123,17 +116,48 @@ class TestK8sApisInitialization:
             assert mock_config.host == 'https://test-endpoint'
             assert mock_config.api_key == {'authorization': 'Bearer test-token'}
             assert mock_config.verify_ssl is True
-            assert mock_config.ssl_ca_cert == '/tmp/ca-cert-file'
+            assert mock_config.ca_cert_data == 'test-ca-data'
 
-            # Verify CA data was written to the temp file
-            mock_temp_file.write.assert_called_once_with(b'test-ca-data')
+            # Verify no temp file was written
+            mock_named_temporary_file.assert_not_called()
+            assert apis._ca_cert_file_path is None
 
             # Verify dynamic client was set
             assert apis.dynamic_client == mock_dynamic_client
 
+    def test_init_with_ca_data_file_fallback(self, mock_kubernetes_client):
+        """Test initialization writes the CA data to a temp file on older clients."""
+        mock_client, _, _ = mock_kubernetes_client
+
+        # Configuration of a client without in-memory CA data support
+        mock_config = MagicMock(spec=['host', 'api_key', 'verify_ssl', 'ssl_ca_cert'])
+        mock_client.Configuration.return_value = mock_config
+
+        # Mock tempfile and file operations with context manager support
+        mock_temp_file = MagicMock()
+        mock_temp_file.name = '/tmp/ca-cert-file'
+        mock_temp_file.__enter__.return_value = mock_temp_file
+
+        with (
+            patch('tempfile.NamedTemporaryFile', return_value=mock_temp_file),
+            patch('os.path.exists', return_value=True),
+            patch('os.unlink'),
+            patch('kubernetes.dynamic.DynamicClient'),
+        ):
+            ca_data = base64.b64encode(b'test-ca-data').decode('utf-8')
+            K8sApis('https://test-endpoint', 'test-token', ca_data)
+
+            assert mock_config.ssl_ca_cert == '/tmp/ca-cert-file'
+
+            # Verify CA data was written to the temp file
+            mock_temp_file.write.assert_called_once_with(b'test-ca-data')
+
     def test_init_with_ca_data_error(self, mock_kubernetes_client):
         """Test initialization with CA data when an error occurs."""
-        _, _, _ = mock_kubernetes_client
+        mock_client, _, _ = mock_kubernetes_client
+        mock_client.Configuration.return_value = MagicMock(
+            spec=['host', 'api_key', 'verify_ssl', 'ssl_ca_cert']
+        )
 
         # Mock tempfile and file operations with context manager support
         mock_temp_file = MagicMock()
@@ -215,6 +239,17 @@ class TestK8sApisInitialization:
 class TestK8sApisOperations:
     """Tests for K8sApis operations."""
 
+    def test_update_token(self, k8s_apis):
+        """Test update_token keeps the API and dynamic clients."""
+        api_client = k8s_apis.api_client
+        dynamic_client = k8s_apis.dynamic_client
+
+        k8s_apis.update_token('new-token')
+
+        assert api_client.configuration.api_key == {'authorization': 'Bearer new-token'}
+        assert k8s_apis.api_client is api_client
+        assert k8s_apis.dynamic_client is dynamic_client
+
     def test_dynamic_client_initialization(self, k8s_apis):
         """Test that the dynamic client is initialized."""
         # Verify that the dynamic client is initialized
@@ -417,6 +452,58 @@ class TestK8sApisOperations:
         args, kwargs = mock_resource.get.call_args
         assert 'namespace' not in kwargs
 
+    def test_list_resources_follows_continue_token(self, k8s_apis):
+        """Test list_resources requesting pages until no continue token is returned."""
+        mock_resource = MagicMock()
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        first_page = MagicMock()
+        first_page.items = ['pod-1', 'pod-2']
+        setattr(first_page.metadata, 'continue', 'token-1')
+        last_page = MagicMock()
+        last_page.items = ['pod-3']
+        setattr(last_page.metadata, 'continue', None)
+        mock_resource.get.side_effect = [first_page, last_page]
+
+        response = k8s_apis.list_resources('Pod', 'v1', page_size=2)
+
+        # The items of all pages are returned in the first response
+        assert response is first_page
+        assert response.items == ['pod-1', 'pod-2', 'pod-3']
+
+        # The second page is requested with the continue token of the first
+        first_call, second_call = mock_resource.get.call_args_list
+        assert first_call.kwargs == {'limit': 2}
+        assert second_call.kwargs == {'limit': 2, '_continue': 'token-1'}
+
+    def test_iter_resource_pages_metadata_only(self, k8s_apis):
+        """Test iter_resource_pages asking for PartialObjectMetadataList in metadata-only mode."""
+        mock_resource = MagicMock()
+        mock_resources = MagicMock()
+        mock_resources.get.return_value = mock_resource
+        k8s_apis.dynamic_client.resources = mock_resources
+
+        pages = list(
+            k8s_apis.iter_resource_pages('Pod', 'v1', namespace='default', metadata_only=True)
+        )
+
+        assert pages == [mock_resource.get.return_value]
+        kwargs = mock_resource.get.call_args.kwargs
+        assert kwargs['namespace'] == 'default'
+        assert kwargs['limit'] == 500
+        assert 'as=PartialObjectMetadataList' in kwargs['header_params']['Accept']
+
+    def test_iter_resource_pages_error(self, k8s_apis):
+        """Test iter_resource_pages adding context to errors."""
+        mock_resource = MagicMock()
+        mock_resource.get.side_effect = Exception('Forbidden')
+        k8s_apis.dynamic_client.resources.get.return_value = mock_resource
+
+        with pytest.raises(ValueError, match='Error listing Pod resources: Forbidden'):
+            list(k8s_apis.iter_resource_pages('Pod', 'v1'))
+
     def test_get_pod_logs(self, k8s_apis):
         """Test get_pod_logs method."""
         # Mock the dynamic client and resources
@@ -448,10 +535,12 @@ class TestK8sApisOperations:
         mock_log.get.assert_called_once_with(
             name='test-pod',
             namespace='test-namespace',
-            container='test-container',
-            sinceSeconds=60,
-            tailLines=100,
-            limitBytes=1024,
+            query_params=[
+                ('container', 'test-container'),
+                ('sinceSeconds', 60),
+                ('tailLines', 100),
+                ('limitBytes', 1024),
+            ],
         )
 
     def test_get_pod_logs_minimal(self, k8s_apis):
@@ -481,6 +570,7 @@ class TestK8sApisOperations:
         mock_log.get.assert_called_once_with(
             name='test-pod',
             namespace='test-namespace',
+            query_params=[],
         )
 
     def _create_mock_event(self):
@@ -844,3 +934,27 @@ class TestK8sApisOperations:
             # Verify the API was called
             mock_client.CoreApi.assert_called_once_with(k8s_apis.api_client)
             mock_core_api.get_api_versions.assert_called_once()
+
+    def test_get_api_versions_cached(self, k8s_apis):
+        """Test get_api_versions reuses the cluster's cached API versions."""
+        with patch('kubernetes.client') as mock_client:
+            mock_client.CoreApi.return_value.get_api_versions.return_value.versions = ['v1']
+            mock_client.ApisApi.return_value.get_api_versions.return_value.groups = []
+
+            assert k8s_apis.get_api_versions() == ['v1']
+            assert k8s_apis.get_api_versions() == ['v1']
+
+            mock_client.CoreApi.return_value.get_api_versions.assert_called_once()
+
+    def test_unknown_kind_invalidates_api_versions(self, k8s_apis):
+        """Test an unknown resource kind drops the cluster's cached API versions."""
+        from awslabs.eks_mcp_server.k8s_discovery_cache import DiscoveryCache
+        from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+        DiscoveryCache().set_api_versions('https://test-endpoint', ['v1'])
+        k8s_apis.dynamic_client.resources.get.side_effect = ResourceNotFoundError('No matches')
+
+        with pytest.raises(ValueError, match='Error managing Widget resource'):
+            k8s_apis.manage_resource(Operation.READ, 'Widget', 'example.com/v1', name='w')
+
+        assert DiscoveryCache().get_api_versions('https://test-endpoint') is None
@@ -12,9 +12,17 @@
 """Tests for the K8sClientCache class."""
 
 import pytest
+import ssl
+import threading
 import time
-from awslabs.eks_mcp_server.k8s_client_cache import K8S_AWS_ID_HEADER, K8sClientCache
+from awslabs.eks_mcp_server.k8s_client_cache import (
+    K8S_AWS_ID_HEADER,
+    K8sClientCache,
+    is_stale_client_error,
+)
+from kubernetes.client.exceptions import ApiException
 from unittest.mock import MagicMock, patch
+from urllib3.exceptions import MaxRetryError
 
 
 class TestK8sClientCache:
@@ -222,6 +230,9 @@ class TestK8sClientCache:
         mock_k8s_apis = MagicMock()
         cache._client_cache.clear()
         cache._client_cache['test-cluster'] = mock_k8s_apis
+        cache._token_expires_at['test-cluster'] = time.time() + 60
+        cache._cluster_info_cache['test-cluster'] = ('https://test-endpoint', 'test-ca-data')
+        cache._client_cluster_info['test-cluster'] = ('https://test-endpoint', 'test-ca-data')
 
         # Mock the _get_cluster_credentials method
         with patch.object(cache, '_get_cluster_credentials') as mock_get_credentials:
@@ -278,57 +289,192 @@ class TestK8sClientCache:
             # Verify that the client was not cached
             assert 'test-cluster' not in cache._client_cache
 
-    def test_ttl_cache_expiration(self):
-        """Test that the TTLCache expires entries after the TTL."""
-        # Create a K8sClientCache instance
+    def test_expired_token_refreshed_in_place(self):
+        """Test that an expired token is replaced without recreating the client."""
         cache = K8sClientCache()
 
-        # Clear the client cache and create a new one with a very short TTL for testing
-        cache._client_cache.clear()
-
-        # Use a very short TTL for testing (0.1 seconds)
-        test_ttl = 0.1
-
-        # Create a new cache with the test TTL
-        with patch('awslabs.eks_mcp_server.k8s_client_cache.TOKEN_TTL', test_ttl):
-            from cachetools import TTLCache
-
-            cache._client_cache = TTLCache(maxsize=100, ttl=test_ttl)
-
-            # Mock _get_cluster_credentials to return valid credentials
-            with patch.object(
+        with (
+            patch.object(
                 cache,
                 '_get_cluster_credentials',
                 return_value=('https://test-endpoint', 'test-token', 'test-ca-data'),
-            ):
-                # Mock the K8sApis constructor to return different instances each time
-                with patch(
-                    'awslabs.eks_mcp_server.k8s_client_cache.K8sApis'
-                ) as mock_k8s_apis_class:
-                    # Create two different mock instances
-                    mock_k8s_apis1 = MagicMock()
-                    mock_k8s_apis2 = MagicMock()
-
-                    # Set up the mock to return different instances on consecutive calls
-                    mock_k8s_apis_class.side_effect = [mock_k8s_apis1, mock_k8s_apis2]
+            ),
+            patch.object(
+                cache,
+                '_get_cluster_info',
+                return_value=('https://test-endpoint', 'test-ca-data'),
+            ),
+            patch.object(cache, '_get_token', return_value='new-token'),
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis') as mock_k8s_apis_class,
+        ):
+            client1 = cache.get_client('test-cluster')
+
+            # Expire the token
+            cache._token_expires_at['test-cluster'] = time.time() - 1
+
+            client2 = cache.get_client('test-cluster')
+
+            # Verify the client was kept and its token replaced
+            assert client1 is client2
+            assert mock_k8s_apis_class.call_count == 1
+            client1.update_token.assert_called_once_with('new-token')
+            assert cache._token_expires_at['test-cluster'] > time.time()
+
+    def test_client_rebuilt_when_cluster_info_changes(self):
+        """Test that a client is rebuilt when the CA data of its cluster changed."""
+        cache = K8sClientCache()
+        cache.invalidate('test-cluster')
 
-                    # Get a client - should create a new one
-                    client1 = cache.get_client('test-cluster')
+        with (
+            patch.object(
+                cache,
+                '_get_cluster_credentials',
+                side_effect=[
+                    ('https://test-endpoint', 'test-token', 'old-ca-data'),
+                    ('https://test-endpoint', 'test-token', 'new-ca-data'),
+                ],
+            ),
+            patch.object(cache, '_get_cluster_info') as mock_get_cluster_info,
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis') as mock_k8s_apis_class,
+        ):
+            mock_k8s_apis_class.side_effect = lambda *args: MagicMock()
+            client1 = cache.get_client('test-cluster')
+
+            # The cluster info expired and describing the cluster again returns a new CA
+            mock_get_cluster_info.return_value = ('https://test-endpoint', 'new-ca-data')
+            client2 = cache.get_client('test-cluster')
+
+        assert client1 is not client2
+        mock_k8s_apis_class.assert_called_with(
+            'https://test-endpoint', 'test-token', 'new-ca-data'
+        )
+        assert cache._client_cluster_info['test-cluster'] == (
+            'https://test-endpoint',
+            'new-ca-data',
+        )
+
+    def test_get_client_does_not_block_other_clusters(self):
+        """Test that creating the client of a slow cluster does not block other clusters."""
+        cache = K8sClientCache()
+        cache.invalidate('slow-cluster')
+        cache.invalidate('fast-cluster')
+        slow_started = threading.Event()
+        release_slow = threading.Event()
+
+        def get_cluster_credentials(cluster_name):
+            if cluster_name == 'slow-cluster':
+                slow_started.set()
+                release_slow.wait(5)
+            return ('https://test-endpoint', 'test-token', 'test-ca-data')
+
+        with (
+            patch.object(cache, '_get_cluster_credentials', side_effect=get_cluster_credentials),
+            patch('awslabs.eks_mcp_server.k8s_client_cache.K8sApis'),
+        ):
+            slow = threading.Thread(target=cache.get_client, args=('slow-cluster',))
+            slow.start()
+            assert slow_started.wait(5)
+
+            # The fast cluster gets its client while the slow one is still being created
+            assert cache.get_client('fast-cluster') is not None
+            assert slow.is_alive()
+
+            release_slow.set()
+            slow.join(5)
+
+        assert 'slow-cluster' in cache._client_cache
+
+    def test_invalidate(self):
+        """Test that invalidating a cluster drops its client and cluster info."""
+        cache = K8sClientCache()
+        cache._client_cache['test-cluster'] = MagicMock()
+        cache._token_expires_at['test-cluster'] = time.time() + 60
+        cache._cluster_info_cache['test-cluster'] = ('https://test-endpoint', 'test-ca-data')
+        cache._client_cluster_info['test-cluster'] = ('https://test-endpoint', 'test-ca-data')
+
+        cache.invalidate('test-cluster')
+
+        assert 'test-cluster' not in cache._client_cache
+        assert 'test-cluster' not in cache._token_expires_at
+        assert 'test-cluster' not in cache._cluster_info_cache
+        assert 'test-cluster' not in cache._client_cluster_info
+
+    def test_is_stale_client_error(self):
+        """Test the errors that require rebuilding the client of a cluster."""
+        assert is_stale_client_error(ApiException(status=401))
+        assert is_stale_client_error(ssl.SSLError('certificate verify failed'))
+        assert is_stale_client_error(
+            MaxRetryError(None, '/api', reason=ssl.SSLCertVerificationError('bad certificate'))
+        )
+        try:
+            try:
+                raise ApiException(status=401)
+            except ApiException as e:
+                raise ValueError('Error listing Pod resources') from e
+        except ValueError as e:
+            assert is_stale_client_error(e)
+        assert not is_stale_client_error(ApiException(status=404))
+        assert not is_stale_client_error(Exception('Test error'))
+
+    def test_background_token_refresh(self):
+        """Test that tokens close to expiring are refreshed in the background."""
+        cache = K8sClientCache()
+        mock_k8s_apis = MagicMock()
+        cache._client_cache['expiring-cluster'] = mock_k8s_apis
+        cache._token_expires_at['expiring-cluster'] = time.time() + 10
+        cache._client_cache['fresh-cluster'] = MagicMock()
+        cache._token_expires_at['fresh-cluster'] = time.time() + 600
+        cache._token_expires_at['evicted-cluster'] = time.time() + 10
+
+        with (
+            patch('awslabs.eks_mcp_server.k8s_client_cache.TOKEN_REFRESH_INTERVAL', 0.01),
+            patch.object(cache, '_get_token', return_value='new-token') as mock_get_token,
+        ):
+            cache._start_refresh_thread()
+            deadline = time.time() + 2
+            while not mock_k8s_apis.update_token.called and time.time() < deadline:
+                time.sleep(0.01)
+            cache.stop()
+            cache._refresh_thread.join(1)
+
+        mock_k8s_apis.update_token.assert_called_with('new-token')
+        assert all(call.args == ('expiring-cluster',) for call in mock_get_token.call_args_list)
+        assert 'evicted-cluster' not in cache._token_expires_at
+
+    def test_background_token_refresh_error(self):
+        """Test that a failed background refresh leaves the client in the cache."""
+        cache = K8sClientCache()
+        cache._client_cache['test-cluster'] = MagicMock()
+        cache._token_expires_at['test-cluster'] = time.time()
 
-                    # Verify that K8sApis was initialized
-                    assert mock_k8s_apis_class.call_count == 1
+        with patch.object(cache, '_get_token', side_effect=Exception('Test error')):
+            cache._stop_event.wait = MagicMock(side_effect=[False, True])
+            cache._refresh_tokens()
 
-                    # Wait for the cache entry to expire
-                    time.sleep(test_ttl + 0.1)
+        assert 'test-cluster' in cache._client_cache
 
-                    # Get a client again - should create a new one because the cache entry expired
-                    client2 = cache.get_client('test-cluster')
+    def test_cluster_info_cached(self):
+        """Test that describe_cluster results are reused for new tokens."""
+        cache = K8sClientCache()
+        mock_eks_client = MagicMock()
+        mock_eks_client.describe_cluster.return_value = {
+            'cluster': {
+                'endpoint': 'https://test-endpoint',
+                'certificateAuthority': {'data': 'test-ca-data'},
+            }
+        }
+        mock_sts_client = MagicMock()
+        mock_sts_client.generate_presigned_url.return_value = 'https://test-presigned-url'
 
-                    # Verify that K8sApis was initialized again
-                    assert mock_k8s_apis_class.call_count == 2
+        with (
+            patch.object(cache, '_get_eks_client', return_value=mock_eks_client),
+            patch.object(cache, '_get_sts_client', return_value=mock_sts_client),
+        ):
+            cache._get_cluster_credentials('test-cluster')
+            cache._get_cluster_credentials('test-cluster')
 
-                    # Verify that we got different client instances
-                    assert client1 != client2
+        mock_eks_client.describe_cluster.assert_called_once_with(name='test-cluster')
+        assert mock_sts_client.generate_presigned_url.call_count == 2
 
     def test_get_cluster_credentials(self):
         """Test _get_cluster_credentials method."""
@@ -0,0 +1,128 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+# ruff: noqa: D101, D102, D103
+"""Tests for the Kubernetes API discovery cache."""
+
+import json
+import os
+import time
+from awslabs.eks_mcp_server.k8s_discovery_cache import DISCOVERY_CACHE_TTL, DiscoveryCache
+from unittest.mock import MagicMock, patch
+
+
+ENDPOINT = 'https://test-cluster.eks.amazonaws.com'
+
+
+def write_cache_file(path, git_version, age):
+    """Write a discovery cache file of the given server version and age."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({'version': {'kubernetes': {'gitVersion': git_version}}}))
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+class TestDiscoveryCache:
+    def test_singleton(self):
+        assert DiscoveryCache() is DiscoveryCache()
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_reuses_dynamic_client_with_new_api_client(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        first_api_client = MagicMock()
+        second_api_client = MagicMock()
+
+        dynamic_client = cache.get_dynamic_client(ENDPOINT, first_api_client)
+        assert cache.get_dynamic_client(ENDPOINT, second_api_client) is dynamic_client
+
+        mock_dynamic_client_class.assert_called_once_with(
+            first_api_client, cache_file=str(cache.cache_file(ENDPOINT))
+        )
+        assert dynamic_client.client is second_api_client
+        assert dynamic_client.configuration is second_api_client.configuration
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_stale_cache_file_kept_when_version_unchanged(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        path = cache.cache_file(ENDPOINT)
+        write_cache_file(path, 'v1.30.0', DISCOVERY_CACHE_TTL + 60)
+
+        with patch.object(cache, '_get_server_version', return_value='v1.30.0'):
+            cache.get_dynamic_client(ENDPOINT, MagicMock())
+
+        assert path.exists()
+        assert time.time() - path.stat().st_mtime < 60
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_stale_cache_file_removed_when_version_changed(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        path = cache.cache_file(ENDPOINT)
+        write_cache_file(path, 'v1.29.0', DISCOVERY_CACHE_TTL + 60)
+
+        with patch.object(cache, '_get_server_version', return_value='v1.30.0'):
+            cache.get_dynamic_client(ENDPOINT, MagicMock())
+
+        assert not path.exists()
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_fresh_cache_file_skips_version_check(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        write_cache_file(cache.cache_file(ENDPOINT), 'v1.29.0', 0)
+
+        with patch.object(cache, '_get_server_version') as mock_get_server_version:
+            cache.get_dynamic_client(ENDPOINT, MagicMock())
+
+        mock_get_server_version.assert_not_called()
+        assert cache.cache_file(ENDPOINT).exists()
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_expired_entry_rediscovers_after_upgrade(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        mock_dynamic_client_class.side_effect = [MagicMock(), MagicMock()]
+        with patch.object(cache, '_get_server_version', return_value='v1.29.0'):
+            write_cache_file(cache.cache_file(ENDPOINT), 'v1.29.0', DISCOVERY_CACHE_TTL + 60)
+            dynamic_client = cache.get_dynamic_client(ENDPOINT, MagicMock())
+        cache.set_api_versions(ENDPOINT, ['v1'])
+        cache._entries[ENDPOINT]['validated_at'] -= DISCOVERY_CACHE_TTL + 60
+
+        with patch.object(cache, '_get_server_version', return_value='v1.30.0'):
+            assert cache.get_dynamic_client(ENDPOINT, MagicMock()) is not dynamic_client
+
+        assert cache.get_api_versions(ENDPOINT) is None
+        assert mock_dynamic_client_class.call_count == 2
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_expired_entry_kept_when_version_unavailable(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        dynamic_client = cache.get_dynamic_client(ENDPOINT, MagicMock())
+        cache._entries[ENDPOINT]['validated_at'] -= DISCOVERY_CACHE_TTL + 60
+
+        with patch.object(cache, '_get_server_version', return_value=None):
+            assert cache.get_dynamic_client(ENDPOINT, MagicMock()) is dynamic_client
+
+    @patch('kubernetes.dynamic.DynamicClient')
+    def test_api_versions_and_invalidate(self, mock_dynamic_client_class):
+        cache = DiscoveryCache()
+        assert cache.get_api_versions(ENDPOINT) is None
+
+        cache.get_dynamic_client(ENDPOINT, MagicMock())
+        cache.set_api_versions(ENDPOINT, ['apps/v1', 'v1'])
+        assert cache.get_api_versions(ENDPOINT) == ['apps/v1', 'v1']
+
+        cache.invalidate(ENDPOINT)
+        assert cache.get_api_versions(ENDPOINT) is None
+
+    @patch('kubernetes.client.VersionApi')
+    def test_get_server_version(self, mock_version_api_class):
+        mock_version_api_class.return_value.get_code.return_value.git_version = 'v1.30.0'
+        assert DiscoveryCache()._get_server_version(MagicMock()) == 'v1.30.0'
+
+        mock_version_api_class.return_value.get_code.side_effect = Exception('Unauthorized')
+        assert DiscoveryCache()._get_server_version(MagicMock()) is None
@@ -14,10 +14,10 @@
 import os
 import pytest
 from awslabs.eks_mcp_server.k8s_apis import K8sApis
-from awslabs.eks_mcp_server.k8s_handler import K8sHandler
+from awslabs.eks_mcp_server.k8s_handler import K8sHandler, log_sort_key
 from mcp.server.fastmcp import Context
 from mcp.types import TextContent
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 
 @pytest.fixture
@@ -67,7 +67,7 @@ class TestK8sHandler:
             assert handler.allow_sensitive_data_access is False
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 8
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -98,7 +98,7 @@ class TestK8sHandler:
             assert handler.allow_sensitive_data_access is True
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 8
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -707,7 +707,7 @@ metadata:
 
         mock_response = MagicMock()
         mock_response.items = [mock_item1, mock_item2]
-        mock_k8s_apis.list_resources.return_value = mock_response
+        mock_k8s_apis.iter_resource_pages.return_value = iter([mock_response])
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis) as mock_client:
             result = await handler.list_k8s_resources(
@@ -722,11 +722,11 @@ metadata:
             # Verify that get_client was called
             mock_client.assert_called_once_with('test-cluster')
 
-            # Verify that list_resources was called once
-            mock_k8s_apis.list_resources.assert_called_once()
+            # Verify that the resources were listed once
+            mock_k8s_apis.iter_resource_pages.assert_called_once()
 
             # Get the call args
-            args, kwargs = mock_k8s_apis.list_resources.call_args
+            args, kwargs = mock_k8s_apis.iter_resource_pages.call_args
 
             # Verify the positional args
             assert args[0] == 'Pod'
@@ -735,6 +735,7 @@ metadata:
             # Verify the keyword args
             assert kwargs['namespace'] == 'test-namespace'
             assert kwargs['label_selector'] == 'app=test'
+            assert kwargs['metadata_only'] is True
 
             # Verify the result
             assert not result.isError
@@ -769,7 +770,7 @@ metadata:
         # Mock response with no items
         mock_response = MagicMock()
         mock_response.items = []
-        mock_k8s_apis.list_resources.return_value = mock_response
+        mock_k8s_apis.iter_resource_pages.return_value = iter([mock_response])
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
             result = await handler.list_k8s_resources(
@@ -790,6 +791,84 @@ metadata:
                 'Successfully listed 0 Pod resources in test-namespace/' in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_from_watch_cache(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test list_k8s_resources serving the list from the watch cache."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, enable_watch_cache=True)
+
+        handler.watch_cache = MagicMock()
+        handler.watch_cache.list_resources.return_value = [
+            {
+                'name': 'test-pod-1',
+                'namespace': 'test-namespace',
+                'creation_timestamp': '2023-01-01T00:00:00Z',
+                'labels': {'app': 'test'},
+                'annotations': None,
+            }
+        ]
+
+        with patch.object(handler, 'get_client') as mock_client:
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='test-namespace',
+                label_selector='app=test',
+                field_selector=None,
+            )
+
+            # The API server is not called
+            mock_client.assert_not_called()
+
+        handler.watch_cache.list_resources.assert_called_once_with(
+            'test-cluster',
+            'Pod',
+            'v1',
+            namespace='test-namespace',
+            label_selector='app=test',
+            field_selector=None,
+        )
+        assert not result.isError
+        assert result.count == 1
+        assert result.items[0].name == 'test-pod-1'
+        assert result.items[0].creation_timestamp == '2023-01-01T00:00:00Z'
+
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_watch_cache_fallback(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test list_k8s_resources listing from the API server when the cache cannot answer."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, enable_watch_cache=True)
+
+        handler.watch_cache = MagicMock()
+        handler.watch_cache.list_resources.return_value = None
+        mock_k8s_apis = MagicMock()
+        mock_k8s_apis.iter_resource_pages.return_value = iter([MagicMock(items=[])])
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='test-namespace',
+                label_selector=None,
+                field_selector='status.phase=Running',
+            )
+
+        mock_k8s_apis.iter_resource_pages.assert_called_once()
+        assert not result.isError
+        assert result.count == 0
+
     @pytest.mark.asyncio
     async def test_list_k8s_resources_error(self, mock_context, mock_mcp, mock_client_cache):
         """Test list_k8s_resources method with an error."""
@@ -801,7 +880,7 @@ metadata:
 
         # Mock get_client
         mock_k8s_apis = MagicMock()
-        mock_k8s_apis.list_resources.side_effect = Exception('Failed to list resources')
+        mock_k8s_apis.iter_resource_pages.side_effect = Exception('Failed to list resources')
 
         with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
             result = await handler.list_k8s_resources(
@@ -822,6 +901,38 @@ metadata:
                 'Failed to list Pod resources: Failed to list resources' in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_list_k8s_resources_unauthorized(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test that the cached client is dropped when the API server rejects its token."""
+        from kubernetes.client.exceptions import ApiException
+        from kubernetes.dynamic.exceptions import UnauthorizedError
+
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp)
+
+        # A real K8sApis, which re-raises the error of its dynamic client as a ValueError
+        mock_k8s_apis = K8sApis.__new__(K8sApis)
+        mock_k8s_apis.endpoint = 'https://test-endpoint'
+        mock_k8s_apis.dynamic_client = MagicMock()
+        mock_resource = mock_k8s_apis.dynamic_client.resources.get.return_value
+        mock_resource.get.side_effect = UnauthorizedError(ApiException(status=401))
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.list_k8s_resources(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                api_version='v1',
+                namespace='test-namespace',
+            )
+
+        assert result.isError
+        mock_client_cache.invalidate.assert_called_once_with('test-cluster')
+
     @pytest.mark.asyncio
     async def test_generate_app_manifest_write_access_disabled(
         self, mock_context, mock_mcp, mock_client_cache
@@ -1133,7 +1244,7 @@ metadata:
             K8sHandler(mock_mcp, allow_write=True, allow_sensitive_data_access=True)
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 8
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -1157,7 +1268,7 @@ metadata:
         assert handler.allow_write is False
 
         # Verify that the tools were registered
-        assert mock_mcp.tool.call_count == 7
+        assert mock_mcp.tool.call_count == 8
 
         # Get all call args
         call_args_list = mock_mcp.tool.call_args_list
@@ -1357,6 +1468,195 @@ metadata:
                 in result.content[0].text
             )
 
+    def _mock_pods(self, mock_k8s_apis, pods):
+        """Set up list_resources to return pods with the given containers."""
+        items = []
+        for pod_name, containers in pods.items():
+            item = MagicMock()
+            item.to_dict.return_value = {
+                'metadata': {'name': pod_name},
+                'spec': {'containers': [{'name': name} for name in containers]},
+            }
+            items.append(item)
+        mock_k8s_apis.list_resources.return_value = MagicMock(items=items)
+
+    @pytest.mark.asyncio
+    async def test_get_pod_logs_by_selector_merges_logs(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_pod_logs_by_selector merging the logs of all containers by timestamp."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_k8s_apis = MagicMock()
+        self._mock_pods(mock_k8s_apis, {'web-1': ['app', 'proxy'], 'web-2': ['app']})
+        logs = {
+            ('web-1', 'app'): '2025-01-01T00:00:01.5Z ERROR a\n2025-01-01T00:00:04Z ok b\n',
+            ('web-1', 'proxy'): '2025-01-01T00:00:02.25Z ERROR c\n',
+            (
+                'web-2',
+                'app',
+            ): '2025-01-01T00:00:01.123456789Z ERROR d\n2025-01-01T00:00:03Z ERROR e\n',
+        }
+        mock_k8s_apis.get_pod_logs.side_effect = lambda **kwargs: logs[
+            (kwargs['pod_name'], kwargs['container_name'])
+        ]
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.get_pod_logs_by_selector(
+                mock_context,
+                cluster_name='test-cluster',
+                namespace='test-namespace',
+                label_selector='app=web',
+                container_name=None,
+                since_seconds=60,
+                tail_lines=100,
+                limit_bytes=1024,
+                grep='ERROR',
+                max_lines=3,
+                follow_seconds=0,
+            )
+
+        mock_k8s_apis.list_resources.assert_called_once_with(
+            kind='Pod', api_version='v1', namespace='test-namespace', label_selector='app=web'
+        )
+        mock_k8s_apis.get_pod_logs.assert_any_call(
+            pod_name='web-1',
+            namespace='test-namespace',
+            container_name='proxy',
+            since_seconds=60,
+            tail_lines=100,
+            limit_bytes=1024,
+            since_time=None,
+            timestamps=True,
+        )
+        assert not result.isError
+        assert result.containers == ['web-1/app', 'web-1/proxy', 'web-2/app']
+        # Lines not matching the grep are dropped before the newest max_lines are kept
+        assert result.log_lines == [
+            '2025-01-01T00:00:01.5Z [web-1/app] ERROR a',
+            '2025-01-01T00:00:02.25Z [web-1/proxy] ERROR c',
+            '2025-01-01T00:00:03Z [web-2/app] ERROR e',
+        ]
+        assert result.truncated
+
+    @pytest.mark.asyncio
+    async def test_get_pod_logs_by_selector_container_error(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_pod_logs_by_selector returning the logs of the other containers on errors."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_k8s_apis = MagicMock()
+        self._mock_pods(mock_k8s_apis, {'web-1': ['app'], 'web-2': ['app']})
+
+        def get_pod_logs(**kwargs):
+            if kwargs['pod_name'] == 'web-2':
+                raise Exception('container is waiting to start')
+            return '2025-01-01T00:00:01Z started\n'
+
+        mock_k8s_apis.get_pod_logs.side_effect = get_pod_logs
+
+        with patch.object(handler, 'get_client', return_value=mock_k8s_apis):
+            result = await handler.get_pod_logs_by_selector(
+                mock_context,
+                cluster_name='test-cluster',
+                namespace='test-namespace',
+                label_selector='app=web',
+                container_name='app',
+                since_seconds=None,
+                tail_lines=100,
+                limit_bytes=1024,
+                grep=None,
+                max_lines=500,
+                follow_seconds=0,
+            )
+
+        assert not result.isError
+        assert result.log_lines == ['2025-01-01T00:00:01Z [web-1/app] started']
+        assert not result.truncated
+        assert 'failed to get logs from web-2/app' in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_get_pod_logs_by_selector_follow(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_pod_logs_by_selector streaming new log lines in follow mode."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=True)
+
+        mock_k8s_apis = MagicMock()
+        self._mock_pods(mock_k8s_apis, {'web-1': ['app']})
+        mock_k8s_apis.get_pod_logs.side_effect = [
+            '2025-01-01T00:00:01.5Z first\n',
+            # Logs since the second of the last line include the line already returned
+            '2025-01-01T00:00:01.5Z first\n2025-01-01T00:00:02Z second\n',
+        ]
+
+        with (
+            patch.object(handler, 'get_client', return_value=mock_k8s_apis),
+            patch('awslabs.eks_mcp_server.k8s_handler.asyncio.sleep', new=AsyncMock()),
+            patch('awslabs.eks_mcp_server.k8s_handler.time') as mock_time,
+        ):
+            mock_time.monotonic.side_effect = [0, 0, 2, 3]
+            result = await handler.get_pod_logs_by_selector(
+                mock_context,
+                cluster_name='test-cluster',
+                namespace='test-namespace',
+                label_selector='app=web',
+                container_name=None,
+                since_seconds=None,
+                tail_lines=100,
+                limit_bytes=1024,
+                grep=None,
+                max_lines=500,
+                follow_seconds=3,
+            )
+
+        assert mock_k8s_apis.get_pod_logs.call_args.kwargs['since_time'] == '2025-01-01T00:00:01Z'
+        assert mock_k8s_apis.get_pod_logs.call_args.kwargs['tail_lines'] is None
+        mock_context.report_progress.assert_called_once_with(
+            2, 3, '2025-01-01T00:00:02Z [web-1/app] second'
+        )
+        assert result.log_lines == [
+            '2025-01-01T00:00:01.5Z [web-1/app] first',
+            '2025-01-01T00:00:02Z [web-1/app] second',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_pod_logs_by_selector_sensitive_data_access_disabled(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_pod_logs_by_selector with sensitive data access disabled."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(mock_mcp, allow_sensitive_data_access=False)
+
+        result = await handler.get_pod_logs_by_selector(
+            mock_context,
+            cluster_name='test-cluster',
+            namespace='test-namespace',
+            label_selector='app=web',
+        )
+
+        assert result.isError
+        assert 'requires --allow-sensitive-data-access' in result.content[0].text
+
+    def test_log_sort_key(self):
+        """Test log_sort_key ordering timestamps with different fraction lengths."""
+        assert log_sort_key('2025-01-01T00:00:01.5Z') > log_sort_key(
+            '2025-01-01T00:00:01.123456789Z'
+        )
+        assert log_sort_key('2025-01-01T00:00:01Z') < log_sort_key('2025-01-01T00:00:01.1Z')
+
     @pytest.mark.asyncio
     async def test_get_k8s_events_success(self, mock_context, mock_mcp, mock_client_cache):
         """Test get_k8s_events method with successful event retrieval."""
@@ -1478,6 +1778,50 @@ metadata:
                 in result.content[0].text
             )
 
+    @pytest.mark.asyncio
+    async def test_get_k8s_events_from_watch_cache(
+        self, mock_context, mock_mcp, mock_client_cache
+    ):
+        """Test get_k8s_events serving the events from the watch cache."""
+        with patch(
+            'awslabs.eks_mcp_server.k8s_handler.K8sClientCache', return_value=mock_client_cache
+        ):
+            handler = K8sHandler(
+                mock_mcp, allow_sensitive_data_access=True, enable_watch_cache=True
+            )
+
+        handler.watch_cache = MagicMock()
+        handler.watch_cache.get_events.return_value = [
+            {
+                'first_timestamp': '2023-01-01T00:00:00Z',
+                'last_timestamp': '2023-01-01T00:05:00Z',
+                'count': 3,
+                'message': 'Back-off restarting failed container',
+                'reason': 'BackOff',
+                'reporting_component': 'kubelet',
+                'type': 'Warning',
+            }
+        ]
+
+        with patch.object(handler, 'get_client') as mock_client:
+            result = await handler.get_k8s_events(
+                mock_context,
+                cluster_name='test-cluster',
+                kind='Pod',
+                name='test-pod',
+                namespace='test-namespace',
+            )
+
+            # The API server is not called
+            mock_client.assert_not_called()
+
+        handler.watch_cache.get_events.assert_called_once_with(
+            'test-cluster', 'Pod', 'test-pod', 'test-namespace'
+        )
+        assert not result.isError
+        assert result.count == 1
+        assert result.events[0].reason == 'BackOff'
+
     @pytest.mark.asyncio
     async def test_get_k8s_events_sensitive_data_access_disabled(
         self, mock_context, mock_mcp, mock_client_cache
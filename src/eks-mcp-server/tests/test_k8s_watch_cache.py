@@ -0,0 +1,249 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+# ruff: noqa: D101, D102, D103
+"""Tests for the Kubernetes watch cache."""
+
+import pytest
+from awslabs.eks_mcp_server.k8s_watch_cache import (
+    K8sWatchCache,
+    ResourceInformer,
+    labels_match,
+    parse_field_selector,
+    parse_label_selector,
+)
+from unittest.mock import MagicMock, patch
+
+
+def pod(name, namespace='default', labels=None, resource_version='1'):
+    """Build the raw object of a pod."""
+    return {
+        'kind': 'Pod',
+        'metadata': {
+            'name': name,
+            'namespace': namespace,
+            'creationTimestamp': '2025-01-01T00:00:00Z',
+            'labels': labels,
+            'resourceVersion': resource_version,
+        },
+        'spec': {'containers': [{'name': 'app'}]},
+    }
+
+
+def event(name, involved_name, reason, namespace='default'):
+    """Build the raw object of an event about a pod."""
+    return {
+        'metadata': {'name': name, 'namespace': namespace, 'resourceVersion': '5'},
+        'involvedObject': {'kind': 'Pod', 'name': involved_name, 'namespace': namespace},
+        'firstTimestamp': '2025-01-01T00:00:00Z',
+        'lastTimestamp': '2025-01-01T00:01:00Z',
+        'count': 2,
+        'message': f'{reason} happened',
+        'reason': reason,
+        'source': {'component': 'kubelet'},
+        'type': 'Warning',
+    }
+
+
+def make_informer(items, watch_events=(), kind='Pod'):
+    """Create an informer whose client lists the items and watches the events."""
+    resource = MagicMock()
+    resource.namespaced = True
+    list_response = MagicMock()
+    list_response.items = [MagicMock(to_dict=MagicMock(return_value=item)) for item in items]
+    list_response.metadata.resourceVersion = '10'
+    resource.watch.return_value = iter(watch_events)
+
+    client = MagicMock()
+    client.dynamic_client.resources.get.return_value = resource
+    client.iter_resource_pages.return_value = iter([list_response])
+
+    informer = ResourceInformer(lambda: client, 'v1', kind)
+    informer._new_watcher = MagicMock()
+    return informer, resource
+
+
+class TestSelectors:
+    def test_parse_label_selector(self):
+        assert parse_label_selector('app=nginx,tier in (web, api),!canary,env!=prod,team') == [
+            ('app', '=', ('nginx',)),
+            ('tier', 'in', ('web', 'api')),
+            ('canary', '!', ()),
+            ('env', '!=', ('prod',)),
+            ('team', 'exists', ()),
+        ]
+        assert parse_label_selector(None) == []
+
+    def test_parse_label_selector_invalid(self):
+        with pytest.raises(ValueError):
+            parse_label_selector('app in nginx')
+
+    def test_labels_match(self):
+        requirements = parse_label_selector('app=nginx,tier notin (db),!canary')
+        assert labels_match({'app': 'nginx', 'tier': 'web'}, requirements)
+        assert not labels_match({'app': 'nginx', 'tier': 'db'}, requirements)
+        assert not labels_match({'app': 'nginx', 'canary': 'true'}, requirements)
+        assert not labels_match({}, requirements)
+
+    def test_parse_field_selector(self):
+        assert parse_field_selector('metadata.name=web-1,metadata.namespace!=kube-system') == [
+            ('name', '=', 'web-1'),
+            ('namespace', '!=', 'kube-system'),
+        ]
+        with pytest.raises(ValueError):
+            parse_field_selector('status.phase=Running')
+
+
+class TestResourceInformer:
+    def test_list_and_query(self):
+        informer, _ = make_informer(
+            [
+                pod('web-1', labels={'app': 'web'}),
+                pod('web-2', namespace='prod', labels={'app': 'web'}),
+                pod('db-1', labels={'app': 'db'}),
+            ]
+        )
+        informer._list()
+
+        assert informer.wait_synced(0)
+        assert [item['name'] for item in informer.list()] == ['db-1', 'web-1', 'web-2']
+        assert [item['name'] for item in informer.list(namespace='default')] == ['db-1', 'web-1']
+        assert [item['name'] for item in informer.list(label_selector='app=web')] == [
+            'web-1',
+            'web-2',
+        ]
+        assert informer.list(field_selector='metadata.name=web-2') == [
+            {
+                'name': 'web-2',
+                'namespace': 'prod',
+                'creation_timestamp': '2025-01-01T00:00:00Z',
+                'labels': {'app': 'web'},
+                'annotations': None,
+            }
+        ]
+
+    def test_watch_applies_events(self):
+        informer, resource = make_informer(
+            [pod('web-1', labels={'app': 'web'}), pod('web-2', labels={'app': 'web'})],
+            [
+                {'type': 'ADDED', 'raw_object': pod('web-3', labels={'app': 'web'})},
+                {'type': 'MODIFIED', 'raw_object': pod('web-1', labels={'app': 'old'})},
+                {'type': 'DELETED', 'raw_object': pod('web-2', resource_version='12')},
+                {
+                    'type': 'BOOKMARK',
+                    'raw_object': {'kind': 'Pod', 'metadata': {'resourceVersion': '15'}},
+                },
+            ],
+        )
+        informer._list()
+        informer._watch()
+
+        assert [item['name'] for item in informer.list(label_selector='app=web')] == ['web-3']
+        assert [item['name'] for item in informer.list(label_selector='app=old')] == ['web-1']
+        assert informer._resource_version == '15'
+        assert resource.watch.call_args.kwargs['resource_version'] == '10'
+        assert resource.watch.call_args.kwargs['allow_watch_bookmarks'] is True
+
+    def test_run_stops_after_failed_lists(self):
+        informer, _ = make_informer([])
+        informer._list = MagicMock(side_effect=RuntimeError('forbidden'))
+
+        with patch('awslabs.eks_mcp_server.k8s_watch_cache.MAX_LIST_FAILURES', 1):
+            informer._run()
+
+        assert informer.failed
+        assert informer.stopped
+        informer._list.assert_called_once()
+
+    def test_watch_error_event_raises(self):
+        informer, _ = make_informer(
+            [], [{'type': 'ERROR', 'raw_object': {'code': 410, 'message': 'too old'}}]
+        )
+        informer._list()
+
+        with pytest.raises(ValueError, match='410'):
+            informer._watch()
+
+    def test_events_for(self):
+        informer, _ = make_informer(
+            [
+                event('e1', 'web-1', 'BackOff'),
+                event('e2', 'web-2', 'Pulled'),
+                event('e3', 'web-1', 'Killing', namespace='prod'),
+            ],
+            kind='Event',
+        )
+        informer._list()
+
+        events = informer.events_for('Pod', 'web-1', 'default')
+        assert events == [
+            {
+                'first_timestamp': '2025-01-01T00:00:00Z',
+                'last_timestamp': '2025-01-01T00:01:00Z',
+                'count': 2,
+                'message': 'BackOff happened',
+                'reason': 'BackOff',
+                'reporting_component': 'kubelet',
+                'type': 'Warning',
+            }
+        ]
+        assert [event['reason'] for event in informer.events_for('Pod', 'web-1', None)] == [
+            'BackOff',
+            'Killing',
+        ]
+
+
+class TestK8sWatchCache:
+    def test_failed_informer_is_not_restarted(self):
+        cache = K8sWatchCache(MagicMock())
+
+        with patch.object(ResourceInformer, 'start') as mock_start:
+            informer = cache._get_informer('cluster', 'v1', 'Pod')
+            informer.failed = True
+            informer.stop()
+
+            assert not informer.wait_synced(10)
+            assert cache.list_resources('cluster', 'Pod', 'v1') is None
+            assert mock_start.call_count == 1
+
+            cache._failed_until[('cluster', 'v1', 'Pod')] = 0
+            assert cache._get_informer('cluster', 'v1', 'Pod') is not informer
+            assert mock_start.call_count == 2
+
+    def test_list_resources_unsupported_field_selector(self):
+        client_factory = MagicMock()
+        cache = K8sWatchCache(client_factory)
+
+        assert (
+            cache.list_resources('cluster', 'Pod', 'v1', field_selector='status.phase=Running')
+            is None
+        )
+        client_factory.assert_not_called()
+
+    def test_list_resources_not_synced(self):
+        cache = K8sWatchCache(MagicMock())
+        informer = MagicMock()
+        informer.wait_synced.return_value = False
+
+        with patch.object(cache, '_get_informer', return_value=informer):
+            assert cache.list_resources('cluster', 'Pod', 'v1') is None
+
+    def test_get_informer_reuses_and_expires(self):
+        cache = K8sWatchCache(MagicMock())
+
+        with patch.object(ResourceInformer, 'start') as mock_start:
+            informer = cache._get_informer('cluster', 'v1', 'Pod')
+            assert cache._get_informer('cluster', 'v1', 'Pod') is informer
+            assert mock_start.call_count == 1
+
+            informer.last_used -= 24 * 60 * 60
+            assert cache._get_informer('cluster', 'v1', 'Pod') is not informer
+            assert informer.stopped
+            assert mock_start.call_count == 2
@@ -52,7 +52,7 @@ async def test_command_line_args():
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         # Test with default args (read-only mode by default)
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=False
+            allow_write=False, allow_sensitive_data_access=False, enable_watch_cache=False
         )
 
         # Mock AWS client creation
@@ -76,7 +76,7 @@ async def test_command_line_args():
     # Test with write access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=False
+            allow_write=True, allow_sensitive_data_access=False, enable_watch_cache=False
         )
 
         # Mock AWS client creation
@@ -108,7 +108,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, False)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, False)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, False, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -117,7 +119,7 @@ async def test_command_line_args():
     # Test with sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=False, allow_sensitive_data_access=True
+            allow_write=False, allow_sensitive_data_access=True, enable_watch_cache=False
         )
 
         # Mock AWS client creation
@@ -149,7 +151,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with correct parameters
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, False)
-                                mock_k8s_handler.assert_called_once_with(mock_server, False, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, False, True, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, False)
 
                                 # Verify that run was called
@@ -158,7 +162,7 @@ async def test_command_line_args():
     # Test with both write access and sensitive data access enabled
     with patch.object(argparse.ArgumentParser, 'parse_args') as mock_parse_args:
         mock_parse_args.return_value = argparse.Namespace(
-            allow_write=True, allow_sensitive_data_access=True
+            allow_write=True, allow_sensitive_data_access=True, enable_watch_cache=False
         )
 
         # Mock AWS client creation
@@ -190,7 +194,9 @@ async def test_command_line_args():
                                 # Verify that the handlers were initialized with both flags
                                 mock_cloudwatch_handler.assert_called_once_with(mock_server, True)
                                 mock_eks_stack_handler.assert_called_once_with(mock_server, True)
-                                mock_k8s_handler.assert_called_once_with(mock_server, True, True)
+                                mock_k8s_handler.assert_called_once_with(
+                                    mock_server, True, True, False
+                                )
                                 mock_iam_handler.assert_called_once_with(mock_server, True)
 
                                 # Verify that run was called
@@ -206,7 +212,7 @@ async def test_k8s_handler_initialization_default():
     K8sHandler(mock_mcp)
 
     # Verify that the tools were registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 8
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -232,7 +238,7 @@ async def test_k8s_handler_initialization_write_access_disabled():
     K8sHandler(mock_mcp, allow_write=False)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 8
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -259,7 +265,7 @@ async def test_k8s_handler_initialization_write_access_enabled():
     K8sHandler(mock_mcp, allow_write=True)
 
     # Verify that all tools were registered (now includes list_api_versions)
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 8
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -285,7 +291,7 @@ async def test_k8s_handler_initialization_sensitive_data_access_enabled():
     K8sHandler(mock_mcp, allow_sensitive_data_access=True)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 8
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -311,7 +317,7 @@ async def test_k8s_handler_initialization_both_flags_enabled():
     K8sHandler(mock_mcp, allow_write=True, allow_sensitive_data_access=True)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 7
+    assert mock_mcp.tool.call_count == 8
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -351,7 +357,7 @@ async def test_cloudwatch_handler_initialization():
     CloudWatchHandler(mock_mcp)
 
     # Verify that all tools are registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 3
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -362,6 +368,7 @@ async def test_cloudwatch_handler_initialization():
     # Verify that all tools are registered
     assert 'get_cloudwatch_metrics' in tool_names
     assert 'get_cloudwatch_logs' in tool_names
+    assert 'get_cloudwatch_metrics_batch' in tool_names
 
 
 @pytest.mark.asyncio
@@ -373,7 +380,7 @@ async def test_cloudwatch_handler_initialization_with_sensitive_data_access():
     CloudWatchHandler(mock_mcp, allow_sensitive_data_access=True)
 
     # Verify that all tools were registered
-    assert mock_mcp.tool.call_count == 2
+    assert mock_mcp.tool.call_count == 3
 
     # Get all call args
     call_args_list = mock_mcp.tool.call_args_list
@@ -6,7 +6,8 @@ from .execute_terragrunt_command import execute_terragrunt_command_impl
 from .search_aws_provider_docs import search_aws_provider_docs_impl
 from .search_awscc_provider_docs import search_awscc_provider_docs_impl
 from .search_specific_aws_ia_modules import search_specific_aws_ia_modules_impl
-from .run_checkov_scan import run_checkov_scan_impl
+from .run_checkov_scan import get_checkov_scan_result_impl, run_checkov_scan_impl
+from .provider_resources_catalog import query_provider_resource_catalog_impl
 
 __all__ = [
     'search_user_provided_module_impl',
@@ -16,4 +17,6 @@ __all__ = [
     'search_awscc_provider_docs_impl',
     'search_specific_aws_ia_modules_impl',
     'run_checkov_scan_impl',
+    'get_checkov_scan_result_impl',
+    'query_provider_resource_catalog_impl',
 ]
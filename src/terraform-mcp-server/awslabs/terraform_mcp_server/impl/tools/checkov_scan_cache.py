@@ -0,0 +1,308 @@
+"""Per-module result cache for incremental Checkov scans.
+
+Findings are cached per module, i.e. per directory of scannable files, because Checkov
+evaluates the files of a directory together (graph checks and variable resolution span files).
+A module's fingerprint covers the content of its files and, for Terraform, the local modules it
+calls, so a change to a called module invalidates its callers. The cache of a working directory
+is only reused with the same Checkov version and ruleset (framework, selected and skipped checks
+and the ``.checkov.yaml`` configuration); anything else starts from an empty cache.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+
+# Directory holding one cache file per scanned working directory, overridable through the
+# environment
+CHECKOV_CACHE_DIR = Path(
+    os.environ.get(
+        'TERRAFORM_MCP_CHECKOV_CACHE_DIR',
+        Path.home() / '.cache' / 'awslabs-terraform-mcp-server' / 'checkov',
+    )
+)
+
+# Version of the cache file layout; older files are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Files each framework scans; frameworks not listed here are always scanned in full
+FRAMEWORK_FILE_PATTERNS = {
+    'terraform': ('*.tf', '*.tf.json', '*.tfvars', '*.tfvars.json'),
+    'cloudformation': ('*.yaml', '*.yml', '*.json', '*.template'),
+    'kubernetes': ('*.yaml', '*.yml', '*.json'),
+    'dockerfile': ('Dockerfile', 'Dockerfile.*', '*.Dockerfile'),
+    'arm': ('*.json',),
+}
+
+# Directories never scanned, in addition to hidden directories such as .terraform
+IGNORED_DIRS = {'node_modules'}
+
+# Checkov configuration files changing which checks run
+CHECKOV_CONFIG_FILES = ('.checkov.yaml', '.checkov.yml')
+
+# Local module calls in Terraform files
+LOCAL_MODULE_SOURCE_PATTERN = re.compile(r'^\s*source\s*=\s*"(\.{1,2}/[^"]*)"', re.MULTILINE)
+
+# Result lists of a Checkov JSON report and the summary counter each one feeds
+CHECK_RESULT_KEYS = {
+    'failed_checks': 'failed',
+    'passed_checks': 'passed',
+    'skipped_checks': 'skipped',
+}
+
+
+def collect_modules(root: str, framework: str) -> Optional[Dict[str, List[str]]]:
+    """Group the files Checkov would scan by directory.
+
+    Args:
+        root: Working directory of the scan
+        framework: Checkov framework
+
+    Returns:
+        Mapping of each directory to its sorted files, or None if the framework cannot be
+        scanned incrementally
+    """
+    patterns = FRAMEWORK_FILE_PATTERNS.get(framework)
+    if patterns is None:
+        return None
+
+    modules = {}
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = [
+            name
+            for name in subdirectories
+            if not name.startswith('.') and name not in IGNORED_DIRS
+        ]
+        matches = sorted(
+            os.path.join(directory, name)
+            for name in files
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+        )
+        if matches:
+            modules[os.path.normpath(directory)] = matches
+    return modules
+
+
+def _hash_directory(directory: str, patterns: tuple) -> str:
+    """Hash the scannable files of a directory that is not part of the scan."""
+    digest = hashlib.sha256()
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return 'missing'
+    for name in names:
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            digest.update(f'\0{name}\0'.encode())
+            digest.update(Path(directory, name).read_bytes())
+    return digest.hexdigest()
+
+
+def fingerprint_modules(modules: Dict[str, List[str]], framework: str) -> Dict[str, str]:
+    """Fingerprint every module of a scan.
+
+    Args:
+        modules: Mapping of directories to their files, from ``collect_modules``
+        framework: Checkov framework
+
+    Returns:
+        Mapping of each directory to the hex digest of its inputs
+    """
+    patterns = FRAMEWORK_FILE_PATTERNS[framework]
+    content_hashes = {}
+    module_calls: Dict[str, Set[str]] = {}
+    for directory, files in modules.items():
+        digest = hashlib.sha256()
+        calls = set()
+        for path in files:
+            content = Path(path).read_bytes()
+            digest.update(f'\0{os.path.basename(path)}\0'.encode())
+            digest.update(content)
+            if framework == 'terraform':
+                text = content.decode('utf-8', 'replace')
+                for source in LOCAL_MODULE_SOURCE_PATTERN.findall(text):
+                    calls.add(os.path.normpath(os.path.join(directory, source)))
+        content_hashes[directory] = digest.hexdigest()
+        module_calls[directory] = calls
+
+    def combined(directory: str, visiting: Set[str]) -> str:
+        own = content_hashes.get(directory)
+        if own is None:
+            own = _hash_directory(directory, patterns)
+        if directory in visiting or not module_calls.get(directory):
+            return own
+        digest = hashlib.sha256(own.encode())
+        for called in sorted(module_calls[directory]):
+            digest.update(combined(called, visiting | {directory}).encode())
+        return digest.hexdigest()
+
+    return {directory: combined(directory, set()) for directory in modules}
+
+
+def compute_ruleset_key(
+    root: str,
+    checkov_version: str,
+    framework: str,
+    check_ids: Optional[List[str]],
+    skip_check_ids: Optional[List[str]],
+) -> str:
+    """Hash everything besides the scanned files that changes the findings of a scan.
+
+    Args:
+        root: Working directory of the scan
+        checkov_version: Installed Checkov version
+        framework: Checkov framework
+        check_ids: Checks to run
+        skip_check_ids: Checks to skip
+
+    Returns:
+        Hex digest identifying the ruleset
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [checkov_version, framework, sorted(check_ids or []), sorted(skip_check_ids or [])]
+        ).encode()
+    )
+    for name in CHECKOV_CONFIG_FILES:
+        config = Path(root, name)
+        if config.is_file():
+            digest.update(config.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_path(root: str) -> Path:
+    """Return the cache file of a working directory."""
+    return CHECKOV_CACHE_DIR / f'{hashlib.sha256(root.encode()).hexdigest()}.json'
+
+
+def load_scan_cache(root: str, ruleset_key: str) -> Dict[str, Dict[str, Any]]:
+    """Load the cached findings of a working directory.
+
+    Args:
+        root: Working directory of the scan
+        ruleset_key: Ruleset from ``compute_ruleset_key``
+
+    Returns:
+        Mapping of directories to their cache entries, empty if nothing usable is cached
+    """
+    try:
+        cache = json.loads(_cache_path(root).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('format') != CACHE_FORMAT_VERSION or cache.get('ruleset') != ruleset_key:
+        logger.info(f'Checkov version or ruleset changed, ignoring cached findings for {root}')
+        return {}
+    return cache.get('modules', {})
+
+
+def save_scan_cache(root: str, ruleset_key: str, modules: Dict[str, Dict[str, Any]]) -> None:
+    """Store the findings of a working directory.
+
+    Args:
+        root: Working directory of the scan
+        ruleset_key: Ruleset from ``compute_ruleset_key``
+        modules: Mapping of directories to their cache entries
+    """
+    path = _cache_path(root)
+    cache = {'format': CACHE_FORMAT_VERSION, 'ruleset': ruleset_key, 'modules': modules}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f'Failed to store Checkov findings in {path}: {e}')
+
+
+def _empty_counts() -> Dict[str, int]:
+    """Return zeroed summary counters."""
+    return {'passed': 0, 'failed': 0, 'skipped': 0, 'parsing_errors': 0, 'resource_count': 0}
+
+
+def split_checkov_report(
+    output: str, root: str, directories: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Split a Checkov JSON report into cache entries per module.
+
+    Findings for resources of a called module are attributed to the calling file, whose
+    fingerprint covers the module. File paths are stored relative to the working directory,
+    the way a directory scan reports them.
+
+    Args:
+        output: Checkov JSON output
+        root: Working directory of the scan
+        directories: Directories that were scanned
+
+    Returns:
+        Mapping of each scanned directory to its failed checks and summary counts
+
+    Raises:
+        ValueError: If the output is not a Checkov JSON report
+    """
+    data = json.loads(output)
+    reports = data if isinstance(data, list) else [data]
+    entries: Dict[str, Dict[str, Any]] = {
+        directory: {'failed_checks': [], 'counts': _empty_counts()} for directory in directories
+    }
+    resources: Dict[str, Set[str]] = {directory: set() for directory in directories}
+
+    def owner(path: str) -> str:
+        directory = os.path.dirname(path)
+        while directory not in entries:
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return sorted(entries)[0]
+            directory = parent
+        return directory
+
+    def absolute(path: str) -> str:
+        if os.path.isabs(path) and os.path.exists(path):
+            return os.path.normpath(path)
+        return os.path.normpath(os.path.join(root, path.lstrip('/')))
+
+    if not entries:
+        return entries
+
+    for report in reports:
+        if not isinstance(report, dict):
+            raise ValueError('Unexpected Checkov report')
+        results = report.get('results', {})
+        for key, counter in CHECK_RESULT_KEYS.items():
+            for check in results.get(key, []):
+                path = check.get('file_abs_path') or absolute(check.get('file_path', ''))
+                caller = check.get('caller_file_path')
+                directory = owner(absolute(caller) if caller else os.path.normpath(path))
+                entries[directory]['counts'][counter] += 1
+                resources[directory].add(f'{path}:{check.get("resource")}')
+                if key == 'failed_checks':
+                    check = dict(check, file_path='/' + os.path.relpath(path, root))
+                    entries[directory]['failed_checks'].append(check)
+        for path in results.get('parsing_errors', []):
+            entries[owner(absolute(path))]['counts']['parsing_errors'] += 1
+
+    for directory, entry in entries.items():
+        entry['counts']['resource_count'] = len(resources[directory])
+    return entries
+
+
+def merge_cached_findings(entries: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge module cache entries into a single Checkov JSON report.
+
+    Args:
+        entries: Cache entries of every module of the working directory
+
+    Returns:
+        Report with the failed checks and summary of all modules
+    """
+    failed_checks = []
+    summary = _empty_counts()
+    for directory in sorted(entries):
+        failed_checks.extend(entries[directory]['failed_checks'])
+        for counter, value in entries[directory]['counts'].items():
+            summary[counter] = summary.get(counter, 0) + value
+    return {'results': {'failed_checks': failed_checks}, 'summary': summary}
@@ -0,0 +1,284 @@
+"""Non-blocking execution of Terraform and Terragrunt commands.
+
+Commands run as asyncio subprocesses, so a long ``apply`` does not block the event loop and
+other tools stay responsive. Output is read incrementally: complete lines are forwarded to
+the MCP client as log notifications while the command runs, and only the most recent output
+is kept in a bounded buffer for the tool result. Commands in the same working directory are
+serialized because they would contend for the same state lock, while different workspaces
+run concurrently.
+"""
+
+import asyncio
+import codecs
+import os
+import signal
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from loguru import logger
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+
+# Default timeout for a single command, overridable through the environment
+DEFAULT_COMMAND_TIMEOUT = float(os.environ.get('TERRAFORM_MCP_COMMAND_TIMEOUT', '3600'))
+
+# Maximum number of characters of each output stream kept for the tool result
+MAX_CAPTURED_OUTPUT_CHARS = 1_000_000
+
+# Minimum interval between two streamed log notifications
+STREAM_INTERVAL_SECONDS = 1.0
+
+# Time a command gets to exit after being interrupted before it is killed
+TERMINATION_GRACE_SECONDS = 30.0
+
+# Size of a single read from the process pipes
+READ_CHUNK_SIZE = 65536
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a finished command.
+
+    Attributes:
+        returncode: Exit code of the process.
+        stdout: Captured standard output, truncated to the most recent output if needed.
+        stderr: Captured standard error, truncated to the most recent output if needed.
+        duration: Wall-clock duration of the command in seconds.
+    """
+
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+
+
+class CommandTimeoutError(Exception):
+    """Raised when a command does not finish within its timeout.
+
+    The output captured before the command was stopped is kept on the exception.
+    """
+
+    def __init__(self, timeout: float, stdout: str, stderr: str):
+        """Initialize the error with the timeout and the partial output."""
+        super().__init__(f'Command timed out after {timeout:g} seconds')
+        self.timeout = timeout
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+class OutputBuffer:
+    """Ring buffer keeping the most recent lines of a stream within a character budget."""
+
+    def __init__(self, max_chars: Optional[int] = MAX_CAPTURED_OUTPUT_CHARS):
+        """Initialize the buffer.
+
+        Args:
+            max_chars: Maximum number of characters kept, or None for no limit
+        """
+        self._max_chars = max_chars
+        self._lines: Deque[str] = deque()
+        self._size = 0
+        self._dropped = 0
+        self._partial = ''
+
+    def write(self, text: str) -> List[str]:
+        """Append text to the buffer.
+
+        Args:
+            text: Decoded output chunk
+
+        Returns:
+            The lines completed by this chunk, without their line endings
+        """
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._append(line + '\n')
+        return lines
+
+    def flush(self) -> List[str]:
+        """Complete a trailing line without a line ending, returning it if there was one."""
+        if not self._partial:
+            return []
+        line, self._partial = self._partial, ''
+        self._append(line)
+        return [line]
+
+    def _append(self, line: str) -> None:
+        """Add a line, evicting the oldest lines once the budget is exceeded."""
+        if self._max_chars is not None and len(line) > self._max_chars:
+            line = line[-self._max_chars :]
+        self._lines.append(line)
+        self._size += len(line)
+        while self._max_chars is not None and self._size > self._max_chars:
+            self._size -= len(self._lines.popleft())
+            self._dropped += 1
+
+    def getvalue(self) -> str:
+        """Return the buffered output, noting how many earlier lines were dropped."""
+        text = ''.join(self._lines) + self._partial
+        if self._dropped:
+            return f'[... {self._dropped} earlier lines truncated ...]\n{text}'
+        return text
+
+
+# Locks serializing commands per working directory, with the number of commands using each
+_WORKSPACE_LOCKS: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+
+@asynccontextmanager
+async def workspace_lock(working_directory: str) -> AsyncIterator[None]:
+    """Serialize commands running in the same working directory.
+
+    A lock only lives while commands are using it, so idle workspaces leave nothing behind.
+
+    Args:
+        working_directory: Directory the command runs in
+    """
+    key = os.path.realpath(working_directory)
+    lock, users = _WORKSPACE_LOCKS.get(key, (asyncio.Lock(), 0))
+    _WORKSPACE_LOCKS[key] = (lock, users + 1)
+    if lock.locked():
+        logger.info(f'Waiting for the running command in {working_directory} to finish')
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _WORKSPACE_LOCKS[key]
+        if users > 1:
+            _WORKSPACE_LOCKS[key] = (lock, users - 1)
+        else:
+            del _WORKSPACE_LOCKS[key]
+
+
+async def _notify(ctx: Any, message: str) -> None:
+    """Send a log notification to the client, ignoring clients that cannot receive it."""
+    try:
+        await ctx.info(message)
+    except Exception as e:
+        logger.debug(f'Failed to send log notification: {e}')
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """Interrupt a process so it can release its state lock, killing it if it does not exit."""
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == 'nt':
+            process.terminate()
+        else:
+            process.send_signal(signal.SIGINT)
+    except ProcessLookupError:
+        return
+
+    try:
+        await asyncio.wait_for(process.wait(), TERMINATION_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f'Process {process.pid} did not exit after an interrupt, killing it')
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_command(
+    cmd: List[str],
+    cwd: str,
+    env: Optional[Dict[str, str]] = None,
+    ctx: Any = None,
+    timeout: Optional[float] = None,
+    output_filter: Optional[Callable[[str], str]] = None,
+    max_output_chars: Optional[int] = MAX_CAPTURED_OUTPUT_CHARS,
+) -> CommandResult:
+    """Run a command without blocking the event loop, streaming its output.
+
+    If the calling task is cancelled, the command is interrupted before the cancellation is
+    propagated, so no orphaned ``apply`` keeps running in the background.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        env: Environment of the process
+        ctx: Optional MCP context; when given, output lines are sent as log notifications
+        timeout: Maximum run time in seconds (default: DEFAULT_COMMAND_TIMEOUT)
+        output_filter: Optional function applied to streamed lines before they are sent
+        max_output_chars: Maximum characters kept per stream, or None for no limit
+
+    Returns:
+        CommandResult with the exit code and the captured output
+
+    Raises:
+        CommandTimeoutError: If the command does not finish within the timeout
+    """
+    timeout = timeout or DEFAULT_COMMAND_TIMEOUT
+    start_time = time.time()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    logger.debug(f'Started process {process.pid}: {" ".join(cmd)}')
+
+    stdout_buffer = OutputBuffer(max_output_chars)
+    stderr_buffer = OutputBuffer(max_output_chars)
+    pending: List[str] = []
+    last_notification = time.monotonic()
+
+    async def flush_pending() -> None:
+        nonlocal last_notification
+        if pending and ctx is not None:
+            message = '\n'.join(pending)
+            pending.clear()
+            await _notify(ctx, output_filter(message) if output_filter else message)
+        last_notification = time.monotonic()
+
+    async def pump(stream: Optional[asyncio.StreamReader], buffer: OutputBuffer) -> None:
+        if stream is None:
+            return
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        while True:
+            chunk = await stream.read(READ_CHUNK_SIZE)
+            if not chunk:
+                lines = buffer.write(decoder.decode(b'', final=True)) + buffer.flush()
+                pending.extend(lines)
+                return
+            pending.extend(buffer.write(decoder.decode(chunk)))
+            if time.monotonic() - last_notification >= STREAM_INTERVAL_SECONDS:
+                await flush_pending()
+
+    readers = asyncio.gather(
+        pump(process.stdout, stdout_buffer), pump(process.stderr, stderr_buffer)
+    )
+    try:
+        await asyncio.wait_for(asyncio.shield(readers), timeout)
+        returncode = await process.wait()
+    except asyncio.TimeoutError:
+        logger.warning(f'Command timed out after {timeout:g} seconds: {" ".join(cmd)}')
+        await _terminate(process)
+        try:
+            # Provider plugins may briefly outlive the process and keep the pipes open
+            await asyncio.wait_for(readers, TERMINATION_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        await flush_pending()
+        raise CommandTimeoutError(timeout, stdout_buffer.getvalue(), stderr_buffer.getvalue())
+    except asyncio.CancelledError:
+        logger.warning(f'Command cancelled, interrupting process {process.pid}')
+        await _terminate(process)
+        readers.cancel()
+        raise
+
+    await flush_pending()
+    duration = time.time() - start_time
+    logger.info(f'Command exited with code {returncode} after {duration:.2f} seconds')
+    return CommandResult(
+        returncode=returncode,
+        stdout=stdout_buffer.getvalue(),
+        stderr=stderr_buffer.getvalue(),
+        duration=duration,
+    )
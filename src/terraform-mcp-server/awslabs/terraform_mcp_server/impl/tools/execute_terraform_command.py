@@ -3,22 +3,40 @@
 import json
 import os
 import re
-import subprocess
+from awslabs.terraform_mcp_server.impl.tools.command_runner import (
+    CommandTimeoutError,
+    run_command,
+    workspace_lock,
+)
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import (
+    check_init_state,
+    configure_plugin_cache,
+    estimate_cache_savings,
+    parse_plugin_cache_hits,
+    plugin_cache_lock,
+    record_init_state,
+    record_provider_downloads,
+)
 from awslabs.terraform_mcp_server.impl.tools.utils import get_dangerous_patterns
 from awslabs.terraform_mcp_server.models import TerraformExecutionRequest, TerraformExecutionResult
+from contextlib import nullcontext
 from loguru import logger
+from typing import Any
 
 
 async def execute_terraform_command_impl(
     request: TerraformExecutionRequest,
+    ctx: Any = None,
 ) -> TerraformExecutionResult:
     """Execute Terraform workflow commands against an AWS account.
 
     This tool runs Terraform commands (init, plan, validate, apply, destroy) in the
-    specified working directory, with optional variables and region settings.
+    specified working directory, with optional variables and region settings. Commands run
+    without blocking the server, and commands in different working directories run concurrently.
 
     Parameters:
         request: Details about the Terraform command to execute
+        ctx: Optional MCP context used to stream command output while it runs
 
     Returns:
         A TerraformExecutionResult object containing command output and status
@@ -86,6 +104,9 @@ async def execute_terraform_command_impl(
     if request.aws_region:
         env['AWS_REGION'] = request.aws_region
 
+    # Share downloaded providers across working directories
+    configure_plugin_cache(env)
+
     # Security check for command injection
     allowed_commands = ['init', 'plan', 'validate', 'apply', 'destroy']
     if request.command not in allowed_commands:
@@ -132,70 +153,116 @@ async def execute_terraform_command_impl(
         for key, value in request.variables.items():
             cmd.append(f'-var={key}={value}')
 
-    # Execute command
+    # Execute command, one at a time per working directory
     try:
-        process = subprocess.run(
-            cmd, cwd=request.working_directory, capture_output=True, text=True, env=env
-        )
-
-        # Prepare the result
-        stdout = process.stdout
-        stderr = process.stderr if process.stderr else ''
-
-        # Clean output text if requested
-        if request.strip_ansi:
-            logger.debug('Cleaning command output text (ANSI codes and control characters)')
-            stdout = clean_output_text(stdout)
-            stderr = clean_output_text(stderr)
-
-        result = {
-            'command': f'terraform {request.command}',
-            'status': 'success' if process.returncode == 0 else 'error',
-            'return_code': process.returncode,
-            'stdout': stdout,
-            'stderr': stderr,
-            'working_directory': request.working_directory,
-            'outputs': None,
-        }
+        async with workspace_lock(request.working_directory):
+            # Skip init when nothing it depends on changed since the last successful one
+            if request.command == 'init' and request.init_if_stale:
+                is_current, last_init_seconds = check_init_state(request.working_directory)
+                if is_current:
+                    logger.info(f'Skipping terraform init in {request.working_directory}')
+                    return TerraformExecutionResult(
+                        command='terraform init',
+                        status='success',
+                        return_code=0,
+                        stdout='Skipped terraform init: the configuration, the dependency lock file and the installed modules are unchanged since the last successful init.',
+                        working_directory=request.working_directory,
+                        outputs=None,
+                        init_skipped=True,
+                        time_saved_seconds=last_init_seconds,
+                    )
 
-        # Get outputs if this was a successful apply command
-        if request.command == 'apply' and process.returncode == 0:
-            try:
-                logger.info('Getting Terraform outputs')
-                output_process = subprocess.run(
-                    ['terraform', 'output', '-json'],
+            # The shared plugin cache does not support concurrent writers
+            async with plugin_cache_lock() if request.command == 'init' else nullcontext():
+                process = await run_command(
+                    cmd,
                     cwd=request.working_directory,
-                    capture_output=True,
-                    text=True,
                     env=env,
+                    ctx=ctx,
+                    timeout=request.timeout,
+                    output_filter=clean_output_text if request.strip_ansi else None,
                 )
 
-                if output_process.returncode == 0 and output_process.stdout:
-                    # Get output and clean it if needed
-                    output_stdout = output_process.stdout
-                    if request.strip_ansi:
-                        output_stdout = clean_output_text(output_stdout)
-
-                    # Parse the JSON output
-                    raw_outputs = json.loads(output_stdout)
-
-                    # Process outputs to extract values from complex structure
-                    processed_outputs = {}
-                    for key, value in raw_outputs.items():
-                        # Terraform outputs in JSON format have a nested structure
-                        # with 'value', 'type', and sometimes 'sensitive'
-                        if isinstance(value, dict) and 'value' in value:
-                            processed_outputs[key] = value['value']
-                        else:
-                            processed_outputs[key] = value
-
-                    result['outputs'] = processed_outputs
-                    logger.info(f'Extracted {len(processed_outputs)} Terraform outputs')
-            except Exception as e:
-                logger.warning(f'Failed to get Terraform outputs: {e}')
-
-        # Return the output
-        return TerraformExecutionResult(**result)
+            # Prepare the result
+            stdout = process.stdout
+            stderr = process.stderr if process.stderr else ''
+
+            # Clean output text if requested
+            if request.strip_ansi:
+                logger.debug('Cleaning command output text (ANSI codes and control characters)')
+                stdout = clean_output_text(stdout)
+                stderr = clean_output_text(stderr)
+
+            result = {
+                'command': f'terraform {request.command}',
+                'status': 'success' if process.returncode == 0 else 'error',
+                'return_code': process.returncode,
+                'stdout': stdout,
+                'stderr': stderr,
+                'working_directory': request.working_directory,
+                'outputs': None,
+            }
+
+            # Report plugin cache reuse and remember the init for init_if_stale
+            if request.command == 'init':
+                cache_hits = parse_plugin_cache_hits(stdout)
+                result['plugin_cache_hits'] = cache_hits
+                result['time_saved_seconds'] = estimate_cache_savings(cache_hits)
+                if process.returncode == 0:
+                    record_provider_downloads(stdout, process.duration)
+                    record_init_state(request.working_directory, process.duration)
+
+            # Get outputs if this was a successful apply command
+            if request.command == 'apply' and process.returncode == 0:
+                try:
+                    logger.info('Getting Terraform outputs')
+                    output_process = await run_command(
+                        ['terraform', 'output', '-json'],
+                        cwd=request.working_directory,
+                        env=env,
+                        max_output_chars=None,
+                    )
+
+                    if output_process.returncode == 0 and output_process.stdout:
+                        # Get output and clean it if needed
+                        output_stdout = output_process.stdout
+                        if request.strip_ansi:
+                            output_stdout = clean_output_text(output_stdout)
+
+                        # Parse the JSON output
+                        raw_outputs = json.loads(output_stdout)
+
+                        # Process outputs to extract values from complex structure
+                        processed_outputs = {}
+                        for key, value in raw_outputs.items():
+                            # Terraform outputs in JSON format have a nested structure
+                            # with 'value', 'type', and sometimes 'sensitive'
+                            if isinstance(value, dict) and 'value' in value:
+                                processed_outputs[key] = value['value']
+                            else:
+                                processed_outputs[key] = value
+
+                        result['outputs'] = processed_outputs
+                        logger.info(f'Extracted {len(processed_outputs)} Terraform outputs')
+                except Exception as e:
+                    logger.warning(f'Failed to get Terraform outputs: {e}')
+
+            # Return the output
+            return TerraformExecutionResult(**result)
+    except CommandTimeoutError as e:
+        stdout, stderr = e.stdout, e.stderr
+        if request.strip_ansi:
+            stdout = clean_output_text(stdout)
+            stderr = clean_output_text(stderr)
+        return TerraformExecutionResult(
+            command=f'terraform {request.command}',
+            status='error',
+            stdout=stdout,
+            stderr=stderr,
+            error_message=str(e),
+            working_directory=request.working_directory,
+            outputs=None,
+        )
     except Exception as e:
         return TerraformExecutionResult(
             command=f'terraform {request.command}',
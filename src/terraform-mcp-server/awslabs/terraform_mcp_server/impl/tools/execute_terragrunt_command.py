@@ -3,25 +3,41 @@
 import json
 import os
 import re
-import subprocess
+from awslabs.terraform_mcp_server.impl.tools.command_runner import (
+    CommandTimeoutError,
+    run_command,
+    workspace_lock,
+)
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import (
+    configure_plugin_cache,
+    plugin_cache_lock,
+)
+from awslabs.terraform_mcp_server.impl.tools.terragrunt_run_all import (
+    NO_AUTO_INIT_ENV,
+    execute_terragrunt_run_all,
+)
 from awslabs.terraform_mcp_server.impl.tools.utils import get_dangerous_patterns
 from awslabs.terraform_mcp_server.models import (
     TerragruntExecutionRequest,
     TerragruntExecutionResult,
 )
 from loguru import logger
+from typing import Any
 
 
 async def execute_terragrunt_command_impl(
     request: TerragruntExecutionRequest,
+    ctx: Any = None,
 ) -> TerragruntExecutionResult:
     """Execute Terragrunt workflow commands against an AWS account.
 
     This tool runs Terragrunt commands (init, plan, validate, apply, destroy, run-all) in the
-    specified working directory, with optional variables and region settings.
+    specified working directory, with optional variables and region settings. Commands run
+    without blocking the server, and commands in different working directories run concurrently.
 
     Parameters:
         request: Details about the Terragrunt command to execute
+        ctx: Optional MCP context used to stream command output while it runs
 
     Returns:
         A TerragruntExecutionResult object containing command output and status
@@ -89,6 +105,10 @@ async def execute_terragrunt_command_impl(
     if request.aws_region:
         env['AWS_REGION'] = request.aws_region
 
+    # Share downloaded providers across units and working directories. Terragrunt runs init
+    # automatically before any command, so every command may write to the shared cache.
+    shared_plugin_cache = configure_plugin_cache(env)
+
     # Security check for command injection
     allowed_commands = ['init', 'plan', 'validate', 'apply', 'destroy', 'output', 'run-all']
     if request.command not in allowed_commands:
@@ -103,7 +123,7 @@ async def execute_terragrunt_command_impl(
         )
 
     # Validate that terragrunt_config is not used with run-all
-    if request.terragrunt_config and request.command == 'run-all':
+    if request.terragrunt_config and (request.command == 'run-all' or request.run_all):
         logger.error('terragrunt_config cannot be used with run-all command')
         return TerragruntExecutionResult(
             command=f'terragrunt {request.command}',
@@ -178,8 +198,9 @@ async def execute_terragrunt_command_impl(
                         affected_dirs=None,
                     )
 
-    # Build the command
+    # Build the command, and the init run before it when using the shared plugin cache
     base_cmd = ['terragrunt']
+    init_cmd = ['terragrunt']
 
     # Handle run-all command differently
     if request.command == 'run-all':
@@ -187,8 +208,10 @@ async def execute_terragrunt_command_impl(
         # The actual terraform command becomes the first argument
         # Default to 'apply' if not specified in the command
         base_cmd.append('apply')
+        init_cmd.extend(['run-all', 'init', '-input=false'])
     else:
         base_cmd.append(request.command)
+        init_cmd.extend(['init', '-input=false'])
 
     # Add auto-approve flag for apply and destroy commands to make them non-interactive
     if request.command in ['apply', 'destroy'] or (request.command == 'run-all'):
@@ -199,6 +222,7 @@ async def execute_terragrunt_command_impl(
     if request.terragrunt_config:
         logger.info(f'Using custom terragrunt config file: {request.terragrunt_config}')
         base_cmd.append(f'--terragrunt-config={request.terragrunt_config}')
+        init_cmd.append(f'--terragrunt-config={request.terragrunt_config}')
 
     # Add variables only for commands that accept them (plan, apply, destroy, output)
     if request.command in ['plan', 'apply', 'destroy', 'output', 'run-all'] and request.variables:
@@ -210,88 +234,136 @@ async def execute_terragrunt_command_impl(
     if request.include_dirs and request.command == 'run-all':
         for dir_path in request.include_dirs:
             base_cmd.append(f'--queue-include-dir={dir_path}')
+            init_cmd.append(f'--queue-include-dir={dir_path}')
 
     # Add exclude-dirs if specified
     if request.exclude_dirs and request.command == 'run-all':
         for dir_path in request.exclude_dirs:
             base_cmd.append(f'--queue-exclude-dir={dir_path}')
+            init_cmd.append(f'--queue-exclude-dir={dir_path}')
+
+    # Run the command in every unit below the working directory, in dependency order
+    if request.run_all and request.command != 'run-all':
+        return await execute_terragrunt_run_all(
+            request,
+            base_cmd[1:],
+            env,
+            ctx=ctx,
+            output_filter=clean_output_text if request.strip_ansi else None,
+            shared_plugin_cache=shared_plugin_cache,
+        )
 
-    # Execute command
-    try:
-        process = subprocess.run(
-            base_cmd, cwd=request.working_directory, capture_output=True, text=True, env=env
+    async def run(cmd, command_env):
+        return await run_command(
+            cmd,
+            cwd=request.working_directory,
+            env=command_env,
+            ctx=ctx,
+            timeout=request.timeout,
+            output_filter=clean_output_text if request.strip_ansi else None,
         )
 
-        # Prepare the result
-        stdout = process.stdout
-        stderr = process.stderr if process.stderr else ''
+    # Execute command, one at a time per working directory
+    try:
+        async with workspace_lock(request.working_directory):
+            # The shared plugin cache does not support concurrent writers, so only the init
+            # holds plugin_cache_lock; the command itself then runs without its automatic init
+            if not shared_plugin_cache:
+                process = await run(base_cmd, env)
+            elif request.command == 'init':
+                async with plugin_cache_lock():
+                    process = await run(base_cmd, env)
+            else:
+                async with plugin_cache_lock():
+                    process = await run(init_cmd, env)
+                env = {**env, **NO_AUTO_INIT_ENV}
+                if process.returncode == 0:
+                    process = await run(base_cmd, env)
+
+            # Prepare the result
+            stdout = process.stdout
+            stderr = process.stderr if process.stderr else ''
+
+            # Clean output text if requested
+            if request.strip_ansi:
+                logger.debug('Cleaning command output text (ANSI codes and control characters)')
+                stdout = clean_output_text(stdout)
+                stderr = clean_output_text(stderr)
+
+            # Extract affected directories for run-all command
+            affected_dirs = None
+            if request.command == 'run-all':
+                affected_dirs = []
+                # Look for directory paths in the output
+                dir_pattern = re.compile(r'Module at\s+"([^"]+)"')
+                for match in dir_pattern.finditer(stdout):
+                    affected_dirs.append(match.group(1))
+
+            result = {
+                'command': f'terragrunt {request.command}',
+                'status': 'success' if process.returncode == 0 else 'error',
+                'return_code': process.returncode,
+                'stdout': stdout,
+                'stderr': stderr,
+                'working_directory': request.working_directory,
+                'outputs': None,
+                'affected_dirs': affected_dirs,
+            }
+
+            # Get outputs if this was a successful apply or output command
+            if (
+                request.command in ['apply', 'output'] or (request.command == 'run-all')
+            ) and process.returncode == 0:
+                try:
+                    logger.info('Getting Terragrunt outputs')
+                    output_process = await run_command(
+                        ['terragrunt', 'output', '-json'],
+                        cwd=request.working_directory,
+                        env=env,
+                        max_output_chars=None,
+                    )
 
-        # Clean output text if requested
+                    if output_process.returncode == 0 and output_process.stdout:
+                        # Get output and clean it if needed
+                        output_stdout = output_process.stdout
+                        if request.strip_ansi:
+                            output_stdout = clean_output_text(output_stdout)
+
+                        # Parse the JSON output
+                        raw_outputs = json.loads(output_stdout)
+
+                        # Process outputs to extract values from complex structure
+                        processed_outputs = {}
+                        for key, value in raw_outputs.items():
+                            # Terraform outputs in JSON format have a nested structure
+                            # with 'value', 'type', and sometimes 'sensitive'
+                            if isinstance(value, dict) and 'value' in value:
+                                processed_outputs[key] = value['value']
+                            else:
+                                processed_outputs[key] = value
+
+                        result['outputs'] = processed_outputs
+                        logger.info(f'Extracted {len(processed_outputs)} Terragrunt outputs')
+                except Exception as e:
+                    logger.warning(f'Failed to get Terragrunt outputs: {e}')
+
+            # Return the output
+            return TerragruntExecutionResult(**result)
+    except CommandTimeoutError as e:
+        stdout, stderr = e.stdout, e.stderr
         if request.strip_ansi:
-            logger.debug('Cleaning command output text (ANSI codes and control characters)')
             stdout = clean_output_text(stdout)
             stderr = clean_output_text(stderr)
-
-        # Extract affected directories for run-all command
-        affected_dirs = None
-        if request.command == 'run-all':
-            affected_dirs = []
-            # Look for directory paths in the output
-            dir_pattern = re.compile(r'Module at\s+"([^"]+)"')
-            for match in dir_pattern.finditer(stdout):
-                affected_dirs.append(match.group(1))
-
-        result = {
-            'command': f'terragrunt {request.command}',
-            'status': 'success' if process.returncode == 0 else 'error',
-            'return_code': process.returncode,
-            'stdout': stdout,
-            'stderr': stderr,
-            'working_directory': request.working_directory,
-            'outputs': None,
-            'affected_dirs': affected_dirs,
-        }
-
-        # Get outputs if this was a successful apply or output command
-        if (
-            request.command in ['apply', 'output'] or (request.command == 'run-all')
-        ) and process.returncode == 0:
-            try:
-                logger.info('Getting Terragrunt outputs')
-                output_process = subprocess.run(
-                    ['terragrunt', 'output', '-json'],
-                    cwd=request.working_directory,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                )
-
-                if output_process.returncode == 0 and output_process.stdout:
-                    # Get output and clean it if needed
-                    output_stdout = output_process.stdout
-                    if request.strip_ansi:
-                        output_stdout = clean_output_text(output_stdout)
-
-                    # Parse the JSON output
-                    raw_outputs = json.loads(output_stdout)
-
-                    # Process outputs to extract values from complex structure
-                    processed_outputs = {}
-                    for key, value in raw_outputs.items():
-                        # Terraform outputs in JSON format have a nested structure
-                        # with 'value', 'type', and sometimes 'sensitive'
-                        if isinstance(value, dict) and 'value' in value:
-                            processed_outputs[key] = value['value']
-                        else:
-                            processed_outputs[key] = value
-
-                    result['outputs'] = processed_outputs
-                    logger.info(f'Extracted {len(processed_outputs)} Terragrunt outputs')
-            except Exception as e:
-                logger.warning(f'Failed to get Terragrunt outputs: {e}')
-
-        # Return the output
-        return TerragruntExecutionResult(**result)
+        return TerragruntExecutionResult(
+            command=f'terragrunt {request.command}',
+            status='error',
+            stdout=stdout,
+            stderr=stderr,
+            error_message=str(e),
+            working_directory=request.working_directory,
+            outputs=None,
+            affected_dirs=None,
+        )
     except Exception as e:
         return TerragruntExecutionResult(
             command=f'terragrunt {request.command}',
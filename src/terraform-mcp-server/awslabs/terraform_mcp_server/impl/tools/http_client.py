@@ -0,0 +1,197 @@
+"""Shared asynchronous HTTP client for Terraform Registry and GitHub lookups."""
+
+import asyncio
+import httpx
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from loguru import logger
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+# Default request timeout in seconds when the caller does not provide one
+DEFAULT_TIMEOUT = 10.0
+
+# Connection pool size shared by all hosts
+MAX_CONNECTIONS = 20
+
+# Maximum number of concurrent requests sent to a single host
+MAX_CONNECTIONS_PER_HOST = 6
+
+# Maximum number of responses kept in the ETag cache
+MAX_CACHE_ENTRIES = 256
+
+# Responses younger than this are served from the cache without revalidation
+CACHE_FRESH_SECONDS = 300.0
+
+# Status codes worth caching (200 for content, 404 for repeated README/branch fallbacks)
+CACHEABLE_STATUS_CODES = (200, 404)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response together with its validators."""
+
+    response: httpx.Response
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class HttpClient:
+    """Pooled async HTTP client with per-host concurrency limits and ETag-aware caching.
+
+    A single ``httpx.AsyncClient`` is reused so connections to the Terraform Registry,
+    the GitHub API and raw.githubusercontent.com are kept alive between lookups.
+    Responses are stored in a bounded LRU cache: entries younger than ``fresh_seconds``
+    are returned without a network call, older entries are revalidated with
+    ``If-None-Match``/``If-Modified-Since`` and reused on ``304 Not Modified``.
+    Concurrent requests for the same URL share a single in-flight request.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        max_cache_entries: int = MAX_CACHE_ENTRIES,
+        fresh_seconds: float = CACHE_FRESH_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            max_connections: Size of the shared connection pool
+            max_connections_per_host: Maximum concurrent requests to a single host
+            max_cache_entries: Maximum number of cached responses
+            fresh_seconds: Age below which cached responses are served without revalidation
+            transport: Optional httpx transport, mainly useful for testing
+        """
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._max_cache_entries = max_cache_entries
+        self._fresh_seconds = fresh_seconds
+        self._transport = transport
+
+        self._cache: 'OrderedDict[CacheKey, _CacheEntry]' = OrderedDict()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[CacheKey, 'asyncio.Future[httpx.Response]'] = {}
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, recreating loop-bound state if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            logger.debug('Creating pooled HTTP client')
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+            self._loop = loop
+            self._host_limits = {}
+            self._in_flight = {}
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Return the concurrency limiter for the host of the given URL."""
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self._max_connections_per_host)
+        return self._host_limits[host]
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Perform a GET request, serving or revalidating cached responses where possible.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional request headers (part of the cache key)
+            timeout: Optional request timeout in seconds
+
+        Returns:
+            The HTTP response (possibly a cached one)
+        """
+        self._ensure_client()
+        request_headers = dict(headers or {})
+        key: CacheKey = (url, tuple(sorted(request_headers.items())))
+
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry.stored_at < self._fresh_seconds:
+            logger.debug(f'HTTP cache hit: {url}')
+            self._cache.move_to_end(key)
+            return entry.response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._fetch(key, url, request_headers, timeout))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            logger.debug(f'Joining in-flight request: {url}')
+
+        return await asyncio.shield(in_flight)
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> httpx.Response:
+        """Send the request, using cached validators for a conditional GET when available."""
+        client = self._ensure_client()
+        entry = self._cache.get(key)
+
+        request_headers = dict(headers)
+        if entry and entry.etag:
+            request_headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            request_headers['If-Modified-Since'] = entry.last_modified
+
+        async with self._host_limit(url):
+            start_time = time.time()
+            response = await client.get(
+                url, headers=request_headers, timeout=timeout or DEFAULT_TIMEOUT
+            )
+            logger.debug(
+                f'GET {url} -> {response.status_code} in {time.time() - start_time:.2f} seconds'
+            )
+
+        if response.status_code == 304 and entry:
+            logger.debug(f'HTTP cache revalidated: {url}')
+            entry.stored_at = time.monotonic()
+            self._cache.move_to_end(key)
+            return entry.response
+
+        if response.status_code in CACHEABLE_STATUS_CODES:
+            self._cache[key] = _CacheEntry(
+                response=response,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                stored_at=time.monotonic(),
+            )
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_cache_entries:
+                self._cache.popitem(last=False)
+
+        return response
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
+
+# Process-wide client shared by all registry and GitHub lookups
+http_client = HttpClient()
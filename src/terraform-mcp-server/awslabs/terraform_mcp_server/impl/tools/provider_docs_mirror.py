@@ -0,0 +1,349 @@
+"""Local mirror and index of the Terraform AWS and AWSCC provider documentation.
+
+The mirror is built once by the ``sync_provider_docs`` script: it downloads the provider
+documentation tree for a pinned provider version, parses every document into the structured
+form produced by ``parse_markdown_documentation`` and writes the result into a single
+gzip-compressed JSON file per provider. The search tools load that file lazily and serve
+resource and data source lookups from memory, falling back to GitHub only on a miss.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from .http_client import HttpClient
+from bisect import bisect_left
+from datetime import datetime, timezone
+from loguru import logger
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Directory holding the synced mirrors, overridable through the environment
+PROVIDER_DOCS_MIRROR_DIR = Path(
+    os.environ.get(
+        'TERRAFORM_MCP_PROVIDER_DOCS_DIR',
+        Path.home() / '.cache' / 'awslabs-terraform-mcp-server' / 'provider_docs',
+    )
+)
+
+# Version of the on-disk format, bumped whenever the layout changes
+MIRROR_FORMAT_VERSION = 1
+
+# Where each provider keeps its documentation and how its files are laid out
+PROVIDER_DOCS_SOURCES: Dict[str, Dict[str, Any]] = {
+    'aws': {
+        'repository': 'hashicorp/terraform-provider-aws',
+        'docs_path': 'website/docs',
+        'asset_dirs': {'resource': 'r', 'data_source': 'd'},
+        'file_suffix': '.html.markdown',
+        'prefix': 'aws_',
+    },
+    'awscc': {
+        'repository': 'hashicorp/terraform-provider-awscc',
+        'docs_path': 'docs',
+        'asset_dirs': {'resource': 'resources', 'data_source': 'data-sources'},
+        'file_suffix': '.md',
+        'prefix': 'awscc_',
+    },
+}
+
+# Parser signature shared by both provider search modules
+MarkdownParser = Callable[[str, str, str, str], Dict[str, Any]]
+
+
+class ProviderDocsIndex:
+    """In-memory index over the parsed documentation of one provider version.
+
+    Documents are keyed by asset type and by asset name without the provider prefix, so
+    exact lookups are a pair of dictionary accesses. A sorted name list per asset type
+    supports prefix suggestions with a binary search.
+    """
+
+    def __init__(self, provider: str, version: str, docs: Dict[str, Dict[str, Dict[str, Any]]]):
+        """Initialize the index.
+
+        Args:
+            provider: Provider name ('aws' or 'awscc')
+            version: Provider version the documentation was synced from
+            docs: Parsed documents keyed by asset type and unprefixed asset name
+        """
+        self.provider = provider
+        self.version = version
+        self._prefix = PROVIDER_DOCS_SOURCES[provider]['prefix']
+        self._docs = docs
+        self._sorted_names = {asset_type: sorted(names) for asset_type, names in docs.items()}
+
+    def __len__(self) -> int:
+        """Return the total number of indexed documents."""
+        return sum(len(names) for names in self._docs.values())
+
+    def _normalize(self, asset_name: str) -> str:
+        """Lowercase the asset name and strip the provider prefix."""
+        name = asset_name.strip().lower()
+        if name.startswith(self._prefix):
+            name = name[len(self._prefix) :]
+        return name
+
+    def lookup(self, asset_name: str, asset_type: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed documentation for an asset, or None if it is not mirrored.
+
+        Args:
+            asset_name: Asset name with or without the provider prefix
+            asset_type: Either 'resource' or 'data_source'
+
+        Returns:
+            Parsed documentation dictionary or None
+        """
+        return self._docs.get(asset_type, {}).get(self._normalize(asset_name))
+
+    def suggest(self, asset_name: str, asset_type: str, limit: int = 5) -> List[str]:
+        """Suggest asset names sharing the longest possible prefix with the given name.
+
+        The full name is tried first; if nothing starts with it, trailing ``_segment``
+        parts are dropped one at a time (``s3_bucket_polcy`` -> ``s3_bucket``).
+
+        Args:
+            asset_name: Asset name with or without the provider prefix
+            asset_type: 'resource', 'data_source' or 'both'
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of prefixed asset names
+        """
+        asset_types = ['resource', 'data_source'] if asset_type == 'both' else [asset_type]
+        prefix = self._normalize(asset_name)
+
+        while prefix:
+            matches: List[str] = []
+            for current_type in asset_types:
+                names = self._sorted_names.get(current_type, [])
+                position = bisect_left(names, prefix)
+                while (
+                    position < len(names)
+                    and names[position].startswith(prefix)
+                    and len(matches) < limit
+                ):
+                    full_name = f'{self._prefix}{names[position]}'
+                    if full_name not in matches:
+                        matches.append(full_name)
+                    position += 1
+            if matches:
+                return matches
+            prefix = prefix.rpartition('_')[0]
+
+        return []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the serializable form of the index."""
+        return {
+            'format_version': MIRROR_FORMAT_VERSION,
+            'provider': self.provider,
+            'version': self.version,
+            'synced_at': datetime.now(timezone.utc).isoformat(),
+            'docs': self._docs,
+        }
+
+    def save(self, path: Path) -> None:
+        """Atomically write the index to a gzip-compressed JSON file.
+
+        Args:
+            path: Destination file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'ProviderDocsIndex':
+        """Load an index previously written with ``save``.
+
+        Args:
+            path: Mirror file
+
+        Returns:
+            ProviderDocsIndex instance
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != MIRROR_FORMAT_VERSION:
+            raise ValueError(f'Unsupported provider docs mirror format in {path}')
+        return cls(data['provider'], data['version'], data['docs'])
+
+
+def mirror_path(provider: str, mirror_dir: Optional[Path] = None) -> Path:
+    """Return the mirror file for a provider.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        mirror_dir: Optional override of the mirror directory
+
+    Returns:
+        Path to the gzip-compressed mirror file
+    """
+    return (mirror_dir or PROVIDER_DOCS_MIRROR_DIR) / f'{provider}_provider_docs.json.gz'
+
+
+# Loaded indexes keyed by provider, together with the mtime of the file they came from
+_LOADED_INDEXES: Dict[str, Tuple[float, Optional[ProviderDocsIndex]]] = {}
+
+
+def get_provider_docs_index(provider: str) -> Optional[ProviderDocsIndex]:
+    """Return the mirrored documentation index for a provider, if one has been synced.
+
+    The mirror file is loaded on first use and reloaded when a new sync replaces it.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+
+    Returns:
+        ProviderDocsIndex or None when no usable mirror exists
+    """
+    path = mirror_path(provider)
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+
+    loaded = _LOADED_INDEXES.get(provider)
+    if loaded and loaded[0] == mtime:
+        return loaded[1]
+
+    index: Optional[ProviderDocsIndex] = None
+    try:
+        start_time = time.time()
+        index = ProviderDocsIndex.load(path)
+        logger.info(
+            f'Loaded {provider} provider docs mirror v{index.version} ({len(index)} documents) '
+            f'in {time.time() - start_time:.2f} seconds'
+        )
+    except Exception as e:
+        logger.warning(f'Ignoring unreadable {provider} provider docs mirror at {path}: {e}')
+
+    _LOADED_INDEXES[provider] = (mtime, index)
+    return index
+
+
+async def _list_doc_files(
+    client: HttpClient, provider: str, version: str
+) -> List[Tuple[str, str, str]]:
+    """List the documentation files of a provider version using the GitHub trees API.
+
+    Args:
+        client: HTTP client to use
+        provider: Provider name ('aws' or 'awscc')
+        version: Provider version (without the leading 'v')
+
+    Returns:
+        List of (asset_type, asset_name, path relative to the docs directory) tuples
+    """
+    source = PROVIDER_DOCS_SOURCES[provider]
+    repository = source['repository']
+    parent_path, _, docs_dir = source['docs_path'].rpartition('/')
+    headers = {'Accept': 'application/vnd.github.v3+json'}
+
+    # Resolve the sha of the docs directory so only that subtree has to be listed
+    contents_url = f'https://api.github.com/repos/{repository}/contents'
+    if parent_path:
+        contents_url += f'/{parent_path}'
+    contents_url += f'?ref=v{version}'
+    response = await client.get(contents_url, headers=headers)
+    response.raise_for_status()
+    docs_sha = next(
+        (item['sha'] for item in response.json() if item.get('name') == docs_dir),
+        None,
+    )
+    if not docs_sha:
+        raise ValueError(f'No {source["docs_path"]} directory in {repository} v{version}')
+
+    tree_url = f'https://api.github.com/repos/{repository}/git/trees/{docs_sha}?recursive=1'
+    response = await client.get(tree_url, headers=headers)
+    response.raise_for_status()
+    tree = response.json()
+    if tree.get('truncated'):
+        logger.warning(f'GitHub truncated the docs tree listing for {repository} v{version}')
+
+    doc_files = []
+    dir_to_type = {directory: asset_type for asset_type, directory in source['asset_dirs'].items()}
+    for item in tree.get('tree', []):
+        directory, _, filename = item.get('path', '').partition('/')
+        if item.get('type') != 'blob' or directory not in dir_to_type or '/' in filename:
+            continue
+        if not filename.endswith(source['file_suffix']):
+            continue
+        asset_name = filename[: -len(source['file_suffix'])]
+        doc_files.append((dir_to_type[directory], asset_name, item['path']))
+
+    return doc_files
+
+
+async def sync_provider_docs(
+    provider: str,
+    version: str,
+    parser: MarkdownParser,
+    mirror_dir: Optional[Path] = None,
+    concurrency: int = 16,
+) -> Path:
+    """Download, parse and index the documentation of a pinned provider version.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        version: Provider version (without the leading 'v')
+        parser: The provider's ``parse_markdown_documentation`` function
+        mirror_dir: Optional override of the mirror directory
+        concurrency: Maximum number of concurrent downloads
+
+    Returns:
+        Path of the written mirror file
+    """
+    source = PROVIDER_DOCS_SOURCES[provider]
+    raw_base_url = f'https://raw.githubusercontent.com/{source["repository"]}/v{version}/{source["docs_path"]}'
+    # A dedicated client: thousands of one-off downloads should not churn the shared cache
+    client = HttpClient(
+        max_connections=concurrency,
+        max_connections_per_host=concurrency,
+        max_cache_entries=0,
+    )
+
+    start_time = time.time()
+    doc_files = await _list_doc_files(client, provider, version)
+    logger.info(f'Syncing {len(doc_files)} {provider} provider docs for v{version}')
+
+    async def fetch_and_parse(
+        asset_type: str, asset_name: str, path: str
+    ) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        url = f'{raw_base_url}/{path}'
+        try:
+            response = await client.get(url, timeout=30.0)
+        except Exception as e:
+            logger.warning(f'Failed to download {url}: {e}')
+            return None
+        if response.status_code != 200:
+            logger.warning(f'Failed to download {url}: HTTP {response.status_code}')
+            return None
+        full_name = f'{source["prefix"]}{asset_name}'
+        return asset_type, asset_name, parser(response.text, full_name, url, f'sync-{provider}')
+
+    results = await asyncio.gather(
+        *[fetch_and_parse(asset_type, name, path) for asset_type, name, path in doc_files]
+    )
+
+    docs: Dict[str, Dict[str, Dict[str, Any]]] = {
+        asset_type: {} for asset_type in source['asset_dirs']
+    }
+    for result in results:
+        if result:
+            asset_type, asset_name, parsed = result
+            docs[asset_type][asset_name] = parsed
+
+    index = ProviderDocsIndex(provider, version, docs)
+    path = mirror_path(provider, mirror_dir)
+    index.save(path)
+    logger.info(
+        f'Wrote {len(index)} {provider} provider docs to {path} '
+        f'in {time.time() - start_time:.2f} seconds'
+    )
+    return path
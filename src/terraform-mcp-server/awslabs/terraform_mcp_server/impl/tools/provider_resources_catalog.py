@@ -0,0 +1,387 @@
+"""Structured catalog of the AWS and AWSCC provider resources and data sources.
+
+The provider resource generators write a JSON catalog next to each markdown listing, holding
+the resource and data source names of each category. The service segment and documentation
+URL of an asset follow from its name, so they are derived when the catalog is loaded instead
+of being stored per row. This module loads those catalogs once and answers filtered queries
+from in-memory indexes, so callers receive only the rows they ask for instead of the whole
+listing.
+"""
+
+import json
+import os
+import time
+from awslabs.terraform_mcp_server.models import (
+    ProviderResourceCatalogEntry,
+    ProviderResourceCatalogResult,
+    ProviderResourceCategory,
+)
+from bisect import bisect_left
+from datetime import datetime, timezone
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
+
+
+# Directory holding the generated listings and catalogs
+STATIC_DIR = Path(__file__).parent.parent.parent / 'static'
+
+# Version of the catalog format, bumped whenever the layout changes
+CATALOG_FORMAT_VERSION = 2
+
+# Documentation URL of an asset, from its provider, kind and unprefixed name
+DOCS_URL_TEMPLATE = (
+    'https://registry.terraform.io/providers/hashicorp/{provider}/latest/docs/{kind}/{name}'
+)
+
+# Maximum number of rows a single query may return
+MAX_QUERY_LIMIT = 500
+
+# Catalog location and naming rules of each provider. The AWSCC registry navigation only
+# splits assets into resources and data sources, so its catalog is categorized by service.
+CATALOG_SOURCES: Dict[str, Dict[str, Any]] = {
+    'aws': {
+        'path': STATIC_DIR / 'AWS_PROVIDER_RESOURCES.json',
+        'prefix': 'aws_',
+        'categorize_by_service': False,
+    },
+    'awscc': {
+        'path': STATIC_DIR / 'AWSCC_PROVIDER_RESOURCES.json',
+        'prefix': 'awscc_',
+        'categorize_by_service': True,
+    },
+}
+
+
+def asset_service(provider: str, asset_name: str) -> str:
+    """Return the service segment of an asset name (``aws_s3_bucket`` -> ``s3``).
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        asset_name: Prefixed asset name
+
+    Returns:
+        The service segment, or an empty string for unprefixed names
+    """
+    prefix = CATALOG_SOURCES[provider]['prefix']
+    if not asset_name.startswith(prefix):
+        return ''
+    return asset_name[len(prefix) :].partition('_')[0]
+
+
+def asset_url(provider: str, asset_name: str, data_source: bool) -> str:
+    """Return the registry documentation URL of an asset.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        asset_name: Prefixed asset name
+        data_source: Whether the asset is a data source
+
+    Returns:
+        Documentation URL
+    """
+    prefix = CATALOG_SOURCES[provider]['prefix']
+    name = asset_name[len(prefix) :] if asset_name.startswith(prefix) else asset_name
+    kind = 'data-sources' if data_source else 'resources'
+    return DOCS_URL_TEMPLATE.format(provider=provider, kind=kind, name=name)
+
+
+def build_catalog(
+    provider: str, version: str, categories: Mapping[str, Mapping[str, List[Dict[str, Any]]]]
+) -> Dict[str, Any]:
+    """Build the catalog of a provider from the categories collected by a generator.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        version: Provider version the listing was generated from
+        categories: Mapping of category name to its 'resources' and 'data_sources' items,
+            each item holding at least a 'name'
+
+    Returns:
+        Serializable catalog dictionary, with the sorted asset names of each category
+    """
+    by_service = CATALOG_SOURCES[provider]['categorize_by_service']
+    names: Dict[str, Dict[str, set]] = {}
+    for category, category_data in categories.items():
+        for key in ('resources', 'data_sources'):
+            for item in category_data.get(key, []):
+                service = asset_service(provider, item['name'])
+                name = service if by_service and service else category
+                category_names = names.setdefault(
+                    name, {'resources': set(), 'data_sources': set()}
+                )
+                category_names[key].add(item['name'])
+
+    return {
+        'format_version': CATALOG_FORMAT_VERSION,
+        'provider': provider,
+        'version': version,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'categories': {
+            category: {key: sorted(assets) for key, assets in category_names.items()}
+            for category, category_names in sorted(names.items())
+        },
+    }
+
+
+def catalog_assets(catalog: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Expand a catalog into one row per asset, deriving the service and URL of each.
+
+    Args:
+        catalog: Catalog built with ``build_catalog``
+
+    Returns:
+        Rows holding the category, service, name, data source flag and URL of each asset,
+        ordered by category, then resources before data sources, then name
+    """
+    provider = catalog['provider']
+    assets = []
+    for category, category_names in sorted(catalog['categories'].items()):
+        for key, data_source in (('resources', False), ('data_sources', True)):
+            for name in category_names.get(key, []):
+                assets.append(
+                    {
+                        'category': category,
+                        'service': asset_service(provider, name),
+                        'name': name,
+                        'data_source': data_source,
+                        'url': asset_url(provider, name, data_source),
+                    }
+                )
+    return assets
+
+
+def write_catalog(catalog: Dict[str, Any], path: Path) -> None:
+    """Write a catalog as indented JSON with sorted keys, as the pre-commit hooks expect.
+
+    Args:
+        catalog: Catalog built with ``build_catalog``
+        path: Destination file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(catalog, indent=2, sort_keys=True) + '\n')
+    os.replace(tmp_path, path)
+
+
+class ProviderResourceCatalog:
+    """In-memory indexes over the catalog of one provider.
+
+    Assets are grouped by lowercased category for category filters, and a sorted list of
+    unprefixed names supports name prefix filters with a binary search.
+    """
+
+    def __init__(self, provider: str, version: str, assets: List[Dict[str, Any]]):
+        """Initialize the catalog.
+
+        Args:
+            provider: Provider name ('aws' or 'awscc')
+            version: Provider version the catalog was generated from
+            assets: Catalog rows
+        """
+        self.provider = provider
+        self.version = version
+        self._prefix = CATALOG_SOURCES[provider]['prefix']
+        self._assets = assets
+        self._by_category: Dict[str, List[int]] = {}
+        self._category_names: Dict[str, str] = {}
+        for position, asset in enumerate(assets):
+            key = asset['category'].lower()
+            self._by_category.setdefault(key, []).append(position)
+            self._category_names.setdefault(key, asset['category'])
+        self._sorted_names: List[Tuple[str, int]] = sorted(
+            (self._normalize(asset['name']), position) for position, asset in enumerate(assets)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of assets in the catalog."""
+        return len(self._assets)
+
+    def _normalize(self, asset_name: str) -> str:
+        """Lowercase the asset name and strip the provider prefix."""
+        name = asset_name.strip().lower()
+        if name.startswith(self._prefix):
+            name = name[len(self._prefix) :]
+        return name
+
+    def categories(self) -> List[ProviderResourceCategory]:
+        """Return every category with its resource and data source counts."""
+        summaries = []
+        for key in sorted(self._by_category):
+            positions = self._by_category[key]
+            data_sources = sum(
+                1 for position in positions if self._assets[position]['data_source']
+            )
+            summaries.append(
+                ProviderResourceCategory(
+                    name=self._category_names[key],
+                    resource_count=len(positions) - data_sources,
+                    data_source_count=data_sources,
+                )
+            )
+        return summaries
+
+    def _category_positions(self, category: str) -> List[int]:
+        """Return the assets of a category, matched exactly or, failing that, by substring."""
+        wanted = category.strip().lower()
+        if wanted in self._by_category:
+            return self._by_category[wanted]
+        return sorted(
+            position
+            for key, positions in self._by_category.items()
+            if wanted in key
+            for position in positions
+        )
+
+    def _prefix_positions(self, name_prefix: str) -> List[int]:
+        """Return the assets whose name starts with the given prefix, in name order."""
+        prefix = self._normalize(name_prefix)
+        start = bisect_left(self._sorted_names, (prefix, -1))
+        positions = []
+        for name, position in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+        return positions
+
+    def query(
+        self,
+        category: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        asset_type: str = 'both',
+    ) -> List[Dict[str, Any]]:
+        """Return the assets matching all of the given filters.
+
+        Args:
+            category: Category name, matched case-insensitively, exactly or by substring
+            name_prefix: Asset name prefix, with or without the provider prefix
+            asset_type: 'resource', 'data_source' or 'both'
+
+        Returns:
+            Matching catalog rows
+        """
+        positions: Optional[List[int]] = None
+        if name_prefix:
+            positions = self._prefix_positions(name_prefix)
+        if category:
+            category_positions = self._category_positions(category)
+            if positions is None:
+                positions = category_positions
+            else:
+                allowed = set(category_positions)
+                positions = [position for position in positions if position in allowed]
+        if positions is None:
+            positions = list(range(len(self._assets)))
+
+        matches = []
+        for position in positions:
+            asset = self._assets[position]
+            if asset_type == 'resource' and asset['data_source']:
+                continue
+            if asset_type == 'data_source' and not asset['data_source']:
+                continue
+            matches.append(asset)
+        return matches
+
+    @classmethod
+    def load(cls, path: Path) -> 'ProviderResourceCatalog':
+        """Load a catalog written with ``write_catalog``.
+
+        Args:
+            path: Catalog file
+
+        Returns:
+            ProviderResourceCatalog instance
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != CATALOG_FORMAT_VERSION:
+            raise ValueError(f'Unsupported provider resource catalog format in {path}')
+        return cls(data['provider'], data['version'], catalog_assets(data))
+
+
+# Loaded catalogs keyed by provider, together with the mtime of the file they came from
+_LOADED_CATALOGS: Dict[str, Tuple[float, ProviderResourceCatalog]] = {}
+
+
+def get_provider_resource_catalog(provider: str) -> ProviderResourceCatalog:
+    """Return the catalog of a provider, loading it on first use or after regeneration.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+
+    Returns:
+        ProviderResourceCatalog instance
+    """
+    path = CATALOG_SOURCES[provider]['path']
+    mtime = path.stat().st_mtime
+
+    loaded = _LOADED_CATALOGS.get(provider)
+    if loaded and loaded[0] == mtime:
+        return loaded[1]
+
+    start_time = time.time()
+    catalog = ProviderResourceCatalog.load(path)
+    logger.info(
+        f'Loaded {provider} provider resource catalog v{catalog.version} ({len(catalog)} assets) '
+        f'in {time.time() - start_time:.2f} seconds'
+    )
+    _LOADED_CATALOGS[provider] = (mtime, catalog)
+    return catalog
+
+
+async def query_provider_resource_catalog_impl(
+    provider: Literal['aws', 'awscc'],
+    category: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    asset_type: str = 'both',
+    limit: int = 100,
+) -> ProviderResourceCatalogResult:
+    """Query the resource catalog of the AWS or AWSCC provider.
+
+    Without a category or name prefix only the category summary is returned, so a caller
+    can discover the categories first and then fetch the rows of the one it needs.
+
+    Args:
+        provider: Provider name ('aws' or 'awscc')
+        category: Optional category filter
+        name_prefix: Optional asset name prefix filter
+        asset_type: 'resource', 'data_source' or 'both'
+        limit: Maximum number of rows to return
+
+    Returns:
+        ProviderResourceCatalogResult with the matching rows or the category summary
+    """
+    logger.info(
+        f"Querying {provider} provider resource catalog: category='{category}', "
+        f"name_prefix='{name_prefix}', asset_type='{asset_type}'"
+    )
+
+    try:
+        catalog = get_provider_resource_catalog(provider)
+    except Exception as e:
+        logger.error(f'Error loading {provider} provider resource catalog: {e}')
+        return ProviderResourceCatalogResult(
+            status='error',
+            provider=provider,
+            error_message=f'Provider resource catalog is not available: {str(e)}',
+        )
+
+    if not category and not name_prefix:
+        return ProviderResourceCatalogResult(
+            status='success',
+            provider=provider,
+            provider_version=catalog.version,
+            categories=catalog.categories(),
+        )
+
+    matches = catalog.query(category=category, name_prefix=name_prefix, asset_type=asset_type)
+    limit = max(1, min(limit, MAX_QUERY_LIMIT))
+    return ProviderResourceCatalogResult(
+        status='success',
+        provider=provider,
+        provider_version=catalog.version,
+        total_matches=len(matches),
+        assets=[ProviderResourceCatalogEntry(**asset) for asset in matches[:limit]],
+    )
@@ -1,17 +1,47 @@
 """Implementation of Checkov scan tools."""
 
+import asyncio
 import json
 import os
 import re
 import subprocess
+import threading
+import uuid
+from awslabs.terraform_mcp_server.impl.tools.checkov_scan_cache import (
+    collect_modules,
+    compute_ruleset_key,
+    fingerprint_modules,
+    load_scan_cache,
+    merge_cached_findings,
+    save_scan_cache,
+    split_checkov_report,
+)
+from awslabs.terraform_mcp_server.impl.tools.command_runner import run_command
 from awslabs.terraform_mcp_server.impl.tools.utils import get_dangerous_patterns
 from awslabs.terraform_mcp_server.models import (
     CheckovScanRequest,
     CheckovScanResult,
     CheckovVulnerability,
 )
+from collections import OrderedDict
 from loguru import logger
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Maximum number of Checkov scans running at once; further scans wait for a free slot
+MAX_CONCURRENT_SCANS = 2
+
+# Number of background scans kept for polling, oldest finished scans are dropped first
+MAX_SCAN_JOBS = 50
+
+# Installed Checkov version, set once Checkov was found or installed
+_CHECKOV_VERSION: Optional[str] = None
+_CHECKOV_INSTALL_LOCK = threading.Lock()
+
+_SCAN_SLOTS: Optional[asyncio.Semaphore] = None
+
+# Background scans by job id
+_SCAN_JOBS: 'OrderedDict[str, Tuple[CheckovScanRequest, asyncio.Task]]' = OrderedDict()
 
 
 def _clean_output_text(text: str) -> str:
@@ -73,34 +103,43 @@ def _clean_output_text(text: str) -> str:
 def _ensure_checkov_installed() -> bool:
     """Ensure Checkov is installed, and install it if not.
 
+    The check only runs until Checkov was found once, so later scans do not pay for it. It
+    blocks, so scans call it from a worker thread.
+
     Returns:
         True if Checkov is installed or was successfully installed, False otherwise
     """
-    try:
-        # Check if Checkov is already installed
-        subprocess.run(
-            ['checkov', '--version'],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        logger.info('Checkov is already installed')
-        return True
-    except FileNotFoundError:
-        logger.warning('Checkov not found, attempting to install')
+    global _CHECKOV_VERSION
+    with _CHECKOV_INSTALL_LOCK:
+        if _CHECKOV_VERSION is not None:
+            return True
         try:
-            # Install Checkov using pip
-            subprocess.run(
-                ['pip', 'install', 'checkov'],
+            # Check if Checkov is already installed
+            process = subprocess.run(
+                ['checkov', '--version'],
                 capture_output=True,
                 text=True,
-                check=True,
+                check=False,
             )
-            logger.info('Successfully installed Checkov')
+            _CHECKOV_VERSION = str(process.stdout or '').strip() or 'unknown'
+            logger.info('Checkov is already installed')
             return True
-        except subprocess.CalledProcessError as e:
-            logger.error(f'Failed to install Checkov: {e}')
-            return False
+        except FileNotFoundError:
+            logger.warning('Checkov not found, attempting to install')
+            try:
+                # Install Checkov using pip
+                subprocess.run(
+                    ['pip', 'install', 'checkov'],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                logger.info('Successfully installed Checkov')
+                _CHECKOV_VERSION = 'unknown'
+                return True
+            except subprocess.CalledProcessError as e:
+                logger.error(f'Failed to install Checkov: {e}')
+                return False
 
 
 def _parse_checkov_json_output(output: str) -> Tuple[List[CheckovVulnerability], Dict[str, Any]]:
@@ -150,27 +189,264 @@ def _parse_checkov_json_output(output: str) -> Tuple[List[CheckovVulnerability],
         return [], {'error': 'Failed to parse JSON output'}
 
 
-async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResult:
-    """Run Checkov scan on Terraform code.
+def _scan_slots() -> asyncio.Semaphore:
+    """Return the semaphore limiting the number of concurrent Checkov scans."""
+    global _SCAN_SLOTS
+    if _SCAN_SLOTS is None:
+        _SCAN_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_SCANS)
+    return _SCAN_SLOTS
+
+
+def _build_checkov_command(request: CheckovScanRequest, targets: List[str]) -> List[str]:
+    """Build the Checkov command line.
 
     Args:
         request: Details about the Checkov scan to execute
+        targets: Directory (``-d``) or file (``-f``) arguments selecting what to scan
+
+    Returns:
+        Command and arguments
+    """
+    cmd = ['checkov', '--quiet', *targets]
+
+    # Add framework if specified
+    if request.framework:
+        cmd.extend(['--framework', request.framework])
+
+    # Add specific check IDs if provided
+    if request.check_ids:
+        cmd.extend(['--check', ','.join(request.check_ids)])
+
+    # Add skip check IDs if provided
+    if request.skip_check_ids:
+        cmd.extend(['--skip-check', ','.join(request.skip_check_ids)])
+
+    # Set output format
+    cmd.extend(['--output', request.output_format])
+    return cmd
+
+
+def _build_scan_result(
+    request: CheckovScanRequest, returncode: int, stdout: str
+) -> CheckovScanResult:
+    """Turn the output of a Checkov run into a scan result.
+
+    Args:
+        request: Details about the Checkov scan that was executed
+        returncode: Exit code of Checkov
+        stdout: Cleaned standard output of Checkov
 
     Returns:
         A CheckovScanResult object containing scan results and vulnerabilities
     """
-    logger.info(f'Running Checkov scan in {request.working_directory}')
+    # Parse results if JSON output was requested
+    vulnerabilities = []
+    summary = {}
+    if request.output_format == 'json' and stdout:
+        vulnerabilities, summary = _parse_checkov_json_output(stdout)
+
+    # For non-JSON output, try to parse vulnerabilities from the text output
+    elif stdout and returncode == 1:  # Return code 1 means vulnerabilities were found
+        # Simple regex to extract failed checks from CLI output
+        failed_checks = re.findall(
+            r'Check: (CKV\w*_\d+).*?FAILED for resource: ([\w\.]+).*?File: ([\w\/\.-]+):(\d+)',
+            stdout,
+            re.DOTALL,
+        )
+        for check_id, resource, file_path, line in failed_checks:
+            vuln = CheckovVulnerability(
+                id=check_id,
+                type='terraform',
+                resource=resource,
+                file_path=file_path,
+                line=int(line),
+                description=f'Failed check: {check_id}',
+                guideline=None,
+                severity='MEDIUM',
+                fixed=False,
+                fix_details=None,
+            )
+            vulnerabilities.append(vuln)
 
-    # Ensure Checkov is installed
-    if not _ensure_checkov_installed():
-        return CheckovScanResult(
-            status='error',
+        # Extract summary counts
+        passed_match = re.search(r'Passed checks: (\d+)', stdout)
+        failed_match = re.search(r'Failed checks: (\d+)', stdout)
+        skipped_match = re.search(r'Skipped checks: (\d+)', stdout)
+
+        summary = {
+            'passed': int(passed_match.group(1)) if passed_match else 0,
+            'failed': int(failed_match.group(1)) if failed_match else 0,
+            'skipped': int(skipped_match.group(1)) if skipped_match else 0,
+        }
+
+    # Prepare the result - consider it a success even if vulnerabilities were found
+    # A return code of 1 from Checkov means vulnerabilities were found, not an error
+    is_error = returncode not in [0, 1]
+    return CheckovScanResult(
+        status='error' if is_error else 'success',
+        return_code=returncode,
+        working_directory=request.working_directory,
+        vulnerabilities=vulnerabilities,
+        summary=summary,
+        raw_output=stdout,
+    )
+
+
+async def _run_checkov(
+    request: CheckovScanRequest, working_dir: str, targets: List[str]
+) -> Tuple[int, str]:
+    """Run Checkov without blocking the event loop and return its exit code and cleaned output."""
+    cmd = _build_checkov_command(request, targets)
+    logger.info(f'Executing command: {" ".join(cmd)}')
+    process = await run_command(cmd, cwd=working_dir, max_output_chars=None)
+
+    # Clean output text
+    stdout = _clean_output_text(process.stdout)
+    stderr = _clean_output_text(process.stderr)
+
+    # Debug logging
+    logger.info(f'Checkov return code: {process.returncode}')
+    logger.debug(f'Checkov stdout: {stdout}')
+    logger.info(f'Checkov stderr: {stderr}')
+    return process.returncode, stdout
+
+
+async def _run_incremental_scan(
+    request: CheckovScanRequest, working_dir: str, modules: Dict[str, List[str]]
+) -> CheckovScanResult:
+    """Scan only the modules that changed since the last scan and merge in cached findings.
+
+    Args:
+        request: Details about the Checkov scan to execute
+        working_dir: Absolute working directory
+        modules: Mapping of the directories to scan to their files
+
+    Returns:
+        A CheckovScanResult object covering every module of the working directory
+    """
+    fingerprints = await asyncio.to_thread(fingerprint_modules, modules, request.framework)
+    ruleset_key = compute_ruleset_key(
+        working_dir,
+        _CHECKOV_VERSION or 'unknown',
+        request.framework,
+        request.check_ids,
+        request.skip_check_ids,
+    )
+    cached = load_scan_cache(working_dir, ruleset_key)
+    changed = [
+        directory
+        for directory in sorted(modules)
+        if cached.get(directory, {}).get('fingerprint') != fingerprints[directory]
+    ]
+    entries = {directory: cached[directory] for directory in modules if directory not in changed}
+    logger.info(
+        f'Checkov findings of {len(entries)} modules are cached, scanning {len(changed)} modules'
+    )
+
+    result = None
+    if changed:
+        # Scanning the whole directory keeps Checkov's own output when nothing is cached
+        if len(changed) == len(modules):
+            targets = ['-d', working_dir]
+        else:
+            targets = [arg for d in changed for path in modules[d] for arg in ('-f', path)]
+        returncode, stdout = await _run_checkov(request, working_dir, targets)
+        result = _build_scan_result(request, returncode, stdout)
+        if result.status == 'error':
+            return result
+        try:
+            scanned = split_checkov_report(stdout, working_dir, changed)
+        except (ValueError, AttributeError) as e:
+            logger.warning(f'Not caching Checkov findings that could not be split: {e}')
+            return result
+        for directory in changed:
+            entries[directory] = dict(scanned[directory], fingerprint=fingerprints[directory])
+        save_scan_cache(working_dir, ruleset_key, entries)
+
+    if result is None or len(changed) < len(modules):
+        merged = json.dumps(merge_cached_findings(entries))
+        vulnerabilities, summary = _parse_checkov_json_output(merged)
+        result = CheckovScanResult(
+            status='success',
+            return_code=1 if vulnerabilities else 0,
             working_directory=request.working_directory,
-            error_message='Failed to install Checkov. Please install it manually with: pip install checkov',
-            vulnerabilities=[],
-            summary={},
-            raw_output=None,
+            vulnerabilities=vulnerabilities,
+            summary=summary,
+            raw_output=merged,
         )
+    result.scanned_modules = len(changed)
+    result.cached_modules = len(modules) - len(changed)
+    return result
+
+
+async def _run_scan(request: CheckovScanRequest, working_dir: str) -> CheckovScanResult:
+    """Run a validated Checkov scan on one of the scan slots.
+
+    Args:
+        request: Details about the Checkov scan to execute
+        working_dir: Absolute working directory
+
+    Returns:
+        A CheckovScanResult object containing scan results and vulnerabilities
+    """
+    async with _scan_slots():
+        # Ensure Checkov is installed, without blocking the event loop
+        if not await asyncio.to_thread(_ensure_checkov_installed):
+            return CheckovScanResult(
+                status='error',
+                working_directory=request.working_directory,
+                error_message='Failed to install Checkov. Please install it manually with: pip install checkov',
+                vulnerabilities=[],
+                summary={},
+                raw_output=None,
+            )
+
+        try:
+            # Findings are cached per module for JSON scans of frameworks with known file types
+            modules = None
+            if request.output_format == 'json':
+                modules = collect_modules(working_dir, request.framework)
+            if modules:
+                return await _run_incremental_scan(request, working_dir, modules)
+
+            returncode, stdout = await _run_checkov(request, working_dir, ['-d', working_dir])
+            return _build_scan_result(request, returncode, stdout)
+        except Exception as e:
+            logger.error(f'Error running Checkov scan: {e}')
+            return CheckovScanResult(
+                status='error',
+                working_directory=request.working_directory,
+                error_message=str(e),
+                vulnerabilities=[],
+                summary={},
+                raw_output=None,
+            )
+
+
+def _prune_scan_jobs() -> None:
+    """Drop the oldest finished background scans beyond MAX_SCAN_JOBS."""
+    for job_id in list(_SCAN_JOBS):
+        if len(_SCAN_JOBS) <= MAX_SCAN_JOBS:
+            return
+        if _SCAN_JOBS[job_id][1].done():
+            del _SCAN_JOBS[job_id]
+
+
+async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResult:
+    """Run Checkov scan on Terraform code.
+
+    JSON scans only rescan the modules whose files changed since the previous scan with the
+    same Checkov version and ruleset, and merge in the cached findings of the other modules.
+    Background scans return a job id right away; their result is polled with
+    ``get_checkov_scan_result_impl``.
+
+    Args:
+        request: Details about the Checkov scan to execute
+
+    Returns:
+        A CheckovScanResult object containing scan results and vulnerabilities
+    """
+    logger.info(f'Running Checkov scan in {request.working_directory}')
 
     # Security checks for parameters
 
@@ -247,7 +523,6 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
                         raw_output=None,
                     )
 
-    # Build the command
     # Convert working_directory to absolute path if it's not already
     working_dir = request.working_directory
     if not os.path.isabs(working_dir):
@@ -259,101 +534,46 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
         working_dir = os.path.abspath(os.path.join(project_root, working_dir))
 
     logger.info(f'Using absolute working directory: {working_dir}')
-    cmd = ['checkov', '--quiet', '-d', working_dir]
-
-    # Add framework if specified
-    if request.framework:
-        cmd.extend(['--framework', request.framework])
-
-    # Add specific check IDs if provided
-    if request.check_ids:
-        cmd.extend(['--check', ','.join(request.check_ids)])
 
-    # Add skip check IDs if provided
-    if request.skip_check_ids:
-        cmd.extend(['--skip-check', ','.join(request.skip_check_ids)])
-
-    # Set output format
-    cmd.extend(['--output', request.output_format])
-
-    # Execute command
-    try:
-        logger.info(f'Executing command: {" ".join(cmd)}')
-        process = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-
-        # Clean output text
-        stdout = _clean_output_text(process.stdout)
-        stderr = _clean_output_text(process.stderr)
+    if not request.background:
+        return await _run_scan(request, working_dir)
 
-        # Debug logging
-        logger.info(f'Checkov return code: {process.returncode}')
-        logger.info(f'Checkov stdout: {stdout}')
-        logger.info(f'Checkov stderr: {stderr}')
+    # Run the scan in the background and let the client poll for its result
+    job_id = uuid.uuid4().hex
+    _SCAN_JOBS[job_id] = (request, asyncio.create_task(_run_scan(request, working_dir)))
+    _prune_scan_jobs()
+    logger.info(f'Started background Checkov scan {job_id}')
+    return CheckovScanResult(
+        status='running',
+        working_directory=request.working_directory,
+        job_id=job_id,
+    )
 
-        # Parse results if JSON output was requested
-        vulnerabilities = []
-        summary = {}
-        if request.output_format == 'json' and stdout:
-            vulnerabilities, summary = _parse_checkov_json_output(stdout)
-
-        # For non-JSON output, try to parse vulnerabilities from the text output
-        elif stdout and process.returncode == 1:  # Return code 1 means vulnerabilities were found
-            # Simple regex to extract failed checks from CLI output
-            failed_checks = re.findall(
-                r'Check: (CKV\w*_\d+).*?FAILED for resource: ([\w\.]+).*?File: ([\w\/\.-]+):(\d+)',
-                stdout,
-                re.DOTALL,
-            )
-            for check_id, resource, file_path, line in failed_checks:
-                vuln = CheckovVulnerability(
-                    id=check_id,
-                    type='terraform',
-                    resource=resource,
-                    file_path=file_path,
-                    line=int(line),
-                    description=f'Failed check: {check_id}',
-                    guideline=None,
-                    severity='MEDIUM',
-                    fixed=False,
-                    fix_details=None,
-                )
-                vulnerabilities.append(vuln)
 
-            # Extract summary counts
-            passed_match = re.search(r'Passed checks: (\d+)', stdout)
-            failed_match = re.search(r'Failed checks: (\d+)', stdout)
-            skipped_match = re.search(r'Skipped checks: (\d+)', stdout)
+async def get_checkov_scan_result_impl(job_id: str) -> CheckovScanResult:
+    """Get the result of a background Checkov scan.
 
-            summary = {
-                'passed': int(passed_match.group(1)) if passed_match else 0,
-                'failed': int(failed_match.group(1)) if failed_match else 0,
-                'skipped': int(skipped_match.group(1)) if skipped_match else 0,
-            }
+    Args:
+        job_id: Job id returned when the scan was started
 
-        # Prepare the result - consider it a success even if vulnerabilities were found
-        # A return code of 1 from Checkov means vulnerabilities were found, not an error
-        is_error = process.returncode not in [0, 1]
-        result = CheckovScanResult(
-            status='error' if is_error else 'success',
-            return_code=process.returncode,
-            working_directory=request.working_directory,
-            vulnerabilities=vulnerabilities,
-            summary=summary,
-            raw_output=stdout,
+    Returns:
+        The scan result, or a result with status 'running' while the scan is in progress
+    """
+    job = _SCAN_JOBS.get(job_id)
+    if job is None:
+        return CheckovScanResult(
+            status='error',
+            working_directory='',
+            job_id=job_id,
+            error_message=f'Unknown Checkov scan job: {job_id}',
         )
 
-        return result
-    except Exception as e:
-        logger.error(f'Error running Checkov scan: {e}')
+    request, task = job
+    if not task.done():
         return CheckovScanResult(
-            status='error',
-            working_directory=request.working_directory,
-            error_message=str(e),
-            vulnerabilities=[],
-            summary={},
-            raw_output=None,
+            status='running', working_directory=request.working_directory, job_id=job_id
         )
+
+    result = task.result()
+    result.job_id = job_id
+    return result
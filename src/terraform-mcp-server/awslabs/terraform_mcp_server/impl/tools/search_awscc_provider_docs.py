@@ -4,7 +4,9 @@ import re
 import requests
 import sys
 import time
+from .provider_docs_mirror import get_provider_docs_index
 from awslabs.terraform_mcp_server.models import TerraformAWSCCProviderDocsResult
+from collections import OrderedDict
 from loguru import logger
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple, cast
@@ -33,8 +35,9 @@ GITHUB_RAW_BASE_URL = (
     'https://raw.githubusercontent.com/hashicorp/terraform-provider-awscc/main/docs'
 )
 
-# Simple in-memory cache
-_GITHUB_DOC_CACHE = {}
+# Simple bounded in-memory LRU cache
+_GITHUB_DOC_CACHE: 'OrderedDict[str, Optional[Dict[str, Any]]]' = OrderedDict()
+_GITHUB_DOC_CACHE_MAX_ENTRIES = 256
 
 
 def resource_to_github_path(
@@ -119,12 +122,23 @@ def fetch_github_documentation(
     # Use a hash function to ensure the cache key is safe
     cache_key = f'{asset_name}_{asset_type}'
 
+    # Serve from the local provider docs mirror when one has been synced
+    mirror = get_provider_docs_index('awscc')
+    if mirror:
+        mirrored = mirror.lookup(asset_name, asset_type)
+        if mirrored:
+            logger.info(
+                f"[{correlation_id}] Using mirrored v{mirror.version} documentation for '{asset_name}' (asset_type: {asset_type})"
+            )
+            return mirrored
+
     # Check cache first
     if cache_enabled:
         if cache_key in _GITHUB_DOC_CACHE:
             logger.info(
                 f"[{correlation_id}] Using cached documentation for '{asset_name}' (asset_type: {asset_type})"
             )
+            _GITHUB_DOC_CACHE.move_to_end(cache_key)
             return _GITHUB_DOC_CACHE[cache_key]
 
     try:
@@ -169,6 +183,8 @@ def fetch_github_documentation(
         # Cache the result with the composite key
         if cache_enabled:
             _GITHUB_DOC_CACHE[cache_key] = result
+            if len(_GITHUB_DOC_CACHE) > _GITHUB_DOC_CACHE_MAX_ENTRIES:
+                _GITHUB_DOC_CACHE.popitem(last=False)
 
         fetch_time = time.time() - start_time
         logger.info(f'[{correlation_id}] GitHub documentation fetched in {fetch_time:.2f} seconds')
@@ -590,6 +606,14 @@ async def search_awscc_provider_docs_impl(
 
         # Return a "not found" result
         logger.warning(f'[{correlation_id}] No documentation found for asset {asset_name}')
+        not_found_description = f"No documentation found for resource type '{asset_name}'."
+
+        # Point at similarly named assets when a local mirror is available
+        mirror = get_provider_docs_index('awscc')
+        suggestions = mirror.suggest(search_term, asset_type) if mirror else []
+        if suggestions:
+            not_found_description += f' Similar assets: {", ".join(suggestions)}.'
+
         end_time = time.time()
         logger.info(
             f'[{correlation_id}] Search completed in {end_time - start_time:.2f} seconds (no results)'
@@ -598,7 +622,7 @@ async def search_awscc_provider_docs_impl(
             TerraformAWSCCProviderDocsResult(
                 asset_name='Not found',
                 asset_type=cast(Literal['both', 'resource', 'data_source'], asset_type),
-                description=f"No documentation found for resource type '{asset_name}'.",
+                description=not_found_description,
                 url=None,
                 example_usage=None,
                 schema_arguments=None,
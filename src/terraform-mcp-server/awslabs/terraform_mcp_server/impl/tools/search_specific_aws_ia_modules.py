@@ -2,12 +2,13 @@
 
 import asyncio
 import re
-import requests
 import time
 import traceback
+from .http_client import http_client
 from .utils import (
     clean_description,
     extract_outputs_from_readme,
+    get_github_readme,
     get_github_release_details,
     get_submodules,
     get_variables_tf,
@@ -44,7 +45,7 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
         details_url = f'https://registry.terraform.io/v1/modules/{namespace}/{name}/{provider}'
         logger.debug(f'Making API request to: {details_url}')
 
-        response = requests.get(details_url)
+        response = await http_client.get(details_url)
         response.raise_for_status()
 
         details = response.json()
@@ -63,7 +64,7 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
             versions_url = f'{details_url}/versions'
             logger.debug(f'Making API request to get versions: {versions_url}')
 
-            versions_response = requests.get(versions_url)
+            versions_response = await http_client.get(versions_url)
             logger.debug(f'Versions API response code: {versions_response.status_code}')
 
             if versions_response.status_code == 200:
@@ -111,8 +112,17 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
                     owner, repo = github_parts.groups()
                     logger.info(f'Extracted GitHub repo: {owner}/{repo}')
 
-                    # Get version details from GitHub
-                    github_version_info = await get_github_release_details(owner, repo)
+                    # Release details, variables.tf and the README are independent lookups,
+                    # so issue them concurrently instead of one after another
+                    lookups = [
+                        get_github_release_details(owner, repo),
+                        get_variables_tf(owner, repo, 'main'),
+                    ]
+                    if not readme_content:
+                        lookups.append(get_github_readme(owner, repo))
+                    results = await asyncio.gather(*lookups)
+                    github_version_info, (variables_content, variables) = results[0], results[1]
+
                     version_details = github_version_info['details']
                     version_from_github = github_version_info['version']
 
@@ -120,8 +130,6 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
                         logger.info(f'Found version from GitHub: {version_from_github}')
                         details['latest_version'] = version_from_github
 
-                    # Get variables.tf content and parsed variables
-                    variables_content, variables = await get_variables_tf(owner, repo, 'main')
                     if variables_content and variables:
                         logger.info(f'Found variables.tf with {len(variables)} variables')
                         details['variables_content'] = variables_content
@@ -144,22 +152,8 @@ async def get_module_details(namespace: str, name: str, provider: str = 'aws') -
                             f'APPROACH 2: Fetching README from GitHub source: {source_url}'
                         )
 
-                        # Convert HTTPS URL to raw content URL
                         try:
-                            # Try main branch first, then fall back to master if needed
-                            found_readme_branch = None
-                            for branch in ['main', 'master']:
-                                raw_readme_url = f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md'
-                                logger.debug(f'Trying to fetch README from: {raw_readme_url}')
-
-                                readme_response = requests.get(raw_readme_url)
-                                if readme_response.status_code == 200:
-                                    readme_content = readme_response.text
-                                    found_readme_branch = branch
-                                    logger.info(
-                                        f'Successfully fetched README from GitHub ({branch}): {len(readme_content)} chars'
-                                    )
-                                    break
+                            readme_content, found_readme_branch = results[2]
 
                             # Look for submodules now that we have identified the main branch
                             if found_readme_branch:
@@ -253,7 +247,7 @@ async def get_specific_module_info(module_info: Dict[str, str]) -> Optional[Modu
     try:
         # First, check if the module exists
         details_url = f'https://registry.terraform.io/v1/modules/{namespace}/{name}/{provider}'
-        response = requests.get(details_url)
+        response = await http_client.get(details_url)
 
         if response.status_code != 200:
             logger.warning(
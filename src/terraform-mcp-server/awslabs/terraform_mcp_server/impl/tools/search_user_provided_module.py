@@ -10,12 +10,14 @@
 # and limitations under the License.
 """Implementation of user provided module from the Terraform registry search tool."""
 
+import asyncio
 import re
-import requests
 import traceback
+from awslabs.terraform_mcp_server.impl.tools.http_client import http_client
 from awslabs.terraform_mcp_server.impl.tools.utils import (
     clean_description,
     extract_outputs_from_readme,
+    get_github_readme,
     get_github_release_details,
     get_variables_tf,
 )
@@ -225,7 +227,7 @@ async def get_module_details(
 
         logger.debug(f'Making API request to: {details_url}')
 
-        response = requests.get(details_url)
+        response = await http_client.get(details_url)
         response.raise_for_status()
 
         details = response.json()
@@ -263,8 +265,20 @@ async def get_module_details(
                     owner, repo = github_parts.groups()
                     logger.info(f'Extracted GitHub repo: {owner}/{repo}')
 
-                    # Get version details from GitHub
-                    github_version_info = await get_github_release_details(owner, repo)
+                    # Release details, variables.tf and the README are independent lookups,
+                    # so issue them concurrently instead of one after another
+                    lookups = [
+                        get_github_release_details(owner, repo),
+                        get_variables_tf(owner, repo, 'main'),
+                    ]
+                    if not readme_content:
+                        logger.debug(f'Fetching README from GitHub source: {source_url}')
+                        lookups.append(get_github_readme(owner, repo))
+                    results = await asyncio.gather(*lookups)
+                    github_version_info, (variables_content, variables) = results[0], results[1]
+                    if not readme_content:
+                        readme_content, _ = results[2]
+
                     version_details = github_version_info['details']
                     version_from_github = github_version_info['version']
 
@@ -273,8 +287,6 @@ async def get_module_details(
                         if not module_version:
                             module_version = version_from_github
 
-                    # Get variables.tf content and parsed variables
-                    variables_content, variables = await get_variables_tf(owner, repo, 'main')
                     if variables_content and variables:
                         logger.info(f'Found variables.tf with {len(variables)} variables')
                         details['variables_content'] = variables_content
@@ -291,23 +303,6 @@ async def get_module_details(
                             details['variables_content'] = variables_content
                             details['variables'] = [var.dict() for var in variables]
 
-                    # If README content not already found, try fetching it from GitHub
-                    if not readme_content:
-                        logger.debug(f'Fetching README from GitHub source: {source_url}')
-
-                        # Try main branch first, then fall back to master if needed
-                        for branch in ['main', 'master']:
-                            raw_readme_url = f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md'
-                            logger.debug(f'Trying to fetch README from: {raw_readme_url}')
-
-                            readme_response = requests.get(raw_readme_url)
-                            if readme_response.status_code == 200:
-                                readme_content = readme_response.text
-                                logger.info(
-                                    f'Successfully fetched README from GitHub ({branch}): {len(readme_content)} chars'
-                                )
-                                break
-
         # Add readme_content to details if available
         if readme_content:
             logger.info(f'Successfully extracted README content ({len(readme_content)} chars)')
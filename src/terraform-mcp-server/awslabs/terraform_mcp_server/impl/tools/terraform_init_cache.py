@@ -0,0 +1,224 @@
+"""Shared provider plugin cache and init state tracking for Terraform working directories.
+
+Every working directory initialized through the server shares one ``TF_PLUGIN_CACHE_DIR``,
+so a provider is downloaded once and then linked into each ``.terraform`` directory. The
+cache is only used for providers whose checksums are recorded in ``.terraform.lock.hcl``,
+which is Terraform's default since 1.4 and keeps the lock file authoritative.
+
+After a successful ``init`` a fingerprint of the inputs that ``init`` depends on (the
+configuration files, the lock file and the installed module manifest) is stored in the
+``.terraform`` directory. When the fingerprint still matches, a later ``init`` can be skipped.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from loguru import logger
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Shared provider plugin cache, overridable through the environment
+PLUGIN_CACHE_DIR = Path(
+    os.environ.get(
+        'TERRAFORM_MCP_PLUGIN_CACHE_DIR',
+        os.environ.get(
+            'TF_PLUGIN_CACHE_DIR',
+            Path.home() / '.cache' / 'awslabs-terraform-mcp-server' / 'plugin-cache',
+        ),
+    )
+)
+
+# File inside .terraform recording the fingerprint of the last successful init
+INIT_STATE_FILE = 'awslabs-mcp-init-state.json'
+
+# Configuration files of a working directory, hashed whole since provider requirements,
+# module calls and backend settings can be written in many equivalent ways
+CONFIGURATION_PATTERNS = ('*.tf', '*.tf.json')
+
+# Files recording the dependencies that init selected and installed
+INIT_OUTPUT_FILES = ('.terraform.lock.hcl', '.terraform/modules/modules.json')
+
+# File in the plugin cache recording how long each provider took to download
+DOWNLOAD_TIMES_FILE = 'awslabs-mcp-download-times.json'
+
+# Terraform reports providers linked from the plugin cache and downloaded ones differently
+PLUGIN_CACHE_HIT_PATTERN = re.compile(r'Using (\S+) v(\S+) from the shared cache directory')
+PROVIDER_INSTALLED_PATTERN = re.compile(r'Installed (\S+) v(\S+)')
+
+# The plugin cache is not safe for concurrent writers, so init runs are serialized
+_PLUGIN_CACHE_LOCK: Optional[asyncio.Lock] = None
+
+
+def configure_plugin_cache(env: Dict[str, str]) -> bool:
+    """Point Terraform at the shared plugin cache, unless the caller configured one.
+
+    Args:
+        env: Environment of the Terraform process, updated in place
+
+    Returns:
+        Whether the process uses the shared plugin cache, and must hold
+        ``plugin_cache_lock`` while it may write to it
+    """
+    if env.get('TF_PLUGIN_CACHE_DIR'):
+        return False
+    try:
+        PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f'Not using the shared plugin cache at {PLUGIN_CACHE_DIR}: {e}')
+        return False
+    env['TF_PLUGIN_CACHE_DIR'] = str(PLUGIN_CACHE_DIR)
+    return True
+
+
+def plugin_cache_lock() -> asyncio.Lock:
+    """Return the lock serializing init runs that write to the shared plugin cache."""
+    global _PLUGIN_CACHE_LOCK
+    if _PLUGIN_CACHE_LOCK is None:
+        _PLUGIN_CACHE_LOCK = asyncio.Lock()
+    return _PLUGIN_CACHE_LOCK
+
+
+def compute_init_fingerprint(working_directory: str) -> str:
+    """Hash the inputs of ``terraform init`` in a working directory.
+
+    The fingerprint covers the full content of every ``.tf`` and ``.tf.json`` file in the
+    directory, the dependency lock file and the manifest of installed modules, so any edit
+    to a provider requirement, module call or backend block invalidates it.
+
+    Args:
+        working_directory: Terraform working directory
+
+    Returns:
+        Hex digest of the init inputs
+    """
+    digest = hashlib.sha256()
+    directory = Path(working_directory)
+
+    for name in INIT_OUTPUT_FILES:
+        path = directory / name
+        digest.update(f'\0{name}\0'.encode())
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b'<missing>')
+
+    tf_files = sorted(
+        {path for pattern in CONFIGURATION_PATTERNS for path in directory.glob(pattern)}
+    )
+    for tf_file in tf_files:
+        try:
+            content = tf_file.read_bytes()
+        except OSError:
+            continue
+        digest.update(f'\0{tf_file.name}\0'.encode())
+        digest.update(content)
+
+    return digest.hexdigest()
+
+
+def _state_path(working_directory: str) -> Path:
+    """Return the init state file of a working directory."""
+    return Path(working_directory) / '.terraform' / INIT_STATE_FILE
+
+
+def check_init_state(working_directory: str) -> Tuple[bool, Optional[float]]:
+    """Check whether the last successful init of a working directory is still current.
+
+    Args:
+        working_directory: Terraform working directory
+
+    Returns:
+        Tuple of (whether init can be skipped, duration of the last init in seconds)
+    """
+    try:
+        state = json.loads(_state_path(working_directory).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False, None
+
+    last_duration = state.get('init_seconds')
+    if not (Path(working_directory) / '.terraform' / 'providers').is_dir():
+        return False, last_duration
+    if state.get('fingerprint') != compute_init_fingerprint(working_directory):
+        return False, last_duration
+    return True, last_duration
+
+
+def record_init_state(working_directory: str, duration: float) -> None:
+    """Record a successful init so that an unchanged directory can skip the next one.
+
+    Args:
+        working_directory: Terraform working directory
+        duration: Duration of the init in seconds
+    """
+    path = _state_path(working_directory)
+    state = {
+        'fingerprint': compute_init_fingerprint(working_directory),
+        'init_seconds': round(float(duration), 2),
+        'recorded_at': time.time(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(state), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f'Failed to record init state in {path}: {e}')
+
+
+def parse_plugin_cache_hits(output: str) -> List[str]:
+    """Return the providers that init linked from the shared plugin cache.
+
+    Args:
+        output: Standard output of ``terraform init``
+
+    Returns:
+        List of 'namespace/name vX.Y.Z' strings
+    """
+    return [f'{name} v{version}' for name, version in PLUGIN_CACHE_HIT_PATTERN.findall(output)]
+
+
+def record_provider_downloads(output: str, duration: float) -> None:
+    """Record the download time of the providers an init had to fetch.
+
+    The init duration is split evenly across the providers it downloaded. The recorded
+    times are used to estimate the time saved when the cache serves those providers later.
+
+    Args:
+        output: Standard output of ``terraform init``
+        duration: Duration of the init in seconds
+    """
+    installed = [
+        f'{name} v{version}' for name, version in PROVIDER_INSTALLED_PATTERN.findall(output)
+    ]
+    if not installed:
+        return
+    path = PLUGIN_CACHE_DIR / DOWNLOAD_TIMES_FILE
+    try:
+        download_times = json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+        for provider in installed:
+            download_times[provider] = round(float(duration) / len(installed), 2)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(download_times), encoding='utf-8')
+    except (OSError, ValueError) as e:
+        logger.warning(f'Failed to record provider download times in {path}: {e}')
+
+
+def estimate_cache_savings(cache_hits: List[str]) -> Optional[float]:
+    """Estimate the time saved by linking providers from the plugin cache.
+
+    Args:
+        cache_hits: Providers reported by ``parse_plugin_cache_hits``
+
+    Returns:
+        Estimated seconds saved, or None when no download time is known for any provider
+    """
+    try:
+        download_times = json.loads(
+            (PLUGIN_CACHE_DIR / DOWNLOAD_TIMES_FILE).read_text(encoding='utf-8')
+        )
+    except (OSError, ValueError):
+        return None
+    known = [download_times[provider] for provider in cache_hits if provider in download_times]
+    return round(sum(known), 2) if known else None
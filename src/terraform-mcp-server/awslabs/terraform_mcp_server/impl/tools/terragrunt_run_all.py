@@ -0,0 +1,432 @@
+"""Native, dependency-aware execution of a Terragrunt command across all units of a tree.
+
+Instead of passing ``run-all`` through to the CLI, units (directories containing a
+``terragrunt.hcl``) are discovered below the working directory and their ``dependency`` and
+``dependencies`` blocks are read to build a dependency graph. Each unit runs as its own
+``terragrunt`` process as soon as everything it depends on has succeeded, with at most a
+configurable number of units running at once. ``destroy`` walks the graph in reverse. A unit
+whose dependency failed is skipped, and every unit reports its own status, timing and output.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from awslabs.terraform_mcp_server.impl.tools.command_runner import (
+    CommandTimeoutError,
+    run_command,
+    workspace_lock,
+)
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import plugin_cache_lock
+from awslabs.terraform_mcp_server.models import (
+    TerragruntExecutionRequest,
+    TerragruntExecutionResult,
+    TerragruntUnitResult,
+)
+from loguru import logger
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+
+# File marking a directory as a Terragrunt unit
+UNIT_CONFIG_FILE = 'terragrunt.hcl'
+
+# Directories never searched for units
+IGNORED_DIRS = {'.terragrunt-cache', '.terraform', '.git', 'node_modules'}
+
+# Dependency declarations in a unit configuration
+DEPENDENCY_CONFIG_PATH_PATTERN = re.compile(r'config_path\s*=\s*"([^"]+)"')
+DEPENDENCIES_BLOCK_PATTERN = re.compile(r'dependencies\s*\{[^}]*?paths\s*=\s*\[([^\]]*)\]', re.S)
+QUOTED_STRING_PATTERN = re.compile(r'"([^"]+)"')
+
+# Commands that read the outputs of each unit after it succeeded
+OUTPUT_COMMANDS = ('apply', 'output')
+
+# Maximum characters of output kept per stream of each unit; the full output is streamed
+MAX_UNIT_OUTPUT_CHARS = 20_000
+
+# Disables the automatic init Terragrunt runs before a command (old and new variable names)
+NO_AUTO_INIT_ENV = {'TERRAGRUNT_NO_AUTO_INIT': 'true', 'TG_NO_AUTO_INIT': 'true'}
+
+
+def discover_units(root: str) -> List[str]:
+    """Find every Terragrunt unit below a directory.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted absolute paths of the unit directories
+    """
+    units = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = [name for name in subdirectories if name not in IGNORED_DIRS]
+        if UNIT_CONFIG_FILE in files:
+            units.append(os.path.normpath(directory))
+    return sorted(units)
+
+
+def parse_unit_dependencies(unit: str) -> List[str]:
+    """Read the units a unit depends on from its ``dependency`` and ``dependencies`` blocks.
+
+    Only literal paths, optionally prefixed with ``get_terragrunt_dir()``, are understood.
+
+    Args:
+        unit: Absolute path of the unit directory
+
+    Returns:
+        Absolute paths of the units it depends on
+    """
+    with open(os.path.join(unit, UNIT_CONFIG_FILE), 'r', encoding='utf-8') as f:
+        config = f.read()
+
+    paths = DEPENDENCY_CONFIG_PATH_PATTERN.findall(config)
+    for block in DEPENDENCIES_BLOCK_PATTERN.findall(config):
+        paths.extend(QUOTED_STRING_PATTERN.findall(block))
+
+    dependencies = []
+    for path in paths:
+        path = path.replace('${get_terragrunt_dir()}', unit)
+        if '${' in path:
+            logger.warning(f'Ignoring dependency of {unit} with an unsupported expression: {path}')
+            continue
+        dependencies.append(os.path.normpath(os.path.join(unit, path)))
+    return dependencies
+
+
+def build_dependency_graph(units: List[str]) -> Dict[str, Set[str]]:
+    """Build the dependency graph between units.
+
+    Dependencies on directories that are not part of the run are ignored, so that a subset
+    of a tree selected with include or exclude filters can still be run.
+
+    Args:
+        units: Absolute paths of the units to run
+
+    Returns:
+        Mapping of each unit to the units it depends on
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    unit_set = set(units)
+    graph = {}
+    for unit in units:
+        dependencies = set()
+        for dependency in parse_unit_dependencies(unit):
+            if dependency in unit_set:
+                dependencies.add(dependency)
+            else:
+                logger.debug(f'{unit} depends on {dependency}, which is not part of the run')
+        graph[unit] = dependencies
+
+    # Kahn's algorithm; whatever cannot be ordered is part of a cycle
+    remaining = {unit: len(dependencies) for unit, dependencies in graph.items()}
+    dependents = _dependents(graph)
+    ready = [unit for unit, count in remaining.items() if count == 0]
+    while ready:
+        unit = ready.pop()
+        del remaining[unit]
+        for dependent in dependents[unit]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if remaining:
+        raise ValueError(f'Dependency cycle between units: {", ".join(sorted(remaining))}')
+
+    return graph
+
+
+def _dependents(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Invert a dependency graph."""
+    dependents: Dict[str, Set[str]] = {unit: set() for unit in graph}
+    for unit, dependencies in graph.items():
+        for dependency in dependencies:
+            dependents[dependency].add(unit)
+    return dependents
+
+
+async def schedule_units(
+    graph: Dict[str, Set[str]],
+    run_unit: Callable[[str], Awaitable[TerragruntUnitResult]],
+    max_parallel_units: int,
+    reverse: bool = False,
+) -> Dict[str, TerragruntUnitResult]:
+    """Run units in dependency order on a bounded pool of workers.
+
+    A unit starts as soon as all the units it waits for have succeeded. When one of them
+    fails or is skipped, the unit and everything waiting for it is skipped.
+
+    Args:
+        graph: Mapping of each unit to the units it depends on
+        run_unit: Coroutine function running one unit
+        max_parallel_units: Maximum number of units running at once
+        reverse: Run dependents before their dependencies (for destroy)
+
+    Returns:
+        Result of every unit, keyed by unit path
+    """
+    waits_for = _dependents(graph) if reverse else graph
+    unblocks = graph if reverse else _dependents(graph)
+    remaining = {unit: len(waits_for[unit]) for unit in graph}
+    results: Dict[str, TerragruntUnitResult] = {}
+    ready = sorted(unit for unit, count in remaining.items() if count == 0)
+    running: Dict[asyncio.Task, str] = {}
+
+    def skip(unit: str, reason: str) -> None:
+        if unit in results:
+            return
+        results[unit] = TerragruntUnitResult(
+            path=unit,
+            status='skipped',
+            dependencies=sorted(graph[unit]),
+            error_message=reason,
+        )
+        for blocked in unblocks[unit]:
+            skip(blocked, f'Skipped because {unit} did not succeed')
+
+    try:
+        while ready or running:
+            while ready and len(running) < max_parallel_units:
+                unit = ready.pop(0)
+                if unit not in results:
+                    running[asyncio.create_task(run_unit(unit))] = unit
+
+            if not running:
+                continue
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                unit = running.pop(task)
+                results[unit] = task.result()
+                for blocked in sorted(unblocks[unit]):
+                    if results[unit].status != 'success':
+                        skip(blocked, f'Skipped because {unit} did not succeed')
+                        continue
+                    remaining[blocked] -= 1
+                    if remaining[blocked] == 0 and blocked not in results:
+                        ready.append(blocked)
+    finally:
+        for task in running:
+            task.cancel()
+
+    return results
+
+
+def parse_outputs(output_json: str) -> Dict[str, Any]:
+    """Flatten the ``output -json`` structure into a mapping of output names to values.
+
+    Args:
+        output_json: Standard output of ``terragrunt output -json``
+
+    Returns:
+        Dictionary of output values
+    """
+    outputs = {}
+    for key, value in json.loads(output_json).items():
+        # Outputs in JSON format have a nested structure with 'value', 'type' and 'sensitive'
+        if isinstance(value, dict) and 'value' in value:
+            outputs[key] = value['value']
+        else:
+            outputs[key] = value
+    return outputs
+
+
+def select_units(
+    root: str, include_dirs: Optional[List[str]], exclude_dirs: Optional[List[str]]
+) -> List[str]:
+    """Discover the units below a directory and apply include and exclude filters.
+
+    Args:
+        root: Directory to search
+        include_dirs: Optional directories whose units are run, relative to the root
+        exclude_dirs: Optional directories whose units are not run, relative to the root
+
+    Returns:
+        Absolute paths of the selected units
+    """
+
+    def resolve(paths: Optional[List[str]]) -> List[str]:
+        return [os.path.normpath(os.path.join(root, path)) for path in paths or []]
+
+    def within(unit: str, directories: List[str]) -> bool:
+        return any(unit == d or unit.startswith(d.rstrip(os.sep) + os.sep) for d in directories)
+
+    included = resolve(include_dirs)
+    excluded = resolve(exclude_dirs)
+    return [
+        unit
+        for unit in discover_units(root)
+        if (not included or within(unit, included)) and not within(unit, excluded)
+    ]
+
+
+async def execute_terragrunt_run_all(
+    request: TerragruntExecutionRequest,
+    command_args: List[str],
+    env: Dict[str, str],
+    ctx: Any = None,
+    output_filter: Optional[Callable[[str], str]] = None,
+    shared_plugin_cache: bool = False,
+) -> TerragruntExecutionResult:
+    """Run a Terragrunt command in every unit below the working directory.
+
+    The shared plugin cache does not support concurrent writers, so with it every unit first
+    runs ``init`` while holding ``plugin_cache_lock`` and then runs the command itself with
+    the automatic init disabled. Only the inits are serialized; the commands run in parallel.
+
+    Args:
+        request: Details about the Terragrunt command to execute
+        command_args: Arguments passed to ``terragrunt`` in each unit
+        env: Environment of the processes
+        ctx: Optional MCP context used to stream unit output
+        output_filter: Optional function cleaning output text
+        shared_plugin_cache: Whether the processes use the shared plugin cache
+
+    Returns:
+        A TerragruntExecutionResult with one TerragruntUnitResult per unit
+    """
+    root = os.path.abspath(request.working_directory)
+    command = f'terragrunt {request.command}'
+    start_time = time.time()
+
+    try:
+        units = select_units(root, request.include_dirs, request.exclude_dirs)
+        graph = build_dependency_graph(units)
+    except (OSError, ValueError) as e:
+        logger.error(f'Failed to build the unit dependency graph: {e}')
+        return TerragruntExecutionResult(
+            command=command,
+            status='error',
+            error_message=str(e),
+            working_directory=request.working_directory,
+        )
+
+    if not units:
+        return TerragruntExecutionResult(
+            command=command,
+            status='error',
+            error_message=f'No {UNIT_CONFIG_FILE} files found in {request.working_directory}',
+            working_directory=request.working_directory,
+        )
+
+    logger.info(
+        f"Running '{command}' in {len(units)} units with up to "
+        f'{request.max_parallel_units} in parallel'
+    )
+
+    def clean(text: str) -> str:
+        return output_filter(text) if output_filter and text else text
+
+    async def run_unit(unit: str) -> TerragruntUnitResult:
+        name = os.path.relpath(unit, root)
+        unit_start = time.time()
+
+        def prefix_lines(text: str) -> str:
+            return '\n'.join(f'[{name}] {line}' for line in clean(text).split('\n'))
+
+        async def run(args: List[str], unit_env: Dict[str, str]):
+            return await run_command(
+                ['terragrunt', *args],
+                cwd=unit,
+                env=unit_env,
+                ctx=ctx,
+                timeout=request.timeout,
+                output_filter=prefix_lines,
+                max_output_chars=MAX_UNIT_OUTPUT_CHARS,
+            )
+
+        async with workspace_lock(unit):
+            try:
+                if not shared_plugin_cache:
+                    process = await run(command_args, env)
+                elif request.command == 'init':
+                    async with plugin_cache_lock():
+                        process = await run(command_args, env)
+                else:
+                    async with plugin_cache_lock():
+                        process = await run(['init', '-input=false'], env)
+                    if process.returncode == 0:
+                        process = await run(command_args, {**env, **NO_AUTO_INIT_ENV})
+            except CommandTimeoutError as e:
+                return TerragruntUnitResult(
+                    path=name,
+                    status='error',
+                    duration_seconds=round(time.time() - unit_start, 2),
+                    stdout=clean(e.stdout),
+                    stderr=clean(e.stderr),
+                    dependencies=[os.path.relpath(d, root) for d in sorted(graph[unit])],
+                    error_message=str(e),
+                )
+            except Exception as e:
+                return TerragruntUnitResult(
+                    path=name,
+                    status='error',
+                    duration_seconds=round(time.time() - unit_start, 2),
+                    dependencies=[os.path.relpath(d, root) for d in sorted(graph[unit])],
+                    error_message=str(e),
+                )
+
+            outputs = None
+            if process.returncode == 0 and request.command in OUTPUT_COMMANDS:
+                try:
+                    output_process = await run_command(
+                        ['terragrunt', 'output', '-json'],
+                        cwd=unit,
+                        env=env,
+                        max_output_chars=None,
+                    )
+                    if output_process.returncode == 0 and output_process.stdout:
+                        outputs = parse_outputs(clean(output_process.stdout))
+                except Exception as e:
+                    logger.warning(f'Failed to get Terragrunt outputs of {name}: {e}')
+
+        return TerragruntUnitResult(
+            path=name,
+            status='success' if process.returncode == 0 else 'error',
+            return_code=process.returncode,
+            duration_seconds=round(time.time() - unit_start, 2),
+            stdout=clean(process.stdout),
+            stderr=clean(process.stderr or ''),
+            outputs=outputs,
+            dependencies=[os.path.relpath(d, root) for d in sorted(graph[unit])],
+        )
+
+    results = await schedule_units(
+        graph,
+        run_unit,
+        max_parallel_units=request.max_parallel_units,
+        reverse=request.command == 'destroy',
+    )
+
+    # Units skipped by the scheduler are keyed by absolute path; report them relative to the root
+    unit_results = []
+    for unit in units:
+        result = results[unit]
+        if result.status == 'skipped':
+            result.path = os.path.relpath(unit, root)
+            result.dependencies = [os.path.relpath(d, root) for d in result.dependencies]
+            result.error_message = result.error_message.replace(root + os.sep, '')
+        unit_results.append(result)
+
+    failed = [result.path for result in unit_results if result.status != 'success']
+    duration = time.time() - start_time
+    summary = '\n'.join(
+        f'{result.path}: {result.status}'
+        + (f' ({result.duration_seconds:.1f}s)' if result.duration_seconds is not None else '')
+        for result in unit_results
+    )
+    logger.info(
+        f"'{command}' finished in {duration:.2f} seconds: "
+        f'{len(units) - len(failed)} of {len(units)} units succeeded'
+    )
+
+    return TerragruntExecutionResult(
+        command=command,
+        status='error' if failed else 'success',
+        return_code=1 if failed else 0,
+        stdout=summary,
+        working_directory=request.working_directory,
+        error_message=f'{len(failed)} of {len(units)} units did not succeed' if failed else None,
+        affected_dirs=[result.path for result in unit_results],
+        unit_results=unit_results,
+    )
@@ -2,12 +2,12 @@
 
 import asyncio
 import re
-import requests
 import time
 import traceback
+from .http_client import http_client
 from awslabs.terraform_mcp_server.models import SubmoduleInfo, TerraformVariable
 from loguru import logger
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 def clean_description(description: str) -> str:
@@ -58,7 +58,7 @@ async def get_github_release_details(owner: str, repo: str) -> Dict[str, Any]:
     logger.debug(f'Making request to GitHub releases API: {release_url}')
 
     try:
-        response = requests.get(release_url)
+        response = await http_client.get(release_url)
         logger.debug(f'GitHub releases API response code: {response.status_code}')
 
         if response.status_code == 200:
@@ -88,7 +88,7 @@ async def get_github_release_details(owner: str, repo: str) -> Dict[str, Any]:
     logger.debug(f'No releases found, trying tags: {tags_url}')
 
     try:
-        response = requests.get(tags_url)
+        response = await http_client.get(tags_url)
         logger.debug(f'GitHub tags API response code: {response.status_code}')
 
         if response.status_code == 200 and response.json():
@@ -131,7 +131,6 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
         List of SubmoduleInfo objects
     """
     logger.info(f'Checking for submodules in {owner}/{repo} ({branch} branch)')
-    submodules = []
 
     # Check if modules directory exists
     modules_url = f'https://api.github.com/repos/{owner}/{repo}/contents/modules?ref={branch}'
@@ -140,7 +139,7 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
     try:
         # Get list of directories in /modules
         start_time = time.time()
-        response = requests.get(
+        response = await http_client.get(
             modules_url,
             headers={'Accept': 'application/vnd.github.v3+json'},
             timeout=3.0,  # Add timeout
@@ -174,78 +173,13 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
         max_submodules = min(len(submodule_dirs), 5)
         logger.info(f'Processing {max_submodules} out of {len(submodule_dirs)} submodules')
 
-        # Process each submodule
-        for i, submodule in enumerate(submodule_dirs[:max_submodules]):
-            name = submodule.get('name')
-            path = submodule.get('path', f'modules/{name}')
-
-            # Create basic submodule info
-            submodule_info = SubmoduleInfo(
-                name=name,
-                path=path,
-            )
-
-            # Add a slight delay between API requests to avoid rate limiting
-            if i > 0:
-                await asyncio.sleep(0.2)  # 200ms delay between requests
-
-            # Try to get README content
-            readme_url = (
-                f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}/README.md'
-            )
-            logger.debug(f'Fetching README for submodule {name}: {readme_url}')
-
-            try:
-                start_time = time.time()
-                readme_response = requests.get(readme_url, timeout=2.0)  # Add timeout
-                logger.debug(f'README fetch took {time.time() - start_time:.2f} seconds')
-
-                if readme_response.status_code == 200:
-                    readme_content = readme_response.text
-                    # Truncate if too long
-                    if len(readme_content) > 8000:
-                        readme_content = (
-                            readme_content[:8000] + '...\n[README truncated due to length]'
-                        )
-
-                    # Extract description from first paragraph if available
-                    description = extract_description_from_readme(readme_content)
-                    if description:
-                        submodule_info.description = description
-
-                    submodule_info.readme_content = readme_content
-                    logger.debug(
-                        f'Found README for submodule {name} ({len(readme_content)} chars)'
-                    )
-                else:
-                    logger.debug(
-                        f'No README found for submodule {name}, status: {readme_response.status_code}'
-                    )
-                    # Try lowercase readme.md as fallback
-                    lowercase_readme_url = f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}/readme.md'
-                    logger.debug(f'Trying lowercase readme.md: {lowercase_readme_url}')
-
-                    lowercase_response = requests.get(lowercase_readme_url, timeout=2.0)
-                    if lowercase_response.status_code == 200:
-                        readme_content = lowercase_response.text
-                        if len(readme_content) > 8000:
-                            readme_content = (
-                                readme_content[:8000] + '...\n[README truncated due to length]'
-                            )
-
-                        description = extract_description_from_readme(readme_content)
-                        if description:
-                            submodule_info.description = description
-
-                        submodule_info.readme_content = readme_content
-                        logger.debug(
-                            f'Found lowercase readme.md for {name} ({len(readme_content)} chars)'
-                        )
-            except Exception as ex:
-                logger.error(f'Error fetching README for submodule {name}: {ex}')
-
-            # Add the submodule to our result list
-            submodules.append(submodule_info)
+        # Fetch submodule READMEs concurrently; the shared client enforces per-host limits
+        submodules: List[SubmoduleInfo] = await asyncio.gather(
+            *[
+                _get_submodule_info(owner, repo, branch, submodule)
+                for submodule in submodule_dirs[:max_submodules]
+            ]
+        )
 
         if len(submodule_dirs) > max_submodules:
             logger.warning(
@@ -260,6 +194,105 @@ async def get_submodules(owner: str, repo: str, branch: str = 'master') -> List[
         return []
 
 
+async def _get_submodule_info(
+    owner: str, repo: str, branch: str, submodule: Dict[str, Any]
+) -> SubmoduleInfo:
+    """Build the SubmoduleInfo for a submodule directory, including its README if present.
+
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        branch: Branch name
+        submodule: Directory entry from the GitHub contents API
+
+    Returns:
+        SubmoduleInfo object
+    """
+    name = submodule.get('name')
+    path = submodule.get('path', f'modules/{name}')
+
+    # Create basic submodule info
+    submodule_info = SubmoduleInfo(
+        name=name,
+        path=path,
+    )
+
+    # Try README.md first, then lowercase readme.md as fallback
+    for readme_file in ['README.md', 'readme.md']:
+        readme_url = (
+            f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}/{readme_file}'
+        )
+        logger.debug(f'Fetching {readme_file} for submodule {name}: {readme_url}')
+
+        try:
+            readme_response = await http_client.get(readme_url, timeout=2.0)
+        except Exception as ex:
+            logger.error(f'Error fetching README for submodule {name}: {ex}')
+            break
+
+        if readme_response.status_code != 200:
+            logger.debug(
+                f'No {readme_file} found for submodule {name}, status: {readme_response.status_code}'
+            )
+            continue
+
+        readme_content = readme_response.text
+        # Truncate if too long
+        if len(readme_content) > 8000:
+            readme_content = readme_content[:8000] + '...\n[README truncated due to length]'
+
+        # Extract description from first paragraph if available
+        description = extract_description_from_readme(readme_content)
+        if description:
+            submodule_info.description = description
+
+        submodule_info.readme_content = readme_content
+        logger.debug(f'Found {readme_file} for submodule {name} ({len(readme_content)} chars)')
+        break
+
+    return submodule_info
+
+
+async def get_github_readme(
+    owner: str, repo: str, branches: Sequence[str] = ('main', 'master')
+) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch the root README.md of a GitHub repository, trying several branches at once.
+
+    All candidate branches are requested concurrently and the first branch (in the given
+    order) that has a README wins, so the lookup costs a single round trip.
+
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        branches: Candidate branch names in order of preference
+
+    Returns:
+        Tuple containing the README content and the branch it was found on, or (None, None)
+    """
+    urls = [
+        f'https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md'
+        for branch in branches
+    ]
+    for url in urls:
+        logger.debug(f'Trying to fetch README from: {url}')
+
+    responses = await asyncio.gather(
+        *[http_client.get(url) for url in urls], return_exceptions=True
+    )
+
+    for branch, response in zip(branches, responses):
+        if isinstance(response, BaseException):
+            logger.debug(f'Error fetching README from {branch} branch: {response}')
+            continue
+        if response.status_code == 200:
+            logger.info(
+                f'Successfully fetched README from GitHub ({branch}): {len(response.text)} chars'
+            )
+            return response.text, branch
+
+    return None, None
+
+
 def extract_description_from_readme(readme_content: str) -> Optional[str]:
     """Extract a short description from the README content.
 
@@ -399,7 +432,7 @@ async def get_variables_tf(
 
     try:
         start_time = time.time()
-        response = requests.get(variables_url, timeout=3.0)
+        response = await http_client.get(variables_url, timeout=3.0)
         logger.debug(f'variables.tf fetch took {time.time() - start_time:.2f} seconds')
 
         if response.status_code == 200:
@@ -422,7 +455,7 @@ async def get_variables_tf(
                 master_variables_url = (
                     f'https://raw.githubusercontent.com/{owner}/{repo}/master/variables.tf'
                 )
-                master_response = requests.get(master_variables_url, timeout=3.0)
+                master_response = await http_client.get(master_variables_url, timeout=3.0)
 
                 if master_response.status_code == 200:
                     variables_content = master_response.text
@@ -2,11 +2,15 @@ from .models import (
     ModuleSearchResult,
     TerraformAWSProviderDocsResult,
     TerraformAWSCCProviderDocsResult,
+    ProviderResourceCatalogEntry,
+    ProviderResourceCatalogResult,
+    ProviderResourceCategory,
     SubmoduleInfo,
     TerraformExecutionRequest,
     TerraformExecutionResult,
     TerragruntExecutionRequest,
     TerragruntExecutionResult,
+    TerragruntUnitResult,
     CheckovVulnerability,
     CheckovScanRequest,
     CheckovScanResult,
@@ -20,11 +24,15 @@ __all__ = [
     'ModuleSearchResult',
     'TerraformAWSProviderDocsResult',
     'TerraformAWSCCProviderDocsResult',
+    'ProviderResourceCatalogEntry',
+    'ProviderResourceCatalogResult',
+    'ProviderResourceCategory',
     'SubmoduleInfo',
     'TerraformExecutionRequest',
     'TerraformExecutionResult',
     'TerragruntExecutionRequest',
     'TerragruntExecutionResult',
+    'TerragruntUnitResult',
     'CheckovVulnerability',
     'CheckovScanRequest',
     'CheckovScanResult',
@@ -11,6 +11,8 @@ class TerraformExecutionRequest(BaseModel):
         variables: Optional dictionary of Terraform variables to pass.
         aws_region: Optional AWS region to use.
         strip_ansi: Whether to strip ANSI color codes from command output.
+        timeout: Optional maximum run time of the command in seconds.
+        init_if_stale: Whether to skip init when its inputs are unchanged since the last init.
     """
 
     command: Literal['init', 'plan', 'validate', 'apply', 'destroy'] = Field(
@@ -20,6 +22,13 @@ class TerraformExecutionRequest(BaseModel):
     variables: Optional[Dict[str, str]] = Field(None, description='Terraform variables to pass')
     aws_region: Optional[str] = Field(None, description='AWS region to use')
     strip_ansi: bool = Field(True, description='Whether to strip ANSI color codes from output')
+    timeout: Optional[int] = Field(
+        None, description='Maximum run time of the command in seconds', gt=0
+    )
+    init_if_stale: bool = Field(
+        False,
+        description='Skip init when the configuration and lock file are unchanged since the last init',
+    )
 
 
 class SubmoduleInfo(BaseModel):
@@ -162,6 +171,64 @@ class TerraformAWSCCProviderDocsResult(TerraformProviderDocsResult):
     )
 
 
+class ProviderResourceCatalogEntry(BaseModel):
+    """Model representing one asset in a provider resource catalog.
+
+    Attributes:
+        name: Full name of the resource or data source (e.g. 'aws_s3_bucket').
+        category: Service category the asset is listed under.
+        service: Service segment of the asset name (e.g. 's3').
+        data_source: Whether the asset is a data source rather than a resource.
+        url: URL to the documentation of the asset.
+    """
+
+    name: str
+    category: str
+    service: str
+    data_source: bool
+    url: str
+
+
+class ProviderResourceCategory(BaseModel):
+    """Model summarizing one category of a provider resource catalog.
+
+    Attributes:
+        name: Name of the category.
+        resource_count: Number of resources in the category.
+        data_source_count: Number of data sources in the category.
+    """
+
+    name: str
+    resource_count: int
+    data_source_count: int
+
+
+class ProviderResourceCatalogResult(BaseModel):
+    """Result model for provider resource catalog queries.
+
+    Attributes:
+        status: Execution status (success/error).
+        provider: Provider whose catalog was queried (aws or awscc).
+        provider_version: Provider version the catalog was generated from.
+        total_matches: Number of assets matching the filters, before the limit is applied.
+        assets: Matching assets, up to the requested limit.
+        categories: Category summary, returned when no filter was given.
+        error_message: Optional error message if execution failed.
+    """
+
+    status: Literal['success', 'error']
+    provider: str
+    provider_version: Optional[str] = None
+    total_matches: int = 0
+    assets: List[ProviderResourceCatalogEntry] = Field(
+        [], description='Assets matching the filters'
+    )
+    categories: Optional[List[ProviderResourceCategory]] = Field(
+        None, description='Categories with their asset counts'
+    )
+    error_message: Optional[str] = Field(None, description='Error message if execution failed')
+
+
 class TerraformExecutionResult(BaseModel):
     """Result model for Terraform command execution.
 
@@ -174,6 +241,9 @@ class TerraformExecutionResult(BaseModel):
         working_directory: Directory where the command was executed.
         error_message: Optional error message if execution failed.
         outputs: Dictionary of output values from Terraform (for apply command).
+        init_skipped: Whether init was skipped because its inputs were unchanged.
+        time_saved_seconds: Time saved by skipping init or by reusing cached providers.
+        plugin_cache_hits: Providers linked from the shared plugin cache (for init command).
     """
 
     command: str
@@ -186,6 +256,13 @@ class TerraformExecutionResult(BaseModel):
     outputs: Optional[Dict[str, Any]] = Field(
         None, description='Terraform outputs (for apply command)'
     )
+    init_skipped: bool = Field(False, description='Whether init was skipped as up to date')
+    time_saved_seconds: Optional[float] = Field(
+        None, description='Estimated seconds saved by skipping init or reusing cached providers'
+    )
+    plugin_cache_hits: Optional[List[str]] = Field(
+        None, description='Providers linked from the shared plugin cache'
+    )
 
 
 class CheckovVulnerability(BaseModel):
@@ -225,6 +302,7 @@ class CheckovScanRequest(BaseModel):
         check_ids: Optional list of specific check IDs to run.
         skip_check_ids: Optional list of check IDs to skip.
         output_format: Format for the scan results output.
+        background: Whether to return a job id right away and run the scan in the background.
     """
 
     working_directory: str = Field(..., description='Directory containing Terraform files')
@@ -234,6 +312,9 @@ class CheckovScanRequest(BaseModel):
     check_ids: Optional[List[str]] = Field(None, description='Specific check IDs to run')
     skip_check_ids: Optional[List[str]] = Field(None, description='Check IDs to skip')
     output_format: str = Field('json', description='Output format (json, cli, etc.)')
+    background: bool = Field(
+        False, description='Run the scan in the background and return a job id to poll'
+    )
 
 
 class CheckovScanResult(BaseModel):
@@ -247,9 +328,12 @@ class CheckovScanResult(BaseModel):
         vulnerabilities: List of vulnerabilities found by the scan.
         summary: Summary of the scan results.
         raw_output: Raw output from the Checkov command.
+        job_id: Id of a background scan, used to poll for its result.
+        scanned_modules: Number of modules scanned by this run.
+        cached_modules: Number of unchanged modules whose findings came from the cache.
     """
 
-    status: Literal['success', 'error']
+    status: Literal['success', 'error', 'running']
     return_code: Optional[int] = None
     working_directory: str
     error_message: Optional[str] = None
@@ -258,6 +342,11 @@ class CheckovScanResult(BaseModel):
     )
     summary: Dict[str, Any] = Field({}, description='Summary of scan results')
     raw_output: Optional[str] = Field(None, description='Raw output from Checkov')
+    job_id: Optional[str] = Field(None, description='Id of a background scan to poll')
+    scanned_modules: Optional[int] = Field(None, description='Modules scanned by this run')
+    cached_modules: Optional[int] = Field(
+        None, description='Unchanged modules whose findings came from the cache'
+    )
 
 
 class SearchUserProvidedModuleRequest(BaseModel):
@@ -316,6 +405,9 @@ class TerragruntExecutionRequest(BaseModel):
         include_dirs: Optional list of directories to include in a multi-module run.
         exclude_dirs: Optional list of directories to exclude from a multi-module run.
         run_all: Whether to run the command in all subdirectories with terragrunt.hcl files.
+        terragrunt_config: Optional path to a custom terragrunt config file.
+        timeout: Optional maximum run time of the command in seconds (per unit with run_all).
+        max_parallel_units: Maximum number of units running at once with run_all.
     """
 
     command: Literal['init', 'plan', 'validate', 'apply', 'destroy', 'output', 'run-all'] = Field(
@@ -335,6 +427,38 @@ class TerragruntExecutionRequest(BaseModel):
     terragrunt_config: Optional[str] = Field(
         None, description='Path to a custom terragrunt config file (not valid with run-all)'
     )
+    timeout: Optional[int] = Field(
+        None, description='Maximum run time of the command in seconds', gt=0
+    )
+    max_parallel_units: int = Field(
+        4, description='Maximum number of units running at once with run_all', ge=1
+    )
+
+
+class TerragruntUnitResult(BaseModel):
+    """Result of a Terragrunt command in a single unit of a run_all execution.
+
+    Attributes:
+        path: Unit directory, relative to the working directory.
+        status: Execution status (success/error, or skipped when a dependency did not succeed).
+        return_code: The command's return code in this unit.
+        duration_seconds: Wall-clock duration of the command in this unit.
+        stdout: Standard output of the command in this unit.
+        stderr: Standard error output of the command in this unit.
+        outputs: Output values of the unit (for apply or output command).
+        dependencies: Units this unit depends on, relative to the working directory.
+        error_message: Optional error message if the unit failed or was skipped.
+    """
+
+    path: str
+    status: Literal['success', 'error', 'skipped']
+    return_code: Optional[int] = None
+    duration_seconds: Optional[float] = None
+    stdout: str = ''
+    stderr: str = ''
+    outputs: Optional[Dict[str, Any]] = None
+    dependencies: List[str] = Field(default_factory=list)
+    error_message: Optional[str] = None
 
 
 class TerragruntExecutionResult(BaseModel):
@@ -350,6 +474,7 @@ class TerragruntExecutionResult(BaseModel):
         error_message: Optional error message if execution failed.
         outputs: Dictionary of output values from Terragrunt (for apply command).
         affected_dirs: List of directories affected by a run-all command.
+        unit_results: Per-unit results of a run_all execution.
     """
 
     command: str
@@ -365,3 +490,6 @@ class TerragruntExecutionResult(BaseModel):
     affected_dirs: Optional[List[str]] = Field(
         None, description='Directories affected by a run-all command'
     )
+    unit_results: Optional[List[TerragruntUnitResult]] = Field(
+        None, description='Status, timing and outputs of each unit of a run_all execution'
+    )
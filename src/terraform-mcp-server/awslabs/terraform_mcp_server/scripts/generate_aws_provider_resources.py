@@ -4,7 +4,8 @@ This script scrapes the Terraform AWS provider documentation using Playwright
 and generates a comprehensive markdown file listing all AWS service categories,
 resources, and data sources.
 
-The generated markdown is saved to the static directory for use by the MCP server.
+The generated markdown is saved to the static directory for use by the MCP server, together
+with a structured JSON catalog of the same assets that backs the QueryProviderResourceCatalog tool.
 
 Usage:
   python generate_aws_provider_resources.py [--max-categories N] [--output PATH]
@@ -12,6 +13,7 @@ Usage:
 Options:
   --max-categories N    Limit to N categories (default: all)
   --output PATH         Output file path (default: terraform_mcp_server/static/AWS_PROVIDER_RESOURCES.md)
+  --catalog-output PATH Structured JSON catalog path (default: terraform_mcp_server/static/AWS_PROVIDER_RESOURCES.json)
   --no-fallback         Don't use fallback data if scraping fails
 """
 
@@ -43,6 +45,11 @@ script_dir = Path(__file__).resolve().parent
 repo_root = script_dir.parent.parent.parent
 sys.path.insert(0, str(repo_root))
 
+from awslabs.terraform_mcp_server.impl.tools.provider_resources_catalog import (  # noqa: E402
+    build_catalog,
+    write_catalog,
+)
+
 
 # Configure logger for enhanced diagnostics with stacktraces
 logger.configure(
@@ -64,6 +71,8 @@ NAVIGATION_TIMEOUT = 20000  # 20 seconds
 DEFAULT_OUTPUT_PATH = (
     repo_root / 'awslabs' / 'terraform_mcp_server' / 'static' / 'AWS_PROVIDER_RESOURCES.md'
 )
+# Default structured catalog path
+DEFAULT_CATALOG_OUTPUT_PATH = DEFAULT_OUTPUT_PATH.with_suffix('.json')
 # AWS provider URL
 AWS_PROVIDER_URL = 'https://registry.terraform.io/providers/hashicorp/aws/latest/docs'
 
@@ -1099,6 +1108,12 @@ def parse_arguments():
         default=DEFAULT_OUTPUT_PATH,
         help=f'Output file path (default: {DEFAULT_OUTPUT_PATH})',
     )
+    parser.add_argument(
+        '--catalog-output',
+        type=Path,
+        default=DEFAULT_CATALOG_OUTPUT_PATH,
+        help=f'Structured JSON catalog path (default: {DEFAULT_CATALOG_OUTPUT_PATH})',
+    )
     parser.add_argument(
         '--no-fallback',
         action='store_true',
@@ -1116,6 +1131,7 @@ async def main():
 
     print('Generating AWS provider resources markdown...')
     print(f'Output path: {args.output}')
+    print(f'Catalog output path: {args.catalog_output}')
     print(f'Max categories: {args.max_categories if args.max_categories < 999 else "all"}')
 
     # Set environment variable for max categories
@@ -1213,6 +1229,10 @@ async def main():
             f.write('\n'.join(markdown))
 
         print(f'Successfully generated markdown file at: {args.output}')
+
+        # Write the structured catalog of the same assets
+        write_catalog(build_catalog('aws', provider_version, categories), args.catalog_output)
+        print(f'Successfully generated catalog file at: {args.catalog_output}')
         print(f'Generation completed in {duration.total_seconds():.2f} seconds')
         return 0
 
@@ -0,0 +1,122 @@
+"""Script to sync a local mirror of the Terraform AWS and AWSCC provider documentation.
+
+This script downloads the provider documentation tree for a pinned provider version from
+GitHub, parses every resource and data source document once and stores the result in a
+compressed local index. When a mirror exists, the SearchAwsProviderDocs and
+SearchAwsccProviderDocs tools serve lookups from it instead of fetching from GitHub.
+
+Usage:
+  python -m awslabs.terraform_mcp_server.scripts.sync_provider_docs [--provider NAME] [--version X.Y.Z]
+
+Options:
+  --provider NAME       Provider to sync: aws, awscc or all (default: all)
+  --version X.Y.Z       Provider version to pin (default: latest release; only with a single provider)
+  --output-dir PATH     Mirror directory (default: $TERRAFORM_MCP_PROVIDER_DOCS_DIR or
+                        ~/.cache/awslabs-terraform-mcp-server/provider_docs)
+  --concurrency N       Maximum number of concurrent downloads (default: 16)
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+# Add the parent directory to sys.path so we can import from terraform_mcp_server
+script_dir = Path(__file__).resolve().parent
+repo_root = script_dir.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from awslabs.terraform_mcp_server.impl.tools import (  # noqa: E402
+    search_aws_provider_docs,
+    search_awscc_provider_docs,
+)
+from awslabs.terraform_mcp_server.impl.tools.provider_docs_mirror import (  # noqa: E402
+    PROVIDER_DOCS_MIRROR_DIR,
+    PROVIDER_DOCS_SOURCES,
+    sync_provider_docs,
+)
+from awslabs.terraform_mcp_server.impl.tools.utils import get_github_release_details  # noqa: E402
+
+
+PARSERS = {
+    'aws': search_aws_provider_docs.parse_markdown_documentation,
+    'awscc': search_awscc_provider_docs.parse_markdown_documentation,
+}
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Sync a local mirror of the Terraform AWS/AWSCC provider documentation.'
+    )
+    parser.add_argument(
+        '--provider',
+        choices=['aws', 'awscc', 'all'],
+        default='all',
+        help='Provider to sync (default: all)',
+    )
+    parser.add_argument(
+        '--version',
+        default=None,
+        help='Provider version to pin, e.g. 5.98.0 (default: latest release)',
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        default=PROVIDER_DOCS_MIRROR_DIR,
+        help=f'Mirror directory (default: {PROVIDER_DOCS_MIRROR_DIR})',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=16,
+        help='Maximum number of concurrent downloads (default: 16)',
+    )
+    args = parser.parse_args()
+    if args.version and args.provider == 'all':
+        parser.error('--version requires a single --provider')
+    return args
+
+
+async def main():
+    """Main entry point for the script."""
+    start_time = datetime.now()
+    args = parse_arguments()
+    providers = ['aws', 'awscc'] if args.provider == 'all' else [args.provider]
+
+    try:
+        for provider in providers:
+            version = args.version
+            if not version:
+                owner, repo = PROVIDER_DOCS_SOURCES[provider]['repository'].split('/')
+                version = (await get_github_release_details(owner, repo))['version']
+                if not version:
+                    print(
+                        f'Could not determine the latest {provider} provider release',
+                        file=sys.stderr,
+                    )
+                    return 1
+
+            print(f'Syncing {provider} provider documentation v{version}...')
+            path = await sync_provider_docs(
+                provider,
+                version,
+                PARSERS[provider],
+                mirror_dir=args.output_dir,
+                concurrency=args.concurrency,
+            )
+            print(f'Wrote {provider} provider documentation mirror to: {path}')
+
+        duration = datetime.now() - start_time
+        print(f'Sync completed in {duration.total_seconds():.2f} seconds')
+        return 0
+
+    except Exception as e:
+        print(f'Error syncing provider documentation: {str(e)}', file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -8,6 +8,8 @@ from awslabs.terraform_mcp_server.impl.resources import (
 from awslabs.terraform_mcp_server.impl.tools import (
     execute_terraform_command_impl,
     execute_terragrunt_command_impl,
+    get_checkov_scan_result_impl,
+    query_provider_resource_catalog_impl,
     run_checkov_scan_impl,
     search_aws_provider_docs_impl,
     search_awscc_provider_docs_impl,
@@ -18,6 +20,7 @@ from awslabs.terraform_mcp_server.models import (
     CheckovScanRequest,
     CheckovScanResult,
     ModuleSearchResult,
+    ProviderResourceCatalogResult,
     SearchUserProvidedModuleRequest,
     SearchUserProvidedModuleResult,
     TerraformAWSCCProviderDocsResult,
@@ -32,7 +35,7 @@ from awslabs.terraform_mcp_server.static import (
     MCP_INSTRUCTIONS,
     TERRAFORM_WORKFLOW_GUIDE,
 )
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 from typing import Any, Dict, List, Literal, Optional
 
@@ -44,6 +47,7 @@ mcp = FastMCP(
         'pydantic',
         'loguru',
         'requests',
+        'httpx',
         'beautifulsoup4',
         'PyPDF2',
     ],
@@ -53,6 +57,7 @@ mcp = FastMCP(
 # * Tools
 @mcp.tool(name='ExecuteTerraformCommand')
 async def execute_terraform_command(
+    ctx: Context,
     command: Literal['init', 'plan', 'validate', 'apply', 'destroy'] = Field(
         ..., description='Terraform command to execute'
     ),
@@ -60,11 +65,25 @@ async def execute_terraform_command(
     variables: Optional[Dict[str, str]] = Field(None, description='Terraform variables to pass'),
     aws_region: Optional[str] = Field(None, description='AWS region to use'),
     strip_ansi: bool = Field(True, description='Whether to strip ANSI color codes from output'),
+    timeout: Optional[int] = Field(
+        None, description='Maximum run time of the command in seconds (default: 3600)'
+    ),
+    init_if_stale: bool = Field(
+        False,
+        description='For init, skip the command when the configuration and lock file are unchanged since the last init',
+    ),
 ) -> TerraformExecutionResult:
     """Execute Terraform workflow commands against an AWS account.
 
     This tool runs Terraform commands (init, plan, validate, apply, destroy) in the
-    specified working directory, with optional variables and region settings.
+    specified working directory, with optional variables and region settings. Command output
+    is streamed as log notifications while the command runs, and the command is interrupted
+    when the request is cancelled or the timeout expires.
+
+    Providers are downloaded once into a shared plugin cache and reused by every working
+    directory whose lock file matches. With init_if_stale, init is skipped when the
+    configuration files, the dependency lock file and the installed modules are unchanged
+    since the last successful init; the result reports the time saved.
 
     Parameters:
         command: Terraform command to execute
@@ -72,6 +91,8 @@ async def execute_terraform_command(
         variables: Terraform variables to pass
         aws_region: AWS region to use
         strip_ansi: Whether to strip ANSI color codes from output
+        timeout: Maximum run time of the command in seconds (default: 3600)
+        init_if_stale: For init, skip the command when nothing it depends on has changed
 
     Returns:
         A TerraformExecutionResult object containing command output and status
@@ -82,12 +103,15 @@ async def execute_terraform_command(
         variables=variables,
         aws_region=aws_region,
         strip_ansi=strip_ansi,
+        timeout=timeout,
+        init_if_stale=init_if_stale,
     )
-    return await execute_terraform_command_impl(request)
+    return await execute_terraform_command_impl(request, ctx)
 
 
 @mcp.tool(name='ExecuteTerragruntCommand')
 async def execute_terragrunt_command(
+    ctx: Context,
     command: Literal['init', 'plan', 'validate', 'apply', 'destroy', 'output', 'run-all'] = Field(
         ..., description='Terragrunt command to execute'
     ),
@@ -105,6 +129,12 @@ async def execute_terragrunt_command(
     terragrunt_config: Optional[str] = Field(
         None, description='Path to a custom terragrunt config file (not valid with run-all)'
     ),
+    timeout: Optional[int] = Field(
+        None, description='Maximum run time of the command in seconds (default: 3600)'
+    ),
+    max_parallel_units: int = Field(
+        4, description='Maximum number of units running at once with run_all'
+    ),
 ) -> TerragruntExecutionResult:
     """Execute Terragrunt workflow commands against an AWS account.
 
@@ -113,6 +143,11 @@ async def execute_terragrunt_command(
     Terraform's functionality by providing features like remote state management, dependencies
     between modules, and the ability to execute Terraform commands on multiple modules at once.
 
+    With run_all and a command other than run-all, the command runs in every unit below the
+    working directory in dependency order, independent units in parallel, and the result
+    reports the status, duration and outputs of each unit. Units whose dependencies failed
+    are skipped, and destroy runs dependents first.
+
     Parameters:
         command: Terragrunt command to execute
         working_directory: Directory containing Terragrunt files
@@ -123,6 +158,8 @@ async def execute_terragrunt_command(
         exclude_dirs: Directories to exclude from a multi-module run
         run_all: Run command on all modules in subdirectories
         terragrunt_config: Path to a custom terragrunt config file (not valid with run-all)
+        timeout: Maximum run time of the command in seconds (default: 3600), per unit with run_all
+        max_parallel_units: Maximum number of units running at once with run_all
 
     Returns:
         A TerragruntExecutionResult object containing command output and status
@@ -137,8 +174,10 @@ async def execute_terragrunt_command(
         exclude_dirs=exclude_dirs,
         run_all=run_all,
         terragrunt_config=terragrunt_config,
+        timeout=timeout,
+        max_parallel_units=max_parallel_units,
     )
-    return await execute_terragrunt_command_impl(request)
+    return await execute_terragrunt_command_impl(request, ctx)
 
 
 @mcp.tool(name='SearchAwsProviderDocs')
@@ -237,6 +276,62 @@ async def search_awscc_provider_docs(
     return await search_awscc_provider_docs_impl(asset_name, asset_type)
 
 
+@mcp.tool(name='QueryProviderResourceCatalog')
+async def query_provider_resource_catalog(
+    provider: Literal['aws', 'awscc'] = Field(
+        'aws', description="Provider whose catalog to query - 'aws' (default) or 'awscc'"
+    ),
+    category: Optional[str] = Field(
+        None,
+        description='Service category to filter by, matched case-insensitively (e.g., "Lambda", "s3")',
+    ),
+    name_prefix: Optional[str] = Field(
+        None,
+        description='Asset name prefix to filter by, with or without the provider prefix (e.g., "aws_s3_bucket")',
+    ),
+    asset_type: Literal['resource', 'data_source', 'both'] = Field(
+        'both',
+        description="Type of assets to return - 'resource', 'data_source' or 'both' (default)",
+    ),
+    limit: int = Field(100, description='Maximum number of assets to return (at most 500)'),
+) -> ProviderResourceCatalogResult:
+    """Query the catalog of AWS or AWSCC provider resources and data sources.
+
+    This tool answers targeted questions about which resources and data sources a provider
+    offers, returning only the matching rows instead of the full provider listing. Each row
+    contains the asset name, its category and service, whether it is a data source and the
+    URL of its documentation.
+
+    Call the tool without a category or name prefix to get the list of categories with
+    their asset counts, then query the category or name prefix you are interested in. In
+    the AWSCC catalog categories are the service segment of the asset name (e.g., "s3").
+
+    Examples:
+        - To list the categories of the AWS provider:
+          query_provider_resource_catalog(provider='aws')
+
+        - To list the Lambda resources of the AWS provider:
+          query_provider_resource_catalog(provider='aws', category='Lambda', asset_type='resource')
+
+        - To find every AWSCC asset whose name starts with awscc_ec2_:
+          query_provider_resource_catalog(provider='awscc', name_prefix='awscc_ec2_')
+
+    Parameters:
+        provider: Provider whose catalog to query - 'aws' (default) or 'awscc'
+        category: Optional service category to filter by
+        name_prefix: Optional asset name prefix to filter by
+        asset_type: Type of assets to return - 'resource', 'data_source' or 'both' (default)
+        limit: Maximum number of assets to return
+
+    Returns:
+        A ProviderResourceCatalogResult object with the matching assets and the total number
+        of matches, or the category summary when no filter was given
+    """
+    return await query_provider_resource_catalog_impl(
+        provider, category, name_prefix, asset_type, limit
+    )
+
+
 @mcp.tool(name='SearchSpecificAwsIaModules')
 async def search_specific_aws_ia_modules(
     query: str = Field(
@@ -295,6 +390,9 @@ async def run_checkov_scan(
     check_ids: Optional[List[str]] = Field(None, description='Specific check IDs to run'),
     skip_check_ids: Optional[List[str]] = Field(None, description='Check IDs to skip'),
     output_format: str = Field('json', description='Output format (json, cli, etc.)'),
+    background: bool = Field(
+        False, description='Run the scan in the background and return a job id to poll'
+    ),
 ) -> CheckovScanResult:
     """Run Checkov security scan on Terraform code.
 
@@ -304,12 +402,17 @@ async def run_checkov_scan(
     Checkov (https://www.checkov.io/) is an open-source static code analysis tool that
     can detect hundreds of security and compliance issues in infrastructure-as-code.
 
+    JSON scans cache their findings per module, so a repeated scan only rescans the modules
+    whose files changed and merges in the cached findings of the others. With background set,
+    the tool returns a job id right away; use GetCheckovScanResult to poll for the result.
+
     Parameters:
         working_directory: Directory containing Terraform files to scan
         framework: Framework to scan (default: terraform)
         check_ids: Optional list of specific check IDs to run
         skip_check_ids: Optional list of check IDs to skip
         output_format: Format for scan results (default: json)
+        background: Run the scan in the background and return a job id to poll
 
     Returns:
         A CheckovScanResult object containing scan results and identified vulnerabilities
@@ -320,10 +423,28 @@ async def run_checkov_scan(
         check_ids=check_ids,
         skip_check_ids=skip_check_ids,
         output_format=output_format,
+        background=background,
     )
     return await run_checkov_scan_impl(request)
 
 
+@mcp.tool(name='GetCheckovScanResult')
+async def get_checkov_scan_result(
+    job_id: str = Field(..., description='Job id returned by RunCheckovScan with background set'),
+) -> CheckovScanResult:
+    """Get the result of a Checkov scan started in the background.
+
+    While the scan is in progress the result has status 'running'; poll again later.
+
+    Parameters:
+        job_id: Job id returned by RunCheckovScan with background set
+
+    Returns:
+        A CheckovScanResult object containing scan results and identified vulnerabilities
+    """
+    return await get_checkov_scan_result_impl(job_id)
+
+
 @mcp.tool(name='SearchUserProvidedModule')
 async def search_user_provided_module(
     module_url: str = Field(
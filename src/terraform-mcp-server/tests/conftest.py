@@ -18,6 +18,26 @@ import tempfile
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def isolated_plugin_cache(tmp_path):
+    """Keep the shared Terraform plugin cache of the tests out of the home directory."""
+    with patch(
+        'awslabs.terraform_mcp_server.impl.tools.terraform_init_cache.PLUGIN_CACHE_DIR',
+        tmp_path / 'plugin-cache',
+    ):
+        yield tmp_path / 'plugin-cache'
+
+
+@pytest.fixture(autouse=True)
+def isolated_checkov_cache(tmp_path):
+    """Keep the Checkov findings cache of the tests out of the home directory."""
+    with patch(
+        'awslabs.terraform_mcp_server.impl.tools.checkov_scan_cache.CHECKOV_CACHE_DIR',
+        tmp_path / 'checkov-cache',
+    ):
+        yield tmp_path / 'checkov-cache'
+
+
 @pytest.fixture
 def temp_terraform_dir():
     """Create a secure temporary directory for Terraform tests."""
@@ -0,0 +1,197 @@
+"""Tests for incremental Checkov scans and background scan jobs."""
+
+import asyncio
+import json
+import os
+import pytest
+from awslabs.terraform_mcp_server.impl.tools.checkov_scan_cache import (
+    collect_modules,
+    fingerprint_modules,
+    merge_cached_findings,
+    split_checkov_report,
+)
+from awslabs.terraform_mcp_server.impl.tools.command_runner import CommandResult
+from awslabs.terraform_mcp_server.impl.tools.run_checkov_scan import (
+    get_checkov_scan_result_impl,
+    run_checkov_scan_impl,
+)
+from awslabs.terraform_mcp_server.models import CheckovScanRequest
+from unittest.mock import patch
+
+
+CHECKOV_RUN_COMMAND = 'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan.run_command'
+CHECKOV_INSTALLED = (
+    'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed'
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a Terraform project with a root module calling a local module."""
+    root = tmp_path / 'project'
+    (root / 'modules' / 'bucket').mkdir(parents=True)
+    (root / 'network').mkdir()
+    (root / '.terraform' / 'modules').mkdir(parents=True)
+    (root / 'main.tf').write_text('module "bucket" {\n  source = "./modules/bucket"\n}\n')
+    (root / 'modules' / 'bucket' / 'main.tf').write_text('resource "aws_s3_bucket" "b" {}\n')
+    (root / 'network' / 'main.tf').write_text('resource "aws_vpc" "v" {}\n')
+    (root / '.terraform' / 'modules' / 'copy.tf').write_text('resource "aws_vpc" "v" {}\n')
+    return root
+
+
+def fake_checkov(scanned):
+    """Build a Checkov stand-in failing one check for every file it scans."""
+
+    async def run(cmd, cwd, **kwargs):
+        if '-d' in cmd:
+            modules = collect_modules(cmd[cmd.index('-d') + 1], 'terraform')
+            files = [path for paths in modules.values() for path in paths]
+        else:
+            files = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == '-f']
+        scanned.append(files)
+        failed_checks = [
+            {
+                'check_id': 'CKV_AWS_1',
+                'check_name': f'Check of {os.path.basename(os.path.dirname(path))}',
+                'file_path': path,
+                'file_abs_path': path,
+                'file_line_range': [1, 1],
+                'resource': 'aws_resource.example',
+            }
+            for path in files
+        ]
+        report = {
+            'results': {'failed_checks': failed_checks, 'passed_checks': []},
+            'summary': {'passed': 0, 'failed': len(failed_checks), 'skipped': 0},
+        }
+        return CommandResult(1, json.dumps(report), '', 0.1)
+
+    return run
+
+
+def make_request(project, **kwargs):
+    """Build a JSON Checkov scan request for the project."""
+    return CheckovScanRequest(working_directory=str(project), **kwargs)
+
+
+def test_collect_modules_skips_hidden_directories(project):
+    """Test that files are grouped by directory and .terraform is ignored."""
+    modules = collect_modules(str(project), 'terraform')
+
+    assert sorted(modules) == [
+        str(project),
+        str(project / 'modules' / 'bucket'),
+        str(project / 'network'),
+    ]
+    assert collect_modules(str(project), 'all') is None
+
+
+def test_fingerprint_covers_called_local_modules(project):
+    """Test that changing a called module changes the fingerprint of its caller."""
+    modules = collect_modules(str(project), 'terraform')
+    before = fingerprint_modules(modules, 'terraform')
+
+    (project / 'modules' / 'bucket' / 'main.tf').write_text('resource "aws_s3_bucket" "c" {}\n')
+    after = fingerprint_modules(modules, 'terraform')
+
+    assert after[str(project)] != before[str(project)]
+    assert after[str(project / 'network')] == before[str(project / 'network')]
+
+
+def test_split_and_merge_report(project):
+    """Test that findings are attributed to their module and merged back into one report."""
+    report = {
+        'results': {
+            'failed_checks': [
+                {'check_id': 'CKV_AWS_1', 'file_path': '/network/main.tf', 'resource': 'a'},
+                {
+                    'check_id': 'CKV_AWS_2',
+                    'file_path': '/modules/bucket/main.tf',
+                    'caller_file_path': '/main.tf',
+                    'resource': 'b',
+                },
+            ],
+            'passed_checks': [{'check_id': 'CKV_AWS_3', 'file_path': '/main.tf', 'resource': 'c'}],
+        }
+    }
+
+    entries = split_checkov_report(
+        json.dumps(report), str(project), [str(project), str(project / 'network')]
+    )
+    merged = merge_cached_findings(entries)
+
+    assert entries[str(project)]['counts']['failed'] == 1
+    assert entries[str(project)]['counts']['passed'] == 1
+    assert entries[str(project / 'network')]['failed_checks'][0]['check_id'] == 'CKV_AWS_1'
+    assert merged['summary']['failed'] == 2
+    assert merged['summary']['resource_count'] == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_scan_only_rescans_changed_modules(project):
+    """Test that unchanged modules come from the cache and changed ones are rescanned."""
+    scanned = []
+    with patch(CHECKOV_RUN_COMMAND, side_effect=fake_checkov(scanned)):
+        with patch(CHECKOV_INSTALLED, return_value=True):
+            first = await run_checkov_scan_impl(make_request(project))
+            unchanged = await run_checkov_scan_impl(make_request(project))
+            (project / 'network' / 'main.tf').write_text('resource "aws_vpc" "w" {}\n')
+            changed = await run_checkov_scan_impl(make_request(project))
+
+    assert len(scanned) == 2
+    assert scanned[1] == [str(project / 'network' / 'main.tf')]
+    assert (first.scanned_modules, first.cached_modules) == (3, 0)
+    assert (unchanged.scanned_modules, unchanged.cached_modules) == (0, 3)
+    assert (changed.scanned_modules, changed.cached_modules) == (1, 2)
+    for result in (first, unchanged, changed):
+        assert result.status == 'success'
+        assert result.return_code == 1
+        assert len(result.vulnerabilities) == 3
+    assert {v.file_path for v in changed.vulnerabilities} == {
+        '/main.tf',
+        '/modules/bucket/main.tf',
+        '/network/main.tf',
+    }
+
+
+@pytest.mark.asyncio
+async def test_ruleset_change_invalidates_cache(project):
+    """Test that a different set of skipped checks scans everything again."""
+    scanned = []
+    with patch(CHECKOV_RUN_COMMAND, side_effect=fake_checkov(scanned)):
+        with patch(CHECKOV_INSTALLED, return_value=True):
+            await run_checkov_scan_impl(make_request(project))
+            result = await run_checkov_scan_impl(
+                make_request(project, skip_check_ids=['CKV_AWS_2'])
+            )
+
+    assert len(scanned) == 2
+    assert result.cached_modules == 0
+
+
+@pytest.mark.asyncio
+async def test_background_scan_is_polled_by_job_id(project):
+    """Test that a background scan returns a job id and its result can be polled."""
+    scanned = []
+    with patch(CHECKOV_RUN_COMMAND, side_effect=fake_checkov(scanned)):
+        with patch(CHECKOV_INSTALLED, return_value=True):
+            started = await run_checkov_scan_impl(make_request(project, background=True))
+            polled = await get_checkov_scan_result_impl(started.job_id)
+            while polled.status == 'running':
+                await asyncio.sleep(0.01)
+                polled = await get_checkov_scan_result_impl(started.job_id)
+
+    assert started.status == 'running'
+    assert started.job_id is not None
+    assert polled.status == 'success'
+    assert polled.job_id == started.job_id
+    assert len(polled.vulnerabilities) == 3
+
+
+@pytest.mark.asyncio
+async def test_unknown_scan_job():
+    """Test polling a job id that does not exist."""
+    result = await get_checkov_scan_result_impl('missing')
+
+    assert result.status == 'error'
+    assert 'Unknown Checkov scan job' in result.error_message
@@ -20,6 +20,17 @@ from awslabs.terraform_mcp_server.models import (
 from unittest.mock import MagicMock, patch
 
 
+TERRAFORM_RUN_COMMAND = (
+    'awslabs.terraform_mcp_server.impl.tools.execute_terraform_command.run_command'
+)
+TERRAGRUNT_RUN_COMMAND = (
+    'awslabs.terraform_mcp_server.impl.tools.execute_terragrunt_command.run_command'
+)
+CHECKOV_RUN_COMMAND = 'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan.run_command'
+CHECKOV_INSTALLED = (
+    'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed'
+)
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -41,8 +52,8 @@ async def test_execute_terraform_command_success(temp_terraform_dir):
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, return_value=mock_result):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
@@ -80,8 +91,8 @@ async def test_execute_terraform_command_error(temp_terraform_dir):
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, return_value=mock_result):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
@@ -152,14 +163,14 @@ async def test_run_checkov_scan_success(temp_terraform_dir):
         skip_check_ids=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
             with patch('os.path.isdir', return_value=True):
-                # Mock subprocess.check_output to check if checkov is installed
-                with patch('subprocess.check_output', return_value=b'checkov 2.0.0'):
+                # Mock the check whether checkov is installed
+                with patch(CHECKOV_INSTALLED, return_value=True):
                     # Mock os.path.isabs to return True
                     with patch('os.path.isabs', return_value=True):
                         # Call the function
@@ -258,8 +269,8 @@ async def test_execute_terraform_command_with_outputs(temp_terraform_dir):
             return mock_output_result
         return mock_apply_result
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
@@ -381,14 +392,14 @@ async def test_run_checkov_scan_cli_output(temp_terraform_dir):
         skip_check_ids=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
             with patch('os.path.isdir', return_value=True):
-                # Mock subprocess.check_output to check if checkov is installed
-                with patch('subprocess.check_output', return_value=b'checkov 2.0.0'):
+                # Mock the check whether checkov is installed
+                with patch(CHECKOV_INSTALLED, return_value=True):
                     # Mock os.path.isabs to return True
                     with patch('os.path.isabs', return_value=True):
                         # Call the function
@@ -422,14 +433,14 @@ async def test_run_checkov_scan_error(temp_terraform_dir):
         skip_check_ids=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         # Mock os.path.exists to return True
         with patch('os.path.exists', return_value=True):
             # Mock os.path.isdir to return True
             with patch('os.path.isdir', return_value=True):
-                # Mock subprocess.check_output to check if checkov is installed
-                with patch('subprocess.check_output', return_value=b'checkov 2.0.0'):
+                # Mock the check whether checkov is installed
+                with patch(CHECKOV_INSTALLED, return_value=True):
                     # Mock os.path.isabs to return True
                     with patch('os.path.isabs', return_value=True):
                         # Call the function
@@ -492,8 +503,8 @@ async def test_execute_terragrunt_command_success(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -529,8 +540,8 @@ async def test_execute_terragrunt_command_error(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -0,0 +1,144 @@
+"""Tests for the non-blocking command runner of the terraform-mcp-server."""
+
+import asyncio
+import pytest
+import sys
+import time
+from awslabs.terraform_mcp_server.impl.tools import command_runner
+from awslabs.terraform_mcp_server.impl.tools.command_runner import (
+    CommandTimeoutError,
+    OutputBuffer,
+    run_command,
+    workspace_lock,
+)
+from awslabs.terraform_mcp_server.impl.tools.execute_terraform_command import (
+    execute_terraform_command_impl,
+)
+from awslabs.terraform_mcp_server.models import TerraformExecutionRequest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def python_command(script):
+    """Build a command running a Python script with the current interpreter."""
+    return [sys.executable, '-c', script]
+
+
+async def test_run_command_captures_output_and_return_code(tmp_path):
+    """Test that stdout, stderr and the exit code are captured."""
+    result = await run_command(
+        python_command('import sys\nprint("out")\nprint("err", file=sys.stderr)\nsys.exit(3)'),
+        cwd=str(tmp_path),
+    )
+
+    assert result.returncode == 3
+    assert result.stdout == 'out\n'
+    assert result.stderr == 'err\n'
+
+
+async def test_run_command_streams_output_to_context(tmp_path):
+    """Test that output lines are sent as log notifications while the command runs."""
+    ctx = MagicMock()
+    ctx.info = AsyncMock()
+
+    with patch.object(command_runner, 'STREAM_INTERVAL_SECONDS', 0):
+        await run_command(
+            python_command(
+                'import time\nfor i in range(3):\n    print(i, flush=True)\n    time.sleep(0.05)'
+            ),
+            cwd=str(tmp_path),
+            ctx=ctx,
+            output_filter=str.upper,
+        )
+
+    streamed = '\n'.join(call.args[0] for call in ctx.info.await_args_list)
+    assert streamed.split('\n') == ['0', '1', '2']
+    assert ctx.info.await_count > 1
+
+
+async def test_run_command_timeout_keeps_partial_output(tmp_path):
+    """Test that a command exceeding its timeout is stopped with its partial output."""
+    start = time.monotonic()
+
+    with pytest.raises(CommandTimeoutError) as exc_info:
+        await run_command(
+            python_command('import time\nprint("started", flush=True)\ntime.sleep(30)'),
+            cwd=str(tmp_path),
+            timeout=0.5,
+        )
+
+    assert exc_info.value.stdout == 'started\n'
+    assert time.monotonic() - start < 10
+
+
+async def test_run_command_cancellation_stops_process(tmp_path):
+    """Test that cancelling the caller interrupts the running command."""
+    marker = tmp_path / 'finished'
+    task = asyncio.create_task(
+        run_command(
+            python_command(f'import time\ntime.sleep(2)\nopen({str(marker)!r}, "w").close()'),
+            cwd=str(tmp_path),
+        )
+    )
+    await asyncio.sleep(0.3)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(2.5)
+    assert not marker.exists()
+
+
+def test_output_buffer_keeps_most_recent_lines():
+    """Test that the buffer drops the oldest lines once its budget is exceeded."""
+    buffer = OutputBuffer(max_chars=10)
+
+    assert buffer.write('aaaa\nbbbb\ncc') == ['aaaa', 'bbbb']
+    assert buffer.write('cc\n') == ['cccc']
+    assert buffer.getvalue() == '[... 1 earlier lines truncated ...]\nbbbb\ncccc\n'
+
+
+async def test_workspace_lock_serializes_same_directory_only(tmp_path):
+    """Test that commands in one workspace run one at a time while workspaces run concurrently."""
+    active = {'a': 0, 'b': 0}
+    max_active = {'a': 0, 'b': 0}
+
+    async def use(workspace):
+        async with workspace_lock(str(tmp_path / workspace)):
+            active[workspace] += 1
+            max_active[workspace] = max(max_active[workspace], active[workspace])
+            await asyncio.sleep(0.05)
+            active[workspace] -= 1
+
+    start = time.monotonic()
+    await asyncio.gather(use('a'), use('a'), use('b'), use('b'))
+
+    assert max_active == {'a': 1, 'b': 1}
+    assert time.monotonic() - start < 0.19
+    assert command_runner._WORKSPACE_LOCKS == {}
+
+
+async def test_execute_terraform_command_reports_timeout(temp_terraform_dir):
+    """Test that a timed out Terraform command is returned as an error with its output."""
+    request = TerraformExecutionRequest(
+        command='apply',
+        working_directory=temp_terraform_dir,
+        variables={},
+        aws_region=None,
+        strip_ansi=True,
+        timeout=5,
+    )
+    error = CommandTimeoutError(5, 'Creating...\n', '')
+
+    with patch(
+        'awslabs.terraform_mcp_server.impl.tools.execute_terraform_command.run_command',
+        side_effect=error,
+    ) as mock_run:
+        result = await execute_terraform_command_impl(request)
+
+    assert mock_run.call_args[1]['timeout'] == 5
+    assert result.status == 'error'
+    assert result.error_message == 'Command timed out after 5 seconds'
+    assert result.stdout == 'Creating...\n'
@@ -9,6 +9,10 @@ from awslabs.terraform_mcp_server.models.models import TerraformExecutionRequest
 from unittest.mock import MagicMock, patch
 
 
+TERRAFORM_RUN_COMMAND = (
+    'awslabs.terraform_mcp_server.impl.tools.execute_terraform_command.run_command'
+)
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -31,8 +35,8 @@ async def test_clean_output_text_helper(temp_terraform_dir):
     mock_result.stdout = '\x1b[31mError\x1b[0m: Something went wrong\n┌───┐\n│ABC│\n└───┘'
     mock_result.stderr = 'This -&gt; that &lt;tag&gt; &amp; more'
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terraform_command_impl(request)
 
@@ -64,8 +68,8 @@ async def test_execute_terraform_command_with_region(temp_terraform_dir):
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result) as mock_run:
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, return_value=mock_result) as mock_run:
         # Call the function
         result = await execute_terraform_command_impl(request)
 
@@ -92,7 +96,7 @@ async def test_execute_terraform_command_exception_handling(temp_terraform_dir):
     )
 
     # Mock subprocess.run to raise an exception
-    with patch('subprocess.run', side_effect=Exception('Command execution failed')):
+    with patch(TERRAFORM_RUN_COMMAND, side_effect=Exception('Command execution failed')):
         # Call the function
         result = await execute_terraform_command_impl(request)
 
@@ -126,8 +130,8 @@ async def test_execute_terraform_command_output_error_handling(temp_terraform_di
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terraform_command_impl(request)
 
@@ -165,8 +169,8 @@ async def test_execute_terraform_command_output_json_error(temp_terraform_dir):
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terraform_command_impl(request)
 
@@ -214,8 +218,8 @@ async def test_execute_terraform_command_complex_outputs(temp_terraform_dir):
         strip_ansi=True,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAFORM_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terraform_command_impl(request)
 
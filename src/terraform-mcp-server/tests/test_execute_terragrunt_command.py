@@ -1,16 +1,22 @@
 """Tests for the execute_terragrunt_command implementation."""
 
+import asyncio
 import json
 import pytest
 from awslabs.terraform_mcp_server.impl.tools.execute_terragrunt_command import (
     execute_terragrunt_command_impl,
 )
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import plugin_cache_lock
 from awslabs.terraform_mcp_server.models import (
     TerragruntExecutionRequest,
 )
 from unittest.mock import MagicMock, patch
 
 
+TERRAGRUNT_RUN_COMMAND = (
+    'awslabs.terraform_mcp_server.impl.tools.execute_terragrunt_command.run_command'
+)
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -36,8 +42,8 @@ async def test_execute_terragrunt_command_success(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -51,6 +57,69 @@ async def test_execute_terragrunt_command_success(temp_terraform_dir):
     assert result.working_directory == temp_terraform_dir
 
 
+@pytest.mark.asyncio
+async def test_execute_terragrunt_command_holds_plugin_cache_lock(temp_terraform_dir):
+    """Test that only a separate init holds the plugin cache lock."""
+    mock_result = MagicMock()
+    mock_result.returncode = 0
+    mock_result.stdout = ''
+    mock_result.stderr = ''
+    locked = []
+
+    async def mock_run_command(cmd, **kwargs):
+        locked.append((cmd[1], plugin_cache_lock().locked(), kwargs['env'].get('TG_NO_AUTO_INIT')))
+        return mock_result
+
+    request = TerragruntExecutionRequest(command='plan', working_directory=temp_terraform_dir)
+
+    with (
+        patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_run_command),
+        patch.dict('os.environ', {'TF_PLUGIN_CACHE_DIR': ''}),
+    ):
+        result = await execute_terragrunt_command_impl(request)
+
+    assert result.status == 'success'
+    assert locked == [('init', True, None), ('plan', False, 'true')]
+    assert not plugin_cache_lock().locked()
+
+
+async def test_execute_terragrunt_commands_run_concurrently(tmp_path):
+    """Test that commands in different working directories run at the same time."""
+    mock_result = MagicMock()
+    mock_result.returncode = 0
+    mock_result.stdout = '{}'
+    mock_result.stderr = ''
+    running = 0
+    both_running = asyncio.Event()
+
+    async def mock_run_command(cmd, **kwargs):
+        nonlocal running
+        if cmd[1] in ('plan', 'apply'):
+            running += 1
+            if running == 2:
+                both_running.set()
+            await asyncio.wait_for(both_running.wait(), timeout=5)
+        return mock_result
+
+    requests = []
+    for command in ('plan', 'apply'):
+        directory = tmp_path / command
+        directory.mkdir()
+        requests.append(
+            TerragruntExecutionRequest(command=command, working_directory=str(directory))
+        )
+
+    with (
+        patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_run_command),
+        patch.dict('os.environ', {'TF_PLUGIN_CACHE_DIR': ''}),
+    ):
+        results = await asyncio.gather(
+            *(execute_terragrunt_command_impl(request) for request in requests)
+        )
+
+    assert [result.status for result in results] == ['success', 'success']
+
+
 @pytest.mark.asyncio
 async def test_execute_terragrunt_command_error(temp_terraform_dir):
     """Test the Terragrunt command execution function with error mocks."""
@@ -73,8 +142,8 @@ async def test_execute_terragrunt_command_error(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -108,8 +177,8 @@ async def test_clean_output_text_helper(temp_terraform_dir):
     mock_result.stdout = '\x1b[31mError\x1b[0m: Something went wrong\n┌───┐\n│ABC│\n└───┘'
     mock_result.stderr = 'This -&gt; that &lt;tag&gt; &amp; more'
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -145,8 +214,8 @@ async def test_execute_terragrunt_command_with_region(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result) as mock_run:
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result) as mock_run:
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -224,8 +293,8 @@ async def test_execute_terragrunt_command_with_outputs(temp_terraform_dir):
             return mock_output_result
         return mock_apply_result
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -281,8 +350,8 @@ async def test_execute_terragrunt_command_complex_outputs(temp_terraform_dir):
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -323,8 +392,8 @@ async def test_execute_terragrunt_command_output_error_handling(temp_terraform_d
         terragrunt_config=None,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', side_effect=mock_subprocess_run):
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_subprocess_run):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -378,12 +447,15 @@ async def test_execute_terragrunt_command_run_all(temp_terraform_dir):
         return mock_run_all_result
 
     # Mock subprocess.run with our side_effect function
-    with patch('subprocess.run', side_effect=mock_subprocess_run) as mock_run:
+    with patch(TERRAGRUNT_RUN_COMMAND, side_effect=mock_subprocess_run) as mock_run:
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
-        # Get the first call args (the run-all command)
-        first_call_args = mock_run.call_args_list[0][0][0]
+        # The first call initializes every unit, the second is the run-all command
+        init_call_args = mock_run.call_args_list[0][0][0]
+        assert init_call_args[:4] == ['terragrunt', 'run-all', 'init', '-input=false']
+        assert '--queue-exclude-dir=/path/to/excluded' in init_call_args
+        first_call_args = mock_run.call_args_list[1][0][0]
 
         # Check that the command was constructed correctly
         assert 'terragrunt' in first_call_args
@@ -445,7 +517,7 @@ async def test_execute_terragrunt_command_with_exception(temp_terraform_dir):
     )
 
     # Mock subprocess.run to raise an exception
-    with patch('subprocess.run', side_effect=Exception('Command execution failed')):
+    with patch(TERRAGRUNT_RUN_COMMAND, side_effect=Exception('Command execution failed')):
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
@@ -479,8 +551,8 @@ async def test_execute_terragrunt_command_with_custom_config(temp_terraform_dir)
         terragrunt_config=custom_config,
     )
 
-    # Mock subprocess.run
-    with patch('subprocess.run', return_value=mock_result) as mock_run:
+    # Mock the command runner
+    with patch(TERRAGRUNT_RUN_COMMAND, return_value=mock_result) as mock_run:
         # Call the function
         result = await execute_terragrunt_command_impl(request)
 
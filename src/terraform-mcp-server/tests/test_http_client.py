@@ -0,0 +1,124 @@
+"""Tests for the shared HTTP client of the terraform-mcp-server."""
+
+import asyncio
+import httpx
+import pytest
+from awslabs.terraform_mcp_server.impl.tools.http_client import HttpClient
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport that records requests and serves canned responses."""
+
+    def __init__(self, handler, delay=0.0):
+        """Initialize the transport with a request handler and optional latency."""
+        self.handler = handler
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    async def handle_async_request(self, request):
+        """Record the request and return the handler's response."""
+        self.requests.append(request)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return self.handler(request)
+        finally:
+            self.active -= 1
+
+
+async def test_fresh_response_is_served_from_cache():
+    """Test that a second request within the freshness window does not hit the network."""
+    transport = RecordingTransport(lambda request: httpx.Response(200, text='hello'))
+    client = HttpClient(transport=transport)
+
+    first = await client.get('https://example.com/a')
+    second = await client.get('https://example.com/a')
+
+    assert first.text == 'hello'
+    assert second.text == 'hello'
+    assert len(transport.requests) == 1
+
+
+async def test_stale_response_is_revalidated_with_etag():
+    """Test that stale entries are revalidated with If-None-Match and reused on 304."""
+
+    def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text='body', headers={'ETag': '"v1"'})
+
+    transport = RecordingTransport(handler)
+    client = HttpClient(transport=transport, fresh_seconds=0)
+
+    first = await client.get('https://example.com/a')
+    second = await client.get('https://example.com/a')
+
+    assert len(transport.requests) == 2
+    assert 'If-None-Match' not in transport.requests[0].headers
+    assert transport.requests[1].headers['If-None-Match'] == '"v1"'
+    assert second.status_code == 200
+    assert second.text == first.text == 'body'
+
+
+async def test_headers_are_part_of_cache_key():
+    """Test that requests with different headers are cached separately."""
+    transport = RecordingTransport(lambda request: httpx.Response(200, text='ok'))
+    client = HttpClient(transport=transport)
+
+    await client.get('https://example.com/a')
+    await client.get('https://example.com/a', headers={'Accept': 'application/json'})
+
+    assert len(transport.requests) == 2
+
+
+async def test_error_responses_are_not_cached():
+    """Test that server errors are always re-requested."""
+    transport = RecordingTransport(lambda request: httpx.Response(500))
+    client = HttpClient(transport=transport)
+
+    await client.get('https://example.com/a')
+    await client.get('https://example.com/a')
+
+    assert len(transport.requests) == 2
+
+
+async def test_concurrent_requests_for_same_url_are_coalesced():
+    """Test that concurrent requests for one URL share a single network request."""
+    transport = RecordingTransport(lambda request: httpx.Response(200, text='ok'), delay=0.05)
+    client = HttpClient(transport=transport)
+
+    responses = await asyncio.gather(*[client.get('https://example.com/a') for _ in range(5)])
+
+    assert len(transport.requests) == 1
+    assert all(response.text == 'ok' for response in responses)
+
+
+async def test_per_host_concurrency_limit():
+    """Test that no more than the configured number of requests run against one host."""
+    transport = RecordingTransport(lambda request: httpx.Response(200), delay=0.02)
+    client = HttpClient(transport=transport, max_connections_per_host=2)
+
+    await asyncio.gather(*[client.get(f'https://example.com/{i}') for i in range(6)])
+
+    assert len(transport.requests) == 6
+    assert transport.max_active == 2
+
+
+async def test_cache_is_bounded():
+    """Test that the least recently used entries are evicted."""
+    transport = RecordingTransport(lambda request: httpx.Response(200))
+    client = HttpClient(transport=transport, max_cache_entries=2)
+
+    await client.get('https://example.com/1')
+    await client.get('https://example.com/2')
+    await client.get('https://example.com/3')
+    await client.get('https://example.com/1')
+
+    assert len(transport.requests) == 4
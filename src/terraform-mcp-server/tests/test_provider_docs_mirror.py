@@ -0,0 +1,167 @@
+"""Tests for the local provider documentation mirror."""
+
+import httpx
+import pytest
+from awslabs.terraform_mcp_server.impl.tools import provider_docs_mirror
+from awslabs.terraform_mcp_server.impl.tools.provider_docs_mirror import (
+    ProviderDocsIndex,
+    get_provider_docs_index,
+    mirror_path,
+    sync_provider_docs,
+)
+from awslabs.terraform_mcp_server.impl.tools.search_aws_provider_docs import (
+    fetch_github_documentation,
+    parse_markdown_documentation,
+)
+from unittest.mock import patch
+
+
+HTTP_CLIENT_GET = 'awslabs.terraform_mcp_server.impl.tools.http_client.HttpClient.get'
+
+
+def _doc(title):
+    return {
+        'title': title,
+        'description': f'{title} description',
+        'example_snippets': [],
+        'url': f'https://example.com/{title}',
+        'arguments': None,
+        'attributes': None,
+    }
+
+
+@pytest.fixture
+def aws_index():
+    """Create a small AWS provider docs index."""
+    return ProviderDocsIndex(
+        'aws',
+        '5.98.0',
+        {
+            'resource': {
+                's3_bucket': _doc('aws_s3_bucket'),
+                's3_bucket_policy': _doc('aws_s3_bucket_policy'),
+                's3_bucket_versioning': _doc('aws_s3_bucket_versioning'),
+                'instance': _doc('aws_instance'),
+            },
+            'data_source': {'s3_bucket': _doc('aws_s3_bucket')},
+        },
+    )
+
+
+@pytest.fixture
+def mirror_dir(tmp_path):
+    """Point the mirror directory at a temporary path."""
+    with patch.object(provider_docs_mirror, 'PROVIDER_DOCS_MIRROR_DIR', tmp_path):
+        provider_docs_mirror._LOADED_INDEXES.clear()
+        yield tmp_path
+        provider_docs_mirror._LOADED_INDEXES.clear()
+
+
+def test_lookup_accepts_prefixed_and_unprefixed_names(aws_index):
+    """Test exact lookups with and without the provider prefix."""
+    assert aws_index.lookup('aws_s3_bucket', 'resource')['title'] == 'aws_s3_bucket'
+    assert aws_index.lookup('S3_Bucket', 'data_source')['title'] == 'aws_s3_bucket'
+    assert aws_index.lookup('aws_instance', 'data_source') is None
+    assert len(aws_index) == 5
+
+
+def test_suggest_by_prefix(aws_index):
+    """Test prefix suggestions."""
+    assert aws_index.suggest('aws_s3_bucket_p', 'resource') == ['aws_s3_bucket_policy']
+    assert aws_index.suggest('s3_buck', 'both') == [
+        'aws_s3_bucket',
+        'aws_s3_bucket_policy',
+        'aws_s3_bucket_versioning',
+    ]
+
+
+def test_suggest_backs_off_to_shorter_prefixes(aws_index):
+    """Test that misspelled trailing segments fall back to the longest matching prefix."""
+    assert aws_index.suggest('aws_s3_bucket_polcy', 'resource', limit=2) == [
+        'aws_s3_bucket',
+        'aws_s3_bucket_policy',
+    ]
+    assert aws_index.suggest('aws_lambda_function', 'resource') == []
+
+
+def test_save_and_load_round_trip(aws_index, tmp_path):
+    """Test that an index survives a save/load round trip."""
+    path = tmp_path / 'aws_provider_docs.json.gz'
+    aws_index.save(path)
+
+    loaded = ProviderDocsIndex.load(path)
+
+    assert loaded.version == '5.98.0'
+    assert loaded.lookup('aws_s3_bucket_policy', 'resource') == _doc('aws_s3_bucket_policy')
+
+
+def test_get_provider_docs_index_without_mirror(mirror_dir):
+    """Test that no index is returned when no mirror has been synced."""
+    assert get_provider_docs_index('aws') is None
+
+
+def test_get_provider_docs_index_loads_and_caches(mirror_dir, aws_index):
+    """Test that the mirror is loaded once and reused."""
+    aws_index.save(mirror_path('aws'))
+
+    first = get_provider_docs_index('aws')
+    second = get_provider_docs_index('aws')
+
+    assert first is not None
+    assert first is second
+
+
+def test_get_provider_docs_index_ignores_corrupt_mirror(mirror_dir):
+    """Test that an unreadable mirror is ignored."""
+    mirror_path('aws').write_bytes(b'not gzip')
+
+    assert get_provider_docs_index('aws') is None
+
+
+def test_fetch_github_documentation_prefers_mirror(mirror_dir, aws_index):
+    """Test that mirrored documents are served without a GitHub request."""
+    aws_index.save(mirror_path('aws'))
+
+    with patch('requests.get') as mock_get:
+        result = fetch_github_documentation('aws_s3_bucket', 'resource', False)
+
+    mock_get.assert_not_called()
+    assert result == _doc('aws_s3_bucket')
+
+
+@pytest.mark.asyncio
+async def test_sync_provider_docs(mirror_dir):
+    """Test syncing the docs tree into a mirror file."""
+    markdown = '# Resource: aws_s3_bucket\n\nProvides a S3 bucket resource.\n'
+
+    def side_effect(url, **kwargs):
+        request = httpx.Request('GET', url)
+        if '/contents/website' in url:
+            return httpx.Response(
+                200, json=[{'name': 'docs', 'type': 'dir', 'sha': 'abc'}], request=request
+            )
+        if '/git/trees/abc' in url:
+            return httpx.Response(
+                200,
+                request=request,
+                json={
+                    'tree': [
+                        {'path': 'r', 'type': 'tree'},
+                        {'path': 'r/s3_bucket.html.markdown', 'type': 'blob'},
+                        {'path': 'd/s3_bucket.html.markdown', 'type': 'blob'},
+                        {'path': 'guides/version-5-upgrade.html.markdown', 'type': 'blob'},
+                    ]
+                },
+            )
+        if url.endswith('.html.markdown'):
+            return httpx.Response(200, text=markdown, request=request)
+        return httpx.Response(404, request=request)
+
+    with patch(HTTP_CLIENT_GET, side_effect=side_effect):
+        path = await sync_provider_docs('aws', '5.98.0', parse_markdown_documentation)
+
+    index = ProviderDocsIndex.load(path)
+    assert len(index) == 2
+    resource = index.lookup('aws_s3_bucket', 'resource')
+    assert resource['description'] == 'Provides a S3 bucket resource.'
+    assert resource['url'].endswith('/v5.98.0/website/docs/r/s3_bucket.html.markdown')
@@ -0,0 +1,164 @@
+"""Tests for the structured provider resource catalog."""
+
+import json
+import pytest
+from awslabs.terraform_mcp_server.impl.tools import provider_resources_catalog
+from awslabs.terraform_mcp_server.impl.tools.provider_resources_catalog import (
+    ProviderResourceCatalog,
+    build_catalog,
+    catalog_assets,
+    query_provider_resource_catalog_impl,
+    write_catalog,
+)
+from unittest.mock import patch
+
+
+def _item(name, kind='resources'):
+    return {
+        'name': name,
+        'url': f'https://registry.terraform.io/providers/hashicorp/aws/latest/docs/{kind}/{name[4:]}',
+    }
+
+
+CATEGORIES = {
+    'Lambda': {
+        'resources': [_item('aws_lambda_function'), _item('aws_lambda_alias')],
+        'data_sources': [_item('aws_lambda_function', 'data-sources')],
+    },
+    'S3 (Simple Storage)': {
+        'resources': [_item('aws_s3_bucket'), _item('aws_s3_bucket_policy')],
+        'data_sources': [_item('aws_s3_bucket', 'data-sources')],
+    },
+}
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    """Write a small AWS catalog and point the loader at it."""
+    path = tmp_path / 'AWS_PROVIDER_RESOURCES.json'
+    write_catalog(build_catalog('aws', '5.98.0', CATEGORIES), path)
+    sources = {
+        **provider_resources_catalog.CATALOG_SOURCES,
+        'aws': {**provider_resources_catalog.CATALOG_SOURCES['aws'], 'path': path},
+    }
+    with patch.object(provider_resources_catalog, 'CATALOG_SOURCES', sources):
+        provider_resources_catalog._LOADED_CATALOGS.clear()
+        yield path
+        provider_resources_catalog._LOADED_CATALOGS.clear()
+
+
+def test_build_catalog_rows():
+    """Test that every asset becomes one row with its category, service and derived URL."""
+    catalog = build_catalog('aws', '5.98.0', CATEGORIES)
+    assets = catalog_assets(catalog)
+
+    assert catalog['version'] == '5.98.0'
+    assert catalog['categories']['Lambda']['resources'] == [
+        'aws_lambda_alias',
+        'aws_lambda_function',
+    ]
+    assert len(assets) == 6
+    assert assets[0] == {
+        'category': 'Lambda',
+        'service': 'lambda',
+        'name': 'aws_lambda_alias',
+        'data_source': False,
+        'url': _item('aws_lambda_alias')['url'],
+    }
+    assert assets[2]['url'] == _item('aws_lambda_function', 'data-sources')['url']
+    assert [asset['data_source'] for asset in assets[:3]] == [False, False, True]
+
+
+def test_build_catalog_categorizes_awscc_by_service():
+    """Test that AWSCC assets are categorized by the service segment of their name."""
+    categories = {'Resources': {'resources': [_item('awscc_ec2_vpc')], 'data_sources': []}}
+
+    catalog = build_catalog('awscc', '1.36.0', categories)
+
+    assert list(catalog['categories']) == ['ec2']
+    assert catalog_assets(catalog)[0]['url'] == (
+        'https://registry.terraform.io/providers/hashicorp/awscc/latest/docs/resources/ec2_vpc'
+    )
+
+
+def test_write_catalog_round_trip(tmp_path):
+    """Test that a written catalog loads back with the same rows."""
+    path = tmp_path / 'catalog.json'
+    catalog = build_catalog('aws', '5.98.0', CATEGORIES)
+    write_catalog(catalog, path)
+
+    loaded = ProviderResourceCatalog.load(path)
+
+    assert path.read_text() == json.dumps(catalog, indent=2, sort_keys=True) + '\n'
+
+    assert loaded.version == '5.98.0'
+    assert len(loaded) == 6
+
+
+def test_query_filters():
+    """Test category, name prefix and asset type filters."""
+    catalog = build_catalog('aws', '5.98.0', CATEGORIES)
+    index = ProviderResourceCatalog('aws', '5.98.0', catalog_assets(catalog))
+
+    assert len(index.query(category='lambda')) == 3
+    assert len(index.query(category='s3')) == 3
+    assert [asset['name'] for asset in index.query(name_prefix='s3_bucket_')] == [
+        'aws_s3_bucket_policy'
+    ]
+    assert [
+        asset['name'] for asset in index.query(name_prefix='aws_', asset_type='data_source')
+    ] == ['aws_lambda_function', 'aws_s3_bucket']
+    assert index.query(category='Lambda', name_prefix='aws_s3') == []
+
+
+def test_categories_summary():
+    """Test the per-category counts."""
+    catalog = build_catalog('aws', '5.98.0', CATEGORIES)
+    index = ProviderResourceCatalog('aws', '5.98.0', catalog_assets(catalog))
+
+    summary = {category.name: category for category in index.categories()}
+
+    assert summary['Lambda'].resource_count == 2
+    assert summary['Lambda'].data_source_count == 1
+
+
+@pytest.mark.asyncio
+async def test_query_impl_returns_limited_rows(catalog_path):
+    """Test that the tool returns the total number of matches and at most limit rows."""
+    result = await query_provider_resource_catalog_impl('aws', category='Lambda', limit=2)
+
+    assert result.status == 'success'
+    assert result.provider_version == '5.98.0'
+    assert result.total_matches == 3
+    assert len(result.assets) == 2
+    assert result.categories is None
+
+
+@pytest.mark.asyncio
+async def test_query_impl_without_filters_returns_categories(catalog_path):
+    """Test that the tool returns only the category summary when no filter is given."""
+    result = await query_provider_resource_catalog_impl('aws')
+
+    assert result.status == 'success'
+    assert result.assets == []
+    assert [category.name for category in result.categories] == ['Lambda', 'S3 (Simple Storage)']
+
+
+@pytest.mark.asyncio
+async def test_query_impl_missing_catalog(catalog_path):
+    """Test that a missing catalog is reported as an error."""
+    catalog_path.unlink()
+
+    result = await query_provider_resource_catalog_impl('aws', category='Lambda')
+
+    assert result.status == 'error'
+    assert 'not available' in result.error_message
+
+
+@pytest.mark.asyncio
+async def test_shipped_catalogs_load():
+    """Test that the catalogs shipped in the static directory are loadable."""
+    for provider in ('aws', 'awscc'):
+        result = await query_provider_resource_catalog_impl(provider, name_prefix='s3_bucket')
+        assert result.status == 'success'
+        assert result.total_matches > 0
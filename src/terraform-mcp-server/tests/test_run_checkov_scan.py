@@ -12,6 +12,8 @@ from awslabs.terraform_mcp_server.models.models import CheckovScanRequest
 from unittest.mock import MagicMock, patch
 
 
+CHECKOV_RUN_COMMAND = 'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan.run_command'
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -151,8 +153,8 @@ async def test_run_checkov_scan_with_absolute_path(temp_terraform_dir):
     )
     mock_result.stderr = ''
 
-    # Mock subprocess.run and _ensure_checkov_installed
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner and _ensure_checkov_installed
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         with patch(
             'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
             return_value=True,
@@ -190,8 +192,8 @@ async def test_run_checkov_scan_with_relative_path(temp_terraform_dir):
     )
     mock_result.stderr = ''
 
-    # Mock subprocess.run, _ensure_checkov_installed, and os.path.isabs
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner, _ensure_checkov_installed, and os.path.isabs
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         with patch(
             'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
             return_value=True,
@@ -266,8 +268,8 @@ async def test_run_checkov_scan_cli_output_parsing(temp_terraform_dir):
     mock_result.stdout = cli_output
     mock_result.stderr = ''
 
-    # Mock subprocess.run and _ensure_checkov_installed
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner and _ensure_checkov_installed
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         with patch(
             'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
             return_value=True,
@@ -302,8 +304,8 @@ async def test_run_checkov_scan_with_return_code_2(temp_terraform_dir):
     mock_result.stdout = 'Error running checkov'
     mock_result.stderr = 'Failed to parse Terraform files'
 
-    # Mock subprocess.run and _ensure_checkov_installed
-    with patch('subprocess.run', return_value=mock_result):
+    # Mock the command runner and _ensure_checkov_installed
+    with patch(CHECKOV_RUN_COMMAND, return_value=mock_result):
         with patch(
             'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
             return_value=True,
@@ -329,8 +331,8 @@ async def test_run_checkov_scan_exception_handling(temp_terraform_dir):
         skip_check_ids=None,
     )
 
-    # Mock subprocess.run to raise an exception
-    with patch('subprocess.run', side_effect=Exception('Command execution failed')):
+    # Mock the command runner to raise an exception
+    with patch(CHECKOV_RUN_COMMAND, side_effect=Exception('Command execution failed')):
         with patch(
             'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
             return_value=True,
@@ -20,6 +20,8 @@ from unittest.mock import patch
 from urllib.parse import urlparse
 
 
+HTTP_CLIENT_GET = 'awslabs.terraform_mcp_server.impl.tools.http_client.HttpClient.get'
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -313,8 +315,8 @@ async def test_get_module_details_success(
         'verified': True,
     }
 
-    # Mock the requests.get function
-    with patch('requests.get') as mock_requests_get:
+    # Mock the shared HTTP client
+    with patch(HTTP_CLIENT_GET) as mock_http_get:
         # Setup the mock to return different responses based on the URL
         def mock_get_side_effect(url):
             # Use proper URL parsing for secure validation
@@ -328,7 +330,7 @@ async def test_get_module_details_success(
             else:
                 return MockResponse(404)
 
-        mock_requests_get.side_effect = mock_get_side_effect
+        mock_http_get.side_effect = mock_get_side_effect
 
         # Mock the GitHub release details
         mock_get_github_release_details.return_value = {
@@ -370,11 +372,11 @@ async def test_get_module_details_success(
         # that handles different URLs
 
 
-@patch('requests.get')
-async def test_get_module_details_error(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_error(mock_http_get):
     """Test the get_module_details function with error responses."""
     # Setup mock to return an error
-    mock_requests_get.return_value = MockResponse(404)
+    mock_http_get.return_value = MockResponse(404)
 
     # Call the function
     result = await get_module_details('nonexistent', 'module', 'aws')
@@ -383,7 +385,7 @@ async def test_get_module_details_error(mock_requests_get):
     assert result == {}
 
     # Verify the API call
-    mock_requests_get.assert_called_with(
+    mock_http_get.assert_called_with(
         'https://registry.terraform.io/v1/modules/nonexistent/module/aws'
     )
 
@@ -663,8 +665,8 @@ async def test_search_user_provided_module_impl_extract_outputs_from_readme(
     assert len(result.outputs) == 0
 
 
-@patch('requests.get')
-async def test_parse_module_url_with_http_scheme(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_parse_module_url_with_http_scheme(mock_http_get):
     """Test parse_module_url with HTTP scheme."""
     # Test with HTTP scheme
     result = parse_module_url('http://registry.terraform.io/hashicorp/consul/aws')
@@ -679,8 +681,8 @@ async def test_parse_module_url_with_http_scheme(mock_requests_get):
     assert result is None
 
 
-@patch('requests.get')
-async def test_get_module_details_with_readme_in_api(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_readme_in_api(mock_http_get):
     """Test get_module_details when README is directly in API response."""
     # Setup mock
     mock_response = MockResponse(
@@ -697,7 +699,7 @@ async def test_get_module_details_with_readme_in_api(mock_requests_get):
             'published_at': '2023-01-01T00:00:00Z',
         },
     )
-    mock_requests_get.return_value = mock_response
+    mock_http_get.return_value = mock_response
 
     # Call the function
     result = await get_module_details('hashicorp', 'consul', 'aws', '0.11.0')
@@ -708,8 +710,8 @@ async def test_get_module_details_with_readme_in_api(mock_requests_get):
     assert result['readme_content'] == '# Consul AWS Module\n\nThis module deploys Consul on AWS.'
 
 
-@patch('requests.get')
-async def test_get_module_details_with_github_source(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_github_source(mock_http_get):
     """Test get_module_details with GitHub source URL."""
 
     # Setup mocks for different API calls
@@ -740,7 +742,7 @@ async def test_get_module_details_with_github_source(mock_requests_get):
         else:
             return MockResponse(404)
 
-    mock_requests_get.side_effect = mock_get_side_effect
+    mock_http_get.side_effect = mock_get_side_effect
 
     # Mock the GitHub release details and variables.tf
     with patch(
@@ -788,8 +790,8 @@ async def test_get_module_details_with_github_source(mock_requests_get):
             assert result['variables'][0]['name'] == 'cluster_name'
 
 
-@patch('requests.get')
-async def test_get_module_details_with_large_readme(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_large_readme(mock_http_get):
     """Test get_module_details with a large README that gets truncated."""
     # Create a large README (over 8000 chars)
     large_readme = '# Large README\n\n' + ('x' * 8100)
@@ -809,7 +811,7 @@ async def test_get_module_details_with_large_readme(mock_requests_get):
             'published_at': '2023-01-01T00:00:00Z',
         },
     )
-    mock_requests_get.return_value = mock_response
+    mock_http_get.return_value = mock_response
 
     # Call the function
     result = await get_module_details('hashicorp', 'consul', 'aws', '0.11.0')
@@ -821,11 +823,11 @@ async def test_get_module_details_with_large_readme(mock_requests_get):
     assert '[README truncated due to length]' in result['readme_content']
 
 
-@patch('requests.get')
-async def test_get_module_details_with_api_error(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_api_error(mock_http_get):
     """Test get_module_details with API error."""
     # Setup mock to raise an exception
-    mock_requests_get.side_effect = Exception('API error')
+    mock_http_get.side_effect = Exception('API error')
 
     # Call the function
     result = await get_module_details('hashicorp', 'consul', 'aws', '0.11.0')
@@ -834,8 +836,8 @@ async def test_get_module_details_with_api_error(mock_requests_get):
     assert result == {}
 
 
-@patch('requests.get')
-async def test_get_module_details_no_readme_content(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_no_readme_content(mock_http_get):
     """Test get_module_details when no README content is found through any method."""
     # Setup mock for registry API response without README
     registry_response = MockResponse(
@@ -867,7 +869,7 @@ async def test_get_module_details_no_readme_content(mock_requests_get):
         else:
             return MockResponse(404)
 
-    mock_requests_get.side_effect = mock_get_side_effect
+    mock_http_get.side_effect = mock_get_side_effect
 
     # Mock GitHub release details and variables.tf to return empty values
     with patch(
@@ -887,8 +889,8 @@ async def test_get_module_details_no_readme_content(mock_requests_get):
             assert 'readme_content' not in result
 
 
-@patch('requests.get')
-async def test_get_module_details_with_variables_content(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_variables_content(mock_http_get):
     """Test get_module_details when variables are found in variables.tf."""
     # Setup mock for registry API response with GitHub source URL
     registry_response = MockResponse(
@@ -938,7 +940,7 @@ variable "num_servers" {
         else:
             return MockResponse(404)
 
-    mock_requests_get.side_effect = mock_get_side_effect
+    mock_http_get.side_effect = mock_get_side_effect
 
     # Skip mocking get_variables_tf and directly use the implementation
     # This will ensure the variables_content is processed correctly
@@ -959,8 +961,8 @@ variable "num_servers" {
     assert result['variables'][1]['default'] == '3'
 
 
-@patch('requests.get')
-async def test_get_module_details_with_variables_in_master_branch(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_variables_in_master_branch(mock_http_get):
     """Test get_module_details when variables are found in master branch (fallback)."""
     # Setup mock for registry API response with GitHub source URL
     registry_response = MockResponse(
@@ -1006,7 +1008,7 @@ variable "cluster_name" {
         else:
             return MockResponse(404)
 
-    mock_requests_get.side_effect = mock_get_side_effect
+    mock_http_get.side_effect = mock_get_side_effect
 
     # Call the function
     result = await get_module_details('hashicorp', 'consul', 'aws', '0.11.0')
@@ -1022,8 +1024,8 @@ variable "cluster_name" {
     assert result['variables'][0]['required'] is True
 
 
-@patch('requests.get')
-async def test_get_module_details_with_version_from_github(mock_requests_get):
+@patch(HTTP_CLIENT_GET)
+async def test_get_module_details_with_version_from_github(mock_http_get):
     """Test get_module_details when version is found from GitHub and no module version is set."""
     # Setup mock for registry API response with GitHub source URL but no version
     registry_response = MockResponse(
@@ -1066,7 +1068,7 @@ async def test_get_module_details_with_version_from_github(mock_requests_get):
                 )
         return MockResponse(404)
 
-    mock_requests_get.side_effect = mock_get_side_effect
+    mock_http_get.side_effect = mock_get_side_effect
 
     # Call the function directly without mocking get_github_release_details
     # This will test the actual code path that sets the version from GitHub
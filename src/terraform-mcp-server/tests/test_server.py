@@ -18,6 +18,7 @@ from awslabs.terraform_mcp_server.models import (
     CheckovScanResult,
     CheckovVulnerability,
     ModuleSearchResult,
+    ProviderResourceCatalogResult,
     SearchUserProvidedModuleResult,
     TerraformAWSCCProviderDocsResult,
     TerraformAWSProviderDocsResult,
@@ -32,7 +33,7 @@ from awslabs.terraform_mcp_server.server import (
     terraform_aws_provider_resources_listing,
     terraform_awscc_provider_resources_listing,
 )
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 class TestMCPServer:
@@ -95,12 +96,16 @@ class TestTools:
         mock_execute_terraform_command_impl.return_value = mock_result
 
         # Call the function
+        mock_ctx = MagicMock()
         result = await execute_terraform_command(
+            ctx=mock_ctx,
             command='init',
             working_directory=temp_dir,
             variables={'foo': 'bar'},
             aws_region='us-west-2',
             strip_ansi=True,
+            timeout=600,
+            init_if_stale=False,
         )
 
         # Verify the result
@@ -110,6 +115,8 @@ class TestTools:
         mock_execute_terraform_command_impl.assert_called_once()
         args, _ = mock_execute_terraform_command_impl.call_args
         request = args[0]
+        assert args[1] is mock_ctx
+        assert request.timeout == 600
         assert request.command == 'init'
         assert request.working_directory == temp_dir
         assert request.variables == {'foo': 'bar'}
@@ -203,6 +210,35 @@ class TestTools:
         # Verify the mock was called with the correct arguments
         mock_search_awscc_provider_docs_impl.assert_called_once_with('awscc_s3_bucket', 'resource')
 
+    def test_query_provider_resource_catalog_registration(self):
+        """Test that the query_provider_resource_catalog tool is registered correctly."""
+        tool = mcp._tool_manager.get_tool('QueryProviderResourceCatalog')
+        assert tool is not None
+        assert tool.name == 'QueryProviderResourceCatalog'
+        assert 'Query the catalog of AWS or AWSCC provider' in tool.description
+
+    @pytest.mark.asyncio
+    @patch('awslabs.terraform_mcp_server.server.query_provider_resource_catalog_impl')
+    async def test_query_provider_resource_catalog(self, mock_query_impl):
+        """Test the query_provider_resource_catalog function."""
+        from awslabs.terraform_mcp_server.server import query_provider_resource_catalog
+
+        mock_result = ProviderResourceCatalogResult(
+            status='success', provider='aws', provider_version='5.98.0'
+        )
+        mock_query_impl.return_value = mock_result
+
+        result = await query_provider_resource_catalog(
+            provider='aws',
+            category='Lambda',
+            name_prefix=None,
+            asset_type='resource',
+            limit=10,
+        )
+
+        assert result == mock_result
+        mock_query_impl.assert_called_once_with('aws', 'Lambda', None, 'resource', 10)
+
     def test_search_specific_aws_ia_modules_registration(self):
         """Test that the search_specific_aws_ia_modules tool is registered correctly."""
         tool = mcp._tool_manager.get_tool('SearchSpecificAwsIaModules')
@@ -296,6 +332,7 @@ class TestTools:
             check_ids=['CKV_AWS_1'],
             skip_check_ids=['CKV_AWS_2'],
             output_format='json',
+            background=False,
         )
 
         # Verify the result
@@ -310,6 +347,30 @@ class TestTools:
         assert request.check_ids == ['CKV_AWS_1']
         assert request.skip_check_ids == ['CKV_AWS_2']
         assert request.output_format == 'json'
+        assert request.background is False
+
+    def test_get_checkov_scan_result_registration(self):
+        """Test that the get_checkov_scan_result tool is registered correctly."""
+        tool = mcp._tool_manager.get_tool('GetCheckovScanResult')
+        assert tool is not None
+        assert tool.name == 'GetCheckovScanResult'
+        assert 'Checkov scan started in the background' in tool.description
+
+    @pytest.mark.asyncio
+    @patch('awslabs.terraform_mcp_server.server.get_checkov_scan_result_impl')
+    async def test_get_checkov_scan_result(self, mock_get_checkov_scan_result_impl):
+        """Test the get_checkov_scan_result function."""
+        from awslabs.terraform_mcp_server.server import get_checkov_scan_result
+
+        mock_result = CheckovScanResult(
+            status='running', working_directory='/path/to/dir', job_id='abc123'
+        )
+        mock_get_checkov_scan_result_impl.return_value = mock_result
+
+        result = await get_checkov_scan_result(job_id='abc123')
+
+        assert result == mock_result
+        mock_get_checkov_scan_result_impl.assert_called_once_with('abc123')
 
     def test_search_user_provided_module_registration(self):
         """Test that the search_user_provided_module tool is registered correctly."""
@@ -410,6 +471,7 @@ class TestTools:
 
         # Call the function
         result = await execute_terragrunt_command(
+            ctx=MagicMock(),
             command='init',
             working_directory=temp_dir,
             variables={'foo': 'bar'},
@@ -419,6 +481,8 @@ class TestTools:
             exclude_dirs=['/path/to/excluded'],
             run_all=False,
             terragrunt_config='custom-terragrunt.hcl',
+            timeout=None,
+            max_parallel_units=2,
         )
 
         # Verify the result
@@ -437,6 +501,7 @@ class TestTools:
         assert request.exclude_dirs == ['/path/to/excluded']
         assert request.run_all is False
         assert request.terragrunt_config == 'custom-terragrunt.hcl'
+        assert request.max_parallel_units == 2
 
 
 class TestResources:
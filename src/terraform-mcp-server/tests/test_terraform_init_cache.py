@@ -0,0 +1,181 @@
+"""Tests for the shared plugin cache and init state tracking."""
+
+import pytest
+from awslabs.terraform_mcp_server.impl.tools.command_runner import CommandResult
+from awslabs.terraform_mcp_server.impl.tools.execute_terraform_command import (
+    execute_terraform_command_impl,
+)
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import (
+    check_init_state,
+    compute_init_fingerprint,
+    configure_plugin_cache,
+    estimate_cache_savings,
+    parse_plugin_cache_hits,
+    record_init_state,
+    record_provider_downloads,
+)
+from awslabs.terraform_mcp_server.models import TerraformExecutionRequest
+from pathlib import Path
+from unittest.mock import patch
+
+
+TERRAFORM_RUN_COMMAND = (
+    'awslabs.terraform_mcp_server.impl.tools.execute_terraform_command.run_command'
+)
+
+MAIN_TF = """
+terraform {
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+
+module "vpc" {
+  source  = "terraform-aws-modules/vpc/aws"
+  version = "5.1.0"
+}
+
+resource "aws_s3_bucket" "example" {
+  bucket = "example"
+}
+"""
+
+LOCK_FILE = 'provider "registry.terraform.io/hashicorp/aws" {\n  version = "5.31.0"\n}\n'
+
+INIT_OUTPUT = """Initializing provider plugins...
+- Finding hashicorp/aws versions matching "~> 5.0"...
+- Using hashicorp/aws v5.31.0 from the shared cache directory
+- Installing hashicorp/random v3.6.0...
+- Installed hashicorp/random v3.6.0 (signed by HashiCorp)
+
+Terraform has been successfully initialized!
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Create an initialized Terraform working directory."""
+    (tmp_path / 'main.tf').write_text(MAIN_TF)
+    (tmp_path / '.terraform.lock.hcl').write_text(LOCK_FILE)
+    (tmp_path / '.terraform' / 'providers').mkdir(parents=True)
+    return tmp_path
+
+
+def test_configure_plugin_cache(isolated_plugin_cache):
+    """Test that the shared cache is set unless the caller configured one."""
+    env = {}
+    assert configure_plugin_cache(env) is True
+    assert env['TF_PLUGIN_CACHE_DIR'] == str(isolated_plugin_cache)
+    assert isolated_plugin_cache.is_dir()
+
+    env = {'TF_PLUGIN_CACHE_DIR': '/custom/cache'}
+    assert configure_plugin_cache(env) is False
+    assert env['TF_PLUGIN_CACHE_DIR'] == '/custom/cache'
+
+
+def test_fingerprint_tracks_init_inputs(workspace):
+    """Test that provider, backend and module changes all change the fingerprint."""
+    fingerprints = {compute_init_fingerprint(str(workspace))}
+    assert compute_init_fingerprint(str(workspace)) in fingerprints
+
+    # An inline provider requirement, which has no separate version line
+    (workspace / 'main.tf').write_text(
+        MAIN_TF.replace(
+            'aws = {', 'random = { source = "hashicorp/random", version = "3.6.0" }\n    aws = {'
+        )
+    )
+    fingerprints.add(compute_init_fingerprint(str(workspace)))
+
+    (workspace / 'backend.tf').write_text(
+        'terraform {\n  backend "s3" {\n    bucket = "a"\n  }\n}\n'
+    )
+    fingerprints.add(compute_init_fingerprint(str(workspace)))
+
+    (workspace / 'backend.tf').write_text(
+        'terraform {\n  backend "s3" {\n    bucket = "b"\n  }\n}\n'
+    )
+    fingerprints.add(compute_init_fingerprint(str(workspace)))
+
+    (workspace / '.terraform' / 'modules').mkdir()
+    (workspace / '.terraform' / 'modules' / 'modules.json').write_text('{"Modules": []}')
+    fingerprints.add(compute_init_fingerprint(str(workspace)))
+
+    assert len(fingerprints) == 5
+
+
+def test_init_state_tracks_lock_file(workspace):
+    """Test that a recorded init stays current until the lock file changes."""
+    assert check_init_state(str(workspace)) == (False, None)
+
+    record_init_state(str(workspace), 12.5)
+    assert check_init_state(str(workspace)) == (True, 12.5)
+
+    (workspace / '.terraform.lock.hcl').write_text(LOCK_FILE.replace('5.31.0', '5.32.0'))
+    assert check_init_state(str(workspace)) == (False, 12.5)
+
+
+def test_init_state_requires_installed_providers(workspace):
+    """Test that a removed .terraform/providers directory forces a new init."""
+    record_init_state(str(workspace), 3.0)
+    (workspace / '.terraform' / 'providers').rmdir()
+
+    assert check_init_state(str(workspace))[0] is False
+
+
+def test_cache_hits_and_savings():
+    """Test parsing cache hits and estimating the time they saved."""
+    record_provider_downloads(INIT_OUTPUT.replace('Using', 'Installed'), 20.0)
+
+    hits = parse_plugin_cache_hits(INIT_OUTPUT)
+
+    assert hits == ['hashicorp/aws v5.31.0']
+    assert estimate_cache_savings(hits) == 10.0
+    assert estimate_cache_savings(['hashicorp/null v3.2.0']) is None
+
+
+@pytest.mark.asyncio
+async def test_init_if_stale_skips_unchanged_workspace(workspace):
+    """Test that a second init with init_if_stale is skipped and reports the time saved."""
+    request = TerraformExecutionRequest(
+        command='init',
+        working_directory=str(workspace),
+        variables={},
+        aws_region=None,
+        strip_ansi=True,
+        init_if_stale=True,
+    )
+    init_result = CommandResult(returncode=0, stdout=INIT_OUTPUT, stderr='', duration=42.0)
+
+    with patch(TERRAFORM_RUN_COMMAND, return_value=init_result) as mock_run:
+        first = await execute_terraform_command_impl(request)
+        second = await execute_terraform_command_impl(request)
+
+    assert mock_run.call_count == 1
+    assert Path(mock_run.call_args[1]['env']['TF_PLUGIN_CACHE_DIR']).name == 'plugin-cache'
+    assert first.init_skipped is False
+    assert first.plugin_cache_hits == ['hashicorp/aws v5.31.0']
+    assert second.status == 'success'
+    assert second.init_skipped is True
+    assert second.time_saved_seconds == 42.0
+
+
+@pytest.mark.asyncio
+async def test_init_without_init_if_stale_always_runs(workspace):
+    """Test that init runs every time unless init_if_stale is set."""
+    request = TerraformExecutionRequest(
+        command='init',
+        working_directory=str(workspace),
+        variables={},
+        aws_region=None,
+        strip_ansi=True,
+    )
+    init_result = CommandResult(returncode=0, stdout=INIT_OUTPUT, stderr='', duration=1.0)
+
+    with patch(TERRAFORM_RUN_COMMAND, return_value=init_result) as mock_run:
+        await execute_terraform_command_impl(request)
+        await execute_terraform_command_impl(request)
+
+    assert mock_run.call_count == 2
@@ -0,0 +1,218 @@
+"""Tests for the native, dependency-aware Terragrunt run-all."""
+
+import asyncio
+import pytest
+from awslabs.terraform_mcp_server.impl.tools.command_runner import CommandResult
+from awslabs.terraform_mcp_server.impl.tools.execute_terragrunt_command import (
+    execute_terragrunt_command_impl,
+)
+from awslabs.terraform_mcp_server.impl.tools.terraform_init_cache import plugin_cache_lock
+from awslabs.terraform_mcp_server.impl.tools.terragrunt_run_all import (
+    MAX_UNIT_OUTPUT_CHARS,
+    build_dependency_graph,
+    discover_units,
+    parse_unit_dependencies,
+    schedule_units,
+    select_units,
+)
+from awslabs.terraform_mcp_server.models import TerragruntExecutionRequest, TerragruntUnitResult
+from unittest.mock import patch
+
+
+RUN_ALL_RUN_COMMAND = 'awslabs.terraform_mcp_server.impl.tools.terragrunt_run_all.run_command'
+
+
+@pytest.fixture
+def unit_tree(tmp_path):
+    """Create a tree of units where app depends on vpc and db, and db depends on vpc."""
+    configs = {
+        'vpc': '',
+        'db': 'dependency "vpc" {\n  config_path = "../vpc"\n}\n',
+        'app': (
+            'dependency "db" {\n  config_path = "${get_terragrunt_dir()}/../db"\n}\n'
+            'dependencies {\n  paths = ["../vpc"]\n}\n'
+        ),
+    }
+    for name, config in configs.items():
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'terragrunt.hcl').write_text(config)
+    cache = tmp_path / 'app' / '.terragrunt-cache' / 'abc'
+    cache.mkdir(parents=True)
+    (cache / 'terragrunt.hcl').write_text('')
+    return tmp_path
+
+
+def make_request(working_directory, **kwargs):
+    """Build a run_all request with defaults for the tests."""
+    return TerragruntExecutionRequest(
+        working_directory=str(working_directory),
+        run_all=True,
+        **{'command': 'apply', 'variables': {}, **kwargs},
+    )
+
+
+def test_discover_units_skips_cache_directories(unit_tree):
+    """Test that units are found while .terragrunt-cache copies are ignored."""
+    units = discover_units(str(unit_tree))
+
+    assert units == [str(unit_tree / name) for name in ('app', 'db', 'vpc')]
+
+
+def test_parse_unit_dependencies(unit_tree):
+    """Test reading dependency and dependencies blocks."""
+    dependencies = parse_unit_dependencies(str(unit_tree / 'app'))
+
+    assert sorted(dependencies) == [str(unit_tree / 'db'), str(unit_tree / 'vpc')]
+
+
+def test_build_dependency_graph_detects_cycles(unit_tree):
+    """Test that a dependency cycle is rejected."""
+    (unit_tree / 'vpc' / 'terragrunt.hcl').write_text('dependencies {\n  paths = ["../app"]\n}\n')
+
+    with pytest.raises(ValueError, match='Dependency cycle'):
+        build_dependency_graph(discover_units(str(unit_tree)))
+
+
+def test_select_units_applies_filters(unit_tree):
+    """Test include and exclude filters, and that dependencies outside the run are ignored."""
+    units = select_units(str(unit_tree), None, ['vpc'])
+    graph = build_dependency_graph(units)
+
+    assert units == [str(unit_tree / 'app'), str(unit_tree / 'db')]
+    assert graph[str(unit_tree / 'app')] == {str(unit_tree / 'db')}
+    assert select_units(str(unit_tree), ['db'], None) == [str(unit_tree / 'db')]
+
+
+@pytest.mark.asyncio
+async def test_schedule_units_runs_independent_units_in_parallel():
+    """Test that units start once their dependencies finish, up to the parallelism limit."""
+    graph = {'a': set(), 'b': set(), 'c': set(), 'd': {'a', 'b'}}
+    active = 0
+    max_active = 0
+    finished = []
+
+    async def run_unit(unit):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        finished.append(unit)
+        return TerragruntUnitResult(path=unit, status='success')
+
+    results = await schedule_units(graph, run_unit, max_parallel_units=2)
+
+    assert max_active == 2
+    assert finished.index('d') > max(finished.index('a'), finished.index('b'))
+    assert all(result.status == 'success' for result in results.values())
+
+
+@pytest.mark.asyncio
+async def test_schedule_units_skips_dependents_of_failed_units():
+    """Test that a failure skips everything depending on the failed unit."""
+    graph = {'a': set(), 'b': {'a'}, 'c': {'b'}, 'd': set()}
+    started = []
+
+    async def run_unit(unit):
+        started.append(unit)
+        return TerragruntUnitResult(path=unit, status='error' if unit == 'a' else 'success')
+
+    results = await schedule_units(graph, run_unit, max_parallel_units=4)
+
+    assert sorted(started) == ['a', 'd']
+    assert results['b'].status == 'skipped'
+    assert results['c'].status == 'skipped'
+    assert results['d'].status == 'success'
+
+
+@pytest.mark.asyncio
+async def test_schedule_units_reverse_order_for_destroy():
+    """Test that dependents run before their dependencies in reverse mode."""
+    graph = {'vpc': set(), 'db': {'vpc'}, 'app': {'db', 'vpc'}}
+    order = []
+
+    async def run_unit(unit):
+        order.append(unit)
+        return TerragruntUnitResult(path=unit, status='success')
+
+    await schedule_units(graph, run_unit, max_parallel_units=4, reverse=True)
+
+    assert order == ['app', 'db', 'vpc']
+
+
+@pytest.mark.asyncio
+async def test_execute_terragrunt_command_native_run_all(unit_tree):
+    """Test that run_all runs each unit in dependency order and reports per-unit results."""
+    calls = []
+
+    async def fake_run_command(cmd, cwd, **kwargs):
+        calls.append((cwd, cmd))
+        if cmd[1] == 'output':
+            return CommandResult(0, '{"id": {"value": "x", "type": "string"}}', '', 0.1)
+        return CommandResult(0, 'Apply complete!\n', '', 0.1)
+
+    request = make_request(unit_tree, variables={'env': 'test'}, max_parallel_units=2)
+    with patch(RUN_ALL_RUN_COMMAND, side_effect=fake_run_command):
+        result = await execute_terragrunt_command_impl(request)
+
+    applies = [(cwd, cmd) for cwd, cmd in calls if cmd[1] == 'apply']
+    assert [cwd for cwd, _ in applies] == [str(unit_tree / name) for name in ('vpc', 'db', 'app')]
+    assert applies[0][1] == ['terragrunt', 'apply', '-auto-approve', '-var=env=test']
+    assert result.status == 'success'
+    assert result.affected_dirs == ['app', 'db', 'vpc']
+    assert [unit.outputs for unit in result.unit_results] == [{'id': 'x'}] * 3
+    assert result.unit_results[0].dependencies == ['db', 'vpc']
+
+
+@pytest.mark.asyncio
+async def test_execute_terragrunt_command_native_run_all_failure(unit_tree):
+    """Test that a failed unit makes the run fail and skips its dependents."""
+
+    async def fake_run_command(cmd, cwd, **kwargs):
+        if cwd.endswith('db'):
+            return CommandResult(1, '', 'Error: access denied\n', 0.1)
+        return CommandResult(0, '', '', 0.1)
+
+    with patch(RUN_ALL_RUN_COMMAND, side_effect=fake_run_command):
+        result = await execute_terragrunt_command_impl(make_request(unit_tree, command='plan'))
+
+    statuses = {unit.path: unit.status for unit in result.unit_results}
+    assert statuses == {'app': 'skipped', 'db': 'error', 'vpc': 'success'}
+    assert result.status == 'error'
+    assert result.error_message == '2 of 3 units did not succeed'
+
+
+@pytest.mark.asyncio
+async def test_execute_terragrunt_command_native_run_all_serializes_inits(unit_tree):
+    """Test that units init under the plugin cache lock and then run without auto-init."""
+    calls = []
+
+    async def fake_run_command(cmd, cwd, **kwargs):
+        calls.append((cmd[1], plugin_cache_lock().locked(), kwargs))
+        return CommandResult(0, '', '', 0.1)
+
+    with (
+        patch(RUN_ALL_RUN_COMMAND, side_effect=fake_run_command),
+        patch.dict('os.environ', {'TF_PLUGIN_CACHE_DIR': ''}),
+    ):
+        result = await execute_terragrunt_command_impl(make_request(unit_tree, command='plan'))
+
+    assert result.status == 'success'
+    inits = [call for call in calls if call[0] == 'init']
+    plans = [call for call in calls if call[0] == 'plan']
+    assert len(inits) == len(plans) == 3
+    assert all(locked for _, locked, _ in inits)
+    assert not any(locked for _, locked, _ in plans)
+    assert all(kwargs['env']['TERRAGRUNT_NO_AUTO_INIT'] == 'true' for _, _, kwargs in plans)
+    assert all(kwargs['max_output_chars'] == MAX_UNIT_OUTPUT_CHARS for _, _, kwargs in calls)
+
+
+@pytest.mark.asyncio
+async def test_execute_terragrunt_command_run_all_rejects_terragrunt_config(unit_tree):
+    """Test that a custom config file cannot be combined with run_all."""
+    request = make_request(unit_tree, terragrunt_config='custom.hcl')
+
+    result = await execute_terragrunt_command_impl(request)
+
+    assert result.status == 'error'
+    assert 'cannot be used with run-all' in result.error_message
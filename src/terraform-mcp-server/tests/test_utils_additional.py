@@ -10,6 +10,8 @@ from awslabs.terraform_mcp_server.models import TerraformVariable
 from unittest.mock import MagicMock, patch
 
 
+HTTP_CLIENT_GET = 'awslabs.terraform_mcp_server.impl.tools.http_client.HttpClient.get'
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -19,8 +21,8 @@ class TestGetGithubReleaseDetails:
     @pytest.mark.asyncio
     async def test_get_github_release_details_with_latest_release(self):
         """Test getting GitHub release details with a latest release."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create a mock response for the latest release
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -33,7 +35,7 @@ class TestGetGithubReleaseDetails:
             # Call the function
             result = await get_github_release_details('owner', 'repo')
 
-            # Check that requests.get was called with the correct URL
+            # Check that the HTTP client was called with the correct URL
             mock_get.assert_called_once_with(
                 'https://api.github.com/repos/owner/repo/releases/latest'
             )
@@ -46,8 +48,8 @@ class TestGetGithubReleaseDetails:
     @pytest.mark.asyncio
     async def test_get_github_release_details_with_tags(self):
         """Test getting GitHub release details with tags when no releases are found."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create mock responses
             mock_release_response = MagicMock()
             mock_release_response.status_code = 404  # No releases found
@@ -84,7 +86,7 @@ class TestGetGithubReleaseDetails:
             # Call the function
             result = await get_github_release_details('owner', 'repo')
 
-            # Check that requests.get was called with the correct URLs
+            # Check that the HTTP client was called with the correct URLs
             assert mock_get.call_count == 2
             mock_get.assert_any_call('https://api.github.com/repos/owner/repo/releases/latest')
             mock_get.assert_any_call('https://api.github.com/repos/owner/repo/tags')
@@ -97,8 +99,8 @@ class TestGetGithubReleaseDetails:
     @pytest.mark.asyncio
     async def test_get_github_release_details_with_no_releases_or_tags(self):
         """Test getting GitHub release details with no releases or tags."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create mock responses
             mock_release_response = MagicMock()
             mock_release_response.status_code = 404  # No releases found
@@ -120,7 +122,7 @@ class TestGetGithubReleaseDetails:
             # Call the function
             result = await get_github_release_details('owner', 'repo')
 
-            # Check that requests.get was called with the correct URLs
+            # Check that the HTTP client was called with the correct URLs
             assert mock_get.call_count == 2
             mock_get.assert_any_call('https://api.github.com/repos/owner/repo/releases/latest')
             mock_get.assert_any_call('https://api.github.com/repos/owner/repo/tags')
@@ -132,8 +134,8 @@ class TestGetGithubReleaseDetails:
     @pytest.mark.asyncio
     async def test_get_github_release_details_with_exception(self):
         """Test getting GitHub release details with an exception."""
-        # Mock the requests.get function to raise an exception
-        with patch('requests.get', side_effect=Exception('Test exception')):
+        # Mock the shared HTTP client to raise an exception
+        with patch(HTTP_CLIENT_GET, side_effect=Exception('Test exception')):
             # Call the function
             result = await get_github_release_details('owner', 'repo')
 
@@ -148,8 +150,8 @@ class TestGetSubmodules:
     @pytest.mark.asyncio
     async def test_get_submodules_with_submodules(self):
         """Test getting submodules with submodules."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create mock responses
             mock_modules_response = MagicMock()
             mock_modules_response.status_code = 200
@@ -206,7 +208,7 @@ module "submodule1" {
             # Call the function with explicit branch parameter
             result = await get_submodules('owner', 'repo', 'master')
 
-            # Check that requests.get was called with the correct URLs
+            # Check that the HTTP client was called with the correct URLs
             assert mock_get.call_count >= 3
             mock_get.assert_any_call(
                 'https://api.github.com/repos/owner/repo/contents/modules?ref=master',
@@ -228,8 +230,8 @@ module "submodule1" {
     @pytest.mark.asyncio
     async def test_get_submodules_with_no_modules_directory(self):
         """Test getting submodules with no modules directory."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create a mock response
             mock_response = MagicMock()
             mock_response.status_code = 404  # No modules directory found
@@ -238,7 +240,7 @@ module "submodule1" {
             # Call the function with explicit branch parameter
             result = await get_submodules('owner', 'repo', 'master')
 
-            # Check that requests.get was called with the correct URL
+            # Check that the HTTP client was called with the correct URL
             mock_get.assert_called_once_with(
                 'https://api.github.com/repos/owner/repo/contents/modules?ref=master',
                 headers={'Accept': 'application/vnd.github.v3+json'},
@@ -251,8 +253,8 @@ module "submodule1" {
     @pytest.mark.asyncio
     async def test_get_submodules_with_rate_limit(self):
         """Test getting submodules with a rate limit error."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create a mock response
             mock_response = MagicMock()
             mock_response.status_code = 403  # Rate limit exceeded
@@ -261,7 +263,7 @@ module "submodule1" {
             # Call the function with explicit branch parameter
             result = await get_submodules('owner', 'repo', 'master')
 
-            # Check that requests.get was called with the correct URL
+            # Check that the HTTP client was called with the correct URL
             mock_get.assert_called_once_with(
                 'https://api.github.com/repos/owner/repo/contents/modules?ref=master',
                 headers={'Accept': 'application/vnd.github.v3+json'},
@@ -274,8 +276,8 @@ module "submodule1" {
     @pytest.mark.asyncio
     async def test_get_submodules_with_exception(self):
         """Test getting submodules with an exception."""
-        # Mock the requests.get function to raise an exception
-        with patch('requests.get', side_effect=Exception('Test exception')):
+        # Mock the shared HTTP client to raise an exception
+        with patch(HTTP_CLIENT_GET, side_effect=Exception('Test exception')):
             # Call the function
             result = await get_submodules('owner', 'repo')
 
@@ -289,8 +291,8 @@ class TestGetVariablesTf:
     @pytest.mark.asyncio
     async def test_get_variables_tf_with_variables(self):
         """Test getting variables.tf with variables."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create a mock response
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -331,7 +333,7 @@ variable "instance_type" {
                 # Call the function
                 content, variables = await get_variables_tf('owner', 'repo')
 
-                # Check that requests.get was called with the correct URL
+                # Check that the HTTP client was called with the correct URL
                 mock_get.assert_called_once_with(
                     'https://raw.githubusercontent.com/owner/repo/main/variables.tf',
                     timeout=3.0,
@@ -358,8 +360,8 @@ variable "instance_type" {
     @pytest.mark.asyncio
     async def test_get_variables_tf_with_no_variables_tf(self):
         """Test getting variables.tf with no variables.tf file."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create mock responses
             mock_main_response = MagicMock()
             mock_main_response.status_code = 404  # No variables.tf found in main branch
@@ -380,7 +382,7 @@ variable "instance_type" {
             # Call the function
             content, variables = await get_variables_tf('owner', 'repo')
 
-            # Check that requests.get was called with the correct URLs
+            # Check that the HTTP client was called with the correct URLs
             assert mock_get.call_count == 2
             mock_get.assert_any_call(
                 'https://raw.githubusercontent.com/owner/repo/main/variables.tf',
@@ -398,8 +400,8 @@ variable "instance_type" {
     @pytest.mark.asyncio
     async def test_get_variables_tf_with_master_branch_fallback(self):
         """Test getting variables.tf from the master branch as fallback."""
-        # Mock the requests.get function
-        with patch('requests.get') as mock_get:
+        # Mock the shared HTTP client
+        with patch(HTTP_CLIENT_GET) as mock_get:
             # Create mock responses
             mock_main_response = MagicMock()
             mock_main_response.status_code = 404  # No variables.tf found in main branch
@@ -440,7 +442,7 @@ variable "region" {
                 # Call the function
                 content, variables = await get_variables_tf('owner', 'repo')
 
-                # Check that requests.get was called with the correct URLs
+                # Check that the HTTP client was called with the correct URLs
                 assert mock_get.call_count == 2
                 mock_get.assert_any_call(
                     'https://raw.githubusercontent.com/owner/repo/main/variables.tf',
@@ -467,8 +469,8 @@ variable "region" {
     @pytest.mark.asyncio
     async def test_get_variables_tf_with_exception(self):
         """Test getting variables.tf with an exception."""
-        # Mock the requests.get function to raise an exception
-        with patch('requests.get', side_effect=Exception('Test exception')):
+        # Mock the shared HTTP client to raise an exception
+        with patch(HTTP_CLIENT_GET, side_effect=Exception('Test exception')):
             # Call the function
             content, variables = await get_variables_tf('owner', 'repo')
 
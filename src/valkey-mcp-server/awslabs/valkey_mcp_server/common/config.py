@@ -30,6 +30,17 @@ VALKEY_CFG = {
     'ssl_cert_reqs': os.getenv('VALKEY_SSL_CERT_REQS', 'required'),
     'ssl_ca_certs': os.getenv('VALKEY_SSL_CA_CERTS', None),
     'cluster_mode': os.getenv('VALKEY_CLUSTER_MODE', False) in ('true', '1', 't'),
+    'max_connections': int(os.getenv('VALKEY_MAX_CONNECTIONS', 10)),
+    'pool_timeout': float(os.getenv('VALKEY_POOL_TIMEOUT', 20)),
+    'health_check_interval': int(os.getenv('VALKEY_HEALTH_CHECK_INTERVAL', 30)),
+    'retries': int(os.getenv('VALKEY_RETRIES', 3)),
+    'analyzer_ops_per_sec': int(os.getenv('VALKEY_ANALYZER_OPS_PER_SEC', 1000)),
+    'near_cache': os.getenv('VALKEY_NEAR_CACHE', False) in ('true', '1', 't'),
+    'near_cache_max_entries': int(os.getenv('VALKEY_NEAR_CACHE_MAX_ENTRIES', 10000)),
+    'near_cache_max_bytes': int(os.getenv('VALKEY_NEAR_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    'near_cache_prefixes': [
+        prefix for prefix in os.getenv('VALKEY_NEAR_CACHE_PREFIXES', '').split(',') if prefix
+    ],
 }
 
 
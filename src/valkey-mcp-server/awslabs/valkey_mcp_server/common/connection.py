@@ -9,26 +9,64 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 
+import asyncio
 import sys
 from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
+from awslabs.valkey_mcp_server.common.near_cache import NearCache
 from awslabs.valkey_mcp_server.version import __version__
-from typing import Optional, Type, Union
-from valkey import (
-    Valkey,
-    exceptions,
-)
-from valkey.cluster import ValkeyCluster
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from valkey import exceptions
+from valkey.asyncio import BlockingConnectionPool, Connection, SSLConnection, Valkey
+from valkey.asyncio.cluster import ValkeyCluster
+from valkey.asyncio.retry import Retry
+from valkey.backoff import ExponentialBackoff
+
+
+def load_ca_path(ca_path: str) -> Optional[str]:
+    """Read the PEM certificates of a CA directory.
+
+    The asyncio client only accepts CA files or data, so the certificates of a directory are
+    passed to it as data.
+
+    Args:
+        ca_path: Directory of CA certificates
+
+    Returns:
+        Concatenated PEM certificates, or None if the directory holds none
+    """
+    certificates = []
+    for path in sorted(Path(ca_path).iterdir()):
+        if not path.is_file():
+            continue
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        if '-----BEGIN CERTIFICATE-----' in content:
+            certificates.append(content.strip())
+    return '\n'.join(certificates) if certificates else None
 
 
 class ValkeyConnectionManager:
     """Manages connection to Valkey."""
 
     _instance: Optional[Union[Valkey, ValkeyCluster]] = None
+    _connection_kwargs: Dict[str, Any] = {}
+    _near_cache: Optional[NearCache] = None
+    _near_cache_lock = asyncio.Lock()
 
     @classmethod
     def get_connection(cls, decode_responses: bool = True) -> Union[Valkey, ValkeyCluster]:
         """Create connection to Valkey if none present or returns existing connection.
 
+        The connection is an asyncio client, so tools await its commands without blocking the
+        event loop. Standalone connections share a pool of up to VALKEY_MAX_CONNECTIONS
+        connections, and tools wait up to VALKEY_POOL_TIMEOUT seconds for a free one; in
+        cluster mode each node gets up to VALKEY_MAX_CONNECTIONS connections. Idle connections
+        are checked with a PING before reuse, and commands failing on a broken connection are
+        retried on a new one with exponential backoff.
+
         Args:
             decode_responses: Whether to decode response bytes to strings. Defaults to True.
 
@@ -37,10 +75,6 @@ class ValkeyConnectionManager:
         """
         if cls._instance is None:
             try:
-                valkey_class: Type[Union[Valkey, ValkeyCluster]] = (
-                    ValkeyCluster if VALKEY_CFG['cluster_mode'] else Valkey
-                )
-
                 # Get SSL settings with defaults
                 ssl_enabled = VALKEY_CFG.get('ssl', False)
                 ssl_cert_reqs = VALKEY_CFG.get('ssl_cert_reqs')
@@ -48,29 +82,48 @@ class ValkeyConnectionManager:
                     ssl_cert_reqs = 'required'
 
                 # Build connection kwargs
-                connection_kwargs = {
+                connection_kwargs: Dict[str, Any] = {
                     'host': VALKEY_CFG['host'],
                     'port': VALKEY_CFG['port'],
                     'username': VALKEY_CFG.get('username'),
                     'password': VALKEY_CFG.get('password', ''),
-                    'ssl': ssl_enabled,
-                    'ssl_ca_path': VALKEY_CFG.get('ssl_ca_path'),
-                    'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
-                    'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
-                    'ssl_cert_reqs': ssl_cert_reqs,
-                    'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
                     'decode_responses': decode_responses,
                     'lib_name': f'valkey-py(mcp-server_v{__version__})',
+                    # Blocking stream reads may wait longer than the asyncio default of 5 seconds
+                    'socket_timeout': None,
+                    'health_check_interval': VALKEY_CFG.get('health_check_interval', 30),
+                    'retry': Retry(ExponentialBackoff(), VALKEY_CFG.get('retries', 3)),
+                    'retry_on_error': [exceptions.ConnectionError, exceptions.TimeoutError],
                 }
+                if ssl_enabled:
+                    ssl_ca_path = VALKEY_CFG.get('ssl_ca_path')
+                    connection_kwargs.update(
+                        {
+                            'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
+                            'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
+                            'ssl_cert_reqs': ssl_cert_reqs,
+                            'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
+                            'ssl_ca_data': load_ca_path(ssl_ca_path) if ssl_ca_path else None,
+                        }
+                    )
+
+                cls._connection_kwargs = dict(connection_kwargs)
 
-                # Add max_connections parameter based on mode
+                max_connections = VALKEY_CFG.get('max_connections', 10)
                 if VALKEY_CFG['cluster_mode']:
-                    connection_kwargs['max_connections_per_node'] = 10
+                    cls._instance = ValkeyCluster(
+                        ssl=ssl_enabled, max_connections=max_connections, **connection_kwargs
+                    )
                 else:
-                    connection_kwargs['max_connections'] = 10
-
-                # Create new instance
-                cls._instance = valkey_class(**connection_kwargs)
+                    # Wait for a free connection instead of failing when all are in use
+                    if ssl_enabled:
+                        connection_kwargs['connection_class'] = SSLConnection
+                    pool = BlockingConnectionPool(
+                        max_connections=max_connections,
+                        timeout=VALKEY_CFG.get('pool_timeout', 20),
+                        **connection_kwargs,
+                    )
+                    cls._instance = Valkey.from_pool(pool)
 
             except exceptions.AuthenticationError:
                 print('Authentication failed', file=sys.stderr)
@@ -95,3 +148,109 @@ class ValkeyConnectionManager:
                 raise
 
         return cls._instance
+
+    @classmethod
+    async def get_near_cache(cls) -> Optional[NearCache]:
+        """Return the client-side cache, starting it on first use, or None if disabled.
+
+        The cache is enabled with VALKEY_NEAR_CACHE. It holds up to
+        VALKEY_NEAR_CACHE_MAX_ENTRIES responses and VALKEY_NEAR_CACHE_MAX_BYTES bytes, and
+        listens for invalidations of the keys starting with VALKEY_NEAR_CACHE_PREFIXES (all keys
+        if unset) on a dedicated RESP3 connection to each primary. In cluster mode, the
+        primaries are discovered again periodically, so listeners follow failovers and
+        resharding.
+
+        Returns:
+            NearCache: The client-side cache, or None if it is disabled.
+        """
+        if not VALKEY_CFG.get('near_cache'):
+            return None
+        if cls._near_cache is not None:
+            return cls._near_cache
+
+        # Concurrent first reads must not start two sets of listeners
+        async with cls._near_cache_lock:
+            if cls._near_cache is not None:
+                return cls._near_cache
+
+            r = cls.get_connection()
+            discover = None
+            if VALKEY_CFG['cluster_mode']:
+
+                async def discover() -> List[Tuple[str, int]]:
+                    slots = await r.cluster_slots()
+                    return sorted(
+                        {
+                            (host or VALKEY_CFG['host'], int(port))
+                            for host, port in (slot['primary'] for slot in slots.values())
+                        }
+                    )
+
+                await r.initialize()
+                addresses = await discover()
+            else:
+                addresses = [(VALKEY_CFG['host'], VALKEY_CFG['port'])]
+
+            listener_kwargs = {
+                key: value
+                for key, value in cls._connection_kwargs.items()
+                if key not in ('host', 'port', 'connection_class')
+            }
+            listener_kwargs.update(
+                {'protocol': 3, 'decode_responses': True, 'socket_keepalive': True}
+            )
+            near_cache = NearCache(
+                VALKEY_CFG.get('near_cache_max_entries', 10000),
+                VALKEY_CFG.get('near_cache_max_bytes', 64 * 1024 * 1024),
+                VALKEY_CFG.get('near_cache_prefixes'),
+            )
+            near_cache.start(
+                addresses,
+                SSLConnection if VALKEY_CFG.get('ssl') else Connection,
+                listener_kwargs,
+                discover,
+            )
+            cls._near_cache = near_cache
+        return cls._near_cache
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the connection and its pool, if present."""
+        if cls._near_cache is not None:
+            near_cache, cls._near_cache = cls._near_cache, None
+            await near_cache.stop()
+        if cls._instance is not None:
+            instance, cls._instance = cls._instance, None
+            await instance.aclose()
+
+
+async def cached_read(command: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Read through the client-side cache, if enabled.
+
+    Args:
+        command: Command name, key and other arguments identifying the response
+        fetch: Function sending the command to the server
+
+    Returns:
+        Response of the command, from the cache if it holds it
+    """
+    near_cache = await ValkeyConnectionManager.get_near_cache()
+    if near_cache is None:
+        return await fetch()
+    return await near_cache.read(command, fetch)
+
+
+def invalidate_cached(*keys: str) -> None:
+    """Drop the client-side cached responses of keys written by this server, if enabled.
+
+    The server also sends an invalidation for the write, but on the listener connection and
+    possibly after the next read; invalidating locally lets that read see the write.
+
+    Args:
+        keys: Written keys
+    """
+    near_cache = ValkeyConnectionManager._near_cache
+    if near_cache is None:
+        return
+    for key in keys:
+        near_cache.invalidate(key)
@@ -0,0 +1,344 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Client-side cache of Valkey reads, kept coherent by server-assisted invalidation."""
+
+import asyncio
+import sys
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+
+# Seconds to wait before reconnecting a broken invalidation listener
+RECONNECT_DELAY = 1
+
+# Seconds between PINGs on a listener, and to wait for the reply before reconnecting; a
+# half-open connection otherwise looks like an idle one and silently misses invalidations
+LISTENER_PING_INTERVAL = 10
+LISTENER_PING_TIMEOUT = 5
+
+# Seconds between checks of the primaries to listen to, in cluster mode
+TOPOLOGY_REFRESH_INTERVAL = 30
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached response, in bytes."""
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _PendingRead:
+    """A read whose response must not be cached if its key is invalidated before it returns."""
+
+    __slots__ = ('stale',)
+
+    def __init__(self):
+        self.stale = False
+
+
+class NearCache:
+    """Bounded LRU cache of read responses, invalidated by the server.
+
+    A dedicated RESP3 connection to each primary enables CLIENT TRACKING in broadcast mode, so
+    the server pushes an invalidation message whenever a key (optionally limited to some
+    prefixes) is modified. Responses are only cached while every listener is tracking, and a
+    response is dropped if its key was invalidated while it was being read. The cache is
+    flushed whenever a listener disconnects or the set of primaries changes, since
+    invalidations may have been missed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        prefixes: Optional[List[str]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum estimated size of the cached responses, in bytes
+            prefixes: Key prefixes to track; all keys are tracked if empty
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.prefixes = prefixes or []
+
+        # Responses and their estimated sizes by command, in LRU order
+        self._entries: 'OrderedDict[Tuple[Any, ...], Tuple[Any, int]]' = OrderedDict()
+        self._commands_by_key: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self._pending_reads: Dict[str, Set[_PendingRead]] = {}
+        self._bytes = 0
+
+        self._listeners: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._topology_watcher: Optional[asyncio.Task] = None
+        self._tracking: Set[Tuple[str, int]] = set()
+        self._addresses: List[Tuple[str, int]] = []
+        self._connection_class: Any = None
+        self._connection_kwargs: Dict[str, Any] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether every listener is tracking, so responses can be cached."""
+        return bool(self._addresses) and len(self._tracking) == len(self._addresses)
+
+    def start(
+        self,
+        addresses: List[Tuple[str, int]],
+        connection_class: Type[Any],
+        connection_kwargs: Dict[str, Any],
+        discover: Optional[Callable[[], Awaitable[List[Tuple[str, int]]]]] = None,
+    ) -> None:
+        """Start listening for invalidations from the given servers, if not listening yet.
+
+        Args:
+            addresses: Host and port of each primary
+            connection_class: Class of the listener connections
+            connection_kwargs: Arguments of the listener connections
+            discover: Function returning the current primaries, called periodically to follow
+                topology changes; the primaries are fixed if None
+        """
+        if self._listeners:
+            return
+        self._connection_class = connection_class
+        self._connection_kwargs = connection_kwargs
+        self.set_addresses(addresses)
+        if discover is not None:
+            self._topology_watcher = asyncio.create_task(self._watch_topology(discover))
+
+    def set_addresses(self, addresses: List[Tuple[str, int]]) -> None:
+        """Listen to the given servers, flushing the cache if they changed.
+
+        Args:
+            addresses: Host and port of each primary
+        """
+        if set(addresses) == set(self._listeners):
+            return
+        if self._listeners:
+            print(f'Near cache listening to new primaries: {addresses}', file=sys.stderr)
+        for address in set(self._listeners) - set(addresses):
+            self._listeners.pop(address).cancel()
+            self._tracking.discard(address)
+        for address in addresses:
+            if address not in self._listeners:
+                self._listeners[address] = asyncio.create_task(
+                    self._listen(address, self._connection_class, self._connection_kwargs)
+                )
+        self._addresses = list(addresses)
+        self.flush()
+
+    async def _watch_topology(
+        self, discover: Callable[[], Awaitable[List[Tuple[str, int]]]]
+    ) -> None:
+        """Follow the primaries returned by discover, until stopped."""
+        while True:
+            await asyncio.sleep(TOPOLOGY_REFRESH_INTERVAL)
+            try:
+                self.set_addresses(await discover())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f'Near cache failed to refresh the primaries: {e}', file=sys.stderr)
+
+    async def stop(self) -> None:
+        """Stop the listeners and flush the cache."""
+        tasks = list(self._listeners.values())
+        if self._topology_watcher is not None:
+            tasks.append(self._topology_watcher)
+            self._topology_watcher = None
+        self._listeners = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._addresses = []
+        self.flush()
+
+    async def _listen(
+        self,
+        address: Tuple[str, int],
+        connection_class: Type[Any],
+        connection_kwargs: Dict[str, Any],
+    ) -> None:
+        """Track keys on one server and apply its invalidations, reconnecting when needed."""
+        host, port = address
+        tracking_args: List[str] = ['CLIENT', 'TRACKING', 'ON', 'BCAST']
+        for prefix in self.prefixes:
+            tracking_args.extend(['PREFIX', prefix])
+
+        while True:
+            connection = connection_class(host=host, port=port, **connection_kwargs)
+            try:
+                await connection.connect()
+                connection._parser.set_invalidation_push_handler(self._handle_invalidation)
+                await connection.send_command(*tracking_args)
+                await connection.read_response()
+                self._tracking.add(address)
+                await self._read_invalidations(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f'Near cache listener for {host}:{port} failed: {e}', file=sys.stderr)
+            finally:
+                self._tracking.discard(address)
+                self.flush()
+                await connection.disconnect(nowait=True)
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _read_invalidations(self, connection: Any) -> None:
+        """Read invalidations from a listener, PINGing it when idle to detect a dead server.
+
+        Raises:
+            ConnectionError: If the server does not reply to a PING in time
+        """
+        loop = asyncio.get_running_loop()
+        next_ping = loop.time() + LISTENER_PING_INTERVAL
+        ping_deadline = None
+        while True:
+            if ping_deadline is None and loop.time() >= next_ping:
+                await connection.send_command('PING', check_health=False)
+                ping_deadline = loop.time() + LISTENER_PING_TIMEOUT
+            wait = (ping_deadline or next_ping) - loop.time()
+            # Returns None on timeout, or after applying an invalidation
+            response = await connection.read_response(timeout=max(wait, 0), push_request=True)
+            if response == 'PONG':
+                ping_deadline = None
+                next_ping = loop.time() + LISTENER_PING_INTERVAL
+            elif ping_deadline is not None and loop.time() >= ping_deadline:
+                raise ConnectionError(f'No reply to PING in {LISTENER_PING_TIMEOUT} seconds')
+
+    def _handle_invalidation(self, message: List[Any]) -> None:
+        """Apply an invalidation push message: ["invalidate", keys or None for a flush]."""
+        keys = message[1]
+        if keys is None:
+            self.flush()
+            return
+        for key in keys:
+            self.invalidate(key.decode() if isinstance(key, bytes) else key)
+
+    async def read(self, command: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached response of a command, or fetch and cache it.
+
+        Args:
+            command: Command name, key and other arguments identifying the response
+            fetch: Function sending the command to the server
+
+        Returns:
+            Response of the command
+        """
+        if not self.ready or not command[1].startswith(tuple(self.prefixes) or ''):
+            # Keys outside the tracked prefixes are never invalidated, so are never cached
+            return await fetch()
+
+        entry = self._entries.get(command)
+        if entry is not None:
+            self._entries.move_to_end(command)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        key = command[1]
+        read = _PendingRead()
+        self._pending_reads.setdefault(key, set()).add(read)
+        try:
+            response = await fetch()
+        finally:
+            reads = self._pending_reads[key]
+            reads.discard(read)
+            if not reads:
+                del self._pending_reads[key]
+
+        if not read.stale and self.ready:
+            self._set(command, response)
+        return response
+
+    def _set(self, command: Tuple[Any, ...], response: Any) -> None:
+        """Cache a response, evicting the least recently used ones beyond the bounds."""
+        size = estimate_size(response)
+        if size > self.max_bytes:
+            return
+        self._delete(command)
+        self._entries[command] = (response, size)
+        self._commands_by_key.setdefault(command[1], set()).add(command)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._delete(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _delete(self, command: Tuple[Any, ...]) -> None:
+        """Remove a cached response."""
+        entry = self._entries.pop(command, None)
+        if entry is None:
+            return
+        self._bytes -= entry[1]
+        key = command[1]
+        commands = self._commands_by_key.get(key)
+        if commands is not None:
+            commands.discard(command)
+            if not commands:
+                del self._commands_by_key[key]
+
+    def invalidate(self, key: str) -> None:
+        """Remove the cached responses of a key and mark its pending reads stale.
+
+        Args:
+            key: Modified key
+        """
+        for read in self._pending_reads.get(key, ()):
+            read.stale = True
+        commands = self._commands_by_key.pop(key, None)
+        if commands:
+            self.invalidations += 1
+            for command in commands:
+                entry = self._entries.pop(command, None)
+                if entry is not None:
+                    self._bytes -= entry[1]
+
+    def flush(self) -> None:
+        """Remove every cached response and mark all pending reads stale."""
+        for reads in self._pending_reads.values():
+            for read in reads:
+                read.stale = True
+        self._entries.clear()
+        self._commands_by_key.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the usage statistics of the cache.
+
+        Returns:
+            Dictionary of hits, misses, hit ratio, size, evictions and invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            'enabled': True,
+            'tracking': self.ready,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
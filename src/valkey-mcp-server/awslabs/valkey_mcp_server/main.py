@@ -13,10 +13,13 @@
 
 from awslabs.valkey_mcp_server.common.server import mcp
 from awslabs.valkey_mcp_server.tools import (
+    batch,  # noqa: F401
     bitmap,  # noqa: F401
+    diagnostics,  # noqa: F401
     hash,  # noqa: F401
     hyperloglog,  # noqa: F401
     json,  # noqa: F401
+    keyspace,  # noqa: F401
     list,  # noqa: F401
     misc,  # noqa: F401
     server_management,  # noqa: F401
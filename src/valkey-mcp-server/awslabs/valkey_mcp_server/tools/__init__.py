@@ -14,10 +14,13 @@ Tool imports for Valkey MCP Server.
 """
 
 from . import (
+    batch,
     bitmap,
+    diagnostics,
     hash,
     hyperloglog,
     json,
+    keyspace,
     list,
     misc,
     server_management,
@@ -0,0 +1,317 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Batch operations for Valkey MCP Server."""
+
+import asyncio
+import inspect
+import json
+from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
+from awslabs.valkey_mcp_server.common.server import mcp
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Tuple, Union
+from valkey.asyncio.cluster import PipelineCommand
+from valkey.exceptions import AskError, MovedError, ValkeyError
+
+
+# Maximum number of operations in one batch
+MAX_BATCH_OPERATIONS = 1000
+
+# Commands whose second argument is a key too
+MOVE_COMMANDS = frozenset({'LMOVE', 'SMOVE'})
+
+# Maximum number of times the transaction of a hash slot is sent again after a MOVED or ASK
+# redirection, e.g. while the cluster is resharding or failing over
+MAX_TRANSACTION_REDIRECTS = 5
+
+# Commands allowed in a batch; all take a key as their first argument
+BATCH_COMMANDS = frozenset(
+    {
+        # Keys
+        'DEL',
+        'EXISTS',
+        'EXPIRE',
+        'PERSIST',
+        'TTL',
+        'TYPE',
+        'UNLINK',
+        # Strings
+        'APPEND',
+        'DECR',
+        'DECRBY',
+        'GET',
+        'GETRANGE',
+        'GETSET',
+        'INCR',
+        'INCRBY',
+        'INCRBYFLOAT',
+        'SET',
+        'SETRANGE',
+        'STRLEN',
+        # Bitmaps
+        'BITCOUNT',
+        'BITPOS',
+        'GETBIT',
+        'SETBIT',
+        # Hashes
+        'HDEL',
+        'HEXISTS',
+        'HGET',
+        'HGETALL',
+        'HINCRBY',
+        'HINCRBYFLOAT',
+        'HKEYS',
+        'HLEN',
+        'HMGET',
+        'HRANDFIELD',
+        'HSET',
+        'HSETNX',
+        'HSTRLEN',
+        'HVALS',
+        # HyperLogLogs
+        'PFADD',
+        'PFCOUNT',
+        # Lists
+        'LINDEX',
+        'LINSERT',
+        'LLEN',
+        'LMOVE',
+        'LPOP',
+        'LPOS',
+        'LPUSH',
+        'LRANGE',
+        'LREM',
+        'LSET',
+        'LTRIM',
+        'RPOP',
+        'RPUSH',
+        # Sets
+        'SADD',
+        'SCARD',
+        'SISMEMBER',
+        'SMEMBERS',
+        'SMOVE',
+        'SPOP',
+        'SRANDMEMBER',
+        'SREM',
+        # Sorted sets
+        'ZADD',
+        'ZCARD',
+        'ZCOUNT',
+        'ZINCRBY',
+        'ZPOPMAX',
+        'ZPOPMIN',
+        'ZRANGE',
+        'ZRANGEBYLEX',
+        'ZRANGEBYSCORE',
+        'ZRANK',
+        'ZREM',
+        'ZREMRANGEBYLEX',
+        'ZREMRANGEBYRANK',
+        'ZREMRANGEBYSCORE',
+        'ZREVRANGE',
+        'ZREVRANGEBYLEX',
+        'ZREVRANGEBYSCORE',
+        'ZREVRANK',
+        'ZSCORE',
+        # Streams
+        'XADD',
+        'XDEL',
+        'XLEN',
+        'XRANGE',
+        'XREVRANGE',
+        'XTRIM',
+        # JSON
+        'JSON.ARRAPPEND',
+        'JSON.ARRINDEX',
+        'JSON.ARRLEN',
+        'JSON.ARRPOP',
+        'JSON.ARRTRIM',
+        'JSON.CLEAR',
+        'JSON.DEL',
+        'JSON.GET',
+        'JSON.NUMINCRBY',
+        'JSON.NUMMULTBY',
+        'JSON.OBJKEYS',
+        'JSON.OBJLEN',
+        'JSON.SET',
+        'JSON.STRAPPEND',
+        'JSON.STRLEN',
+        'JSON.TOGGLE',
+        'JSON.TYPE',
+    }
+)
+
+
+class BatchOperation(BaseModel):
+    """A command executed as part of a batch."""
+
+    command: str = Field(..., description='Command name, e.g. HSET, GET or JSON.SET')
+    args: List[Union[str, int, float]] = Field(
+        ..., description='Command arguments, starting with the key'
+    )
+
+
+def _format_result(index: int, command: Tuple[Any, ...], result: Any) -> Dict[str, Any]:
+    """Format the result of one operation of a batch."""
+    entry: Dict[str, Any] = {'index': index, 'command': command[0]}
+    if isinstance(result, Exception):
+        entry['error'] = str(result)
+    else:
+        entry['result'] = result
+    return entry
+
+
+async def _execute_pipeline(r, commands: List[Tuple[Any, ...]], transaction: bool) -> List[Any]:
+    """Execute commands in one pipeline, returning a result or an exception for each.
+
+    In cluster mode, the pipeline sends the commands of each node in one round trip, to all
+    nodes concurrently.
+    """
+    pipeline_kwargs = {} if VALKEY_CFG['cluster_mode'] else {'transaction': transaction}
+    async with r.pipeline(**pipeline_kwargs) as pipe:
+        for command in commands:
+            pipe.execute_command(*command)
+        return await pipe.execute(raise_on_error=False)
+
+
+async def _apply_response_callback(node, command: Tuple[Any, ...], result: Any) -> Any:
+    """Convert the reply of a command returned by EXEC like the client converts direct replies.
+
+    EXEC returns the raw replies of the queued commands, e.g. a list of fields and values for
+    HGETALL, so the response callback of each command is applied as the standalone client does.
+    """
+    callback = node.response_callbacks.get(command[0])
+    if callback is None or isinstance(result, Exception):
+        return result
+    result = callback(result)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _execute_slot_transactions(r, commands: List[Tuple[Any, ...]]) -> List[Any]:
+    """Execute commands in one MULTI/EXEC transaction per hash slot, concurrently.
+
+    A cluster only runs transactions on keys of the same slot, so the commands are grouped by
+    the slot of their key and each group is sent to the primary of its slot as one pipeline.
+    A transaction redirected with MOVED is sent again after refreshing the slot table, and one
+    redirected with ASK is sent to the importing node after ASKING.
+    """
+    await r.initialize()
+    slots: Dict[int, List[int]] = {}
+    for index, command in enumerate(commands):
+        slots.setdefault(r.keyslot(command[1]), []).append(index)
+
+    results: List[Any] = [None] * len(commands)
+
+    async def execute_transaction(slot: int, indexes: List[int]) -> None:
+        ask_node = None
+        for _ in range(MAX_TRANSACTION_REDIRECTS + 1):
+            node = ask_node or r.nodes_manager.get_node_from_slot(slot)
+            stack = [PipelineCommand(0, 'ASKING')] if ask_node else []
+            stack.append(PipelineCommand(len(stack), 'MULTI'))
+            first = len(stack)
+            stack.extend(
+                PipelineCommand(position, *commands[index])
+                for position, index in enumerate(indexes, start=first)
+            )
+            stack.append(PipelineCommand(len(stack), 'EXEC'))
+            await node.execute_pipeline(stack)
+
+            redirect = next(
+                (cmd.result for cmd in stack if isinstance(cmd.result, AskError)), None
+            )
+            if redirect is None:
+                break
+            if isinstance(redirect, MovedError):
+                # The slot moved to another node; refresh the slot table and send it there
+                ask_node = None
+                await r.nodes_manager.initialize()
+            else:
+                # The slot is migrating and the keys are on the importing node
+                ask_node = r.get_node(host=redirect.host, port=redirect.port)
+                if ask_node is None:
+                    await r.nodes_manager.initialize()
+
+        exec_result = stack[-1].result
+        for position, index in enumerate(indexes, start=first):
+            if isinstance(exec_result, Exception):
+                # The transaction was aborted; report why each command was rejected
+                queued = stack[position].result
+                results[index] = queued if isinstance(queued, Exception) else exec_result
+            else:
+                results[index] = await _apply_response_callback(
+                    node, commands[index], exec_result[position - first]
+                )
+
+    await asyncio.gather(*(execute_transaction(slot, indexes) for slot, indexes in slots.items()))
+    return results
+
+
+@mcp.tool()
+async def execute_batch(operations: List[BatchOperation], transaction: bool = False) -> str:
+    """Execute many commands in one pipeline.
+
+    Commands are sent together and their replies read together, so a batch costs one network
+    round trip instead of one per command. In cluster mode, the commands of each node are
+    pipelined to all nodes concurrently.
+
+    Args:
+        operations: Commands to execute, in order (at most 1000)
+        transaction: Execute the commands atomically in a MULTI/EXEC transaction. In cluster
+            mode, the commands are grouped into one transaction per hash slot; use hash tags
+            (e.g. "{user:1}:profile") to keep related keys in the same transaction.
+
+    Returns:
+        JSON list with the result or error of each operation, or an error message
+    """
+    if not operations:
+        return 'No operations to execute'
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return f'Error: a batch can hold at most {MAX_BATCH_OPERATIONS} operations, got {len(operations)}'
+
+    commands = []
+    for index, operation in enumerate(operations):
+        command = operation.command.upper()
+        if command not in BATCH_COMMANDS:
+            return f"Error: command '{operation.command}' of operation {index} is not supported in batches"
+        if not operation.args:
+            return f"Error: command '{operation.command}' of operation {index} requires a key"
+        commands.append((command, *operation.args))
+
+    try:
+        r = ValkeyConnectionManager.get_connection()
+        if transaction and VALKEY_CFG['cluster_mode']:
+            results = await _execute_slot_transactions(r, commands)
+        else:
+            results = await _execute_pipeline(r, commands, transaction)
+    except ValkeyError as e:
+        return f'Error executing batch: {str(e)}'
+    finally:
+        # Any key of the batch may have been written, even if the batch failed part way
+        keys = [command[1] for command in commands]
+        keys.extend(
+            command[2] for command in commands if command[0] in MOVE_COMMANDS and len(command) > 2
+        )
+        invalidate_cached(*(str(key) for key in keys))
+
+    return json.dumps(
+        [
+            _format_result(index, command, result)
+            for index, (command, result) in enumerate(zip(commands, results))
+        ],
+        default=str,
+    )
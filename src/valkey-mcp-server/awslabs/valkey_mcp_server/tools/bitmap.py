@@ -11,7 +11,10 @@
 
 """Bitmap operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Optional
 from valkey.exceptions import ValkeyError
@@ -36,7 +39,8 @@ async def bitmap_set(key: str, offset: int, value: int) -> str:
             return f'Error: offset must be non-negative, got {offset}'
 
         r = ValkeyConnectionManager.get_connection()
-        previous = r.setbit(key, offset, value)
+        previous = await r.setbit(key, offset, value)
+        invalidate_cached(key)
         return f'Bit at offset {offset} set to {value} (previous value: {previous})'
     except ValkeyError as e:
         return f"Error setting bit in '{key}': {str(e)}"
@@ -58,7 +62,7 @@ async def bitmap_get(key: str, offset: int) -> str:
             return f'Error: offset must be non-negative, got {offset}'
 
         r = ValkeyConnectionManager.get_connection()
-        value = r.getbit(key, offset)
+        value = await r.getbit(key, offset)
         return f'Bit at offset {offset} is {value}'
     except ValkeyError as e:
         return f"Error getting bit from '{key}': {str(e)}"
@@ -83,10 +87,10 @@ async def bitmap_count(key: str, start: Optional[int] = None, end: Optional[int]
                 return 'Error: start and end must be non-negative'
             if start > end:
                 return 'Error: start must be less than or equal to end'
-            count = r.bitcount(key, start, end)
+            count = await r.bitcount(key, start, end)
             range_str = f' in range [{start}, {end}]'
         else:
-            count = r.bitcount(key)
+            count = await r.bitcount(key)
             range_str = ''
 
         return f'Number of set bits{range_str}: {count}'
@@ -135,7 +139,7 @@ async def bitmap_pos(
                 return 'Error: count must be positive'
             args.extend(['COUNT', count])
 
-        pos = r.bitpos(key, bit, *args) if args else r.bitpos(key, bit)
+        pos = await r.bitpos(key, bit, *args) if args else await r.bitpos(key, bit)
 
         if pos == -1 or pos is None:
             range_str = ''
@@ -0,0 +1,366 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Performance diagnostics operations for Valkey MCP Server."""
+
+import asyncio
+import json
+import math
+import time
+from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from typing import Any, Dict, List, Optional
+from valkey.exceptions import ValkeyError
+
+
+# Maximum time between the two samples, in seconds
+MAX_INTERVAL_SECONDS = 60
+
+# Maximum number of characters of a slow command shown in the report
+MAX_COMMAND_LENGTH = 200
+
+# INFO stats counters reported as per-second rates between the two samples
+RATE_COUNTERS = {
+    'total_commands_processed': 'ops_per_sec',
+    'total_net_input_bytes': 'net_input_bytes_per_sec',
+    'total_net_output_bytes': 'net_output_bytes_per_sec',
+    'keyspace_hits': 'keyspace_hits_per_sec',
+    'keyspace_misses': 'keyspace_misses_per_sec',
+    'expired_keys': 'expired_keys_per_sec',
+    'evicted_keys': 'evicted_keys_per_sec',
+    'rejected_connections': 'rejected_connections_per_sec',
+}
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank percentile of values, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _text(value: Any) -> Any:
+    """Decode a bytes value returned undecoded by the client."""
+    return value.decode('utf-8', errors='replace') if isinstance(value, bytes) else value
+
+
+async def _diagnostic_nodes(r) -> List[Any]:
+    """Return the nodes to diagnose: every node in cluster mode, None for a standalone server."""
+    if not VALKEY_CFG['cluster_mode']:
+        return [None]
+    await r.initialize()
+    return sorted(r.get_nodes(), key=lambda node: node.name)
+
+
+def _node_name(node: Any) -> str:
+    """Return the host:port name of a node."""
+    return f'{VALKEY_CFG["host"]}:{VALKEY_CFG["port"]}' if node is None else node.name
+
+
+async def _gather_requests(**requests: Any) -> Dict[str, Any]:
+    """Await requests concurrently, keeping the error of failed ones as their result."""
+    names = list(requests)
+    results = await asyncio.gather(*requests.values(), return_exceptions=True)
+    return dict(zip(names, results))
+
+
+async def _sample_counters(r, node: Any) -> Dict[str, Any]:
+    """Collect the INFO counters of a node."""
+    kwargs = {} if node is None else {'target_nodes': node}
+    return await _gather_requests(
+        commandstats=r.info('commandstats', **kwargs),
+        stats=r.info('stats', **kwargs),
+    )
+
+
+async def _sample_details(r, node: Any, slowlog_entries: int) -> Dict[str, Any]:
+    """Collect the INFO counters, slow log and latency monitor data of a node."""
+    kwargs = {} if node is None else {'target_nodes': node}
+    sample = await _gather_requests(
+        commandstats=r.info('commandstats', **kwargs),
+        stats=r.info('stats', **kwargs),
+        latencystats=r.info('latencystats', **kwargs),
+        slowlog=r.slowlog_get(slowlog_entries, **kwargs),
+        latency_latest=r.execute_command('LATENCY', 'LATEST', **kwargs),
+        latency_doctor=r.execute_command('LATENCY', 'DOCTOR', **kwargs),
+    )
+
+    latest = sample['latency_latest']
+    if isinstance(latest, list) and latest:
+        events = [_text(event[0]) for event in latest]
+        histories = await asyncio.gather(
+            *(r.execute_command('LATENCY', 'HISTORY', event, **kwargs) for event in events),
+            return_exceptions=True,
+        )
+        sample['latency_history'] = dict(zip(events, histories))
+    return sample
+
+
+def _command_deltas(
+    before: List[Dict[str, Any]], after: List[Dict[str, Any]], elapsed: float
+) -> Dict[str, Dict[str, Any]]:
+    """Sum the calls and time of each command between two samples of every node."""
+    commands: Dict[str, Dict[str, Any]] = {}
+    for node_before, node_after in zip(before, after):
+        if isinstance(node_before, Exception) or isinstance(node_after, Exception):
+            continue
+        for name, stat in node_after.items():
+            if not name.startswith('cmdstat_') or not isinstance(stat, dict):
+                continue
+            previous = node_before.get(name, {})
+            command = commands.setdefault(
+                name[len('cmdstat_') :], {'calls': 0, 'usec': 0, 'failed_calls': 0}
+            )
+            command['calls'] += stat.get('calls', 0) - previous.get('calls', 0)
+            command['usec'] += stat.get('usec', 0) - previous.get('usec', 0)
+            command['failed_calls'] += stat.get('failed_calls', 0) - previous.get(
+                'failed_calls', 0
+            )
+
+    total_usec = sum(command['usec'] for command in commands.values())
+    deltas = {}
+    for name, command in commands.items():
+        if command['calls'] <= 0:
+            continue
+        deltas[name] = {
+            'calls': command['calls'],
+            'ops_per_sec': round(command['calls'] / elapsed, 2),
+            'usec_per_call': round(command['usec'] / command['calls'], 2),
+            'time_share': round(command['usec'] / total_usec, 4) if total_usec else 0,
+            'failed_calls': command['failed_calls'],
+        }
+    return deltas
+
+
+def _latency_percentiles(latencystats: List[Any]) -> Dict[str, Dict[str, float]]:
+    """Return the p50 and p99 latency of each command, the highest across nodes."""
+    percentiles: Dict[str, Dict[str, float]] = {}
+    for stats in latencystats:
+        if not isinstance(stats, dict):
+            continue
+        for name, stat in stats.items():
+            if not name.startswith('latency_percentiles_usec_') or not isinstance(stat, dict):
+                continue
+            command = percentiles.setdefault(name[len('latency_percentiles_usec_') :], {})
+            for pct in ('p50', 'p99'):
+                if pct in stat:
+                    command[f'{pct}_usec'] = max(command.get(f'{pct}_usec', 0), stat[pct])
+    return percentiles
+
+
+def _throughput(
+    before: Dict[str, Any], after: Dict[str, Any], elapsed: float
+) -> Optional[Dict[str, Any]]:
+    """Return the per-second rates of the INFO stats counters of a node between two samples."""
+    if not isinstance(before, dict) or not isinstance(after, dict):
+        return None
+    rates: Dict[str, Any] = {
+        rate: round((after.get(counter, 0) - before.get(counter, 0)) / elapsed, 2)
+        for counter, rate in RATE_COUNTERS.items()
+    }
+    lookups = rates['keyspace_hits_per_sec'] + rates['keyspace_misses_per_sec']
+    rates['keyspace_hit_ratio'] = (
+        round(rates['keyspace_hits_per_sec'] / lookups, 4) if lookups else None
+    )
+    return rates
+
+
+def _slowlog_summary(entries: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    """Summarize the slow log entries of every node by command."""
+    durations: Dict[str, List[int]] = {}
+    for entry in entries:
+        name = _text(entry['command']).split(' ', 1)[0].lower()
+        durations.setdefault(name, []).append(entry['duration'])
+
+    by_command = [
+        {
+            'command': name,
+            'count': len(values),
+            'p50_usec': percentile(values, 50),
+            'p99_usec': percentile(values, 99),
+            'max_usec': max(values),
+        }
+        for name, values in durations.items()
+    ]
+    by_command.sort(key=lambda command: (-command['count'], -command['max_usec']))
+
+    slowest = sorted(entries, key=lambda entry: -entry['duration'])[:top]
+    return {
+        'entries': len(entries),
+        'by_command': by_command[:top],
+        'slowest': [
+            {
+                'node': entry['node'],
+                'duration_usec': entry['duration'],
+                'start_time': entry['start_time'],
+                'command': _text(entry['command'])[:MAX_COMMAND_LENGTH],
+                'client_address': _text(entry.get('client_address')),
+            }
+            for entry in slowest
+        ],
+    }
+
+
+def _latency_events(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize the latency monitor events of a node."""
+    events = {}
+    latest = sample['latency_latest']
+    if not isinstance(latest, list):
+        return events
+    histories = sample.get('latency_history', {})
+    for event in latest:
+        name = _text(event[0])
+        history = histories.get(name)
+        values = [point[1] for point in history] if isinstance(history, list) else []
+        events[name] = {
+            'latest_ms': event[2],
+            'max_ms': event[3],
+            'samples': len(values),
+            'p50_ms': percentile(values, 50),
+            'p99_ms': percentile(values, 99),
+        }
+    return events
+
+
+async def _hot_slots(r, entries: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    """Return the busiest hash slots of the cluster.
+
+    CLUSTER SLOT-STATS (Valkey 8.0+) ranks slots by the CPU time spent on them. On older
+    servers, slots are ranked by the number of slow log entries on their keys instead.
+    """
+    primaries = r.get_primaries()
+    results = await asyncio.gather(
+        *(
+            r.execute_command(
+                'CLUSTER', 'SLOT-STATS', 'ORDERBY', 'cpu-usec', 'LIMIT', top, target_nodes=node
+            )
+            for node in primaries
+        ),
+        return_exceptions=True,
+    )
+    if not any(isinstance(result, Exception) for result in results):
+        slots = []
+        for result in results:
+            for slot, stats in result:
+                if isinstance(stats, list):
+                    stats = dict(zip(stats[::2], stats[1::2]))
+                slots.append({'slot': slot, **{_text(k): v for k, v in stats.items()}})
+        slots.sort(key=lambda slot: -slot.get('cpu-usec', 0))
+        return {'source': 'cluster slot-stats', 'slots': slots[:top]}
+
+    counts: Dict[int, int] = {}
+    for entry in entries:
+        args = _text(entry['command']).split(' ')
+        if len(args) > 1:
+            slot = r.keyslot(args[1])
+            counts[slot] = counts.get(slot, 0) + 1
+    slots = [
+        {'slot': slot, 'slow_entries': count}
+        for slot, count in sorted(counts.items(), key=lambda item: -item[1])[:top]
+    ]
+    return {'source': 'slowlog', 'slots': slots}
+
+
+@mcp.tool()
+async def performance_diagnostics(
+    interval_seconds: float = 5, slowlog_entries: int = 128, top: int = 10
+) -> str:
+    """Diagnose server performance from two samples of the statistics of every node.
+
+    Collects INFO commandstats and stats from every node concurrently, waits interval_seconds,
+    then collects them again along with INFO latencystats, SLOWLOG, LATENCY LATEST, HISTORY and
+    DOCTOR. Reports the throughput of each node, the hot commands with their call rates and
+    time per call over the interval, their p50/p99 latency (since the statistics were last
+    reset), a summary of the slow log and latency events, and in cluster mode the hot slots.
+
+    Args:
+        interval_seconds: Seconds between the two samples (at most 60)
+        slowlog_entries: Number of recent slow log entries read from each node
+        top: Number of entries in each ranking of the report
+
+    Returns:
+        JSON performance report, or an error message
+    """
+    if not 0 < interval_seconds <= MAX_INTERVAL_SECONDS:
+        return f'Error: interval_seconds must be between 0 and {MAX_INTERVAL_SECONDS}'
+    if slowlog_entries < 0:
+        return 'Error: slowlog_entries must not be negative'
+    if top <= 0:
+        return 'Error: top must be positive'
+
+    try:
+        r = ValkeyConnectionManager.get_connection()
+        nodes = await _diagnostic_nodes(r)
+        before = await asyncio.gather(*(_sample_counters(r, node) for node in nodes))
+        started_at = time.monotonic()
+        await asyncio.sleep(interval_seconds)
+        after = await asyncio.gather(
+            *(_sample_details(r, node, slowlog_entries) for node in nodes)
+        )
+        elapsed = time.monotonic() - started_at
+    except ValkeyError as e:
+        return f'Error collecting diagnostics: {str(e)}'
+
+    names = [_node_name(node) for node in nodes]
+    errors: Dict[str, Dict[str, str]] = {}
+    for name, sample in [*zip(names, before), *zip(names, after)]:
+        for item, result in sample.items():
+            if isinstance(result, Exception):
+                errors.setdefault(name, {})[item] = str(result)
+
+    commands = _command_deltas(
+        [sample['commandstats'] for sample in before],
+        [sample['commandstats'] for sample in after],
+        elapsed,
+    )
+    percentiles = _latency_percentiles([sample['latencystats'] for sample in after])
+    hot_commands = [
+        {'command': name, **delta, **percentiles.get(name, {})}
+        for name, delta in sorted(commands.items(), key=lambda item: -item[1]['calls'])[:top]
+    ]
+
+    throughput = {
+        name: _throughput(node_before['stats'], node_after['stats'], elapsed)
+        for name, node_before, node_after in zip(names, before, after)
+    }
+    total_ops = sum(rates['ops_per_sec'] for rates in throughput.values() if rates)
+
+    slow_entries = [
+        {**entry, 'node': name}
+        for name, sample in zip(names, after)
+        if isinstance(sample['slowlog'], list)
+        for entry in sample['slowlog']
+    ]
+
+    report: Dict[str, Any] = {
+        'interval_seconds': round(elapsed, 3),
+        'nodes': names,
+        'total_ops_per_sec': round(total_ops, 2),
+        'throughput': throughput,
+        'hot_commands': hot_commands,
+        'slowlog': _slowlog_summary(slow_entries, top),
+        'latency_events': {name: _latency_events(sample) for name, sample in zip(names, after)},
+        'latency_doctor': {
+            name: _text(sample['latency_doctor'])
+            for name, sample in zip(names, after)
+            if not isinstance(sample['latency_doctor'], Exception)
+        },
+    }
+    if VALKEY_CFG['cluster_mode']:
+        try:
+            report['hot_slots'] = await _hot_slots(r, slow_entries, top)
+        except ValkeyError as e:
+            errors.setdefault('cluster', {})['hot_slots'] = str(e)
+    if errors:
+        report['errors'] = errors
+    return json.dumps(report, default=str)
@@ -11,7 +11,11 @@
 
 """Hash operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    cached_read,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Dict, Optional, Union
 from valkey.exceptions import ValkeyError
@@ -31,7 +35,8 @@ async def hash_set(key: str, field: str, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        r.hset(key, field, value)
+        await r.hset(key, field, value)
+        invalidate_cached(key)
         return f"Successfully set field '{field}' in hash '{key}'"
     except ValkeyError as e:
         return f"Error setting hash field in '{key}': {str(e)}"
@@ -50,7 +55,8 @@ async def hash_set_multiple(key: str, mapping: Dict[str, Any]) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hset(key, mapping=mapping)
+        result = await r.hset(key, mapping=mapping)
+        invalidate_cached(key)
         return f"Successfully set {result} fields in hash '{key}'"
     except ValkeyError as e:
         return f"Error setting multiple hash fields in '{key}': {str(e)}"
@@ -70,7 +76,8 @@ async def hash_set_if_not_exists(key: str, field: str, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hsetnx(key, field, value)
+        result = await r.hsetnx(key, field, value)
+        invalidate_cached(key)
         if result:
             return f"Successfully set field '{field}' in hash '{key}'"
         return f"Field '{field}' already exists in hash '{key}'"
@@ -91,7 +98,7 @@ async def hash_get(key: str, field: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hget(key, field)
+        result = await cached_read(('HGET', key, field), lambda: r.hget(key, field))
         if result is None:
             return f"Field '{field}' not found in hash '{key}'"
         return str(result)
@@ -111,7 +118,7 @@ async def hash_get_all(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hgetall(key)
+        result = await cached_read(('HGETALL', key), lambda: r.hgetall(key))
         if not result:
             return f"No fields found in hash '{key}'"
         return str(result)
@@ -132,7 +139,7 @@ async def hash_exists(key: str, field: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hexists(key, field)
+        result = await r.hexists(key, field)
         return str(result).lower()
     except ValkeyError as e:
         return f"Error checking hash field existence in '{key}': {str(e)}"
@@ -153,9 +160,10 @@ async def hash_increment(key: str, field: str, amount: Union[int, float] = 1) ->
     try:
         r = ValkeyConnectionManager.get_connection()
         if isinstance(amount, int):
-            result = r.hincrby(key, field, amount)
+            result = await r.hincrby(key, field, amount)
         else:
-            result = r.hincrbyfloat(key, field, amount)
+            result = await r.hincrbyfloat(key, field, amount)
+        invalidate_cached(key)
         return str(result)
     except ValkeyError as e:
         return f"Error incrementing hash field in '{key}': {str(e)}"
@@ -173,7 +181,7 @@ async def hash_keys(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hkeys(key)
+        result = await r.hkeys(key)
         if not result:
             return f"No fields found in hash '{key}'"
         return str(result)
@@ -193,7 +201,7 @@ async def hash_length(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hlen(key)
+        result = await r.hlen(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting hash length from '{key}': {str(e)}"
@@ -213,9 +221,9 @@ async def hash_random_field(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.hrandfield(key, count)
+            result = await r.hrandfield(key, count)
         else:
-            result = r.hrandfield(key)
+            result = await r.hrandfield(key)
         if not result:
             return f"No fields found in hash '{key}'"
         return str(result)
@@ -236,7 +244,7 @@ async def hash_random_field_with_values(key: str, count: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hrandfield(key, count, withvalues=True)
+        result = await r.hrandfield(key, count, withvalues=True)
         if not result:
             return f"No fields found in hash '{key}'"
         return str(result)
@@ -257,7 +265,7 @@ async def hash_strlen(key: str, field: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hstrlen(key, field)
+        result = await r.hstrlen(key, field)
         return str(result)
     except ValkeyError as e:
         return f"Error getting hash field value length from '{key}': {str(e)}"
@@ -275,7 +283,7 @@ async def hash_values(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.hvals(key)
+        result = await r.hvals(key)
         if not result:
             return f"No values found in hash '{key}'"
         return str(result)
@@ -11,7 +11,10 @@
 
 """HyperLogLog operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from valkey.exceptions import ValkeyError
 
@@ -32,7 +35,8 @@ async def hll_add(key: str, element: str) -> str:
             return 'Error: an element is required'
 
         r = ValkeyConnectionManager.get_connection()
-        result = r.pfadd(key, element)
+        result = await r.pfadd(key, element)
+        invalidate_cached(key)
         if result:
             return f"Added 1 element to '{key}'"
         return f"No new element added to '{key}' (already existed)"
@@ -52,7 +56,7 @@ async def hll_count(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        count = r.pfcount(key)
+        count = await r.pfcount(key)
         return f"Estimated unique elements in '{key}': {count}"
     except ValkeyError as e:
         return f"Error getting count from '{key}': {str(e)}"
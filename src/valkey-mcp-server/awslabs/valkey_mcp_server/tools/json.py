@@ -11,7 +11,11 @@
 
 """JSON operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    cached_read,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Optional, Union
 from valkey.exceptions import ValkeyError
@@ -39,7 +43,8 @@ async def json_set(key: str, path: str, value: Any, nx: bool = False, xx: bool =
         if xx:
             options['xx'] = True
 
-        result = r.json().set(key, path, value, **options)
+        result = await r.json().set(key, path, value, **options)
+        invalidate_cached(key)
         if result:
             return f"Successfully set value at path '{path}' in '{key}'"
         return f"Failed to set value at path '{path}' in '{key}' (path condition not met)"
@@ -77,7 +82,11 @@ async def json_get(
         if space is not None:
             options['space'] = space
 
-        result = r.json().get(key, path, **options) if path else r.json().get(key)
+        command = ('JSON.GET', key, path, *sorted(options.items()))
+        if path:
+            result = await cached_read(command, lambda: r.json().get(key, path, **options))
+        else:
+            result = await cached_read(command, lambda: r.json().get(key))
         if result is None:
             return f"No value found at path '{path or '.'}' in '{key}'"
         return str(result)
@@ -98,7 +107,7 @@ async def json_type(key: str, path: Optional[str] = None) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().type(key, path) if path else r.json().type(key)
+        result = await r.json().type(key, path) if path else await r.json().type(key)
         if result is None:
             return f"No value found at path '{path or '.'}' in '{key}'"
         return f"Type at path '{path or '.'}' in '{key}': {result}"
@@ -122,7 +131,8 @@ async def json_numincrby(key: str, path: str, value: Union[int, float]) -> str:
         r = ValkeyConnectionManager.get_connection()
         # Convert float to int by rounding if needed
         int_value = round(value) if isinstance(value, float) else value
-        result = r.json().numincrby(key, path, int_value)
+        result = await r.json().numincrby(key, path, int_value)
+        invalidate_cached(key)
         return f"Value at path '{path}' in '{key}' incremented to {result}"
     except ValkeyError as e:
         return f"Error incrementing JSON value in '{key}': {str(e)}"
@@ -144,7 +154,8 @@ async def json_nummultby(key: str, path: str, value: Union[int, float]) -> str:
         r = ValkeyConnectionManager.get_connection()
         # Convert float to int by rounding if needed
         int_value = round(value) if isinstance(value, float) else value
-        result = r.json().nummultby(key, path, int_value)
+        result = await r.json().nummultby(key, path, int_value)
+        invalidate_cached(key)
         return f"Value at path '{path}' in '{key}' multiplied to {result}"
     except ValkeyError as e:
         return f"Error multiplying JSON value in '{key}': {str(e)}"
@@ -164,7 +175,8 @@ async def json_strappend(key: str, path: str, value: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().strappend(key, path, value)
+        result = await r.json().strappend(key, path, value)
+        invalidate_cached(key)
         return f"String at path '{path}' in '{key}' appended, new length: {result}"
     except ValkeyError as e:
         return f"Error appending to JSON string in '{key}': {str(e)}"
@@ -183,7 +195,7 @@ async def json_strlen(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().strlen(key, path)
+        result = await r.json().strlen(key, path)
         if result is None:
             return f"No string found at path '{path}' in '{key}'"
         return f"Length of string at path '{path}' in '{key}': {result}"
@@ -208,7 +220,8 @@ async def json_arrappend(key: str, path: str, *values: Any) -> str:
             return 'Error: at least one value is required'
 
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().arrappend(key, path, *values)
+        result = await r.json().arrappend(key, path, *values)
+        invalidate_cached(key)
         return f"Array at path '{path}' in '{key}' appended, new length: {result}"
     except ValkeyError as e:
         return f"Error appending to JSON array in '{key}': {str(e)}"
@@ -238,7 +251,7 @@ async def json_arrindex(
             if stop is not None:
                 args.append(stop)
 
-        result = r.json().arrindex(key, path, *args)
+        result = await r.json().arrindex(key, path, *args)
         if result == -1:
             range_str = ''
             if start is not None or stop is not None:
@@ -262,7 +275,7 @@ async def json_arrlen(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().arrlen(key, path)
+        result = await r.json().arrlen(key, path)
         if result is None:
             return f"No array found at path '{path}' in '{key}'"
         return f"Length of array at path '{path}' in '{key}': {result}"
@@ -284,7 +297,8 @@ async def json_arrpop(key: str, path: str, index: int = -1) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().arrpop(key, path, index)
+        result = await r.json().arrpop(key, path, index)
+        invalidate_cached(key)
         if result is None:
             return f"No value found at index {index} in array at path '{path}' in '{key}'"
         return f"Popped value from index {index} in array at path '{path}' in '{key}': {result}"
@@ -307,7 +321,8 @@ async def json_arrtrim(key: str, path: str, start: int, stop: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().arrtrim(key, path, start, stop)
+        result = await r.json().arrtrim(key, path, start, stop)
+        invalidate_cached(key)
         return f"Array at path '{path}' in '{key}' trimmed to range [{start}, {stop}], new length: {result}"
     except ValkeyError as e:
         return f"Error trimming JSON array in '{key}': {str(e)}"
@@ -326,7 +341,7 @@ async def json_objkeys(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().objkeys(key, path)
+        result = await r.json().objkeys(key, path)
         if result is None:
             return f"No object found at path '{path}' in '{key}'"
         if not result:
@@ -351,7 +366,7 @@ async def json_objlen(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().objlen(key, path)
+        result = await r.json().objlen(key, path)
         if result is None:
             return f"No object found at path '{path}' in '{key}'"
         return f"Number of keys in object at path '{path}' in '{key}': {result}"
@@ -372,7 +387,8 @@ async def json_toggle(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().toggle(key, path)
+        result = await r.json().toggle(key, path)
+        invalidate_cached(key)
         if result is None:
             return f"No boolean value found at path '{path}' in '{key}'"
         return f"Boolean value at path '{path}' in '{key}' toggled to: {str(result).lower()}"
@@ -393,7 +409,8 @@ async def json_clear(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().clear(key, path)
+        result = await r.json().clear(key, path)
+        invalidate_cached(key)
         if result == 1:
             return f"Successfully cleared container at path '{path}' in '{key}'"
         return f"No container found at path '{path}' in '{key}'"
@@ -414,7 +431,8 @@ async def json_del(key: str, path: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.json().delete(key, path)
+        result = await r.json().delete(key, path)
+        invalidate_cached(key)
         if result == 1:
             return f"Successfully deleted value at path '{path}' in '{key}'"
         return f"No value found at path '{path}' in '{key}'"
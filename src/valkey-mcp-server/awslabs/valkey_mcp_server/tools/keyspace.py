@@ -0,0 +1,314 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Keyspace operations for Valkey MCP Server."""
+
+import asyncio
+import heapq
+import json
+import math
+import time
+from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from typing import Any, Dict, List, Optional, Tuple
+from valkey.exceptions import ValkeyError
+
+
+# Maximum number of SCAN calls made by one scan_keys call
+MAX_SCAN_CALLS = 10
+
+# Maximum number of keys sampled by one analyze_keyspace call
+MAX_SAMPLE_SIZE = 10000
+
+# Maximum number of keys analyzed in one pipeline
+MAX_PIPELINE_KEYS = 100
+
+# Commands sent to analyze each sampled key: TYPE, MEMORY USAGE, OBJECT ENCODING and TTL
+OPS_PER_KEY = 4
+
+
+class OpsBudget:
+    """Limits the rate of commands sent to the server to a number of operations per second."""
+
+    def __init__(self, ops_per_sec: int):
+        """Initialize the budget.
+
+        Args:
+            ops_per_sec: Maximum average number of operations per second
+        """
+        self.ops_per_sec = ops_per_sec
+        self.ops = 0
+        self.started_at = time.monotonic()
+
+    async def spend(self, ops: int) -> None:
+        """Wait until the given number of operations can be sent within the budget.
+
+        Args:
+            ops: Number of operations about to be sent
+        """
+        self.ops += ops
+        delay = self.ops / self.ops_per_sec - (time.monotonic() - self.started_at)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _scan_nodes(r) -> List[Any]:
+    """Return the nodes to scan: the primaries in cluster mode, ordered by name."""
+    if not VALKEY_CFG['cluster_mode']:
+        return [None]
+    await r.initialize()
+    return sorted(r.get_primaries(), key=lambda node: node.name)
+
+
+async def _scan(
+    r, node: Any, cursor: int, pattern: str, key_type: Optional[str], count: int
+) -> Tuple[int, List[str]]:
+    """Run one SCAN call, on the given primary in cluster mode."""
+    kwargs = {} if node is None else {'target_nodes': node}
+    cursor, keys = await r.scan(
+        cursor=cursor, match=pattern, count=count, _type=key_type, **kwargs
+    )
+    if isinstance(cursor, dict):
+        # The cluster client returns the cursor of each node it scanned
+        cursor = cursor[node.name]
+    return int(cursor), list(keys)
+
+
+def _parse_cursor(cursor: str, node_count: int) -> Tuple[int, int]:
+    """Split a scan_keys cursor into the index of the node and the cursor on that node."""
+    if node_count == 1:
+        return 0, int(cursor)
+    if cursor == '0':
+        return 0, 0
+    node_index, node_cursor = cursor.split(':')
+    if not 0 <= int(node_index) < node_count:
+        raise ValueError(f'node index {node_index} out of range')
+    return int(node_index), int(node_cursor)
+
+
+@mcp.tool()
+async def scan_keys(
+    pattern: str = '*', key_type: Optional[str] = None, cursor: str = '0', count: int = 100
+) -> str:
+    """Find keys matching a pattern without blocking the server.
+
+    Unlike KEYS, SCAN walks the keyspace incrementally. Pass the returned cursor to the next
+    call to continue, until it returns cursor "0". In cluster mode, the primaries are scanned
+    one after another and the cursor identifies the current primary.
+
+    Args:
+        pattern: Glob-style pattern keys must match (default "*")
+        key_type: Type keys must have (string, list, set, zset, hash, stream, ReJSON-RL)
+        cursor: Cursor returned by the previous call, or "0" to start
+        count: Number of keys to return; a call may return fewer, or slightly more, keys
+
+    Returns:
+        JSON object with the keys and the next cursor, or an error message
+    """
+    if count <= 0:
+        return 'Error: count must be positive'
+
+    try:
+        r = ValkeyConnectionManager.get_connection()
+        nodes = await _scan_nodes(r)
+        try:
+            node_index, node_cursor = _parse_cursor(cursor, len(nodes))
+        except ValueError:
+            return f"Error: invalid cursor '{cursor}'"
+
+        keys: List[str] = []
+        for _ in range(MAX_SCAN_CALLS):
+            node_cursor, node_keys = await _scan(
+                r, nodes[node_index], node_cursor, pattern, key_type, count
+            )
+            keys.extend(node_keys)
+            if node_cursor == 0:
+                node_index += 1
+            if node_index == len(nodes) or len(keys) >= count:
+                break
+    except ValkeyError as e:
+        return f'Error scanning keys: {str(e)}'
+
+    if node_index == len(nodes):
+        next_cursor = '0'
+    elif len(nodes) == 1:
+        next_cursor = str(node_cursor)
+    else:
+        next_cursor = f'{node_index}:{node_cursor}'
+    return json.dumps({'cursor': next_cursor, 'keys': keys})
+
+
+async def _sample_keys(
+    r, pattern: str, key_type: Optional[str], sample_size: int, budget: OpsBudget
+) -> List[str]:
+    """Collect a sample of keys, taking an equal share from each primary in cluster mode."""
+    nodes = await _scan_nodes(r)
+    quota = math.ceil(sample_size / len(nodes))
+    keys: List[str] = []
+    for node in nodes:
+        cursor, node_keys = 0, []
+        while True:
+            await budget.spend(1)
+            cursor, batch = await _scan(
+                r, node, cursor, pattern, key_type, min(quota, MAX_PIPELINE_KEYS * 10)
+            )
+            node_keys.extend(batch)
+            if cursor == 0 or len(node_keys) >= quota:
+                break
+        keys.extend(node_keys[:quota])
+    return keys[:sample_size]
+
+
+async def _analyze_keys(r, keys: List[str], budget: OpsBudget) -> List[Dict[str, Any]]:
+    """Return the type, size, encoding and TTL of keys, pipelining them within the budget."""
+    chunk_size = max(1, min(MAX_PIPELINE_KEYS, budget.ops_per_sec // OPS_PER_KEY))
+    stats = []
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        await budget.spend(len(chunk) * OPS_PER_KEY)
+        async with r.pipeline(transaction=False) as pipe:
+            for key in chunk:
+                pipe.type(key)
+                pipe.memory_usage(key)
+                pipe.object('encoding', key)
+                pipe.ttl(key)
+            results = await pipe.execute(raise_on_error=False)
+
+        for index, key in enumerate(chunk):
+            key_type, size, encoding, ttl = results[
+                index * OPS_PER_KEY : (index + 1) * OPS_PER_KEY
+            ]
+            if any(isinstance(result, Exception) for result in (key_type, size, ttl)):
+                continue
+            if size is None or ttl == -2:
+                # The key expired or was deleted after it was scanned
+                continue
+            stats.append(
+                {
+                    'key': key,
+                    'type': key_type,
+                    'encoding': None if isinstance(encoding, Exception) else encoding,
+                    'bytes': size,
+                    'ttl': ttl,
+                }
+            )
+    return stats
+
+
+def _key_prefix(key: str, delimiter: str) -> str:
+    """Return the prefix of a key up to and including the first delimiter."""
+    if delimiter and delimiter in key:
+        return key.split(delimiter, 1)[0] + delimiter
+    return '(no prefix)'
+
+
+def _build_report(
+    stats: List[Dict[str, Any]], total_keys: int, top: int, delimiter: str, filtered: bool
+) -> Dict[str, Any]:
+    """Summarize the analyzed sample of keys."""
+    sampled_bytes = sum(stat['bytes'] for stat in stats)
+
+    prefixes: Dict[str, Dict[str, Any]] = {}
+    encodings: Dict[str, int] = {}
+    for stat in stats:
+        prefix = prefixes.setdefault(_key_prefix(stat['key'], delimiter), {'keys': 0, 'bytes': 0})
+        prefix['keys'] += 1
+        prefix['bytes'] += stat['bytes']
+        encoding = f'{stat["type"]}:{stat["encoding"]}'
+        encodings[encoding] = encodings.get(encoding, 0) + 1
+
+    no_expiry = [stat for stat in stats if stat['ttl'] == -1]
+    no_expiry_bytes = sum(stat['bytes'] for stat in no_expiry)
+
+    report: Dict[str, Any] = {
+        'total_keys': total_keys,
+        'sampled_keys': len(stats),
+        'sampled_bytes': sampled_bytes,
+        'top_keys': heapq.nlargest(top, stats, key=lambda stat: stat['bytes']),
+        'memory_by_prefix': [
+            {
+                'prefix': name,
+                'keys': prefix['keys'],
+                'bytes': prefix['bytes'],
+                'share': round(prefix['bytes'] / sampled_bytes, 4) if sampled_bytes else 0,
+            }
+            for name, prefix in heapq.nlargest(
+                top, prefixes.items(), key=lambda item: item[1]['bytes']
+            )
+        ],
+        'encodings': dict(sorted(encodings.items(), key=lambda item: -item[1])),
+        'no_expiry': {
+            'keys': len(no_expiry),
+            'share': round(len(no_expiry) / len(stats), 4) if stats else 0,
+            'bytes': no_expiry_bytes,
+            'largest': heapq.nlargest(top, no_expiry, key=lambda stat: stat['bytes']),
+        },
+    }
+    if stats and not filtered:
+        # The sample covers the whole keyspace, so its mean size extrapolates to all keys
+        report['estimated_total_bytes'] = round(sampled_bytes / len(stats) * total_keys)
+    return report
+
+
+@mcp.tool()
+async def analyze_keyspace(
+    pattern: str = '*',
+    key_type: Optional[str] = None,
+    sample_size: int = 1000,
+    top: int = 10,
+    prefix_delimiter: str = ':',
+    ops_per_sec: Optional[int] = None,
+) -> str:
+    """Analyze memory usage and expiry of a sample of keys.
+
+    Keys are sampled with SCAN and analyzed with MEMORY USAGE, OBJECT ENCODING and TTL in
+    pipelines. Commands are sent at no more than ops_per_sec on average, so the analysis is
+    safe to run against production servers. In cluster mode, every primary is sampled.
+
+    Args:
+        pattern: Glob-style pattern sampled keys must match (default "*")
+        key_type: Type sampled keys must have (string, list, set, zset, hash, stream, ReJSON-RL)
+        sample_size: Number of keys to sample (at most 10000)
+        top: Number of entries in each ranking of the report
+        prefix_delimiter: Delimiter ending the key prefix memory is grouped by
+        ops_per_sec: Maximum commands per second sent to the server; defaults to the
+            VALKEY_ANALYZER_OPS_PER_SEC setting
+
+    Returns:
+        JSON report with the largest keys, the memory by key prefix, the encodings and the keys
+        without expiry, or an error message
+    """
+    if not 0 < sample_size <= MAX_SAMPLE_SIZE:
+        return f'Error: sample_size must be between 1 and {MAX_SAMPLE_SIZE}'
+    if top <= 0:
+        return 'Error: top must be positive'
+    if ops_per_sec is None:
+        ops_per_sec = VALKEY_CFG['analyzer_ops_per_sec']
+    if ops_per_sec <= 0:
+        return 'Error: ops_per_sec must be positive'
+
+    budget = OpsBudget(ops_per_sec)
+    try:
+        r = ValkeyConnectionManager.get_connection()
+        keys = await _sample_keys(r, pattern, key_type, sample_size, budget)
+        stats = await _analyze_keys(r, keys, budget)
+        await budget.spend(1)
+        total_keys = await r.dbsize()
+    except ValkeyError as e:
+        return f'Error analyzing keyspace: {str(e)}'
+
+    report = _build_report(
+        stats, total_keys, top, prefix_delimiter, pattern != '*' or key_type is not None
+    )
+    report['ops'] = budget.ops
+    report['elapsed_seconds'] = round(time.monotonic() - budget.started_at, 3)
+    return json.dumps(report, default=str)
@@ -11,7 +11,10 @@
 
 """List operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Optional
 from typing import List as PyList
@@ -31,7 +34,8 @@ async def list_append(key: str, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.rpush(key, value)
+        result = await r.rpush(key, value)
+        invalidate_cached(key)
         return f"Successfully appended value to list '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error appending to list '{key}': {str(e)}"
@@ -50,7 +54,8 @@ async def list_prepend(key: str, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.lpush(key, value)
+        result = await r.lpush(key, value)
+        invalidate_cached(key)
         return f"Successfully prepended value to list '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error prepending to list '{key}': {str(e)}"
@@ -69,7 +74,8 @@ async def list_append_multiple(key: str, values: PyList[Any]) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.rpush(key, *values)
+        result = await r.rpush(key, *values)
+        invalidate_cached(key)
         return f"Successfully appended {len(values)} values to list '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error appending multiple values to list '{key}': {str(e)}"
@@ -88,7 +94,8 @@ async def list_prepend_multiple(key: str, values: PyList[Any]) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.lpush(key, *values)
+        result = await r.lpush(key, *values)
+        invalidate_cached(key)
         return f"Successfully prepended {len(values)} values to list '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error prepending multiple values to list '{key}': {str(e)}"
@@ -107,7 +114,7 @@ async def list_get(key: str, index: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.lindex(key, index)
+        result = await r.lindex(key, index)
         if result is None:
             return f"No value found at index {index} in list '{key}'"
         return str(result)
@@ -129,7 +136,8 @@ async def list_set(key: str, index: int, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        r.lset(key, index, value)
+        await r.lset(key, index, value)
+        invalidate_cached(key)
         return f"Successfully set value at index {index} in list '{key}'"
     except ValkeyError as e:
         return f"Error setting value in list '{key}': {str(e)}"
@@ -149,7 +157,7 @@ async def list_range(key: str, start: int = 0, stop: int = -1) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.lrange(key, start, stop)
+        result = await r.lrange(key, start, stop)
         if not result:
             return f"No values found in range [{start}, {stop}] in list '{key}'"
         return str(result)
@@ -171,7 +179,8 @@ async def list_trim(key: str, start: int, stop: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        r.ltrim(key, start, stop)
+        await r.ltrim(key, start, stop)
+        invalidate_cached(key)
         return f"Successfully trimmed list '{key}' to range [{start}, {stop}]"
     except ValkeyError as e:
         return f"Error trimming list '{key}': {str(e)}"
@@ -189,7 +198,7 @@ async def list_length(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.llen(key)
+        result = await r.llen(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting list length for '{key}': {str(e)}"
@@ -209,9 +218,10 @@ async def list_pop_left(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.lpop(key, count)
+            result = await r.lpop(key, count)
         else:
-            result = r.lpop(key)
+            result = await r.lpop(key)
+        invalidate_cached(key)
         if result is None:
             return f"List '{key}' is empty"
         return str(result)
@@ -233,9 +243,10 @@ async def list_pop_right(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.rpop(key, count)
+            result = await r.rpop(key, count)
         else:
-            result = r.rpop(key)
+            result = await r.rpop(key)
+        invalidate_cached(key)
         if result is None:
             return f"List '{key}' is empty"
         return str(result)
@@ -273,7 +284,7 @@ async def list_position(
         if maxlen is not None:
             options['maxlen'] = maxlen
 
-        result = r.lpos(key, value, **options)
+        result = await r.lpos(key, value, **options)
         if result is None:
             return f"Value not found in list '{key}'"
         return str(result)
@@ -304,7 +315,8 @@ async def list_move(
         if wherefrom not in ['LEFT', 'RIGHT'] or whereto not in ['LEFT', 'RIGHT']:
             return "Error: wherefrom and whereto must be either 'LEFT' or 'RIGHT'"
 
-        result = r.lmove(source, destination, wherefrom, whereto)
+        result = await r.lmove(source, destination, wherefrom, whereto)
+        invalidate_cached(source, destination)
         if result is None:
             return f"Source list '{source}' is empty"
         return f"Successfully moved value '{result}' from {wherefrom} of '{source}' to {whereto} of '{destination}'"
@@ -326,7 +338,8 @@ async def list_insert_before(key: str, pivot: Any, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.linsert(key, 'BEFORE', pivot, value)
+        result = await r.linsert(key, 'BEFORE', pivot, value)
+        invalidate_cached(key)
         if result == -1:
             return f"Pivot value not found in list '{key}'"
         return f"Successfully inserted value before pivot in list '{key}', new length: {result}"
@@ -348,7 +361,8 @@ async def list_insert_after(key: str, pivot: Any, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.linsert(key, 'AFTER', pivot, value)
+        result = await r.linsert(key, 'AFTER', pivot, value)
+        invalidate_cached(key)
         if result == -1:
             return f"Pivot value not found in list '{key}'"
         return f"Successfully inserted value after pivot in list '{key}', new length: {result}"
@@ -370,7 +384,8 @@ async def list_remove(key: str, value: Any, count: int = 0) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.lrem(key, count, value)
+        result = await r.lrem(key, count, value)
+        invalidate_cached(key)
         return f"Successfully removed {result} occurrence(s) of value from list '{key}'"
     except ValkeyError as e:
         return f"Error removing value from list '{key}': {str(e)}"
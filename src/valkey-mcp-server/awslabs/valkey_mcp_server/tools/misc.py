@@ -9,7 +9,11 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    cached_read,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Dict
 from valkey.exceptions import ValkeyError as RedisError
@@ -27,7 +31,8 @@ async def delete(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.delete(key)
+        result = await r.delete(key)
+        invalidate_cached(key)
         return f'Successfully deleted {key}' if result else f'Key {key} not found'
     except RedisError as e:
         return f'Error deleting key {key}: {str(e)}'
@@ -45,8 +50,8 @@ async def type(key: str) -> Dict[str, Any]:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        key_type = r.type(key)
-        info = {'key': key, 'type': key_type, 'ttl': r.ttl(key)}
+        key_type = await cached_read(('TYPE', key), lambda: r.type(key))
+        info = {'key': key, 'type': key_type, 'ttl': await r.ttl(key)}
 
         return info
     except RedisError as e:
@@ -66,7 +71,8 @@ async def expire(name: str, expire_seconds: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        success = r.expire(name, expire_seconds)
+        success = await r.expire(name, expire_seconds)
+        invalidate_cached(name)
         return (
             f"Expiration set to {expire_seconds} seconds for '{name}'."
             if success
@@ -93,11 +99,12 @@ async def rename(old_key: str, new_key: str) -> Dict[str, Any]:
         r = ValkeyConnectionManager.get_connection()
 
         # Check if the old key exists
-        if not r.exists(old_key):
+        if not await r.exists(old_key):
             return {'error': f"Key '{old_key}' does not exist."}
 
         # Rename the key
-        r.rename(old_key, new_key)
+        await r.rename(old_key, new_key)
+        invalidate_cached(old_key, new_key)
         return {'status': 'success', 'message': f"Renamed key '{old_key}' to '{new_key}'"}
 
     except RedisError as e:
@@ -9,6 +9,7 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 
+import json
 from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
 from awslabs.valkey_mcp_server.common.server import mcp
 from valkey.exceptions import ValkeyError
@@ -19,7 +20,7 @@ async def dbsize() -> str:
     """Get the number of keys stored in the Valkey database."""
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.dbsize()
+        result = await r.dbsize()
         return str(result)
     except ValkeyError as e:
         raise RuntimeError(f'Error getting database size: {str(e)}')
@@ -37,7 +38,7 @@ async def info(section: str = 'default') -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        info = r.info(section)
+        info = await r.info(section)
         return str(info)
     except ValkeyError as e:
         raise RuntimeError(f'Error retrieving Redis info: {str(e)}')
@@ -48,7 +49,23 @@ async def client_list() -> str:
     """Get a list of connected clients to the Valkey server."""
     try:
         r = ValkeyConnectionManager.get_connection()
-        clients = r.client_list()
+        clients = await r.client_list()
         return str(clients)
     except ValkeyError as e:
         raise RuntimeError(f'Error retrieving client list: {str(e)}')
+
+
+@mcp.tool()
+async def near_cache_stats() -> str:
+    """Get the hit and miss statistics of the client-side cache.
+
+    The cache is enabled with VALKEY_NEAR_CACHE and serves repeated reads of unchanged keys
+    from local memory.
+
+    Returns:
+        JSON object of cache statistics, with "enabled" false if the cache is disabled.
+    """
+    near_cache = await ValkeyConnectionManager.get_near_cache()
+    if near_cache is None:
+        return json.dumps({'enabled': False})
+    return json.dumps(near_cache.stats())
@@ -11,7 +11,10 @@
 
 """Set operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Optional
 from valkey.exceptions import ValkeyError
@@ -30,7 +33,8 @@ async def set_add(key: str, member: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.sadd(key, member)
+        result = await r.sadd(key, member)
+        invalidate_cached(key)
         return f"Successfully added {result} new member to set '{key}'"
     except ValkeyError as e:
         return f"Error adding to set '{key}': {str(e)}"
@@ -49,7 +53,8 @@ async def set_remove(key: str, member: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.srem(key, member)
+        result = await r.srem(key, member)
+        invalidate_cached(key)
         return f"Successfully removed {result} member from set '{key}'"
     except ValkeyError as e:
         return f"Error removing from set '{key}': {str(e)}"
@@ -69,9 +74,10 @@ async def set_pop(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.spop(key, count)
+            result = await r.spop(key, count)
         else:
-            result = r.spop(key)
+            result = await r.spop(key)
+        invalidate_cached(key)
         if result is None:
             return f"Set '{key}' is empty"
         return str(result)
@@ -93,7 +99,8 @@ async def set_move(source: str, destination: str, member: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.smove(source, destination, member)
+        result = await r.smove(source, destination, member)
+        invalidate_cached(source, destination)
         if result:
             return f"Successfully moved member from set '{source}' to '{destination}'"
         return f"Member not found in source set '{source}'"
@@ -113,7 +120,7 @@ async def set_cardinality(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.scard(key)
+        result = await r.scard(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting set cardinality for '{key}': {str(e)}"
@@ -131,7 +138,7 @@ async def set_members(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.smembers(key)
+        result = await r.smembers(key)
         if not result:
             return f"Set '{key}' is empty"
         return str(result)
@@ -153,9 +160,9 @@ async def set_random_member(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.srandmember(key, count)
+            result = await r.srandmember(key, count)
         else:
-            result = r.srandmember(key)
+            result = await r.srandmember(key)
         if result is None:
             return f"Set '{key}' is empty"
         return str(result)
@@ -176,7 +183,7 @@ async def set_contains(key: str, member: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.sismember(key, member)
+        result = await r.sismember(key, member)
         return str(result).lower()
     except ValkeyError as e:
         return f"Error checking set membership in '{key}': {str(e)}"
@@ -11,7 +11,10 @@
 
 """Sorted Set operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Dict, Optional
 from valkey.exceptions import ValkeyError
@@ -30,7 +33,8 @@ async def sorted_set_add(key: str, mapping: Dict[Any, float]) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zadd(key, mapping)
+        result = await r.zadd(key, mapping)
+        invalidate_cached(key)
         return f"Successfully added {result} new member(s) to sorted set '{key}'"
     except ValkeyError as e:
         return f"Error adding to sorted set '{key}': {str(e)}"
@@ -50,7 +54,8 @@ async def sorted_set_add_incr(key: str, member: Any, score: float) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zincrby(key, score, member)
+        result = await r.zincrby(key, score, member)
+        invalidate_cached(key)
         return f"Successfully set score for member in sorted set '{key}' to {result}"
     except ValkeyError as e:
         return f"Error incrementing score in sorted set '{key}': {str(e)}"
@@ -69,7 +74,8 @@ async def sorted_set_remove(key: str, *members: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zrem(key, *members)
+        result = await r.zrem(key, *members)
+        invalidate_cached(key)
         return f"Successfully removed {result} member(s) from sorted set '{key}'"
     except ValkeyError as e:
         return f"Error removing from sorted set '{key}': {str(e)}"
@@ -89,7 +95,8 @@ async def sorted_set_remove_by_rank(key: str, start: int, stop: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zremrangebyrank(key, start, stop)
+        result = await r.zremrangebyrank(key, start, stop)
+        invalidate_cached(key)
         return f"Successfully removed {result} member(s) by rank from sorted set '{key}'"
     except ValkeyError as e:
         return f"Error removing by rank from sorted set '{key}': {str(e)}"
@@ -109,7 +116,8 @@ async def sorted_set_remove_by_score(key: str, min_score: float, max_score: floa
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zremrangebyscore(key, min_score, max_score)
+        result = await r.zremrangebyscore(key, min_score, max_score)
+        invalidate_cached(key)
         return f"Successfully removed {result} member(s) by score from sorted set '{key}'"
     except ValkeyError as e:
         return f"Error removing by score from sorted set '{key}': {str(e)}"
@@ -129,7 +137,8 @@ async def sorted_set_remove_by_lex(key: str, min_lex: str, max_lex: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zremrangebylex(key, min_lex, max_lex)
+        result = await r.zremrangebylex(key, min_lex, max_lex)
+        invalidate_cached(key)
         return f"Successfully removed {result} member(s) by lex range from sorted set '{key}'"
     except ValkeyError as e:
         return f"Error removing by lex range from sorted set '{key}': {str(e)}"
@@ -152,9 +161,9 @@ async def sorted_set_cardinality(
     try:
         r = ValkeyConnectionManager.get_connection()
         if min_score is not None and max_score is not None:
-            result = r.zcount(key, min_score, max_score)
+            result = await r.zcount(key, min_score, max_score)
         else:
-            result = r.zcard(key)
+            result = await r.zcard(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting sorted set cardinality for '{key}': {str(e)}"
@@ -173,7 +182,7 @@ async def sorted_set_score(key: str, member: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.zscore(key, member)
+        result = await r.zscore(key, member)
         if result is None:
             return f"Member not found in sorted set '{key}'"
         return str(result)
@@ -196,9 +205,9 @@ async def sorted_set_rank(key: str, member: Any, reverse: bool = False) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if reverse:
-            result = r.zrevrank(key, member)
+            result = await r.zrevrank(key, member)
         else:
-            result = r.zrank(key, member)
+            result = await r.zrank(key, member)
         if result is None:
             return f"Member not found in sorted set '{key}'"
         return str(result)
@@ -225,9 +234,9 @@ async def sorted_set_range(
     try:
         r = ValkeyConnectionManager.get_connection()
         if reverse:
-            result = r.zrevrange(key, start, stop, withscores=withscores)
+            result = await r.zrevrange(key, start, stop, withscores=withscores)
         else:
-            result = r.zrange(key, start, stop, withscores=withscores)
+            result = await r.zrange(key, start, stop, withscores=withscores)
         if not result:
             return f"No members found in range for sorted set '{key}'"
         return str(result)
@@ -262,11 +271,11 @@ async def sorted_set_range_by_score(
     try:
         r = ValkeyConnectionManager.get_connection()
         if reverse:
-            result = r.zrevrangebyscore(
+            result = await r.zrevrangebyscore(
                 key, max_score, min_score, withscores=withscores, start=offset, num=count
             )
         else:
-            result = r.zrangebyscore(
+            result = await r.zrangebyscore(
                 key, min_score, max_score, withscores=withscores, start=offset, num=count
             )
         if not result:
@@ -301,9 +310,9 @@ async def sorted_set_range_by_lex(
     try:
         r = ValkeyConnectionManager.get_connection()
         if reverse:
-            result = r.zrevrangebylex(key, max_lex, min_lex, start=offset, num=count)
+            result = await r.zrevrangebylex(key, max_lex, min_lex, start=offset, num=count)
         else:
-            result = r.zrangebylex(key, min_lex, max_lex, start=offset, num=count)
+            result = await r.zrangebylex(key, min_lex, max_lex, start=offset, num=count)
         if not result:
             return f"No members found in lex range for sorted set '{key}'"
         return str(result)
@@ -325,9 +334,10 @@ async def sorted_set_popmin(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.zpopmin(key, count)
+            result = await r.zpopmin(key, count)
         else:
-            result = r.zpopmin(key)
+            result = await r.zpopmin(key)
+        invalidate_cached(key)
         if not result:
             return f"Sorted set '{key}' is empty"
         return str(result)
@@ -349,9 +359,10 @@ async def sorted_set_popmax(key: str, count: Optional[int] = None) -> str:
     try:
         r = ValkeyConnectionManager.get_connection()
         if count:
-            result = r.zpopmax(key, count)
+            result = await r.zpopmax(key, count)
         else:
-            result = r.zpopmax(key)
+            result = await r.zpopmax(key)
+        invalidate_cached(key)
         if not result:
             return f"Sorted set '{key}' is empty"
         return str(result)
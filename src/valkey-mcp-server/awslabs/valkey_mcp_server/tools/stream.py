@@ -11,7 +11,10 @@
 
 """Stream operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Dict, Optional
 from valkey.exceptions import ValkeyError
@@ -46,7 +49,8 @@ async def stream_add(
             else:
                 options['maxlen'] = maxlen
 
-        result = r.xadd(key, field_dict, id=id, **options)
+        result = await r.xadd(key, field_dict, id=id, **options)
+        invalidate_cached(key)
         return f"Successfully added entry with ID '{result}' to stream '{key}'"
     except ValkeyError as e:
         return f"Error adding to stream '{key}': {str(e)}"
@@ -65,7 +69,8 @@ async def stream_delete(key: str, id: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xdel(key, id)
+        result = await r.xdel(key, id)
+        invalidate_cached(key)
         return f"Successfully deleted {result} entries from stream '{key}'"
     except ValkeyError as e:
         return f"Error deleting from stream '{key}': {str(e)}"
@@ -85,7 +90,8 @@ async def stream_trim(key: str, maxlen: int, approximate: bool = True) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xtrim(key, maxlen=maxlen, approximate=approximate)
+        result = await r.xtrim(key, maxlen=maxlen, approximate=approximate)
+        invalidate_cached(key)
         return f"Successfully trimmed stream '{key}', removed {result} entries"
     except ValkeyError as e:
         return f"Error trimming stream '{key}': {str(e)}"
@@ -103,7 +109,7 @@ async def stream_length(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xlen(key)
+        result = await r.xlen(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting stream length for '{key}': {str(e)}"
@@ -128,9 +134,9 @@ async def stream_range(
     try:
         r = ValkeyConnectionManager.get_connection()
         result = (
-            r.xrevrange(key, end, start, count=count)
+            await r.xrevrange(key, end, start, count=count)
             if reverse
-            else r.xrange(key, start, end, count=count)
+            else await r.xrange(key, start, end, count=count)
         )
         if not result:
             return f"No entries found in range for stream '{key}'"
@@ -157,7 +163,7 @@ async def stream_read(
     try:
         r = ValkeyConnectionManager.get_connection()
         streams = {key: last_id}
-        result = r.xread(streams, count=count, block=block)
+        result = await r.xread(streams, count=count, block=block)
         if not result:
             return f"No new entries in stream '{key}'"
         return str(result)
@@ -182,7 +188,8 @@ async def stream_group_create(
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        r.xgroup_create(key, group_name, id=id, mkstream=mkstream)
+        await r.xgroup_create(key, group_name, id=id, mkstream=mkstream)
+        invalidate_cached(key)
         return f"Successfully created consumer group '{group_name}' for stream '{key}'"
     except ValkeyError as e:
         return f'Error creating consumer group: {str(e)}'
@@ -201,7 +208,8 @@ async def stream_group_destroy(key: str, group_name: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xgroup_destroy(key, group_name)
+        result = await r.xgroup_destroy(key, group_name)
+        invalidate_cached(key)
         if result:
             return f"Successfully destroyed consumer group '{group_name}' from stream '{key}'"
         return f"Consumer group '{group_name}' not found in stream '{key}'"
@@ -223,7 +231,8 @@ async def stream_group_set_id(key: str, group_name: str, id: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        r.xgroup_setid(key, group_name, id)
+        await r.xgroup_setid(key, group_name, id)
+        invalidate_cached(key)
         return f"Successfully set last delivered ID for group '{group_name}' in stream '{key}'"
     except ValkeyError as e:
         return f'Error setting group ID: {str(e)}'
@@ -243,7 +252,8 @@ async def stream_group_delete_consumer(key: str, group_name: str, consumer_name:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xgroup_delconsumer(key, group_name, consumer_name)
+        result = await r.xgroup_delconsumer(key, group_name, consumer_name)
+        invalidate_cached(key)
         return f"Successfully deleted consumer '{consumer_name}' from group '{group_name}', {result} pending entries"
     except ValkeyError as e:
         return f'Error deleting consumer: {str(e)}'
@@ -274,9 +284,10 @@ async def stream_read_group(
     try:
         r = ValkeyConnectionManager.get_connection()
         streams = {key: '>'}  # ">" means read undelivered entries
-        result = r.xreadgroup(
+        result = await r.xreadgroup(
             group_name, consumer_name, streams, count=count, block=block, noack=noack
         )
+        invalidate_cached(key)
         if not result:
             return f"No new entries for consumer '{consumer_name}' in group '{group_name}'"
         return str(result)
@@ -296,7 +307,7 @@ async def stream_info(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xinfo_stream(key)
+        result = await r.xinfo_stream(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting stream info for '{key}': {str(e)}"
@@ -314,7 +325,7 @@ async def stream_info_groups(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xinfo_groups(key)
+        result = await r.xinfo_groups(key)
         if not result:
             return f"No consumer groups found for stream '{key}'"
         return str(result)
@@ -335,7 +346,7 @@ async def stream_info_consumers(key: str, group_name: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.xinfo_consumers(key, group_name)
+        result = await r.xinfo_consumers(key, group_name)
         if not result:
             return f"No consumers found in group '{group_name}'"
         return str(result)
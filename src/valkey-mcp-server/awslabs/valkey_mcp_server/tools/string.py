@@ -11,7 +11,11 @@
 
 """String operations for Valkey MCP Server."""
 
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    cached_read,
+    invalidate_cached,
+)
 from awslabs.valkey_mcp_server.common.server import mcp
 from typing import Any, Optional
 from valkey.exceptions import ValkeyError
@@ -43,7 +47,8 @@ async def string_set(
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.set(key, value, ex=ex, px=px, nx=nx, xx=xx, keepttl=keepttl)
+        result = await r.set(key, value, ex=ex, px=px, nx=nx, xx=xx, keepttl=keepttl)
+        invalidate_cached(key)
         if result is None:
             return f"Failed to set value for key '{key}' (condition not met)"
         return f"Successfully set value for key '{key}'"
@@ -63,7 +68,7 @@ async def string_get(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.get(key)
+        result = await cached_read(('GET', key), lambda: r.get(key))
         if result is None:
             return f"Key '{key}' not found"
         return str(result)
@@ -84,7 +89,8 @@ async def string_append(key: str, value: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.append(key, value)
+        result = await r.append(key, value)
+        invalidate_cached(key)
         return f"Successfully appended to key '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error appending to string '{key}': {str(e)}"
@@ -104,7 +110,7 @@ async def string_get_range(key: str, start: int, end: int) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.getrange(key, start, end)
+        result = await r.getrange(key, start, end)
         if not result:
             return f"No characters found in range [{start}, {end}] for key '{key}'"
         return str(result)
@@ -125,7 +131,8 @@ async def string_get_set(key: str, value: Any) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.getset(key, value)
+        result = await r.getset(key, value)
+        invalidate_cached(key)
         if result is None:
             return f"No previous value found for key '{key}'"
         return str(result)
@@ -146,7 +153,8 @@ async def string_increment(key: str, amount: int = 1) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.incrby(key, amount)
+        result = await r.incrby(key, amount)
+        invalidate_cached(key)
         return str(result)
     except ValkeyError as e:
         return f"Error incrementing string '{key}': {str(e)}"
@@ -165,7 +173,8 @@ async def string_increment_float(key: str, amount: float) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.incrbyfloat(key, amount)
+        result = await r.incrbyfloat(key, amount)
+        invalidate_cached(key)
         return str(result)
     except ValkeyError as e:
         return f"Error incrementing float string '{key}': {str(e)}"
@@ -184,7 +193,8 @@ async def string_decrement(key: str, amount: int = 1) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.decrby(key, amount)
+        result = await r.decrby(key, amount)
+        invalidate_cached(key)
         return str(result)
     except ValkeyError as e:
         return f"Error decrementing string '{key}': {str(e)}"
@@ -202,7 +212,7 @@ async def string_length(key: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.strlen(key)
+        result = await r.strlen(key)
         return str(result)
     except ValkeyError as e:
         return f"Error getting string length for '{key}': {str(e)}"
@@ -222,7 +232,8 @@ async def string_set_range(key: str, offset: int, value: str) -> str:
     """
     try:
         r = ValkeyConnectionManager.get_connection()
-        result = r.setrange(key, offset, value)
+        result = await r.setrange(key, offset, value)
+        invalidate_cached(key)
         return f"Successfully set range in string '{key}', new length: {result}"
     except ValkeyError as e:
         return f"Error setting range in string '{key}': {str(e)}"
@@ -0,0 +1,230 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the batch functionality in the valkey MCP server."""
+
+import json
+import pytest
+from awslabs.valkey_mcp_server.tools.batch import (
+    MAX_BATCH_OPERATIONS,
+    BatchOperation,
+    execute_batch,
+)
+from unittest.mock import AsyncMock, MagicMock, patch
+from valkey.exceptions import AskError, MovedError, ResponseError, ValkeyError
+
+
+class TestBatch:
+    """Tests for batch operations."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Create a mock Valkey connection."""
+        with patch(
+            'awslabs.valkey_mcp_server.tools.batch.ValkeyConnectionManager'
+        ) as mock_manager:
+            mock_conn = MagicMock()
+            mock_manager.get_connection.return_value = mock_conn
+            yield mock_conn
+
+    @pytest.fixture
+    def mock_pipeline(self, mock_connection):
+        """Create a mock pipeline returned by the connection."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_connection.pipeline.return_value.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_connection.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+        return mock_pipe
+
+    @pytest.fixture
+    def cluster_mode(self):
+        """Enable cluster mode."""
+        with patch.dict(
+            'awslabs.valkey_mcp_server.tools.batch.VALKEY_CFG', {'cluster_mode': True}
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_execute_batch(self, mock_connection, mock_pipeline):
+        """Test executing commands in one pipeline."""
+        mock_pipeline.execute.return_value = [1, 'value', ResponseError('WRONGTYPE')]
+
+        result = await execute_batch(
+            [
+                BatchOperation(command='hset', args=['user:1', 'name', 'alice']),
+                BatchOperation(command='GET', args=['greeting']),
+                BatchOperation(command='LPUSH', args=['user:1', 'x']),
+            ]
+        )
+
+        assert json.loads(result) == [
+            {'index': 0, 'command': 'HSET', 'result': 1},
+            {'index': 1, 'command': 'GET', 'result': 'value'},
+            {'index': 2, 'command': 'LPUSH', 'error': 'WRONGTYPE'},
+        ]
+        mock_connection.pipeline.assert_called_once_with(transaction=False)
+        mock_pipeline.execute_command.assert_any_call('HSET', 'user:1', 'name', 'alice')
+        mock_pipeline.execute_command.assert_any_call('GET', 'greeting')
+        mock_pipeline.execute.assert_called_once_with(raise_on_error=False)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_invalidates_cache(self, mock_connection, mock_pipeline):
+        """Test that the keys of a batch are dropped from the client-side cache."""
+        mock_pipeline.execute.return_value = [1, 'x']
+
+        with patch('awslabs.valkey_mcp_server.tools.batch.invalidate_cached') as mock_invalidate:
+            await execute_batch(
+                [
+                    BatchOperation(command='INCR', args=['counter']),
+                    BatchOperation(command='LMOVE', args=['src', 'dst', 'LEFT', 'RIGHT']),
+                ]
+            )
+
+        mock_invalidate.assert_called_once_with('counter', 'src', 'dst')
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_transaction(self, mock_connection, mock_pipeline):
+        """Test executing commands in a MULTI/EXEC transaction."""
+        mock_pipeline.execute.return_value = [1, 2]
+
+        result = await execute_batch(
+            [
+                BatchOperation(command='INCR', args=['counter']),
+                BatchOperation(command='INCRBY', args=['counter', 1]),
+            ],
+            transaction=True,
+        )
+
+        assert [entry['result'] for entry in json.loads(result)] == [1, 2]
+        mock_connection.pipeline.assert_called_once_with(transaction=True)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster(self, mock_connection, mock_pipeline, cluster_mode):
+        """Test that cluster mode uses the cluster pipeline without a transaction."""
+        mock_pipeline.execute.return_value = ['OK']
+
+        result = await execute_batch([BatchOperation(command='SET', args=['key', 'value'])])
+
+        assert json.loads(result)[0]['result'] == 'OK'
+        mock_connection.pipeline.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction(self, mock_connection, cluster_mode):
+        """Test that cluster transactions run once per hash slot on the slot's node."""
+        mock_connection.initialize = AsyncMock()
+        mock_connection.keyslot.side_effect = lambda key: 1 if key.startswith('{a}') else 2
+        nodes = {1: MagicMock(), 2: MagicMock()}
+        mock_connection.nodes_manager.get_node_from_slot.side_effect = lambda slot: nodes[slot]
+        nodes[1].response_callbacks = {'GET': lambda response: f'{response}-parsed'}
+
+        async def execute_pipeline(stack):
+            for command in stack[:-1]:
+                command.result = 'QUEUED'
+            stack[-1].result = [f'{command.args[1]}-done' for command in stack[1:-1]]
+
+        async def abort_pipeline(stack):
+            stack[0].result = 'OK'
+            stack[1].result = ResponseError('unknown command')
+            stack[-1].result = ResponseError('EXECABORT')
+
+        nodes[1].execute_pipeline = AsyncMock(side_effect=execute_pipeline)
+        nodes[2].execute_pipeline = AsyncMock(side_effect=abort_pipeline)
+
+        result = await execute_batch(
+            [
+                BatchOperation(command='SET', args=['{a}:1', 'x']),
+                BatchOperation(command='SET', args=['{b}:1', 'y']),
+                BatchOperation(command='GET', args=['{a}:2']),
+                BatchOperation(command='GET', args=['{b}:2']),
+            ],
+            transaction=True,
+        )
+
+        entries = json.loads(result)
+        assert entries[0]['result'] == '{a}:1-done'
+        assert entries[2]['result'] == '{a}:2-done-parsed'
+        assert entries[1]['error'] == 'unknown command'
+        assert entries[3]['error'] == 'EXECABORT'
+        stack = nodes[1].execute_pipeline.call_args[0][0]
+        assert [command.args[0] for command in stack] == ['MULTI', 'SET', 'GET', 'EXEC']
+        mock_connection.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_cluster_transaction_redirected(
+        self, mock_connection, cluster_mode
+    ):
+        """Test that redirected cluster transactions follow MOVED and ASK."""
+        mock_connection.initialize = AsyncMock()
+        mock_connection.nodes_manager.initialize = AsyncMock()
+        mock_connection.keyslot.return_value = 1
+        old_node, new_node, importing_node = MagicMock(), MagicMock(), MagicMock()
+        for node in (old_node, new_node, importing_node):
+            node.response_callbacks = {'SET': lambda response: response == 'OK'}
+        owners = iter([old_node, new_node])
+        mock_connection.nodes_manager.get_node_from_slot.side_effect = lambda slot: next(owners)
+        mock_connection.get_node.return_value = importing_node
+
+        async def moved_pipeline(stack):
+            stack[0].result = 'OK'
+            stack[1].result = MovedError('1 new-node:6379')
+            stack[-1].result = ResponseError('EXECABORT')
+
+        async def ask_pipeline(stack):
+            stack[0].result = 'OK'
+            stack[1].result = AskError('1 importing-node:6379')
+            stack[-1].result = ResponseError('EXECABORT')
+
+        async def execute_pipeline(stack):
+            for command in stack[:-1]:
+                command.result = 'OK' if command.args[0] in ('ASKING', 'MULTI') else 'QUEUED'
+            stack[-1].result = ['OK']
+
+        old_node.execute_pipeline = AsyncMock(side_effect=moved_pipeline)
+        new_node.execute_pipeline = AsyncMock(side_effect=ask_pipeline)
+        importing_node.execute_pipeline = AsyncMock(side_effect=execute_pipeline)
+
+        result = await execute_batch(
+            [BatchOperation(command='SET', args=['key', 'value'])], transaction=True
+        )
+
+        assert json.loads(result) == [{'index': 0, 'command': 'SET', 'result': True}]
+        mock_connection.nodes_manager.initialize.assert_called_once()
+        mock_connection.get_node.assert_called_once_with(host='importing-node', port=6379)
+        stack = importing_node.execute_pipeline.call_args[0][0]
+        assert [command.args[0] for command in stack] == ['ASKING', 'MULTI', 'SET', 'EXEC']
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_validation(self, mock_connection):
+        """Test validation of the operations of a batch."""
+        result = await execute_batch([])
+        assert 'No operations to execute' in result
+
+        result = await execute_batch(
+            [BatchOperation(command='GET', args=['key'])] * (MAX_BATCH_OPERATIONS + 1)
+        )
+        assert f'at most {MAX_BATCH_OPERATIONS} operations' in result
+
+        result = await execute_batch([BatchOperation(command='FLUSHALL', args=['x'])])
+        assert "command 'FLUSHALL' of operation 0 is not supported" in result
+
+        result = await execute_batch([BatchOperation(command='GET', args=[])])
+        assert 'requires a key' in result
+
+        mock_connection.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_error(self, mock_connection, mock_pipeline):
+        """Test error handling when the batch cannot be executed."""
+        mock_pipeline.execute.side_effect = ValkeyError('Connection lost')
+
+        result = await execute_batch([BatchOperation(command='GET', args=['key'])])
+
+        assert 'Error executing batch: Connection lost' in result
@@ -18,7 +18,7 @@ from awslabs.valkey_mcp_server.tools.bitmap import (
     bitmap_pos,
     bitmap_set,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 
 class TestBitmap:
@@ -30,7 +30,7 @@ class TestBitmap:
         with patch(
             'awslabs.valkey_mcp_server.tools.bitmap.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
@@ -35,6 +35,15 @@ class TestConfig:
         assert VALKEY_CFG['ssl_cert_reqs'] == 'required'
         assert VALKEY_CFG['ssl_ca_certs'] is None
         assert VALKEY_CFG['cluster_mode'] is False
+        assert VALKEY_CFG['max_connections'] == 10
+        assert VALKEY_CFG['pool_timeout'] == 20
+        assert VALKEY_CFG['health_check_interval'] == 30
+        assert VALKEY_CFG['retries'] == 3
+        assert VALKEY_CFG['analyzer_ops_per_sec'] == 1000
+        assert VALKEY_CFG['near_cache'] is False
+        assert VALKEY_CFG['near_cache_max_entries'] == 10000
+        assert VALKEY_CFG['near_cache_max_bytes'] == 64 * 1024 * 1024
+        assert VALKEY_CFG['near_cache_prefixes'] == []
 
     @patch.dict(
         os.environ,
@@ -1,8 +1,17 @@
+import asyncio
+import tempfile
 import unittest
-from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.connection import (
+    ValkeyConnectionManager,
+    cached_read,
+    invalidate_cached,
+    load_ca_path,
+)
 from awslabs.valkey_mcp_server.version import __version__
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from valkey import exceptions
+from valkey.asyncio import Connection, SSLConnection
 
 
 class TestValkeyConnectionManager(unittest.TestCase):
@@ -11,6 +20,9 @@ class TestValkeyConnectionManager(unittest.TestCase):
     def setUp(self):
         """Reset the singleton instance before each test."""
         ValkeyConnectionManager._instance = None
+        pool_patcher = patch('awslabs.valkey_mcp_server.common.connection.BlockingConnectionPool')
+        self.mock_pool = pool_patcher.start()
+        self.addCleanup(pool_patcher.stop)
 
     def test_basic_connection(self):
         """Test basic connection creation without cluster mode or SSL."""
@@ -33,25 +45,25 @@ class TestValkeyConnectionManager(unittest.TestCase):
             # Get connection
             conn = ValkeyConnectionManager.get_connection()
 
-            # Verify Valkey was instantiated with correct parameters
-            mock_valkey.assert_called_once_with(
+            # Verify the pool was created with correct parameters
+            self.mock_pool.assert_called_once_with(
+                max_connections=10,
+                timeout=20,
                 host='localhost',
                 port=6379,
                 username=None,
                 password='',
-                ssl=False,
-                ssl_ca_path=None,
-                ssl_keyfile=None,
-                ssl_certfile=None,
-                ssl_cert_reqs=None,
-                ssl_ca_certs=None,
                 decode_responses=True,
-                max_connections=10,
                 lib_name=f'valkey-py(mcp-server_v{__version__})',
+                socket_timeout=None,
+                health_check_interval=30,
+                retry=ANY,
+                retry_on_error=[exceptions.ConnectionError, exceptions.TimeoutError],
             )
+            mock_valkey.from_pool.assert_called_once_with(self.mock_pool.return_value)
 
             # Verify connection is returned
-            self.assertEqual(conn, mock_valkey.return_value)
+            self.assertEqual(conn, mock_valkey.from_pool.return_value)
 
     def test_cluster_mode_connection(self):
         """Test connection creation in cluster mode."""
@@ -76,20 +88,20 @@ class TestValkeyConnectionManager(unittest.TestCase):
 
             # Verify ValkeyCluster was instantiated with correct parameters
             mock_cluster.assert_called_once_with(
+                ssl=False,
+                max_connections=10,
                 host='localhost',
                 port=6379,
                 username=None,
                 password='',
-                ssl=False,
-                ssl_ca_path=None,
-                ssl_keyfile=None,
-                ssl_certfile=None,
-                ssl_cert_reqs=None,
-                ssl_ca_certs=None,
                 decode_responses=True,
-                max_connections_per_node=10,
                 lib_name=f'valkey-py(mcp-server_v{__version__})',
+                socket_timeout=None,
+                health_check_interval=30,
+                retry=ANY,
+                retry_on_error=[exceptions.ConnectionError, exceptions.TimeoutError],
             )
+            self.mock_pool.assert_not_called()
 
             # Verify connection is returned
             self.assertEqual(conn, mock_cluster.return_value)
@@ -116,23 +128,34 @@ class TestValkeyConnectionManager(unittest.TestCase):
                 'ssl_ca_certs': '/path/to/certs',
             }.get(key, default)
 
-            # Get connection and verify Valkey was instantiated with correct SSL parameters
-            ValkeyConnectionManager.get_connection()
-            mock_valkey.assert_called_once_with(
+            # Get connection and verify the pool was created with correct SSL parameters
+            with patch(
+                'awslabs.valkey_mcp_server.common.connection.load_ca_path',
+                return_value='ca data',
+            ) as mock_load_ca_path:
+                ValkeyConnectionManager.get_connection()
+            mock_load_ca_path.assert_called_once_with('/path/to/ca')
+            self.mock_pool.assert_called_once_with(
+                max_connections=10,
+                timeout=20,
                 host='localhost',
                 port=6379,
                 username=None,
                 password='',
-                ssl=True,
-                ssl_ca_path='/path/to/ca',
+                decode_responses=True,
+                lib_name=f'valkey-py(mcp-server_v{__version__})',
+                socket_timeout=None,
+                health_check_interval=30,
+                retry=ANY,
+                retry_on_error=[exceptions.ConnectionError, exceptions.TimeoutError],
                 ssl_keyfile='/path/to/key',
                 ssl_certfile='/path/to/cert',
                 ssl_cert_reqs='required',
                 ssl_ca_certs='/path/to/certs',
-                decode_responses=True,
-                max_connections=10,
-                lib_name=f'valkey-py(mcp-server_v{__version__})',
+                ssl_ca_data='ca data',
+                connection_class=SSLConnection,
             )
+            mock_valkey.from_pool.assert_called_once_with(self.mock_pool.return_value)
 
     def test_connection_reuse(self):
         """Test that the same connection instance is reused."""
@@ -157,7 +180,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             conn2 = ValkeyConnectionManager.get_connection()
 
             # Verify Valkey was instantiated only once
-            mock_valkey.assert_called_once()
+            mock_valkey.from_pool.assert_called_once()
 
             # Verify both calls return same instance
             self.assertEqual(conn1, conn2)
@@ -169,7 +192,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise AuthenticationError
-            mock_valkey.side_effect = exceptions.AuthenticationError()
+            mock_valkey.from_pool.side_effect = exceptions.AuthenticationError()
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -189,7 +212,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise ConnectionError
-            mock_valkey.side_effect = exceptions.ConnectionError()
+            mock_valkey.from_pool.side_effect = exceptions.ConnectionError()
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -209,7 +232,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise TimeoutError
-            mock_valkey.side_effect = exceptions.TimeoutError()
+            mock_valkey.from_pool.side_effect = exceptions.TimeoutError()
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -229,7 +252,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise ResponseError
-            mock_valkey.side_effect = exceptions.ResponseError('test error')
+            mock_valkey.from_pool.side_effect = exceptions.ResponseError('test error')
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -269,7 +292,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise ValkeyError
-            mock_valkey.side_effect = exceptions.ValkeyError('test error')
+            mock_valkey.from_pool.side_effect = exceptions.ValkeyError('test error')
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -289,7 +312,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
             patch('awslabs.valkey_mcp_server.common.connection.Valkey') as mock_valkey,
         ):
             # Configure mock to raise unexpected error
-            mock_valkey.side_effect = Exception('unexpected error')
+            mock_valkey.from_pool.side_effect = Exception('unexpected error')
 
             mock_cfg.__getitem__.side_effect = {
                 'cluster_mode': False,
@@ -302,6 +325,199 @@ class TestValkeyConnectionManager(unittest.TestCase):
             with self.assertRaises(Exception):
                 ValkeyConnectionManager.get_connection()
 
+    def test_pool_configuration(self):
+        """Test that the pool size, timeout, health checks and retries are configurable."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.Valkey'),
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': False,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {
+                'max_connections': 50,
+                'pool_timeout': 5.0,
+                'health_check_interval': 10,
+                'retries': 5,
+            }.get(key, default)
+
+            ValkeyConnectionManager.get_connection()
+
+            _, kwargs = self.mock_pool.call_args
+            self.assertEqual(kwargs['max_connections'], 50)
+            self.assertEqual(kwargs['timeout'], 5.0)
+            self.assertEqual(kwargs['health_check_interval'], 10)
+            self.assertEqual(kwargs['retry']._retries, 5)
+
+    def test_load_ca_path(self):
+        """Test that the certificates of a CA directory are read as CA data."""
+        with tempfile.TemporaryDirectory() as ca_path:
+            cert = '-----BEGIN CERTIFICATE-----\nabc\n-----END CERTIFICATE-----'
+            Path(ca_path, 'a.pem').write_text(cert)
+            Path(ca_path, 'b.0').write_text(cert)
+            Path(ca_path, 'README').write_text('not a certificate')
+
+            self.assertEqual(load_ca_path(ca_path), f'{cert}\n{cert}')
+
+        with tempfile.TemporaryDirectory() as ca_path:
+            self.assertIsNone(load_ca_path(ca_path))
+
+
+class TestValkeyConnectionManagerClose(unittest.IsolatedAsyncioTestCase):
+    """Test cases for closing the connection."""
+
+    async def test_close(self):
+        """Test that close closes the connection and a new one is created afterwards."""
+        mock_instance = AsyncMock()
+        ValkeyConnectionManager._instance = mock_instance
+
+        await ValkeyConnectionManager.close()
+
+        mock_instance.aclose.assert_awaited_once()
+        self.assertIsNone(ValkeyConnectionManager._instance)
+
+        # Closing again does nothing
+        await ValkeyConnectionManager.close()
+
+
+class TestValkeyConnectionManagerNearCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the client-side cache."""
+
+    def setUp(self):
+        """Reset the connection and the cache before each test."""
+        ValkeyConnectionManager._instance = MagicMock()
+        ValkeyConnectionManager._instance.aclose = AsyncMock()
+        ValkeyConnectionManager._near_cache = None
+        ValkeyConnectionManager._connection_kwargs = {
+            'host': 'localhost',
+            'port': 6379,
+            'password': 'secret',
+            'decode_responses': False,
+        }
+        self.addCleanup(setattr, ValkeyConnectionManager, '_instance', None)
+        self.addCleanup(setattr, ValkeyConnectionManager, '_near_cache', None)
+
+    async def test_near_cache_disabled(self):
+        """Test that reads go to the server when the cache is disabled."""
+        fetch = AsyncMock(return_value='value')
+        with patch.dict(
+            'awslabs.valkey_mcp_server.common.connection.VALKEY_CFG', {'near_cache': False}
+        ):
+            self.assertIsNone(await ValkeyConnectionManager.get_near_cache())
+            self.assertEqual(await cached_read(('GET', 'key'), fetch), 'value')
+
+        fetch.assert_awaited_once()
+
+    async def test_near_cache_enabled(self):
+        """Test that the cache listens to the server and serves reads."""
+        with (
+            patch.dict(
+                'awslabs.valkey_mcp_server.common.connection.VALKEY_CFG',
+                {
+                    'near_cache': True,
+                    'cluster_mode': False,
+                    'host': 'localhost',
+                    'port': 6379,
+                    'ssl': False,
+                    'near_cache_max_entries': 5,
+                    'near_cache_max_bytes': 1000,
+                    'near_cache_prefixes': ['user:'],
+                },
+            ),
+            patch('awslabs.valkey_mcp_server.common.connection.NearCache') as mock_near_cache,
+        ):
+            near_cache = mock_near_cache.return_value
+            near_cache.read = AsyncMock(return_value='cached')
+            near_cache.stop = AsyncMock()
+
+            self.assertEqual(await cached_read(('GET', 'key'), AsyncMock()), 'cached')
+            self.assertIs(await ValkeyConnectionManager.get_near_cache(), near_cache)
+
+            mock_near_cache.assert_called_once_with(5, 1000, ['user:'])
+            near_cache.start.assert_called_once_with(
+                [('localhost', 6379)],
+                Connection,
+                {
+                    'password': 'secret',
+                    'decode_responses': True,
+                    'protocol': 3,
+                    'socket_keepalive': True,
+                },
+                None,
+            )
+
+            await ValkeyConnectionManager.close()
+            near_cache.stop.assert_awaited_once()
+            self.assertIsNone(ValkeyConnectionManager._near_cache)
+
+    async def test_near_cache_cluster(self):
+        """Test that the cache listens to every primary in cluster mode."""
+        ValkeyConnectionManager._instance.initialize = AsyncMock()
+        ValkeyConnectionManager._instance.cluster_slots = AsyncMock(
+            return_value={
+                (0, 8191): {'primary': ('10.0.0.2', 6380), 'replicas': []},
+                (8192, 16383): {'primary': ('', 6379), 'replicas': [('10.0.0.3', 6379)]},
+            }
+        )
+        with (
+            patch.dict(
+                'awslabs.valkey_mcp_server.common.connection.VALKEY_CFG',
+                {'near_cache': True, 'cluster_mode': True, 'ssl': True, 'host': '10.0.0.1'},
+            ),
+            patch('awslabs.valkey_mcp_server.common.connection.NearCache') as mock_near_cache,
+        ):
+            await ValkeyConnectionManager.get_near_cache()
+
+            addresses, connection_class, _, discover = (
+                mock_near_cache.return_value.start.call_args[0]
+            )
+            self.assertEqual(addresses, [('10.0.0.1', 6379), ('10.0.0.2', 6380)])
+            self.assertIs(connection_class, SSLConnection)
+
+            # The listeners follow the primaries discovered later
+            ValkeyConnectionManager._instance.cluster_slots.return_value = {
+                (0, 16383): {'primary': ('10.0.0.3', 6379), 'replicas': []}
+            }
+            self.assertEqual(await discover(), [('10.0.0.3', 6379)])
+
+    async def test_near_cache_started_once(self):
+        """Test that concurrent first reads start one cache."""
+
+        async def initialize():
+            await asyncio.sleep(0.01)
+
+        ValkeyConnectionManager._instance.initialize = AsyncMock(side_effect=initialize)
+        ValkeyConnectionManager._instance.cluster_slots = AsyncMock(return_value={})
+        with (
+            patch.dict(
+                'awslabs.valkey_mcp_server.common.connection.VALKEY_CFG',
+                {'near_cache': True, 'cluster_mode': True, 'ssl': False},
+            ),
+            patch('awslabs.valkey_mcp_server.common.connection.NearCache') as mock_near_cache,
+        ):
+            first, second = await asyncio.gather(
+                ValkeyConnectionManager.get_near_cache(),
+                ValkeyConnectionManager.get_near_cache(),
+            )
+
+        self.assertIs(first, second)
+        mock_near_cache.assert_called_once()
+        mock_near_cache.return_value.start.assert_called_once()
+
+    async def test_invalidate_cached(self):
+        """Test that keys written by the server are invalidated in the cache, if enabled."""
+        invalidate_cached('key')
+
+        near_cache = MagicMock()
+        ValkeyConnectionManager._near_cache = near_cache
+        invalidate_cached('a', 'b')
+
+        self.assertEqual(
+            [call.args for call in near_cache.invalidate.call_args_list], [('a',), ('b',)]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
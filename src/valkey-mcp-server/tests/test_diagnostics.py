@@ -0,0 +1,245 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the diagnostics functionality in the valkey MCP server."""
+
+import json
+import pytest
+from awslabs.valkey_mcp_server.tools.diagnostics import percentile, performance_diagnostics
+from unittest.mock import AsyncMock, MagicMock, patch
+from valkey.exceptions import ResponseError, ValkeyError
+
+
+COMMANDSTATS = [
+    {
+        'cmdstat_get': {'calls': 100, 'usec': 200, 'failed_calls': 0},
+        'cmdstat_set': {'calls': 50, 'usec': 300, 'failed_calls': 1},
+    },
+    {
+        'cmdstat_get': {'calls': 1100, 'usec': 2200, 'failed_calls': 0},
+        'cmdstat_set': {'calls': 150, 'usec': 800, 'failed_calls': 3},
+        'cmdstat_info': {'calls': 1, 'usec': 10, 'failed_calls': 0},
+    },
+]
+
+STATS = [
+    {'total_commands_processed': 1000, 'keyspace_hits': 10, 'keyspace_misses': 0},
+    {'total_commands_processed': 3000, 'keyspace_hits': 70, 'keyspace_misses': 20},
+]
+
+SLOWLOG = [
+    {'id': 2, 'start_time': 1700000002, 'duration': 30000, 'command': b'KEYS *'},
+    {'id': 1, 'start_time': 1700000001, 'duration': 12000, 'command': b'HGETALL user:1'},
+    {'id': 0, 'start_time': 1700000000, 'duration': 11000, 'command': b'HGETALL user:2'},
+]
+
+
+def node_connection(mock_conn, samples=None):
+    """Configure the INFO, SLOWLOG and LATENCY replies of a mock connection."""
+    samples = samples or {'commandstats': iter(COMMANDSTATS), 'stats': iter(STATS)}
+
+    async def info(section, **kwargs):
+        if section == 'latencystats':
+            return {'latency_percentiles_usec_get': {'p50': 1.003, 'p99': 5.007, 'p99.9': 9.0}}
+        return next(samples[section])
+
+    async def execute_command(*args, **kwargs):
+        if args[:2] == ('LATENCY', 'LATEST'):
+            return [['command', 1700000000, 250, 300]]
+        if args[:2] == ('LATENCY', 'HISTORY'):
+            return [[1700000000, 100], [1700000001, 250], [1700000002, 300]]
+        if args[:2] == ('LATENCY', 'DOCTOR'):
+            return 'Dave, I have observed latency spikes in this Valkey instance.'
+        raise AssertionError(f'unexpected command {args}')
+
+    mock_conn.info = AsyncMock(side_effect=info)
+    mock_conn.slowlog_get = AsyncMock(return_value=SLOWLOG)
+    mock_conn.execute_command = AsyncMock(side_effect=execute_command)
+
+
+class TestDiagnostics:
+    """Tests for performance diagnostics."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Create a mock Valkey connection and skip the wait between samples."""
+        with (
+            patch(
+                'awslabs.valkey_mcp_server.tools.diagnostics.ValkeyConnectionManager'
+            ) as mock_manager,
+            patch(
+                'awslabs.valkey_mcp_server.tools.diagnostics.asyncio.sleep', new_callable=AsyncMock
+            ),
+            patch('awslabs.valkey_mcp_server.tools.diagnostics.time') as mock_time,
+        ):
+            mock_time.monotonic.side_effect = [100.0, 102.0]
+            mock_conn = MagicMock()
+            mock_manager.get_connection.return_value = mock_conn
+            yield mock_conn
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        assert percentile([], 50) is None
+        assert percentile([5], 99) == 5
+        assert percentile([4, 1, 3, 2], 50) == 2
+        assert percentile(list(range(1, 101)), 99) == 99
+
+    @pytest.mark.asyncio
+    async def test_performance_diagnostics(self, mock_connection):
+        """Test the report of a standalone server."""
+        node_connection(mock_connection)
+
+        report = json.loads(await performance_diagnostics(interval_seconds=2, top=5))
+
+        assert report['interval_seconds'] == 2
+        assert report['total_ops_per_sec'] == 1000
+        rates = report['throughput']['127.0.0.1:6379']
+        assert rates['ops_per_sec'] == 1000
+        assert rates['keyspace_hits_per_sec'] == 30
+        assert rates['keyspace_hit_ratio'] == 0.75
+
+        get, set_, info = report['hot_commands']
+        assert get == {
+            'command': 'get',
+            'calls': 1000,
+            'ops_per_sec': 500,
+            'usec_per_call': 2,
+            'time_share': 0.7968,
+            'failed_calls': 0,
+            'p50_usec': 1.003,
+            'p99_usec': 5.007,
+        }
+        assert (set_['command'], set_['calls'], set_['failed_calls']) == ('set', 100, 2)
+        assert info['command'] == 'info'
+
+        slowlog = report['slowlog']
+        assert slowlog['entries'] == 3
+        assert slowlog['by_command'][0] == {
+            'command': 'hgetall',
+            'count': 2,
+            'p50_usec': 11000,
+            'p99_usec': 12000,
+            'max_usec': 12000,
+        }
+        assert slowlog['slowest'][0]['command'] == 'KEYS *'
+
+        event = report['latency_events']['127.0.0.1:6379']['command']
+        assert event == {
+            'latest_ms': 250,
+            'max_ms': 300,
+            'samples': 3,
+            'p50_ms': 250,
+            'p99_ms': 300,
+        }
+        assert 'latency spikes' in report['latency_doctor']['127.0.0.1:6379']
+        assert 'hot_slots' not in report
+        assert 'errors' not in report
+        mock_connection.slowlog_get.assert_called_with(128)
+
+    @pytest.mark.asyncio
+    async def test_performance_diagnostics_partial_errors(self, mock_connection):
+        """Test that failing commands are reported without failing the whole report."""
+        node_connection(mock_connection)
+        mock_connection.slowlog_get.side_effect = ResponseError('unknown command')
+
+        report = json.loads(await performance_diagnostics())
+
+        assert report['errors'] == {'127.0.0.1:6379': {'slowlog': 'unknown command'}}
+        assert report['slowlog']['entries'] == 0
+        assert report['hot_commands'][0]['command'] == 'get'
+
+    @pytest.mark.asyncio
+    async def test_performance_diagnostics_cluster(self, mock_connection):
+        """Test that every node is sampled and hot slots are reported in cluster mode."""
+        nodes = [MagicMock(), MagicMock()]
+        nodes[0].name = 'node-a:6379'
+        nodes[1].name = 'node-b:6379'
+        mock_connection.initialize = AsyncMock()
+        mock_connection.get_nodes.return_value = nodes
+        mock_connection.get_primaries.return_value = nodes
+        samples = {
+            'commandstats': iter(
+                [COMMANDSTATS[0], COMMANDSTATS[0], COMMANDSTATS[1], COMMANDSTATS[1]]
+            ),
+            'stats': iter([STATS[0], STATS[0], STATS[1], STATS[1]]),
+        }
+        node_connection(mock_connection, samples)
+        node_command = mock_connection.execute_command.side_effect
+
+        async def execute_command(*args, **kwargs):
+            if args[:2] == ('CLUSTER', 'SLOT-STATS'):
+                slot = 100 if kwargs['target_nodes'] is nodes[0] else 9000
+                return [[slot, ['cpu-usec', slot * 10]]]
+            return await node_command(*args, **kwargs)
+
+        mock_connection.execute_command.side_effect = execute_command
+
+        with patch.dict(
+            'awslabs.valkey_mcp_server.tools.diagnostics.VALKEY_CFG', {'cluster_mode': True}
+        ):
+            report = json.loads(await performance_diagnostics())
+
+        assert report['nodes'] == ['node-a:6379', 'node-b:6379']
+        assert report['total_ops_per_sec'] == 2000
+        assert report['slowlog']['entries'] == 6
+        assert report['hot_commands'][0]['calls'] == 2000
+        assert report['hot_slots'] == {
+            'source': 'cluster slot-stats',
+            'slots': [{'slot': 9000, 'cpu-usec': 90000}, {'slot': 100, 'cpu-usec': 1000}],
+        }
+        targets = {call.kwargs['target_nodes'] for call in mock_connection.info.call_args_list}
+        assert targets == set(nodes)
+
+    @pytest.mark.asyncio
+    async def test_hot_slots_from_slowlog(self, mock_connection):
+        """Test that hot slots come from the slow log when CLUSTER SLOT-STATS is unsupported."""
+        node = MagicMock()
+        node.name = 'node-a:6379'
+        mock_connection.initialize = AsyncMock()
+        mock_connection.get_nodes.return_value = [node]
+        mock_connection.get_primaries.return_value = [node]
+        mock_connection.keyslot.side_effect = lambda key: 42 if key.startswith('user') else 7
+        node_connection(mock_connection)
+        node_command = mock_connection.execute_command.side_effect
+
+        async def execute_command(*args, **kwargs):
+            if args[:2] == ('CLUSTER', 'SLOT-STATS'):
+                raise ResponseError('unknown subcommand')
+            return await node_command(*args, **kwargs)
+
+        mock_connection.execute_command.side_effect = execute_command
+
+        with patch.dict(
+            'awslabs.valkey_mcp_server.tools.diagnostics.VALKEY_CFG', {'cluster_mode': True}
+        ):
+            report = json.loads(await performance_diagnostics())
+
+        assert report['hot_slots'] == {
+            'source': 'slowlog',
+            'slots': [{'slot': 42, 'slow_entries': 2}, {'slot': 7, 'slow_entries': 1}],
+        }
+
+    @pytest.mark.asyncio
+    async def test_performance_diagnostics_errors(self, mock_connection):
+        """Test performance_diagnostics error handling."""
+        assert 'interval_seconds must be between' in await performance_diagnostics(0)
+        assert 'interval_seconds must be between' in await performance_diagnostics(61)
+        assert 'slowlog_entries must not be negative' in await performance_diagnostics(
+            slowlog_entries=-1
+        )
+        assert 'top must be positive' in await performance_diagnostics(top=0)
+
+        mock_connection.initialize = AsyncMock(side_effect=ValkeyError('Connection lost'))
+        with patch.dict(
+            'awslabs.valkey_mcp_server.tools.diagnostics.VALKEY_CFG', {'cluster_mode': True}
+        ):
+            result = await performance_diagnostics()
+        assert 'Error collecting diagnostics: Connection lost' in result
@@ -27,7 +27,7 @@ from awslabs.valkey_mcp_server.tools.hash import (
     hash_strlen,
     hash_values,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -38,7 +38,7 @@ class TestHash:
     def mock_connection(self):
         """Create a mock Valkey connection."""
         with patch('awslabs.valkey_mcp_server.tools.hash.ValkeyConnectionManager') as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
@@ -16,7 +16,7 @@ from awslabs.valkey_mcp_server.tools.hyperloglog import (
     hll_add,
     hll_count,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -29,7 +29,7 @@ class TestHyperLogLog:
         with patch(
             'awslabs.valkey_mcp_server.tools.hyperloglog.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
@@ -31,7 +31,7 @@ from awslabs.valkey_mcp_server.tools.json import (
     json_toggle,
     json_type,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -43,7 +43,7 @@ class TestJson:
         """Create a mock Valkey connection."""
         with patch('awslabs.valkey_mcp_server.tools.json.ValkeyConnectionManager') as mock_manager:
             mock_conn = Mock()
-            mock_json = Mock()
+            mock_json = AsyncMock()
             mock_conn.json.return_value = mock_json
             mock_manager.get_connection.return_value = mock_conn
             yield mock_json
@@ -0,0 +1,212 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the keyspace functionality in the valkey MCP server."""
+
+import json
+import pytest
+from awslabs.valkey_mcp_server.tools.keyspace import (
+    OpsBudget,
+    analyze_keyspace,
+    scan_keys,
+)
+from unittest.mock import AsyncMock, MagicMock, patch
+from valkey.exceptions import ResponseError, ValkeyError
+
+
+class TestKeyspace:
+    """Tests for keyspace operations."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Create a mock Valkey connection."""
+        with patch(
+            'awslabs.valkey_mcp_server.tools.keyspace.ValkeyConnectionManager'
+        ) as mock_manager:
+            mock_conn = MagicMock()
+            mock_conn.scan = AsyncMock()
+            mock_conn.dbsize = AsyncMock()
+            mock_conn.initialize = AsyncMock()
+            mock_manager.get_connection.return_value = mock_conn
+            yield mock_conn
+
+    @pytest.fixture
+    def mock_pipeline(self, mock_connection):
+        """Create a mock pipeline returned by the connection."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_connection.pipeline.return_value.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_connection.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+        return mock_pipe
+
+    @pytest.fixture
+    def cluster_nodes(self, mock_connection):
+        """Enable cluster mode with two primaries."""
+        nodes = [MagicMock(), MagicMock()]
+        nodes[0].name = 'node-b:6379'
+        nodes[1].name = 'node-a:6379'
+        mock_connection.get_primaries.return_value = nodes
+        with patch.dict(
+            'awslabs.valkey_mcp_server.tools.keyspace.VALKEY_CFG', {'cluster_mode': True}
+        ):
+            yield sorted(nodes, key=lambda node: node.name)
+
+    @pytest.mark.asyncio
+    async def test_scan_keys(self, mock_connection):
+        """Test scanning keys on a standalone server."""
+        mock_connection.scan.side_effect = [(12, ['user:1']), (0, ['user:2'])]
+
+        result = json.loads(await scan_keys('user:*', key_type='hash', count=5))
+
+        assert result == {'cursor': '0', 'keys': ['user:1', 'user:2']}
+        mock_connection.scan.assert_any_call(cursor=0, match='user:*', count=5, _type='hash')
+        mock_connection.scan.assert_any_call(cursor=12, match='user:*', count=5, _type='hash')
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_returns_cursor(self, mock_connection):
+        """Test that scanning stops once enough keys were found."""
+        mock_connection.scan.return_value = (42, ['a', 'b'])
+
+        result = json.loads(await scan_keys(count=2, cursor='7'))
+
+        assert result == {'cursor': '42', 'keys': ['a', 'b']}
+        mock_connection.scan.assert_called_once_with(cursor=7, match='*', count=2, _type=None)
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_cluster(self, mock_connection, cluster_nodes):
+        """Test that cluster scans walk the primaries in order with a combined cursor."""
+        mock_connection.scan.side_effect = [
+            ({'node-a:6379': 0}, ['a']),
+            ({'node-b:6379': 9}, ['b']),
+        ]
+
+        result = json.loads(await scan_keys(count=2))
+
+        assert result == {'cursor': '1:9', 'keys': ['a', 'b']}
+        targets = [call.kwargs['target_nodes'] for call in mock_connection.scan.call_args_list]
+        assert targets == cluster_nodes
+
+        mock_connection.scan.reset_mock(side_effect=True)
+        mock_connection.scan.return_value = ({'node-b:6379': 0}, ['c'])
+        result = json.loads(await scan_keys(count=2, cursor='1:9'))
+
+        assert result == {'cursor': '0', 'keys': ['c']}
+        assert mock_connection.scan.call_args.kwargs['cursor'] == 9
+        assert mock_connection.scan.call_args.kwargs['target_nodes'] is cluster_nodes[1]
+
+    @pytest.mark.asyncio
+    async def test_scan_keys_errors(self, mock_connection, cluster_nodes):
+        """Test scan_keys error handling."""
+        assert 'count must be positive' in await scan_keys(count=0)
+        assert "invalid cursor '5:1'" in await scan_keys(cursor='5:1')
+        assert "invalid cursor 'abc'" in await scan_keys(cursor='abc')
+
+        mock_connection.scan.side_effect = ValkeyError('Connection lost')
+        assert 'Error scanning keys: Connection lost' in await scan_keys()
+
+    @pytest.mark.asyncio
+    async def test_analyze_keyspace(self, mock_connection, mock_pipeline):
+        """Test the report of the keyspace analyzer."""
+        mock_connection.scan.return_value = (0, ['user:1', 'user:2', 'session:1', 'gone', 'bad'])
+        mock_connection.dbsize.return_value = 50
+        mock_pipeline.execute.return_value = [
+            *('hash', 500, 'listpack', -1),
+            *('hash', 300, 'listpack', 60),
+            *('string', 1000, 'raw', -1),
+            *('none', None, ResponseError('no such key'), -2),
+            *('string', ResponseError('denied'), 'raw', -1),
+        ]
+
+        report = json.loads(await analyze_keyspace(top=2, ops_per_sec=100000))
+
+        assert report['total_keys'] == 50
+        assert report['sampled_keys'] == 3
+        assert report['sampled_bytes'] == 1800
+        assert report['estimated_total_bytes'] == 30000
+        assert [key['key'] for key in report['top_keys']] == ['session:1', 'user:1']
+        assert report['memory_by_prefix'][0] == {
+            'prefix': 'session:',
+            'keys': 1,
+            'bytes': 1000,
+            'share': 0.5556,
+        }
+        assert report['memory_by_prefix'][1]['prefix'] == 'user:'
+        assert report['encodings'] == {'hash:listpack': 2, 'string:raw': 1}
+        assert report['no_expiry']['keys'] == 2
+        assert report['no_expiry']['bytes'] == 1500
+        assert report['ops'] == 1 + 5 * 4 + 1
+        mock_pipeline.memory_usage.assert_any_call('user:1')
+        mock_pipeline.object.assert_any_call('encoding', 'user:1')
+        mock_connection.pipeline.assert_called_with(transaction=False)
+
+    @pytest.mark.asyncio
+    async def test_analyze_keyspace_filtered(self, mock_connection, mock_pipeline):
+        """Test that filtered samples are not extrapolated to the whole keyspace."""
+        mock_connection.scan.side_effect = [(3, ['a:1', 'a:2']), (0, ['a:3'])]
+        mock_connection.dbsize.return_value = 10
+        mock_pipeline.execute.return_value = [*('string', 10, 'embstr', -1)] * 2
+
+        report = json.loads(
+            await analyze_keyspace(pattern='a:*', sample_size=2, ops_per_sec=100000)
+        )
+
+        assert report['sampled_keys'] == 2
+        assert 'estimated_total_bytes' not in report
+        mock_connection.scan.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_analyze_keyspace_cluster(self, mock_connection, mock_pipeline, cluster_nodes):
+        """Test that the analyzer samples every primary."""
+        mock_connection.scan.side_effect = [
+            ({'node-a:6379': 0}, ['a']),
+            ({'node-b:6379': 0}, ['b']),
+        ]
+        mock_connection.dbsize.return_value = 2
+        mock_pipeline.execute.return_value = [*('string', 10, 'embstr', 5)] * 2
+
+        report = json.loads(await analyze_keyspace(sample_size=2, ops_per_sec=100000))
+
+        assert report['sampled_keys'] == 2
+        targets = [call.kwargs['target_nodes'] for call in mock_connection.scan.call_args_list]
+        assert targets == cluster_nodes
+        assert all(call.kwargs['count'] == 1 for call in mock_connection.scan.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_analyze_keyspace_errors(self, mock_connection):
+        """Test analyze_keyspace error handling."""
+        assert 'sample_size must be between' in await analyze_keyspace(sample_size=0)
+        assert 'sample_size must be between' in await analyze_keyspace(sample_size=10001)
+        assert 'top must be positive' in await analyze_keyspace(top=0)
+        assert 'ops_per_sec must be positive' in await analyze_keyspace(ops_per_sec=0)
+
+        mock_connection.scan.side_effect = ValkeyError('Connection lost')
+        result = await analyze_keyspace(ops_per_sec=100000)
+        assert 'Error analyzing keyspace: Connection lost' in result
+
+    @pytest.mark.asyncio
+    async def test_ops_budget(self):
+        """Test that the budget waits until operations fit in the rate."""
+        with (
+            patch('awslabs.valkey_mcp_server.tools.keyspace.time.monotonic') as mock_monotonic,
+            patch(
+                'awslabs.valkey_mcp_server.tools.keyspace.asyncio.sleep', new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            mock_monotonic.return_value = 100.0
+            budget = OpsBudget(100)
+
+            await budget.spend(50)
+            mock_sleep.assert_called_once_with(0.5)
+
+            mock_sleep.reset_mock()
+            mock_monotonic.return_value = 102.0
+            await budget.spend(100)
+            mock_sleep.assert_not_called()
@@ -29,7 +29,7 @@ from awslabs.valkey_mcp_server.tools.list import (
     list_set,
     list_trim,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -172,7 +172,7 @@ class TestList:
     def mock_connection(self):
         """Create a mock Valkey connection."""
         with patch('awslabs.valkey_mcp_server.tools.list.ValkeyConnectionManager') as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
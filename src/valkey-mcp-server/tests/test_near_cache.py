@@ -0,0 +1,278 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Tests for the client-side cache of the valkey MCP server."""
+
+import asyncio
+import pytest
+from awslabs.valkey_mcp_server.common.near_cache import NearCache, estimate_size
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def tracking_cache(max_entries=100, max_bytes=100000):
+    """Create a cache that behaves as if its listener were tracking."""
+    near_cache = NearCache(max_entries, max_bytes)
+    near_cache._addresses = [('localhost', 6379)]
+    near_cache._tracking = {('localhost', 6379)}
+    return near_cache
+
+
+class TestNearCache:
+    """Tests for the client-side cache."""
+
+    @pytest.mark.asyncio
+    async def test_read_through(self):
+        """Test that repeated reads are served from the cache."""
+        near_cache = tracking_cache()
+        fetch = AsyncMock(return_value='value')
+
+        assert await near_cache.read(('GET', 'key'), fetch) == 'value'
+        assert await near_cache.read(('GET', 'key'), fetch) == 'value'
+
+        fetch.assert_awaited_once()
+        stats = near_cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+        assert stats['hit_ratio'] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_not_tracking(self):
+        """Test that nothing is cached until the listener is tracking."""
+        near_cache = NearCache(100, 100000)
+        fetch = AsyncMock(return_value='value')
+
+        await near_cache.read(('GET', 'key'), fetch)
+        await near_cache.read(('GET', 'key'), fetch)
+
+        assert fetch.await_count == 2
+        assert near_cache.stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_untracked_prefix(self):
+        """Test that keys outside the tracked prefixes are not cached."""
+        near_cache = tracking_cache()
+        near_cache.prefixes = ['user:']
+        fetch = AsyncMock(return_value='value')
+
+        await near_cache.read(('GET', 'session:1'), fetch)
+        await near_cache.read(('GET', 'session:1'), fetch)
+        await near_cache.read(('GET', 'user:1'), fetch)
+
+        assert fetch.await_count == 3
+        assert list(near_cache._entries) == [('GET', 'user:1')]
+
+    @pytest.mark.asyncio
+    async def test_invalidation(self):
+        """Test that invalidation messages remove every response of a key."""
+        near_cache = tracking_cache()
+        await near_cache.read(('HGET', 'user:1', 'name'), AsyncMock(return_value='alice'))
+        await near_cache.read(('HGETALL', 'user:1'), AsyncMock(return_value={'name': 'alice'}))
+        await near_cache.read(('GET', 'other'), AsyncMock(return_value='x'))
+
+        near_cache._handle_invalidation(['invalidate', [b'user:1']])
+
+        stats = near_cache.stats()
+        assert stats['entries'] == 1
+        assert stats['invalidations'] == 1
+        assert stats['bytes'] == estimate_size('x')
+
+        near_cache._handle_invalidation(['invalidate', None])
+        assert near_cache.stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidated_during_read(self):
+        """Test that a response is not cached if its key was modified while it was read."""
+        near_cache = tracking_cache()
+
+        async def fetch():
+            near_cache.invalidate('key')
+            return 'old'
+
+        assert await near_cache.read(('GET', 'key'), fetch) == 'old'
+        assert near_cache.stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_bounds(self):
+        """Test that the least recently used responses are evicted beyond the bounds."""
+        near_cache = tracking_cache(max_entries=2)
+        for key in ('a', 'b'):
+            await near_cache.read(('GET', key), AsyncMock(return_value=key))
+        await near_cache.read(('GET', 'a'), AsyncMock())
+        await near_cache.read(('GET', 'c'), AsyncMock(return_value='c'))
+
+        assert set(near_cache._entries) == {('GET', 'a'), ('GET', 'c')}
+        assert near_cache.stats()['evictions'] == 1
+
+        size = estimate_size('x' * 100)
+        near_cache = tracking_cache(max_bytes=size * 2)
+        for key in ('a', 'b', 'c'):
+            await near_cache.read(('GET', key), AsyncMock(return_value='x' * 100))
+        await near_cache.read(('GET', 'big'), AsyncMock(return_value='x' * 1000))
+
+        assert set(near_cache._entries) == {('GET', 'b'), ('GET', 'c')}
+        assert near_cache.stats()['bytes'] == size * 2
+
+    @pytest.mark.asyncio
+    async def test_listener(self):
+        """Test that the listener enables broadcast tracking and applies invalidations."""
+        near_cache = NearCache(100, 100000, prefixes=['user:', 'session:'])
+        connection = MagicMock()
+        connection.connect = AsyncMock()
+        connection.send_command = AsyncMock()
+        connection.disconnect = AsyncMock()
+        pushed = asyncio.Event()
+
+        async def read_response(timeout=None, push_request=False):
+            if not push_request:
+                return 'OK'
+            if not pushed.is_set():
+                handler = connection._parser.set_invalidation_push_handler.call_args[0][0]
+                handler(['invalidate', ['user:1']])
+                pushed.set()
+            await asyncio.sleep(3600)
+
+        connection.read_response = read_response
+        connection_class = MagicMock(return_value=connection)
+
+        near_cache.start([('localhost', 6379)], connection_class, {'protocol': 3})
+        await asyncio.wait_for(pushed.wait(), 1)
+
+        assert near_cache.ready
+        connection_class.assert_called_once_with(host='localhost', port=6379, protocol=3)
+        connection.send_command.assert_awaited_once_with(
+            'CLIENT', 'TRACKING', 'ON', 'BCAST', 'PREFIX', 'user:', 'PREFIX', 'session:'
+        )
+
+        await near_cache.stop()
+        assert not near_cache.ready
+        connection.disconnect.assert_awaited_once_with(nowait=True)
+
+    @pytest.mark.asyncio
+    async def test_listener_reconnects(self):
+        """Test that a broken listener flushes the cache and reconnects."""
+        near_cache = tracking_cache()
+        await near_cache.read(('GET', 'key'), AsyncMock(return_value='value'))
+        near_cache._addresses = []
+        near_cache._tracking = set()
+
+        connection = MagicMock()
+        connection.connect = AsyncMock(side_effect=[ConnectionError('refused'), None])
+        connection.send_command = AsyncMock()
+        connection.disconnect = AsyncMock()
+        tracking = asyncio.Event()
+
+        async def read_response(timeout=None, push_request=False):
+            if push_request:
+                tracking.set()
+                await asyncio.sleep(3600)
+            return 'OK'
+
+        connection.read_response = read_response
+
+        with patch('awslabs.valkey_mcp_server.common.near_cache.RECONNECT_DELAY', 0):
+            near_cache.start([('localhost', 6379)], MagicMock(return_value=connection), {})
+            await asyncio.wait_for(tracking.wait(), 1)
+
+        assert near_cache.stats()['entries'] == 0
+        assert connection.connect.await_count == 2
+        await near_cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_listener_ping_timeout(self):
+        """Test that a listener whose server stops replying to PING reconnects."""
+        near_cache = NearCache(100, 100000)
+        connection = MagicMock()
+        connection.connect = AsyncMock()
+        connection.send_command = AsyncMock()
+        connection.disconnect = AsyncMock()
+        reconnected = asyncio.Event()
+
+        async def read_response(timeout=None, push_request=False):
+            if not push_request:
+                if connection.connect.await_count > 1:
+                    reconnected.set()
+                return 'OK'
+            await asyncio.sleep(min(timeout, 0.01))
+            return None
+
+        connection.read_response = read_response
+
+        with (
+            patch('awslabs.valkey_mcp_server.common.near_cache.LISTENER_PING_INTERVAL', 0),
+            patch('awslabs.valkey_mcp_server.common.near_cache.LISTENER_PING_TIMEOUT', 0.01),
+            patch('awslabs.valkey_mcp_server.common.near_cache.RECONNECT_DELAY', 0),
+        ):
+            near_cache.start([('localhost', 6379)], MagicMock(return_value=connection), {})
+            await asyncio.wait_for(reconnected.wait(), 1)
+
+        connection.send_command.assert_any_await('PING', check_health=False)
+        connection.disconnect.assert_awaited_with(nowait=True)
+        await near_cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_listener_ping_reply(self):
+        """Test that a listener keeps its connection while the server replies to PING."""
+        near_cache = NearCache(100, 100000)
+        connection = MagicMock()
+        connection.connect = AsyncMock()
+        connection.send_command = AsyncMock()
+        connection.disconnect = AsyncMock()
+        pinged = asyncio.Event()
+
+        async def send_command(*args, **kwargs):
+            if args == ('PING',) and connection.send_command.await_count > 3:
+                pinged.set()
+
+        async def read_response(timeout=None, push_request=False):
+            await asyncio.sleep(0)
+            return 'PONG' if push_request else 'OK'
+
+        connection.send_command.side_effect = send_command
+        connection.read_response = read_response
+
+        with patch('awslabs.valkey_mcp_server.common.near_cache.LISTENER_PING_INTERVAL', 0):
+            near_cache.start([('localhost', 6379)], MagicMock(return_value=connection), {})
+            await asyncio.wait_for(pinged.wait(), 1)
+
+        assert near_cache.ready
+        connection.connect.assert_awaited_once()
+        await near_cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_topology_change(self):
+        """Test that the listeners follow the primaries and the cache is flushed on a change."""
+        near_cache = NearCache(100, 100000)
+        listening = []
+
+        async def listen(address, connection_class, connection_kwargs):
+            listening.append(address)
+            near_cache._tracking.add(address)
+            await asyncio.sleep(3600)
+
+        discover = AsyncMock(
+            side_effect=[[('10.0.0.1', 6379), ('10.0.0.2', 6379)], [('10.0.0.2', 6379)]]
+        )
+        with (
+            patch.object(near_cache, '_listen', side_effect=listen),
+            patch('awslabs.valkey_mcp_server.common.near_cache.TOPOLOGY_REFRESH_INTERVAL', 0),
+        ):
+            near_cache.start([('10.0.0.1', 6379)], MagicMock(), {}, discover)
+            await asyncio.sleep(0)
+            await near_cache.read(('GET', 'key'), AsyncMock(return_value='value'))
+            assert near_cache.stats()['entries'] == 1
+
+            while discover.await_count < 2 or len(near_cache._listeners) != 1:
+                await asyncio.sleep(0)
+
+        assert listening == [('10.0.0.1', 6379), ('10.0.0.2', 6379)]
+        assert list(near_cache._listeners) == [('10.0.0.2', 6379)]
+        assert near_cache.stats()['entries'] == 0
+        await near_cache.stop()
+        assert near_cache._topology_watcher is None
@@ -1,6 +1,12 @@
+import json
 import pytest
-from awslabs.valkey_mcp_server.tools.server_management import client_list, dbsize, info
-from unittest.mock import MagicMock, patch
+from awslabs.valkey_mcp_server.tools.server_management import (
+    client_list,
+    dbsize,
+    info,
+    near_cache_stats,
+)
+from unittest.mock import AsyncMock, MagicMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -10,7 +16,7 @@ async def test_dbsize_success():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_conn.dbsize.return_value = 42
         mock_manager.get_connection.return_value = mock_conn
 
@@ -25,7 +31,7 @@ async def test_dbsize_error():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_conn.dbsize.side_effect = ValkeyError('Connection failed')
         mock_manager.get_connection.return_value = mock_conn
 
@@ -40,7 +46,7 @@ async def test_info_success():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_info = {'redis_version': '6.0.0', 'connected_clients': '1'}
         mock_conn.info.return_value = mock_info
         mock_manager.get_connection.return_value = mock_conn
@@ -61,7 +67,7 @@ async def test_info_error():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_conn.info.side_effect = ValkeyError('Info command failed')
         mock_manager.get_connection.return_value = mock_conn
 
@@ -76,7 +82,7 @@ async def test_client_list_success():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_clients = [
             {'id': '1', 'addr': '127.0.0.1:12345', 'age': '100'},
             {'id': '2', 'addr': '127.0.0.1:12346', 'age': '200'},
@@ -95,10 +101,25 @@ async def test_client_list_error():
     with patch(
         'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
     ) as mock_manager:
-        mock_conn = MagicMock()
+        mock_conn = AsyncMock()
         mock_conn.client_list.side_effect = ValkeyError('Client list failed')
         mock_manager.get_connection.return_value = mock_conn
 
         with pytest.raises(RuntimeError) as exc_info:
             await client_list()
         assert 'Error retrieving client list: Client list failed' in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_near_cache_stats():
+    """Test near_cache_stats with the cache enabled and disabled."""
+    with patch(
+        'awslabs.valkey_mcp_server.tools.server_management.ValkeyConnectionManager'
+    ) as mock_manager:
+        mock_manager.get_near_cache = AsyncMock(return_value=None)
+        assert json.loads(await near_cache_stats()) == {'enabled': False}
+
+        mock_cache = MagicMock()
+        mock_cache.stats.return_value = {'enabled': True, 'hits': 3, 'misses': 1}
+        mock_manager.get_near_cache = AsyncMock(return_value=mock_cache)
+        assert json.loads(await near_cache_stats())['hits'] == 3
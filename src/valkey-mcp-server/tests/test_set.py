@@ -22,7 +22,7 @@ from awslabs.valkey_mcp_server.tools.set import (
     set_random_member,
     set_remove,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -33,7 +33,7 @@ class TestSet:
     def mock_connection(self):
         """Create a mock Valkey connection."""
         with patch('awslabs.valkey_mcp_server.tools.set.ValkeyConnectionManager') as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
@@ -20,7 +20,7 @@ from awslabs.valkey_mcp_server.tools.sorted_set import (
     sorted_set_remove,
     sorted_set_score,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -33,7 +33,7 @@ class TestSortedSet:
         with patch(
             'awslabs.valkey_mcp_server.tools.sorted_set.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
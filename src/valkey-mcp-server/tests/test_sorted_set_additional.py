@@ -23,7 +23,7 @@ from awslabs.valkey_mcp_server.tools.sorted_set import (
     sorted_set_remove_by_rank,
     sorted_set_remove_by_score,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -36,7 +36,7 @@ class TestSortedSetAdditional:
         with patch(
             'awslabs.valkey_mcp_server.tools.sorted_set.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
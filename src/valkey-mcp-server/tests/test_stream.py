@@ -24,7 +24,7 @@ from awslabs.valkey_mcp_server.tools.stream import (
     stream_read_group,
     stream_trim,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -37,7 +37,7 @@ class TestStream:
         with patch(
             'awslabs.valkey_mcp_server.tools.stream.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
@@ -21,7 +21,7 @@ from awslabs.valkey_mcp_server.tools.string import (
     string_length,
     string_set,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from valkey.exceptions import ValkeyError
 
 
@@ -34,10 +34,19 @@ class TestString:
         with patch(
             'awslabs.valkey_mcp_server.tools.string.ValkeyConnectionManager'
         ) as mock_manager:
-            mock_conn = Mock()
+            mock_conn = AsyncMock()
             mock_manager.get_connection.return_value = mock_conn
             yield mock_conn
 
+    @pytest.mark.asyncio
+    async def test_string_set_invalidates_cache(self, mock_connection):
+        """Test that setting a string drops its client-side cached responses."""
+        mock_connection.set.return_value = True
+        with patch('awslabs.valkey_mcp_server.tools.string.invalidate_cached') as mock_invalidate:
+            await string_set('key', 'value')
+
+        mock_invalidate.assert_called_once_with('key')
+
     @pytest.mark.asyncio
     async def test_string_set(self, mock_connection):
         """Test setting string value."""